@@ -1,7 +1,24 @@
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from hashlib import shake_128
+from typing import Any, List, Optional
+
+from django.core.paginator import Paginator as DjangoPaginator
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q, QuerySet
+from django.db.models.expressions import OrderBy
+
 from rest_framework.exceptions import APIException, NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.pagination import (
+    LimitOffsetPagination as RestFrameworkLimitOffsetPagination,
+)
 from rest_framework.pagination import (
     PageNumberPagination as RestFrameworkPageNumberPagination,
 )
+from rest_framework.pagination import replace_query_param
+from rest_framework.response import Response
 from rest_framework.status import HTTP_400_BAD_REQUEST
 
 
@@ -11,10 +28,24 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
     page_size = 100
     page_size_query_param = "size"
 
-    def __init__(self, limit_page_size=None, *args, **kwargs):
+    def __init__(self, limit_page_size=None, count=None, *args, **kwargs):
+        """
+        :param limit_page_size: The maximum page size that can be requested.
+        :param count: An already known total count of the paginated queryset. If
+            provided, it's used instead of executing a count query.
+        """
+
         self.limit_page_size = limit_page_size
+        self.known_count = count
         super().__init__(*args, **kwargs)
 
+    def django_paginator_class(self, *args, **kwargs):
+        paginator = DjangoPaginator(*args, **kwargs)
+        if self.known_count is not None:
+            # The `count` is a cached property, so setting it prevents the query.
+            paginator.count = self.known_count
+        return paginator
+
     def get_page_size(self, request):
         page_size = super().get_page_size(request)
 
@@ -39,3 +70,233 @@ class PageNumberPagination(RestFrameworkPageNumberPagination):
             exception = APIException({"error": "ERROR_INVALID_PAGE", "detail": str(e)})
             exception.status_code = HTTP_400_BAD_REQUEST
             raise exception
+
+
+class LimitOffsetPagination(RestFrameworkLimitOffsetPagination):
+    def __init__(self, count=None, *args, **kwargs):
+        """
+        :param count: An already known total count of the paginated queryset. If
+            provided, it's used instead of executing a count query.
+        """
+
+        self.known_count = count
+        super().__init__(*args, **kwargs)
+
+    def get_count(self, queryset):
+        if self.known_count is not None:
+            return self.known_count
+        return super().get_count(queryset)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginates a queryset by remembering the values of the ordering expressions of the
+    last returned row in an opaque cursor, instead of using an offset. The next page
+    is then fetched by filtering on rows that come after those values, which can use
+    the indexes matching the ordering and therefore takes constant time no matter how
+    deep the page is. Rows that are created or deleted while paging don't cause
+    other rows to be skipped or returned twice.
+
+    The queryset can be ordered by any expression, but the last one must be unique.
+    If it isn't already, the `id` is added as the final tie-breaker.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "size"
+    page_size = 100
+    annotation_prefix = "keyset_cursor_"
+
+    def __init__(self, limit_page_size=None):
+        self.limit_page_size = limit_page_size
+        self.next_cursor = None
+        self.request = None
+
+    def get_page_size(self, request) -> int:
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            page_size = self.page_size
+
+        if page_size <= 0:
+            page_size = self.page_size
+
+        if self.limit_page_size and page_size > self.limit_page_size:
+            raise self._get_error(
+                "ERROR_PAGE_SIZE_LIMIT",
+                f"The page size is limited to {self.limit_page_size}.",
+            )
+
+        return page_size
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None) -> List[Any]:
+        self.request = request
+        page_size = self.get_page_size(request)
+        order_bys = self._get_order_bys(queryset)
+        fingerprint = self._get_fingerprint(queryset, order_bys)
+        aliases = [f"{self.annotation_prefix}{i}" for i in range(len(order_bys))]
+
+        queryset = queryset.annotate(
+            **{
+                alias: order_by.expression
+                for alias, order_by in zip(aliases, order_bys)
+            }
+        ).order_by(*order_bys)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            values = self.decode_cursor(cursor, fingerprint, len(order_bys))
+            queryset = queryset.filter(
+                self._get_after_values_q(aliases, order_bys, values)
+            )
+
+        rows = list(queryset[: page_size + 1])
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            last_row = rows[-1]
+            self.next_cursor = self.encode_cursor(
+                [getattr(last_row, alias) for alias in aliases], fingerprint
+            )
+
+        return rows
+
+    def get_next_link(self) -> Optional[str]:
+        if self.next_cursor is None:
+            return None
+
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data) -> Response:
+        return Response({"next": self.get_next_link(), "results": data})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {
+                    "type": "string",
+                    "nullable": True,
+                    "format": "uri",
+                    "description": "URL to the next page, containing the cursor.",
+                },
+                "results": schema,
+            },
+        }
+
+    def encode_cursor(self, values: List[Any], fingerprint: str) -> str:
+        payload = json.dumps([fingerprint, values], cls=DjangoJSONEncoder)
+        return urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(
+        self, cursor: str, fingerprint: str, expected_length: int
+    ) -> List[Any]:
+        """
+        Decodes the cursor and checks that it has been created for the same ordering.
+        The values are compared via lookups on the annotations, so Django converts
+        the serialized strings back to the right type.
+        """
+
+        try:
+            cursor_fingerprint, values = json.loads(urlsafe_b64decode(cursor.encode()))
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+            raise self._get_error("ERROR_INVALID_CURSOR", "The cursor is invalid.")
+
+        if (
+            cursor_fingerprint != fingerprint
+            or not isinstance(values, list)
+            or len(values) != expected_length
+        ):
+            raise self._get_error(
+                "ERROR_INVALID_CURSOR",
+                "The cursor doesn't match the ordering of the rows.",
+            )
+
+        return values
+
+    def _get_order_bys(self, queryset: QuerySet) -> List[OrderBy]:
+        ordering = queryset.query.order_by
+        if not ordering and queryset.query.default_ordering:
+            ordering = queryset.model._meta.ordering
+
+        order_bys = []
+        for order in ordering:
+            if isinstance(order, str):
+                descending = order.startswith("-")
+                order = OrderBy(F(order.lstrip("-")), descending=descending)
+            elif not isinstance(order, OrderBy):
+                order = order.asc()
+            order_bys.append(order)
+
+        last_expression = order_bys[-1].expression if order_bys else None
+        if not (
+            isinstance(last_expression, F) and last_expression.name in ("id", "pk")
+        ):
+            order_bys.append(OrderBy(F("id")))
+
+        return order_bys
+
+    def _get_fingerprint(self, queryset: QuerySet, order_bys: List[OrderBy]) -> str:
+        """
+        Returns a short hash of the compiled SQL of the ordering, so that a cursor
+        can't be used for a differently ordered queryset.
+        """
+
+        # The expressions are resolved against a clone because resolving them can
+        # add joins to the query.
+        query = queryset.query.clone()
+        compiler = query.get_compiler(using=queryset.db)
+        parts = [
+            compiler.compile(order_by.resolve_expression(query, allow_joins=True))
+            for order_by in order_bys
+        ]
+        return shake_128(str(parts).encode()).hexdigest(8)
+
+    def _get_after_values_q(
+        self, aliases: List[str], order_bys: List[OrderBy], values: List[Any]
+    ) -> Q:
+        """
+        Builds the condition matching all the rows that are ordered after the
+        provided values: `(a > v0) OR (a = v0 AND b > v1) OR ...`, taking the
+        direction and the position of the nulls of every order into account. The
+        first order is repeated as a range condition so that an index on it can be
+        used.
+        """
+
+        after_q = Q(pk__in=[])
+        equal_q = Q()
+        for alias, order_by, value in zip(aliases, order_bys, values):
+            after_q |= equal_q & self._get_after_value_q(alias, order_by, value)
+            equal_q &= self._get_equal_value_q(alias, value)
+
+        first_after_or_equal_q = self._get_after_value_q(
+            aliases[0], order_bys[0], values[0]
+        ) | self._get_equal_value_q(aliases[0], values[0])
+
+        return first_after_or_equal_q & after_q
+
+    def _get_after_value_q(self, alias: str, order_by: OrderBy, value: Any) -> Q:
+        # PostgreSQL puts nulls last for ascending and first for descending orders
+        # unless specified otherwise.
+        if order_by.nulls_first or order_by.nulls_last:
+            nulls_last = bool(order_by.nulls_last)
+        else:
+            nulls_last = not order_by.descending
+
+        if value is None:
+            return Q(pk__in=[]) if nulls_last else Q(**{f"{alias}__isnull": False})
+
+        lookup = "lt" if order_by.descending else "gt"
+        after_q = Q(**{f"{alias}__{lookup}": value})
+        if nulls_last:
+            after_q |= Q(**{f"{alias}__isnull": True})
+        return after_q
+
+    def _get_equal_value_q(self, alias: str, value: Any) -> Q:
+        if value is None:
+            return Q(**{f"{alias}__isnull": True})
+        return Q(**{alias: value})
+
+    def _get_error(self, error: str, detail: str) -> APIException:
+        exception = APIException({"error": error, "detail": detail})
+        exception.status_code = HTTP_400_BAD_REQUEST
+        return exception
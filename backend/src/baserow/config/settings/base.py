@@ -211,6 +211,22 @@ CHANNEL_LAYERS = {
         },
     },
 }
+# If enabled, the realtime events are sent to the channel layer directly from the
+# process where they happen, instead of dispatching a Celery task per event. The
+# events that happen within the same interval are grouped per channel group and sent
+# as one message. If the queue is full or sending fails, Celery is used instead.
+BASEROW_WS_DIRECT_BROADCAST_ENABLED = str_to_bool(
+    os.getenv("BASEROW_WS_DIRECT_BROADCAST_ENABLED", "false")
+)
+BASEROW_WS_BROADCAST_BATCH_INTERVAL_MS = int(
+    os.getenv("BASEROW_WS_BROADCAST_BATCH_INTERVAL_MS", 10)
+)
+BASEROW_WS_BROADCAST_MAX_BATCH_SIZE = int(
+    os.getenv("BASEROW_WS_BROADCAST_MAX_BATCH_SIZE", 500)
+)
+BASEROW_WS_BROADCAST_MAX_QUEUE_SIZE = int(
+    os.getenv("BASEROW_WS_BROADCAST_MAX_QUEUE_SIZE", 10000)
+)
 
 # Database
 # https://docs.djangoproject.com/en/2.2/ref/settings/#databases
@@ -320,6 +336,13 @@ BUILDER_PUBLICLY_USED_PROPERTIES_CACHE_TTL_SECONDS = int(
     or 600
 )
 
+# The maximum number of threads used to dispatch the data sources of a builder page
+# that don't depend on each other concurrently, each using its own database
+# connection. The default of 1 dispatches them one after the other.
+BASEROW_BUILDER_DATA_SOURCE_DISPATCH_MAX_WORKERS = int(
+    os.getenv("BASEROW_BUILDER_DATA_SOURCE_DISPATCH_MAX_WORKERS", "") or 1
+)
+
 
 def install_cachalot():
     global INSTALLED_APPS
@@ -347,7 +370,42 @@ CELERY_SINGLETON_BACKEND_CLASS = (
 
 # This flag enable automatic index creation for table views based on sortings.
 AUTO_INDEX_VIEW_ENABLED = os.getenv("BASEROW_AUTO_INDEX_VIEW_ENABLED", "true") == "true"
+# This flag enables the automatic creation of pg_trgm indexes for the text fields that
+# are filtered by a view with a contains filter.
+AUTO_INDEX_TRIGRAM_ENABLED = (
+    os.getenv("BASEROW_AUTO_INDEX_TRIGRAM_ENABLED", "true") == "true"
+)
 AUTO_INDEX_LOCK_EXPIRY = os.getenv("BASEROW_AUTO_INDEX_LOCK_EXPIRY", 60 * 2)
+# The maximum number of partial indexes matching the filters of views created per
+# table. When the budget is reached, the least recently used ones are replaced. The
+# default of 0 disables partial view indexes.
+BASEROW_VIEW_PARTIAL_INDEXES_PER_TABLE = int(
+    os.getenv("BASEROW_VIEW_PARTIAL_INDEXES_PER_TABLE", "") or 0
+)
+
+# The number of seconds a cached view row count is kept. Counts are also invalidated
+# whenever the rows of the table change, so this mainly bounds the staleness of views
+# filtering on relative dates like "today". Setting it to 0 disables the cache.
+BASEROW_VIEW_ROW_COUNT_CACHE_TIMEOUT = int(
+    os.getenv("BASEROW_VIEW_ROW_COUNT_CACHE_TIMEOUT", 60 * 10)
+)
+# When an estimated row count is requested, the estimate of the query planner is only
+# used if it's above this threshold. Below it the exact count is cheap enough.
+BASEROW_ESTIMATED_ROW_COUNT_THRESHOLD = int(
+    os.getenv("BASEROW_ESTIMATED_ROW_COUNT_THRESHOLD", 10000)
+)
+# The number of seconds the group by counts of the last requested page of a grid view
+# are cached. They're invalidated in the same way as the cached row counts. Setting
+# it to 0 disables the cache.
+BASEROW_VIEW_GROUP_BY_METADATA_CACHE_TIMEOUT = int(
+    os.getenv("BASEROW_VIEW_GROUP_BY_METADATA_CACHE_TIMEOUT", "") or 0
+)
+# When rows are created, updated or deleted, the cached footer aggregations of the grid
+# views supporting it are updated with the old and new values of the rows, instead of
+# being computed again over all the rows of the view by the next request.
+BASEROW_VIEW_INCREMENTAL_AGGREGATIONS_ENABLED = str_to_bool(
+    os.getenv("BASEROW_VIEW_INCREMENTAL_AGGREGATIONS_ENABLED", "true")
+)
 
 # Should contain the database connection name of the database where the user tables
 # are stored. This can be different than the default database because there are not
@@ -820,6 +878,11 @@ ROW_PAGE_SIZE_LIMIT = int(os.getenv("BASEROW_ROW_PAGE_SIZE_LIMIT", 200))
 BATCH_ROWS_SIZE_LIMIT = int(
     os.getenv("BATCH_ROWS_SIZE_LIMIT", 200)
 )  # How many rows can be modified at once.
+# The minimum number of rows created at once to insert them with the PostgreSQL COPY
+# command instead of an INSERT statement. Set to 0 to always use INSERT.
+BASEROW_ROW_COPY_INSERT_MIN_ROWS = int(
+    os.getenv("BASEROW_ROW_COPY_INSERT_MIN_ROWS", "") or 100
+)
 
 TRASH_PAGE_SIZE_LIMIT = 200  # How many trash entries can be requested at once.
 
@@ -1055,6 +1118,12 @@ BASEROW_WEBHOOKS_URL_CHECK_TIMEOUT_SECS = int(
 BASEROW_MAX_WEBHOOK_CALLS_IN_QUEUE_PER_WEBHOOK = (
     int(os.getenv("BASEROW_MAX_WEBHOOK_CALLS_IN_QUEUE_PER_WEBHOOK", "0")) or None
 )
+BASEROW_WEBHOOKS_MAX_EVENTS_PER_BATCH = int(
+    os.getenv("BASEROW_WEBHOOKS_MAX_EVENTS_PER_BATCH", "50")
+)
+BASEROW_WEBHOOKS_SUBSCRIPTIONS_CACHE_TIMEOUT = int(
+    os.getenv("BASEROW_WEBHOOKS_SUBSCRIPTIONS_CACHE_TIMEOUT", "") or 60 * 60
+)
 
 # ======== WARNING ========
 # Please read and understand everything at:
@@ -1126,6 +1195,11 @@ BASEROW_IMPORT_EXPORT_RESOURCE_REMOVAL_AFTER_DAYS = int(
 BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT = int(
     os.getenv("BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT", 0)
 )
+# When duplicating tables, databases or snapshots inside the same instance, copy the
+# rows with SQL statements instead of exporting and importing them again.
+BASEROW_DUPLICATE_ROWS_IN_DATABASE = str_to_bool(
+    os.getenv("BASEROW_DUPLICATE_ROWS_IN_DATABASE", "true")
+)
 
 PERMISSION_MANAGERS = [
     "view_ownership",
@@ -1207,6 +1281,20 @@ BASEROW_SYNC_TEMPLATES_TIME_LIMIT = int(
 APPEND_SLASH = False
 
 BASEROW_DISABLE_MODEL_CACHE = bool(os.getenv("BASEROW_DISABLE_MODEL_CACHE", ""))
+# The maximum number of generated table model classes that each worker process keeps
+# in memory. Setting this to 0 disables the process local model class cache.
+BASEROW_MODEL_CLASS_CACHE_SIZE = int(os.getenv("BASEROW_MODEL_CLASS_CACHE_SIZE", 256))
+# The maximum number of formula parse trees that each process keeps in memory, so
+# that formulas that are resolved repeatedly don't have to be parsed again.
+BASEROW_FORMULA_PARSE_TREE_CACHE_SIZE = int(
+    os.getenv("BASEROW_FORMULA_PARSE_TREE_CACHE_SIZE", 2048)
+)
+# The maximum number of generated row serializer classes that are kept in memory for
+# every table model class in the process local model class cache. Setting this to 0
+# disables the row serializer class cache.
+BASEROW_ROW_SERIALIZER_CLASS_CACHE_SIZE = int(
+    os.getenv("BASEROW_ROW_SERIALIZER_CLASS_CACHE_SIZE", 32)
+)
 BASEROW_NOWAIT_FOR_LOCKS = not bool(
     os.getenv("BASEROW_WAIT_INSTEAD_OF_409_CONFLICT_ERROR", False)
 )
@@ -1314,6 +1402,22 @@ BASEROW_OLLAMA_MODELS = os.getenv("BASEROW_OLLAMA_MODELS", "")
 BASEROW_OLLAMA_MODELS = (
     BASEROW_OLLAMA_MODELS.split(",") if BASEROW_OLLAMA_MODELS else []
 )
+# The maximum number of prompts of an AI field generation task that are sent to the
+# generative AI model at the same time.
+BASEROW_AI_FIELD_GENERATION_CONCURRENCY = int(
+    os.getenv("BASEROW_AI_FIELD_GENERATION_CONCURRENCY", "") or 4
+)
+# The maximum number of requests per second every worker process sends to each
+# generative AI provider when generating AI field values. 0 disables the limit.
+BASEROW_AI_FIELD_MAX_REQUESTS_PER_SECOND = float(
+    os.getenv("BASEROW_AI_FIELD_MAX_REQUESTS_PER_SECOND", "") or 0
+)
+# The number of seconds the output of an AI field prompt is cached, so that
+# identical prompts are not sent again. Prompts with files or with a temperature
+# above 0 are never cached. 0 disables the cache.
+BASEROW_AI_FIELD_PROMPT_CACHE_TIMEOUT = int(
+    os.getenv("BASEROW_AI_FIELD_PROMPT_CACHE_TIMEOUT", "") or 3600
+)
 
 BASEROW_PREVENT_POSTGRESQL_DATA_SYNC_CONNECTION_TO_DATABASE = str_to_bool(
     os.getenv("BASEROW_PREVENT_POSTGRESQL_DATA_SYNC_CONNECTION_TO_DATABASE", "true")
@@ -0,0 +1,23 @@
+from functools import wraps
+
+from django.db import transaction
+
+from baserow.contrib.builder.data_sources.handler import DataSourceHandler
+
+
+def atomic_unless_dispatched_concurrently(func):
+    """
+    Runs the decorated view in a transaction, unless the data sources can be
+    dispatched concurrently. The threads dispatching them use their own database
+    connection, so they can't be part of the transaction of the request.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if DataSourceHandler().concurrent_dispatch_enabled():
+            return func(*args, **kwargs)
+
+        with transaction.atomic():
+            return func(*args, **kwargs)
+
+    return wrapper
@@ -23,6 +23,9 @@ from baserow.api.utils import (
     validate_data,
     validate_data_custom_fields,
 )
+from baserow.contrib.builder.api.data_sources.decorators import (
+    atomic_unless_dispatched_concurrently,
+)
 from baserow.contrib.builder.api.data_sources.errors import (
     ERROR_DATA_DOES_NOT_EXIST,
     ERROR_DATA_SOURCE_CANNOT_USE_SERVICE_TYPE,
@@ -529,7 +532,7 @@ class DispatchDataSourcesView(APIView):
             ),
         },
     )
-    @transaction.atomic
+    @atomic_unless_dispatched_concurrently
     @map_exceptions(
         {
             PageDoesNotExist: ERROR_PAGE_DOES_NOT_EXIST,
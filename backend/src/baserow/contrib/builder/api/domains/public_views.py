@@ -14,6 +14,9 @@ from baserow.api.utils import (
     DiscriminatorCustomFieldsMappingSerializer,
     apply_exception_mapping,
 )
+from baserow.contrib.builder.api.data_sources.decorators import (
+    atomic_unless_dispatched_concurrently,
+)
 from baserow.contrib.builder.api.data_sources.errors import (
     ERROR_DATA_DOES_NOT_EXIST,
     ERROR_DATA_SOURCE_DOES_NOT_EXIST,
@@ -392,7 +395,7 @@ class PublicDispatchDataSourcesView(APIView):
             ),
         },
     )
-    @transaction.atomic
+    @atomic_unless_dispatched_concurrently
     @map_exceptions(
         {
             PageDoesNotExist: ERROR_PAGE_DOES_NOT_EXIST,
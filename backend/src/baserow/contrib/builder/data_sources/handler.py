@@ -1,7 +1,12 @@
-from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Union
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 from zipfile import ZipFile
 
+from django.conf import settings
 from django.core.files.storage import Storage
+from django.db import connection, connections
 from django.db.models import Q, QuerySet
 from django.db.utils import DatabaseError, IntegrityError
 
@@ -392,6 +397,14 @@ class DataSourceHandler:
 
         data_source.delete()
 
+    def concurrent_dispatch_enabled(self) -> bool:
+        """
+        Returns whether independent data sources can be dispatched concurrently,
+        which is only possible outside of a transaction.
+        """
+
+        return settings.BASEROW_BUILDER_DATA_SOURCE_DISPATCH_MAX_WORKERS > 1
+
     def dispatch_data_sources(
         self, data_sources, dispatch_context: BuilderDispatchContext
     ):
@@ -406,7 +419,26 @@ class DataSourceHandler:
         """
 
         data_sources_dispatch = {}
+
+        max_workers = settings.BASEROW_BUILDER_DATA_SOURCE_DISPATCH_MAX_WORKERS
+        # The other threads use their own database connection, so they can't see the
+        # changes of a transaction that is still open.
+        if self.concurrent_dispatch_enabled() and not connection.in_atomic_block:
+            independent_data_sources = [
+                data_source
+                for data_source in data_sources
+                if data_source.service_id
+                and not self._references_data_sources(data_source)
+            ]
+            if len(independent_data_sources) > 1:
+                data_sources_dispatch = self._dispatch_data_sources_concurrently(
+                    independent_data_sources, dispatch_context, max_workers
+                )
+
         for data_source in data_sources:
+            if data_source.id in data_sources_dispatch:
+                continue
+
             # Add the initial call to the call stack
             dispatch_context.add_call(data_source.id)
             try:
@@ -420,6 +452,84 @@ class DataSourceHandler:
 
         return data_sources_dispatch
 
+    def _references_data_sources(self, data_source: DataSource) -> bool:
+        """
+        Returns whether any formula of the data source or of its service uses the
+        data source data provider, in which case dispatching it can dispatch other
+        data sources. A literal containing the same text is a false positive, which
+        is fine because the data source is then just dispatched sequentially.
+        """
+
+        return any(
+            formula and "data_source." in str(formula)
+            for formula in data_source.formula_generator(data_source)
+        )
+
+    def _dispatch_data_sources_concurrently(
+        self,
+        data_sources: List[DataSource],
+        dispatch_context: BuilderDispatchContext,
+        max_workers: int,
+    ) -> Dict[int, Union[Any, Exception]]:
+        """
+        Dispatches the data sources in a thread pool. Every data source gets its own
+        copy of the dispatch context so that the call stacks used to detect
+        recursions don't interfere. The results are stored in the cache of the
+        original dispatch context afterwards, so that the data sources referencing
+        them don't dispatch them again.
+
+        :param data_sources: The data sources to dispatch. They must not reference
+            other data sources.
+        :param dispatch_context: The context used for the dispatch.
+        :param max_workers: The maximum number of threads.
+        :return: The result of dispatching the data sources mapped by data source ID.
+        """
+
+        # Evaluate the shared cached property once instead of once per thread.
+        dispatch_context.public_formula_fields
+
+        def dispatch(data_source):
+            data_source_dispatch_context = copy(dispatch_context)
+            data_source_dispatch_context.cache = {
+                **dispatch_context.cache,
+                "data_source_contents": {
+                    **dispatch_context.cache.get("data_source_contents", {})
+                },
+            }
+            data_source_dispatch_context.reset_call_stack()
+            data_source_dispatch_context.add_call(data_source.id)
+            try:
+                return self.dispatch_data_source(
+                    data_source, data_source_dispatch_context
+                )
+            except Exception as e:
+                return e
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(data_sources))
+        ) as executor:
+            futures = {
+                data_source.id: executor.submit(
+                    contextvars.copy_context().run, dispatch, data_source
+                )
+                for data_source in data_sources
+            }
+            data_sources_dispatch = {
+                data_source_id: future.result()
+                for data_source_id, future in futures.items()
+            }
+
+        data_source_contents = dispatch_context.cache.setdefault(
+            "data_source_contents", {}
+        )
+        for data_source_id, result in data_sources_dispatch.items():
+            if not isinstance(result, Exception):
+                data_source_contents[data_source_id] = result
+
+        return data_sources_dispatch
+
     def dispatch_data_source(
         self, data_source: DataSource, dispatch_context: BuilderDispatchContext
     ) -> Any:
@@ -77,11 +77,8 @@ from baserow.core.constants import (
     DATE_TIME_FORMAT,
     DATE_TIME_FORMAT_CHOICES,
 )
-from baserow.core.formula import (
-    BaserowFormulaSyntaxError,
-    get_parse_tree_for_formula,
-    resolve_formula,
-)
+from baserow.core.formula import BaserowFormulaSyntaxError, resolve_formula
+from baserow.core.formula.parser.parser import get_parse_tree_for_formula
 from baserow.core.formula.registries import formula_runtime_function_registry
 from baserow.core.formula.types import BaserowFormula
 from baserow.core.formula.validator import (
@@ -19,7 +19,10 @@ SEARCH_MODE_API_PARAM = OpenApiParameter(
         f"If the default `{SearchModes.MODE_FT_WITH_COUNT}` is used, then Postgres "
         f"full-text search is used. If `{SearchModes.MODE_COMPAT}` is "
         "provided then the search term will be exactly searched for including "
-        "whitespace on each cell. This is the Baserow legacy search behaviour."
+        "whitespace on each cell. This is the Baserow legacy search behaviour. "
+        f"If `{SearchModes.MODE_FT_WITH_ESTIMATED_COUNT}` is provided, then Postgres "
+        "full-text search is used, but for large tables the count of the response is "
+        "estimated by the database instead of counting all the matching rows."
     ),
 )
 
@@ -38,6 +41,18 @@ ONLY_COUNT_API_PARAM = OpenApiParameter(
     description="If provided only the count will be returned.",
 )
 
+ESTIMATE_COUNT_API_PARAM = OpenApiParameter(
+    name="estimate_count",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.BOOL,
+    description=(
+        "If provided together with `count`, and the view has no filters and no "
+        "search or adhoc filters are applied, the count estimated by the database is "
+        "returned for large tables instead of the exact count. This is much faster "
+        "for tables with millions of rows."
+    ),
+)
+
 
 def make_adhoc_filter_api_params(combine_filters=True, view_is_aggregating=False):
     """
@@ -220,6 +235,21 @@ PAGINATION_API_PARAMS = (
     ),
 )
 
+CURSOR_PAGINATION_API_PARAM = OpenApiParameter(
+    name="cursor",
+    location=OpenApiParameter.QUERY,
+    type=OpenApiTypes.STR,
+    description=(
+        "If provided, the rows are paginated by a cursor instead of a page or "
+        "offset. Provide an empty value to get the first page and then follow the "
+        "`next` URL in the response, which contains the cursor of the next page, until "
+        "it's `null`. The `size` parameter defines how many rows are returned per "
+        "page. Fetching a page takes the same amount of time no matter how deep it "
+        "is, and rows are not skipped or duplicated if the table changes in the "
+        "meantime. The response doesn't contain a count."
+    ),
+)
+
 INCLUDE_FIELDS_API_PARAM = OpenApiParameter(
     name="include_fields",
     location=OpenApiParameter.QUERY,
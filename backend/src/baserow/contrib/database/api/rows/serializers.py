@@ -1,5 +1,7 @@
+import threading
+from collections import OrderedDict
 from copy import deepcopy
-from typing import Dict, List
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple, Type
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
@@ -7,6 +9,8 @@ from django.db.models.base import ModelBase
 
 from loguru import logger
 from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
 
 from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.utils import get_serializer_class
@@ -25,6 +29,12 @@ class RowSerializer(serializers.ModelSerializer):
         extra_kwargs = {"id": {"read_only": True}, "order": {"read_only": True}}
 
 
+# Guards the `_row_serializer_classes` of the process local cached table models, which
+# map a key containing the arguments of `get_row_serializer_class` to the generated
+# serializer class.
+_row_serializer_classes_lock = threading.Lock()
+
+
 def serialize_rows_for_response(rows, model, user_field_names=False, many=True):
     return get_row_serializer_class(
         model,
@@ -53,7 +63,9 @@ def get_row_serializer_class(
     Generates a Django rest framework model serializer based on the available fields
     that belong to this model. For each table field, used to generate this serializer,
     a serializer field will be added via the `get_serializer_field` method of the field
-    type.
+    type. If the model comes from the process local model class cache and no
+    `field_kwargs` are provided, the generated serializers are kept on the model
+    class, so that they're reused as long as the model is.
 
     :param model: The model for which to generate a serializer.
     :type model: Model
@@ -86,6 +98,77 @@ def get_row_serializer_class(
     :rtype: ModelSerializer
     """
 
+    if field_ids is not None:
+        field_ids = frozenset(field_ids)
+    if field_names_to_include is not None:
+        field_names_to_include = frozenset(field_names_to_include)
+
+    cache_key = None
+    # Only the cached model classes have this attribute. The serializers of the
+    # models generated for a single call aren't cached because they would keep the
+    # model in memory.
+    serializer_classes: Optional[
+        "OrderedDict[Hashable, Type[serializers.Serializer]]"
+    ] = model.__dict__.get("_row_serializer_classes")
+    if (
+        not field_kwargs
+        and serializer_classes is not None
+        and settings.BASEROW_ROW_SERIALIZER_CLASS_CACHE_SIZE > 0
+    ):
+        # A new model class is generated every time the fields of the table or of
+        # the related tables change, so the cached serializer fields can never be
+        # based on outdated fields.
+        cache_key = (
+            base_class,
+            is_response,
+            field_ids,
+            field_names_to_include,
+            user_field_names,
+            include_id,
+            None if required_fields is None else tuple(required_fields),
+        )
+        with _row_serializer_classes_lock:
+            serializer_class = serializer_classes.get(cache_key)
+            if serializer_class is not None:
+                serializer_classes.move_to_end(cache_key)
+                return serializer_class
+
+    serializer_class = _get_row_serializer_class(
+        model,
+        base_class=base_class,
+        is_response=is_response,
+        field_ids=field_ids,
+        field_names_to_include=field_names_to_include,
+        user_field_names=user_field_names,
+        field_kwargs=field_kwargs,
+        include_id=include_id,
+        required_fields=required_fields,
+    )
+
+    if cache_key is not None:
+        with _row_serializer_classes_lock:
+            serializer_classes[cache_key] = serializer_class
+            serializer_classes.move_to_end(cache_key)
+            while (
+                len(serializer_classes)
+                > settings.BASEROW_ROW_SERIALIZER_CLASS_CACHE_SIZE
+            ):
+                serializer_classes.popitem(last=False)
+
+    return serializer_class
+
+
+def _get_row_serializer_class(
+    model,
+    base_class=None,
+    is_response=False,
+    field_ids=None,
+    field_names_to_include=None,
+    user_field_names=False,
+    field_kwargs=None,
+    include_id=False,
+    required_fields=None,
+):
     if not field_kwargs:
         field_kwargs = {}
 
@@ -144,6 +227,102 @@ def get_row_serializer_class(
     )
 
 
+class RowEncoder:
+    """
+    Converts rows to exactly the same JSON serializable dicts as the row serializer
+    class it's compiled from, without instantiating the serializer and all its
+    fields for every response. The cells of the fields whose type provides a
+    response value encoder are converted directly by it, instead of going through
+    the (nested) serializer field.
+    """
+
+    def __init__(self, serializer_class: Type[serializers.ModelSerializer]):
+        serializer = serializer_class()
+        field_objects_by_name = {
+            field_object["name"]: field_object
+            for field_object in serializer_class.Meta.model._field_objects.values()
+        }
+
+        self.cells: List[Tuple[str, Callable[[Any], Any], Callable[[Any], Any]]] = []
+        for serializer_field in serializer.fields.values():
+            if serializer_field.write_only:
+                continue
+
+            encode = serializer_field.to_representation
+            field_object = field_objects_by_name.get(serializer_field.source)
+            if field_object is not None:
+                encode = (
+                    field_object["type"].get_response_value_encoder(
+                        field_object["field"], serializer_field
+                    )
+                    or encode
+                )
+            self.cells.append(
+                (serializer_field.field_name, serializer_field.get_attribute, encode)
+            )
+
+    def encode(self, row) -> Dict[str, Any]:
+        data = {}
+        for name, get_attribute, encode in self.cells:
+            try:
+                value = get_attribute(row)
+            except SkipField:
+                continue
+
+            # Same as the serializer, `None` values are not encoded.
+            check_for_none = value.pk if isinstance(value, PKOnlyObject) else value
+            data[name] = None if check_for_none is None else encode(value)
+        return data
+
+    def encode_many(self, rows: Iterable) -> List[Dict[str, Any]]:
+        encode = self.encode
+        return [encode(row) for row in rows]
+
+
+def get_row_encoder(
+    serializer_class: Type[serializers.ModelSerializer],
+) -> Optional[RowEncoder]:
+    """
+    Returns the row encoder compiled from the provided row serializer class. It's
+    stored on the class, so that it's compiled only once for the serializer classes
+    cached by `get_row_serializer_class`. None is returned if the serializer can't
+    be compiled because it changes how the fields are represented.
+    """
+
+    row_encoder = serializer_class.__dict__.get("_row_encoder")
+    if row_encoder is None:
+        if (
+            serializer_class.to_representation
+            is not serializers.Serializer.to_representation
+            or not hasattr(serializer_class.Meta.model, "_field_objects")
+        ):
+            return None
+
+        row_encoder = RowEncoder(serializer_class)
+        serializer_class._row_encoder = row_encoder
+    return row_encoder
+
+
+def serialize_rows_with_encoder(
+    serializer_class: Type[serializers.ModelSerializer], rows: Iterable
+) -> List[Dict[str, Any]]:
+    """
+    Serializes the rows for a read response with the row encoder of the serializer
+    class, which produces the same data as `serializer_class(rows, many=True).data`
+    without the per cell overhead of the serializer.
+
+    :param serializer_class: A row serializer class generated by
+        `get_row_serializer_class`.
+    :param rows: The rows that must be serialized.
+    :return: The serialized rows.
+    """
+
+    row_encoder = get_row_encoder(serializer_class)
+    if row_encoder is None:
+        return serializer_class(rows, many=True).data
+    return row_encoder.encode_many(rows)
+
+
 def get_batch_row_serializer_class(row_serializer_class):
     class_name = "BatchRowSerializer"
 
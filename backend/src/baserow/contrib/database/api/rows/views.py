@@ -24,7 +24,7 @@ from baserow.api.exceptions import (
     QueryParameterValidationException,
     RequestBodyValidationException,
 )
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import KeysetPagination, PageNumberPagination
 from baserow.api.schemas import (
     CLIENT_SESSION_ID_SCHEMA_PARAMETER,
     CLIENT_UNDO_REDO_ACTION_GROUP_ID_SCHEMA_PARAMETER,
@@ -115,7 +115,11 @@ from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.handler import CoreHandler
 from baserow.core.trash.exceptions import CannotDeleteAlreadyDeletedItem
 
-from ..constants import ADHOC_FILTERS_API_PARAMS, SEARCH_MODE_API_PARAM
+from ..constants import (
+    ADHOC_FILTERS_API_PARAMS,
+    CURSOR_PAGINATION_API_PARAM,
+    SEARCH_MODE_API_PARAM,
+)
 from .example_serializers import example_pagination_row_serializer_class
 from .schemas import row_names_response_schema
 from .serializers import (
@@ -130,6 +134,7 @@ from .serializers import (
     get_example_batch_rows_serializer_class,
     get_example_row_serializer_class,
     get_row_serializer_class,
+    serialize_rows_with_encoder,
 )
 
 
@@ -158,6 +163,7 @@ class RowsView(APIView):
                 type=OpenApiTypes.INT,
                 description="Defines how many rows should be returned per page.",
             ),
+            CURSOR_PAGINATION_API_PARAM,
             OpenApiParameter(
                 name="search",
                 location=OpenApiParameter.QUERY,
@@ -283,6 +289,7 @@ class RowsView(APIView):
                     "ERROR_REQUEST_BODY_VALIDATION",
                     "ERROR_PAGE_SIZE_LIMIT",
                     "ERROR_INVALID_PAGE",
+                    "ERROR_INVALID_CURSOR",
                     "ERROR_ORDER_BY_FIELD_NOT_FOUND",
                     "ERROR_ORDER_BY_FIELD_NOT_POSSIBLE",
                     "ERROR_FILTER_FIELD_NOT_FOUND",
@@ -402,7 +409,12 @@ class RowsView(APIView):
         if order_by:
             queryset = queryset.order_by_fields_string(order_by, user_field_names)
 
-        paginator = PageNumberPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        if KeysetPagination.cursor_query_param in request.GET:
+            paginator = KeysetPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+        else:
+            paginator = PageNumberPagination(
+                limit_page_size=settings.ROW_PAGE_SIZE_LIMIT
+            )
         page = paginator.paginate_queryset(queryset, request, self)
         serializer_class = get_row_serializer_class(
             model,
@@ -412,11 +424,11 @@ class RowsView(APIView):
             user_field_names=user_field_names,
             field_kwargs=field_kwargs,
         )
-        serializer = serializer_class(page, many=True)
+        serialized_rows = serialize_rows_with_encoder(serializer_class, page)
 
         rows_loaded.send(sender=self, table=table)
 
-        return paginator.get_paginated_response(serializer.data)
+        return paginator.get_paginated_response(serialized_rows)
 
     @extend_schema(
         parameters=[
@@ -32,6 +32,7 @@ from baserow.contrib.database.api.rows.serializers import (
     get_example_row_metadata_field_serializer,
     get_example_row_serializer_class,
     get_row_serializer_class,
+    serialize_rows_with_encoder,
 )
 from baserow.contrib.database.api.views.errors import (
     ERROR_NO_AUTHORIZATION_TO_PUBLICLY_SHARED_VIEW,
@@ -237,9 +238,9 @@ class GalleryViewView(APIView):
         serializer_class = get_row_serializer_class(
             model, RowSerializer, is_response=True
         )
-        serializer = serializer_class(page, many=True)
+        serialized_rows = serialize_rows_with_encoder(serializer_class, page)
 
-        response = paginator.get_paginated_response(serializer.data)
+        response = paginator.get_paginated_response(serialized_rows)
 
         if field_options:
             context = {"fields": [o["field"] for o in model._field_objects.values()]}
@@ -481,9 +482,9 @@ class PublicGalleryViewRowsView(APIView):
         serializer_class = get_row_serializer_class(
             model, RowSerializer, is_response=True, field_ids=field_ids
         )
-        serializer = serializer_class(page, many=True)
+        serialized_rows = serialize_rows_with_encoder(serializer_class, page)
 
-        response = paginator.get_paginated_response(serializer.data)
+        response = paginator.get_paginated_response(serialized_rows)
 
         if field_options:
             context = {"field_options": publicly_visible_field_options}
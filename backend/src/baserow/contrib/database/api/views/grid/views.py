@@ -14,6 +14,7 @@ from baserow.api.decorators import (
     validate_query_parameters,
 )
 from baserow.api.errors import ERROR_USER_NOT_IN_GROUP
+from baserow.api.pagination import KeysetPagination
 from baserow.api.schemas import get_error_schema
 from baserow.api.search.serializers import SearchQueryParamSerializer
 from baserow.api.serializers import get_example_pagination_serializer_class
@@ -23,6 +24,8 @@ from baserow.contrib.database.api.constants import (
     ADHOC_FILTERS_API_PARAMS_WITH_AGGREGATION,
     ADHOC_FILTERS_API_PARAMS_WITH_AGGREGATION_NO_COMBINE,
     ADHOC_SORTING_API_PARAM,
+    CURSOR_PAGINATION_API_PARAM,
+    ESTIMATE_COUNT_API_PARAM,
     EXCLUDE_FIELDS_API_PARAM,
     INCLUDE_FIELDS_API_PARAM,
     ONLY_COUNT_API_PARAM,
@@ -42,6 +45,7 @@ from baserow.contrib.database.api.rows.serializers import (
     get_example_row_metadata_field_serializer,
     get_example_row_serializer_class,
     get_row_serializer_class,
+    serialize_rows_with_encoder,
 )
 from baserow.contrib.database.api.utils import get_include_exclude_field_ids
 from baserow.contrib.database.api.views.errors import (
@@ -136,7 +140,9 @@ class GridViewView(APIView):
                 ),
             ),
             ONLY_COUNT_API_PARAM,
+            ESTIMATE_COUNT_API_PARAM,
             *PAGINATION_API_PARAMS,
+            CURSOR_PAGINATION_API_PARAM,
             *ADHOC_FILTERS_API_PARAMS_NO_COMBINE,
             ADHOC_SORTING_API_PARAM,
             INCLUDE_FIELDS_API_PARAM,
@@ -248,11 +254,39 @@ class GridViewView(APIView):
         )
         model = queryset.model
 
+        # The count can only be cached if the queryset only depends on the view.
+        has_search = bool(query_params.get("search"))
+        use_count_cache = not adhoc_filters.has_any_filters and not has_search
+
         if "count" in request.GET:
-            return Response({"count": queryset.count()})
+            count = None
+            # A broad search in a large table can match millions of rows, so the
+            # count is estimated instead if the search mode allows it. The estimate
+            # is only returned here because the pages must be computed with the
+            # exact count.
+            if has_search:
+                count = view_handler.get_estimated_search_row_count(
+                    queryset, query_params.get("search_mode")
+                )
+            if count is None:
+                count = view_handler.get_view_row_count(
+                    view,
+                    queryset,
+                    use_cache=use_count_cache,
+                    estimate="estimate_count" in request.GET,
+                )
+            return Response({"count": count})
 
         response, page, _ = paginate_and_serialize_queryset(
-            queryset, request, field_ids
+            queryset,
+            request,
+            field_ids,
+            count=(
+                view_handler.get_view_row_count(view, queryset)
+                if use_count_cache
+                and KeysetPagination.cursor_query_param not in request.GET
+                else None
+            ),
         )
 
         if view_type.can_group_by and view.viewgroupby_set.all():
@@ -261,7 +295,10 @@ class GridViewView(APIView):
                 for group_by in view.viewgroupby_set.all()
             ]
             serialized_group_by_metadata = serialize_group_by_fields_metadata(
-                queryset, group_by_fields, page
+                queryset,
+                group_by_fields,
+                page,
+                view=view if use_count_cache else None,
             )
             response.data.update(group_by_metadata=serialized_group_by_metadata)
 
@@ -345,8 +382,7 @@ class GridViewView(APIView):
         serializer_class = get_row_serializer_class(
             model, RowSerializer, is_response=True
         )
-        serializer = serializer_class(results, many=True)
-        return Response(serializer.data)
+        return Response(serialize_rows_with_encoder(serializer_class, results))
 
 
 class GridViewFieldAggregationsView(APIView):
@@ -807,9 +843,13 @@ class PublicGridViewRowsView(APIView):
         ) = get_public_view_filtered_queryset(view, request, query_params)
         model = queryset.model
 
-        count = "count" in request.GET
-        if count:
-            return Response({"count": queryset.count()})
+        if "count" in request.GET:
+            count = None
+            if query_params.get("search"):
+                count = view_handler.get_estimated_search_row_count(
+                    queryset, query_params.get("search_mode")
+                )
+            return Response({"count": queryset.count() if count is None else count})
 
         response, page, _ = paginate_and_serialize_queryset(
             queryset, request, field_ids
@@ -5,14 +5,18 @@ from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.db.models.query import QuerySet
 
-from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from baserow.api.pagination import PageNumberPagination
+from baserow.api.pagination import (
+    KeysetPagination,
+    LimitOffsetPagination,
+    PageNumberPagination,
+)
 from baserow.contrib.database.api.rows.serializers import (
     RowSerializer,
     get_row_serializer_class,
+    serialize_rows_with_encoder,
 )
 from baserow.contrib.database.api.views.serializers import serialize_group_by_metadata
 from baserow.contrib.database.rows.registries import row_metadata_registry
@@ -142,13 +146,14 @@ def get_public_view_filtered_queryset(
 class PaginatedData(NamedTuple):
     response: Response
     page: QuerySet
-    paginator: Union[LimitOffsetPagination, PageNumberPagination]
+    paginator: Union[LimitOffsetPagination, PageNumberPagination, KeysetPagination]
 
 
 def paginate_and_serialize_queryset(
     queryset: QuerySet[GeneratedTableModel],
     request: Request,
     field_ids: Optional[Iterable[int]],
+    count: Optional[int] = None,
 ) -> PaginatedData:
     """
     Paginate and serialize the data for the provided queryset and view.
@@ -156,14 +161,18 @@ def paginate_and_serialize_queryset(
     :param queryset: The queryset to paginate and serialize.
     :param request: The request containing the pagination query parameters.
     :param field_ids: The (optional) field IDs to restrict the serialized data to.
+    :param count: The (optional) already known exact count of the queryset. If not
+        provided, the paginator will count the rows itself.
     :return: The paginated data containing the paginator, the page of results, and
         response containing the serialized data.
     """
 
-    if LimitOffsetPagination.limit_query_param in request.GET:
-        paginator = LimitOffsetPagination()
+    if KeysetPagination.cursor_query_param in request.GET:
+        paginator = KeysetPagination(limit_page_size=settings.ROW_PAGE_SIZE_LIMIT)
+    elif LimitOffsetPagination.limit_query_param in request.GET:
+        paginator = LimitOffsetPagination(count=count)
     else:
-        paginator = PageNumberPagination()
+        paginator = PageNumberPagination(count=count)
 
     page = paginator.paginate_queryset(queryset, request)
     serializer_class = get_row_serializer_class(
@@ -172,9 +181,9 @@ def paginate_and_serialize_queryset(
         is_response=True,
         field_ids=field_ids,
     )
-    serializer = serializer_class(page, many=True)
+    serialized_rows = serialize_rows_with_encoder(serializer_class, page)
 
-    response = paginator.get_paginated_response(serializer.data)
+    response = paginator.get_paginated_response(serialized_rows)
     return PaginatedData(response, page, paginator)
 
 
@@ -225,9 +234,10 @@ def serialize_group_by_fields_metadata(
     queryset: QuerySet[GeneratedTableModel],
     group_by_fields: List[Field],
     page: QuerySet[GeneratedTableModel],
+    view: Optional[View] = None,
 ):
     group_by_metadata = ViewHandler().get_group_by_metadata_in_rows(
-        group_by_fields, page, queryset
+        group_by_fields, page, queryset, view=view
     )
     serialized_group_by_metadata = serialize_group_by_metadata(group_by_metadata)
     return serialized_group_by_metadata
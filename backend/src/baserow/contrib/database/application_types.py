@@ -16,7 +16,15 @@ from django.urls import include, path
 from django.utils import translation
 from django.utils.translation import gettext as _
 
+from psycopg2 import sql
+
 from baserow.contrib.database.api.serializers import DatabaseSerializer
+from baserow.contrib.database.db.rows_copy import (
+    SOURCE_TABLE_ALIAS,
+    RowsCopyContext,
+    copy_relations_in_database,
+    copy_rows_in_database,
+)
 from baserow.contrib.database.db.schema import safe_django_schema_editor
 from baserow.contrib.database.fields.field_cache import FieldCache
 from baserow.contrib.database.fields.registries import field_type_registry
@@ -43,6 +51,10 @@ from .fields.utils import DeferredFieldImporter, DeferredForeignKeyUpdater
 from .search.handler import SearchHandler
 from .table.models import GeneratedTableModel, Table
 
+# The key of the serialized tables containing the original table to copy the rows from
+# when importing, instead of the serialized rows.
+COPY_ROWS_FROM_TABLE_KEY = "_copy_rows_from_table"
+
 
 @dataclass
 class ImportedFields:
@@ -102,12 +114,19 @@ class DatabaseApplicationType(ApplicationType):
         be imported via the `import_tables_serialized`.
         """
 
+        fields_per_table = {
+            table.id: [field.specific for field in table.field_set.all()]
+            for table in tables
+        }
+        rows_copied_in_database = self._can_copy_rows_in_database(
+            fields_per_table, import_export_config
+        )
+
         serialized_tables: List[Dict[str, Any]] = []
         for table in tables:
-            fields = table.field_set.all()
+            fields = fields_per_table[table.id]
             serialized_fields = []
-            for f in fields:
-                field = f.specific
+            for field in fields:
                 field_type = field_type_registry.get_by_model(field)
                 serialized_fields.append(field_type.export_serialized(field))
 
@@ -125,7 +144,7 @@ class DatabaseApplicationType(ApplicationType):
 
             serialized_rows = []
             row_count_limit = settings.BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT
-            if not import_export_config.only_structure:
+            if not import_export_config.only_structure and not rows_copied_in_database:
                 model = table.get_model(fields=fields, add_dependencies=False)
                 row_queryset = model.objects.all()[: row_count_limit or None]
                 if table.created_by_column_added:
@@ -173,9 +192,39 @@ class DatabaseApplicationType(ApplicationType):
                 )
                 if extra_data is not None:
                     structure.update(**extra_data)
+            if rows_copied_in_database:
+                # The rows are copied from this table during the import, which
+                # therefore only works as long as the table exists in this instance.
+                structure[COPY_ROWS_FROM_TABLE_KEY] = table
             serialized_tables.append(structure)
         return serialized_tables
 
+    def _can_copy_rows_in_database(
+        self,
+        fields_per_table: Dict[int, List[Field]],
+        import_export_config: ImportExportConfig,
+    ) -> bool:
+        """
+        Checks whether the rows of the exported tables can be copied inside the
+        database when they're imported, instead of being serialized. This is only
+        possible when the tables are duplicated in the same instance and if all the
+        field types support it.
+        """
+
+        if (
+            not settings.BASEROW_DUPLICATE_ROWS_IN_DATABASE
+            or not import_export_config.is_duplicate
+            or import_export_config.only_structure
+            or settings.BASEROW_IMPORT_EXPORT_TABLE_ROWS_COUNT_LIMIT
+        ):
+            return False
+
+        return all(
+            field_type_registry.get_by_model(field).can_copy_rows_in_database
+            for fields in fields_per_table.values()
+            for field in fields
+        )
+
     def export_serialized(
         self,
         database: Database,
@@ -521,6 +570,13 @@ class DatabaseApplicationType(ApplicationType):
             )
             progress.increment(state=IMPORT_SERIALIZED_IMPORTING)
 
+        # If the tables are duplicated in the same instance, the rows have not been
+        # serialized and are copied from the original tables inside the database.
+        if all(COPY_ROWS_FROM_TABLE_KEY in table for table in serialized_tables):
+            self._copy_table_rows_in_database(
+                serialized_tables, id_mapping, workspace_id_for_user_references
+            )
+
         # Now that everything is in place we can start filling the table with the rows
         # in an efficient matter by using the bulk_create functionality.
         self._import_table_rows(
@@ -686,6 +742,108 @@ class DatabaseApplicationType(ApplicationType):
         # total progress of this import.
         self._after_rows_imported(imported_fields, progress)
 
+    def _copy_table_rows_in_database(
+        self,
+        serialized_tables: List[Dict[str, Any]],
+        id_mapping: Dict[str, Any],
+        workspace_id_for_user_references: Optional[int],
+    ):
+        """
+        Copies the rows and the many to many relations of the original tables into
+        the imported tables with `INSERT ... SELECT` statements, so that the values
+        don't have to be loaded into memory. The relations are copied once all the
+        rows exist because they can reference rows of the other tables.
+
+        :param serialized_tables: The serialized tables containing the original table
+            to copy the rows from.
+        :param id_mapping: A mapping of the original ids to the new ids.
+        :param workspace_id_for_user_references: The workspace the users referenced by
+            the rows must be a member of.
+        """
+
+        context = RowsCopyContext(
+            id_mapping,
+            user_references_workspace_id=workspace_id_for_user_references,
+            collaborators_workspace_id=id_mapping.get("import_workspace_id", None),
+        )
+        relations_to_copy = []
+        already_copied_through_table_names = set()
+
+        for serialized_table in serialized_tables:
+            source_table = serialized_table[COPY_ROWS_FROM_TABLE_KEY]
+            source_model = source_table.get_model(add_dependencies=False)
+            target_model = serialized_table["_model"]
+            source_columns = {
+                model_field.column: model_field
+                for model_field in source_model._meta.concrete_fields
+            }
+            field_names = {
+                field_object["name"]
+                for field_object in target_model._field_objects.values()
+            }
+
+            column_expressions = {}
+            for model_field in target_model._meta.concrete_fields:
+                if model_field.name in field_names:
+                    continue
+                source_column = sql.Identifier(SOURCE_TABLE_ALIAS, model_field.column)
+                if model_field.column not in source_columns:
+                    if model_field.has_default():
+                        column_expressions[model_field.column] = sql.Literal(
+                            model_field.get_default()
+                        )
+                elif model_field.is_relation:
+                    # The only relations of the row itself are the users that created
+                    # and last modified it.
+                    column_expressions[
+                        model_field.column
+                    ] = context.workspace_user_or_null(
+                        source_column, workspace_id_for_user_references
+                    )
+                else:
+                    column_expressions[model_field.column] = source_column
+
+            for serialized_field in serialized_table["fields"]:
+                new_field_id = id_mapping["database_fields"][serialized_field["id"]]
+                field_object = target_model._field_objects[new_field_id]
+                field_type = field_object["type"]
+                target_field = target_model._meta.get_field(field_object["name"])
+                source_field = source_model._meta.get_field(
+                    f"field_{serialized_field['id']}"
+                )
+
+                if isinstance(target_field, models.ManyToManyField):
+                    through_table_name = (
+                        target_field.remote_field.through._meta.db_table
+                    )
+                    if through_table_name not in already_copied_through_table_names:
+                        already_copied_through_table_names.add(through_table_name)
+                        relations_to_copy.append(
+                            (source_field, target_field, field_object)
+                        )
+                    continue
+
+                column_expressions[
+                    target_field.column
+                ] = field_type.get_in_database_copy_expression(
+                    field_object["field"],
+                    sql.Identifier(SOURCE_TABLE_ALIAS, source_field.column),
+                    context,
+                )
+
+            copy_rows_in_database(source_model, target_model, column_expressions)
+
+        for source_field, target_field, field_object in relations_to_copy:
+            copy_relations_in_database(
+                source_field,
+                target_field,
+                partial(
+                    field_object["type"].get_in_database_copy_expression,
+                    field_object["field"],
+                    context=context,
+                ),
+            )
+
     def _import_serialized_fields_values_to_row(
         self,
         row_instance: GeneratedTableModel,
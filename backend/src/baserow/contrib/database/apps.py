@@ -908,6 +908,7 @@ class DatabaseConfig(AppConfig):
         # which need to be filled first.
         import baserow.contrib.database.data_sync.signals  # noqa: F403, F401
         import baserow.contrib.database.search.signals  # noqa: F403, F401
+        import baserow.contrib.database.webhooks.signals  # noqa: F403, F401
         import baserow.contrib.database.ws.signals  # noqa: F403, F401
 
         post_migrate.connect(safely_update_formula_versions, sender=self)
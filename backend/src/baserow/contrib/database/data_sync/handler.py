@@ -43,6 +43,12 @@ from .registries import data_sync_type_registry
 
 
 class DataSyncHandler:
+    sync_batch_size = 2000
+    """
+    The number of data sync rows that are created or updated at the same time when
+    syncing the table.
+    """
+
     def get_data_sync(
         self, data_sync_id: int, base_queryset: Optional[QuerySet] = None
     ) -> DataSync:
@@ -292,6 +298,8 @@ class DataSyncHandler:
 
             try:
                 self._do_sync_table(user, data_sync, progress_builder)
+                data_sync_type = data_sync_type_registry.get_by_model(data_sync)
+                data_sync_type.after_sync_table(user, data_sync)
             finally:
                 cache.delete(lock_key)
         # If calling `get_all_rows` fails with a `SyncError`, then it's an expected
@@ -342,59 +350,137 @@ class DataSyncHandler:
             synced_properties=flat_enabled_properties,
             data_sync_properties=all_properties,
         )
-        progress.increment(by=1)  # makes the total `1`
+        progress.increment(by=1)  # makes the total `2`
 
         model = data_sync.table.get_model()
         unique_primary_keys = [p.key for p in all_properties if p.unique_primary]
         # Fetch the data sync properties again because they could have been changed
         # after calling `set_data_sync_synced_properties`.
-        enabled_properties = DataSyncSyncedProperty.objects.filter(data_sync=data_sync)
+        enabled_properties = list(
+            DataSyncSyncedProperty.objects.filter(data_sync=data_sync)
+        )
         key_to_field_id = {p.key: f"field_{p.field_id}" for p in enabled_properties}
         key_to_property = {p.key: p for p in all_properties}
-        progress.increment(by=1)  # makes the total `2`
+        is_incremental_sync = data_sync_type.is_incremental_sync(data_sync)
+        progress.increment(by=1)  # makes the total `3`
 
+        # Only the unique primary values of the existing rows are loaded into memory,
+        # so that the rows can be matched with the data sync rows. The other cell
+        # values are fetched per batch when they need to be compared.
+        existing_row_ids = {}
+        row_ids_to_delete = []
         existing_rows_queryset = model.objects.all().values(
-            # There is no need to fetch the rows cell values from the row because we
-            # don't need them.
-            *["id"]
-            + list(key_to_field_id.values())
+            *["id"] + [key_to_field_id[key] for key in unique_primary_keys]
         )
-        progress.increment(by=6)  # makes the total `9`
-
-        existing_rows_in_table = {
-            tuple(row[key_to_field_id[key]] for key in unique_primary_keys): row
-            for row in existing_rows_queryset
+        for row in existing_rows_queryset.iterator(chunk_size=self.sync_batch_size):
+            unique_id = tuple(row[key_to_field_id[key]] for key in unique_primary_keys)
             # Unique primaries can't be empty. If they are, then they're left dangling
             # because the primary was removed. They will be deleted later.
-            if all(row[key_to_field_id[key]] for key in unique_primary_keys)
-        }
-        progress.increment(by=1)  # makes the total `10`
+            if all(unique_id):
+                existing_row_ids[unique_id] = row["id"]
+            else:
+                row_ids_to_delete.append(row["id"])
+        progress.increment(by=7)  # makes the total `10`
 
-        rows_of_data_sync = {
-            tuple(row[key] for key in unique_primary_keys): row
-            for row in data_sync_type.get_all_rows(
+        synced_ids = set()
+        has_changes = False
+        for batch in data_sync_type.get_rows_in_batches(
+            data_sync,
+            self.sync_batch_size,
+            progress_builder=progress.create_child_builder(
+                represents_progress=85  # makes the total `95`
+            ),
+        ):
+            has_changes |= self._sync_rows_batch(
+                user,
                 data_sync,
-                progress_builder=progress.create_child_builder(
-                    represents_progress=56  # makes the total `66`
-                ),
+                model,
+                batch,
+                enabled_properties,
+                unique_primary_keys,
+                key_to_field_id,
+                key_to_property,
+                existing_row_ids,
+                synced_ids,
+            )
+
+        # The rows that were not returned by the data sync don't exist anymore and
+        # must be deleted. An incremental sync only returns the changed rows, so this
+        # can only be determined if all the rows have been fetched.
+        if not is_incremental_sync:
+            row_ids_to_delete.extend(
+                row_id
+                for unique_id, row_id in existing_row_ids.items()
+                if unique_id not in synced_ids
+            )
+
+        if len(row_ids_to_delete) > 0:
+            has_changes = True
+            RowHandler().delete_rows(
+                user=user,
+                table=data_sync.table,
+                row_ids=row_ids_to_delete,
+                model=model,
+                send_realtime_update=False,
+                send_webhook_events=False,
+                # The rows should not be trashed
+                permanently_delete=True,
             )
-        }
+        progress.increment(by=5)  # makes the total `100`
+
+        if has_changes:
+            # No need to include this in the progress because it triggers a celery task.
+            SearchHandler.field_value_updated_or_created(data_sync.table)
+
+    def _sync_rows_batch(
+        self,
+        user,
+        data_sync,
+        model,
+        batch,
+        enabled_properties,
+        unique_primary_keys,
+        key_to_field_id,
+        key_to_property,
+        existing_row_ids,
+        synced_ids,
+    ) -> bool:
+        """
+        Creates the rows of the batch that don't exist in the table yet, and updates
+        the existing ones if their values have changed.
+
+        :return: Indicates whether any row has been created or updated.
+        """
+
+        rows_of_data_sync = {}
+        for row in batch:
+            unique_id = tuple(row[key] for key in unique_primary_keys)
+            # If the data sync returns the same row multiple times, then only the
+            # first one is used.
+            if unique_id not in synced_ids:
+                synced_ids.add(unique_id)
+                rows_of_data_sync[unique_id] = row
 
         rows_to_create = []
-        for new_id, data in rows_of_data_sync.items():
-            if new_id not in existing_rows_in_table:
+        row_id_to_new_record = {}
+        for unique_id, data in rows_of_data_sync.items():
+            if unique_id in existing_row_ids:
+                row_id_to_new_record[existing_row_ids[unique_id]] = data
+            else:
                 rows_to_create.append(
                     {
                         f"field_{property.field_id}": data[property.key]
                         for property in enabled_properties
                     }
                 )
-        progress.increment(by=1)  # makes the total `67`
 
         rows_to_update = []
-        for existing_id, existing_record in existing_rows_in_table.items():
-            if existing_id in rows_of_data_sync:
-                new_record_data = rows_of_data_sync[existing_id]
+        if len(row_id_to_new_record) > 0:
+            existing_rows_queryset = model.objects.filter(
+                id__in=row_id_to_new_record.keys()
+            ).values(*["id"] + list(key_to_field_id.values()))
+            for existing_record in existing_rows_queryset:
+                new_record_data = row_id_to_new_record[existing_record["id"]]
                 changed = False
                 for enabled_property in enabled_properties:
                     key = enabled_property.key
@@ -406,18 +492,6 @@ class DataSyncHandler:
                         changed = True
                 if changed:
                     rows_to_update.append(existing_record)
-        progress.increment(by=2)  # makes the total `69`
-
-        row_ids_to_delete = []
-        for existing_id in existing_rows_in_table.keys():
-            if existing_id is None or existing_id not in rows_of_data_sync:
-                row_ids_to_delete.append(existing_rows_in_table[existing_id]["id"])
-        # Loop over the dangling rows and delete those because they can't be identified
-        # anymore.
-        for row in existing_rows_queryset:
-            if any(not row[key_to_field_id[key]] for key in unique_primary_keys):
-                row_ids_to_delete.append(row["id"])
-        progress.increment(by=1)  # makes the total `70`
 
         if len(rows_to_create) > 0:
             RowHandler().create_rows(
@@ -430,7 +504,6 @@ class DataSyncHandler:
                 send_webhook_events=False,
                 skip_search_update=True,
             )
-        progress.increment(by=10)  # makes the total `80`
 
         if len(rows_to_update) > 0:
             RowHandler().update_rows(
@@ -442,28 +515,8 @@ class DataSyncHandler:
                 send_webhook_events=False,
                 skip_search_update=True,
             )
-        progress.increment(by=10)  # makes the total `90`
 
-        if len(row_ids_to_delete) > 0:
-            RowHandler().delete_rows(
-                user=user,
-                table=data_sync.table,
-                row_ids=row_ids_to_delete,
-                model=model,
-                send_realtime_update=False,
-                send_webhook_events=False,
-                # The rows should not be trashed
-                permanently_delete=True,
-            )
-        progress.increment(by=10)  # makes the total `100`
-
-        if (
-            len(rows_to_create) > 0
-            or len(rows_to_update) > 0
-            or len(row_ids_to_delete) > 0
-        ):
-            # No need to include this in the progress because it triggers a celery task.
-            SearchHandler.field_value_updated_or_created(data_sync.table)
+        return len(rows_to_create) > 0 or len(rows_to_update) > 0
 
     def set_data_sync_synced_properties(
         self,
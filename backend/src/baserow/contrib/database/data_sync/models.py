@@ -110,3 +110,17 @@ class PostgreSQLDataSync(DataSync):
             ("verify-full", "verify-full"),
         ),
     )
+    postgresql_incremental_column = models.CharField(
+        max_length=255,
+        blank=True,
+        default="",
+        help_text="If provided, only the rows where the value of this column is higher "
+        "than in the previous sync are fetched. Rows deleted in the source table are "
+        "not removed by such an incremental sync.",
+    )
+    postgresql_incremental_state = models.JSONField(
+        null=True,
+        default=None,
+        help_text="Private state of the previous sync needed to determine which rows "
+        "must be fetched in the next incremental sync.",
+    )
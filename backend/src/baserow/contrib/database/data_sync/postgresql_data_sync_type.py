@@ -1,5 +1,5 @@
 import contextlib
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from django.conf import settings
 from django.db import DEFAULT_DB_ALIAS
@@ -120,6 +120,7 @@ column_type_to_baserow_field_type = {
 class PostgreSQLDataSyncType(DataSyncType):
     type = "postgresql"
     model_class = PostgreSQLDataSync
+    fetch_batch_size = 2000
     allowed_fields = [
         "postgresql_host",
         "postgresql_username",
@@ -129,6 +130,7 @@ class PostgreSQLDataSyncType(DataSyncType):
         "postgresql_schema",
         "postgresql_table",
         "postgresql_sslmode",
+        "postgresql_incremental_column",
     ]
     request_serializer_field_names = [
         "postgresql_host",
@@ -139,6 +141,7 @@ class PostgreSQLDataSyncType(DataSyncType):
         "postgresql_schema",
         "postgresql_table",
         "postgresql_sslmode",
+        "postgresql_incremental_column",
     ]
     # The `postgresql_password` should not be included because it's a secret value that
     # must only be possible to set and not get.
@@ -150,10 +153,20 @@ class PostgreSQLDataSyncType(DataSyncType):
         "postgresql_schema",
         "postgresql_table",
         "postgresql_sslmode",
+        "postgresql_incremental_column",
     ]
 
     @contextlib.contextmanager
-    def _connection(self, instance):
+    def _connection(self, instance, cursor_name=None):
+        """
+        Opens a connection to the PostgreSQL database of the data sync and yields a
+        cursor.
+
+        :param instance: The data sync instance to connect for.
+        :param cursor_name: If provided, a named server-side cursor is returned. This
+            can be used to fetch the result of a query in chunks.
+        """
+
         cursor = None
         connection = None
 
@@ -179,7 +192,7 @@ class PostgreSQLDataSyncType(DataSyncType):
                 port=instance.postgresql_port,
                 sslmode=instance.postgresql_sslmode,
             )
-            cursor = connection.cursor()
+            cursor = connection.cursor(name=cursor_name)
             yield cursor
         except psycopg2.Error as e:
             raise SyncError(str(e))
@@ -263,37 +276,149 @@ class PostgreSQLDataSyncType(DataSyncType):
         instance,
         progress_builder: Optional[ChildProgressBuilder] = None,
     ) -> List[Dict]:
+        return [
+            row
+            for batch in self.get_rows_in_batches(
+                instance, self.fetch_batch_size, progress_builder=progress_builder
+            )
+            for row in batch
+        ]
+
+    def get_rows_in_batches(
+        self,
+        instance,
+        batch_size: int,
+        progress_builder: Optional[ChildProgressBuilder] = None,
+    ) -> Iterable[List[Dict]]:
+        """
+        Streams the rows of the source table ordered by the primary key using a
+        server-side cursor, so that only one batch of rows is in memory at the same
+        time. If the `postgresql_incremental_column` is set and the previous sync
+        state is still valid, only the rows where the value of that column is higher
+        than the high-water mark of the previous sync are fetched.
+        """
+
         schema_name = f"{instance.postgresql_schema}"
         table_name = f"{instance.postgresql_table}"
+        incremental_column = instance.postgresql_incremental_column
+        is_incremental_sync = self.is_incremental_sync(instance)
         properties = self.get_properties(instance)
         order_names = [p.key for p in properties if p.unique_primary]
         column_names = [p.key for p in properties]
+        table_identifier = sql.SQL("{}.{}").format(
+            sql.Identifier(schema_name), sql.Identifier(table_name)
+        )
 
+        conditions = []
+        params = []
         with self._connection(instance) as cursor:
-            count_query = sql.SQL("SELECT count(*) FROM {}.{}").format(
-                sql.Identifier(schema_name), sql.Identifier(table_name)
+            high_water_mark = None
+            if incremental_column:
+                # The high-water mark is determined before fetching the rows, so that
+                # rows changed while syncing are fetched again in the next sync.
+                max_query = sql.SQL("SELECT max({})::text FROM {}").format(
+                    sql.Identifier(incremental_column), table_identifier
+                )
+                cursor.execute(max_query)
+                high_water_mark = cursor.fetchone()[0]
+
+            if is_incremental_sync:
+                previous_high_water_mark = instance.postgresql_incremental_state[
+                    "high_water_mark"
+                ]
+                if high_water_mark is None:
+                    high_water_mark = previous_high_water_mark
+                conditions.append(
+                    sql.SQL("{} > %s AND {} <= %s").format(
+                        sql.Identifier(incremental_column),
+                        sql.Identifier(incremental_column),
+                    )
+                )
+                params.extend([previous_high_water_mark, high_water_mark])
+
+            where = (
+                sql.SQL(" WHERE ") + sql.SQL(" AND ").join(conditions)
+                if conditions
+                else sql.SQL("")
             )
-            cursor.execute(count_query)
+
+            count_query = sql.SQL("SELECT count(*) FROM {}{}").format(
+                table_identifier, where
+            )
+            cursor.execute(count_query, params)
             count = cursor.fetchone()[0]
 
+            # Because the rows are streamed, the limit is not needed when only the
+            # rows changed since the previous sync are fetched. A full sync, like the
+            # first one, is still limited, even if an incremental column is set.
             limit = settings.INITIAL_TABLE_DATA_LIMIT
-            if limit and count > settings.INITIAL_TABLE_DATA_LIMIT:
+            if not is_incremental_sync and limit and count > limit:
                 raise SyncError(f"The table can't contain more than {limit} records.")
 
-            select_query = sql.SQL("SELECT {} FROM {}.{} ORDER BY {}").format(
-                sql.SQL(", ").join(map(sql.Identifier, column_names)),
-                sql.Identifier(schema_name),
-                sql.Identifier(table_name),
-                sql.SQL(", ").join(map(sql.Identifier, order_names)),
-            )
-
-            cursor.execute(select_query)
-            records = cursor.fetchall()
-
-        return [
+        instance.postgresql_incremental_state_after_sync = (
             {
-                p.key: p.prepare_value(record[index])
-                for index, p in enumerate(properties)
+                "signature": self._get_incremental_signature(instance),
+                "high_water_mark": high_water_mark,
             }
-            for record in records
-        ]
+            if incremental_column
+            else None
+        )
+
+        progress = ChildProgressBuilder.build(progress_builder, child_total=count or 1)
+        select_query = sql.SQL("SELECT {} FROM {}{} ORDER BY {}").format(
+            sql.SQL(", ").join(map(sql.Identifier, column_names)),
+            table_identifier,
+            where,
+            sql.SQL(", ").join(map(sql.Identifier, order_names)),
+        )
+
+        with self._connection(instance, cursor_name="baserow_data_sync") as cursor:
+            cursor.execute(select_query, params)
+            while True:
+                records = cursor.fetchmany(batch_size)
+                if not records:
+                    break
+                yield [
+                    {
+                        p.key: p.prepare_value(record[index])
+                        for index, p in enumerate(properties)
+                    }
+                    for record in records
+                ]
+                progress.increment(by=len(records))
+
+        progress.set_progress(progress.total)
+
+    def _get_incremental_signature(self, instance) -> dict:
+        """
+        The rows can only be fetched incrementally if the source and the synced
+        properties didn't change since the previous sync. Otherwise, the rows that
+        are not fetched would have outdated or missing cell values.
+        """
+
+        return {
+            "host": instance.postgresql_host,
+            "port": instance.postgresql_port,
+            "database": instance.postgresql_database,
+            "schema": instance.postgresql_schema,
+            "table": instance.postgresql_table,
+            "column": instance.postgresql_incremental_column,
+            "properties": sorted(
+                instance.synced_properties.values_list("key", flat=True)
+            ),
+        }
+
+    def is_incremental_sync(self, instance) -> bool:
+        state = instance.postgresql_incremental_state
+        return bool(
+            instance.postgresql_incremental_column
+            and state
+            and state.get("high_water_mark") is not None
+            and state.get("signature") == self._get_incremental_signature(instance)
+        )
+
+    def after_sync_table(self, user, instance):
+        state = getattr(instance, "postgresql_incremental_state_after_sync", None)
+        if state != instance.postgresql_incremental_state:
+            instance.postgresql_incremental_state = state
+            instance.save(update_fields=("postgresql_incremental_state",))
@@ -19,7 +19,7 @@ from baserow.core.registry import (
     ModelRegistryMixin,
     Registry,
 )
-from baserow.core.utils import ChildProgressBuilder
+from baserow.core.utils import ChildProgressBuilder, grouper
 
 User = get_user_model()
 
@@ -165,6 +165,52 @@ class DataSyncType(
         :return: Iterable of all rows in the data sync source.
         """
 
+    def get_rows_in_batches(
+        self,
+        instance: "DataSync",
+        batch_size: int,
+        progress_builder: Optional[ChildProgressBuilder] = None,
+    ) -> Iterable[List[Dict]]:
+        """
+        Yields the raw rows of the data sync source in lists of at most `batch_size`
+        rows. The table is synced batch by batch, so a data sync type that can fetch
+        the rows incrementally, for example using a server-side cursor, can override
+        this method to avoid loading all the rows into memory. By default, the rows
+        returned by `get_all_rows` are grouped.
+
+        :param instance: The data sync instance of which the rows must be fetched.
+        :param batch_size: The maximum number of rows in one batch.
+        :param progress_builder: If provided will be used to build a child progress bar
+            and report on this methods progress to the parent of the progress_builder.
+        :raises SyncError: If something goes wrong, but don't want to fail hard and
+            expose the error via the API.
+        :return: Iterable of lists of rows in the data sync source.
+        """
+
+        rows = self.get_all_rows(instance, progress_builder=progress_builder)
+        for batch in grouper(batch_size, rows):
+            yield list(batch)
+
+    def is_incremental_sync(self, instance: "DataSync") -> bool:
+        """
+        Indicates whether the next sync only fetches the rows that have changed since
+        the previous sync. If `True`, the rows that are not returned by
+        `get_rows_in_batches` are left untouched instead of being deleted.
+
+        :param instance: The data sync instance that's going to be synced.
+        :return: `True` if the rows of the next sync are fetched incrementally.
+        """
+
+        return False
+
+    def after_sync_table(self, user: AbstractUser, instance: "DataSync"):
+        """
+        A hook that's called right after the table has successfully been synced.
+
+        :param user: The user on whose behalf the table is synced.
+        :param instance: The related data sync instance.
+        """
+
     def export_serialized(self, instance: "DataSync"):
         """
         Exports the data sync properties and the `allowed_fields` to the serialized
@@ -208,8 +254,12 @@ class DataSyncType(
         original_id = serialized_copy.pop("id")
         properties = serialized_copy.pop("properties", [])
         serialized_copy.pop("type")
+        # Fields that didn't exist when the data sync was exported fall back on their
+        # default value.
         type_properties = {
-            field: serialized_copy.get(field) for field in self.allowed_fields
+            field: serialized_copy[field]
+            for field in self.allowed_fields
+            if field in serialized_copy
         }
         data_sync = self.model_class.objects.create(
             table=table,
@@ -0,0 +1,187 @@
+import json
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Type
+
+from django.db import connection
+from django.db.models import ManyToManyField, Model
+
+from psycopg2 import sql
+
+from baserow.core.models import WorkspaceUser
+
+if TYPE_CHECKING:
+    from baserow.contrib.database.table.models import GeneratedTableModel
+
+SOURCE_TABLE_ALIAS = "source"
+
+
+class RowsCopyContext:
+    """
+    Provides the field types with what they need to compute the SQL expressions
+    copying their values when the rows of tables are duplicated inside the database,
+    instead of being exported and imported again.
+    """
+
+    def __init__(
+        self,
+        id_mapping: Dict[str, Any],
+        user_references_workspace_id: Optional[int] = None,
+        collaborators_workspace_id: Optional[int] = None,
+    ):
+        """
+        :param id_mapping: The mapping of the exported ids to the newly created ids.
+        :param user_references_workspace_id: The workspace the users referenced by
+            the rows, like the creator of the row, must be a member of.
+        :param collaborators_workspace_id: The workspace the users referenced by the
+            collaborator fields must be a member of.
+        """
+
+        self.id_mapping = id_mapping
+        self.user_references_workspace_id = user_references_workspace_id
+        self.collaborators_workspace_id = collaborators_workspace_id
+
+    def map_ids(
+        self, column: sql.Composable, mapping: Dict[int, int]
+    ) -> sql.Composable:
+        """
+        Returns an expression replacing the id stored in the column with the id it's
+        mapped to, or NULL if it's not in the mapping.
+
+        :param column: The column containing the ids to map.
+        :param mapping: The exported ids as keys and the new ids as values.
+        :return: The mapped id expression.
+        """
+
+        if not mapping:
+            return sql.SQL("NULL")
+
+        json_mapping = json.dumps({str(key): value for key, value in mapping.items()})
+        return sql.SQL("({mapping}::jsonb ->> {column}::text)::integer").format(
+            mapping=sql.Literal(json_mapping), column=column
+        )
+
+    def workspace_user_or_null(
+        self, column: sql.Composable, workspace_id: Optional[int]
+    ) -> sql.Composable:
+        """
+        Returns an expression keeping the user id stored in the column only if the
+        user is a member of the provided workspace.
+
+        :param column: The column containing the user ids.
+        :param workspace_id: The workspace the users must be a member of.
+        :return: The user id or NULL expression.
+        """
+
+        if workspace_id is None:
+            return sql.SQL("NULL")
+
+        return sql.SQL(
+            "CASE WHEN {column} IN "
+            "(SELECT user_id FROM {workspace_user_table} WHERE workspace_id = {id}) "
+            "THEN {column} END"
+        ).format(
+            column=column,
+            workspace_user_table=sql.Identifier(WorkspaceUser._meta.db_table),
+            id=sql.Literal(workspace_id),
+        )
+
+
+def get_through_columns(model_field: ManyToManyField) -> Tuple[str, str]:
+    """
+    Returns the columns of the through table of the many to many field containing
+    the id of the row and the id of the related object.
+    """
+
+    through_fields = model_field.remote_field.through._meta.get_fields()
+    return through_fields[1].column, through_fields[2].column
+
+
+def copy_rows_in_database(
+    source_model: Type["GeneratedTableModel"],
+    target_model: Type["GeneratedTableModel"],
+    column_expressions: Dict[str, sql.Composable],
+):
+    """
+    Inserts a copy of all the non trashed rows of the source table into the target
+    table with a single `INSERT ... SELECT` statement, so that the values never
+    leave the database.
+
+    :param source_model: The model of the table to copy the rows from.
+    :param target_model: The model of the table to insert the rows into.
+    :param column_expressions: The columns of the target table as keys and the
+        expressions selecting their value from the source row as values. The source
+        row is available as the `source` alias.
+    """
+
+    copy_sql = sql.SQL(
+        "INSERT INTO {target_table} ({columns}) "
+        "SELECT {expressions} FROM {source_table} AS {source} "
+        "WHERE NOT {source}.trashed"
+    ).format(
+        target_table=sql.Identifier(target_model._meta.db_table),
+        columns=sql.SQL(", ").join(map(sql.Identifier, column_expressions.keys())),
+        expressions=sql.SQL(", ").join(column_expressions.values()),
+        source_table=sql.Identifier(source_model._meta.db_table),
+        source=sql.Identifier(SOURCE_TABLE_ALIAS),
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(copy_sql)
+
+
+def copy_relations_in_database(
+    source_field: ManyToManyField,
+    target_field: ManyToManyField,
+    get_value_expression: Callable[[sql.Composable], sql.Composable],
+):
+    """
+    Inserts a copy of the relations of the source many to many field into the
+    through table of the target field with a single `INSERT ... SELECT` statement.
+    The relations are only copied if both the row and the related object exist and
+    are not trashed, and their order is preserved.
+
+    :param source_field: The many to many field to copy the relations from.
+    :param target_field: The many to many field to insert the relations into.
+    :param get_value_expression: Called with the column of the source through table
+        containing the id of the related object, must return the expression
+        selecting the id of the new related object.
+    """
+
+    source_row_column, source_value_column = get_through_columns(source_field)
+    target_row_column, target_value_column = get_through_columns(target_field)
+    target_through_fields = target_field.remote_field.through._meta.get_fields()
+    target_model = target_through_fields[1].remote_field.model
+    related_model = target_through_fields[2].remote_field.model
+
+    copy_sql = sql.SQL(
+        "INSERT INTO {target_through} ({target_row_column}, {target_value_column}) "
+        "SELECT row_id, value_id FROM ("
+        "SELECT {source}.id, {source}.{source_row_column} AS row_id, "
+        "{value_expression} AS value_id FROM {source_through} AS {source}"
+        ") AS relations "
+        "WHERE row_id IN ({target_ids}) AND value_id IN ({related_ids}) "
+        "ORDER BY id"
+    ).format(
+        target_through=sql.Identifier(target_field.remote_field.through._meta.db_table),
+        target_row_column=sql.Identifier(target_row_column),
+        target_value_column=sql.Identifier(target_value_column),
+        source=sql.Identifier(SOURCE_TABLE_ALIAS),
+        source_row_column=sql.Identifier(source_row_column),
+        value_expression=get_value_expression(
+            sql.Identifier(SOURCE_TABLE_ALIAS, source_value_column)
+        ),
+        source_through=sql.Identifier(source_field.remote_field.through._meta.db_table),
+        target_ids=_get_non_trashed_ids_query(target_model),
+        related_ids=_get_non_trashed_ids_query(related_model),
+    )
+
+    with connection.cursor() as cursor:
+        cursor.execute(copy_sql)
+
+
+def _get_non_trashed_ids_query(model: Type[Model]) -> sql.Composable:
+    query = sql.SQL("SELECT id FROM {table}").format(
+        table=sql.Identifier(model._meta.db_table)
+    )
+    if any(field.name == "trashed" for field in model._meta.concrete_fields):
+        query += sql.SQL(" WHERE NOT trashed")
+    return query
@@ -1,6 +1,6 @@
 import abc
 import time
-from typing import Any, Callable
+from typing import Any, Callable, Iterable, List
 
 from django.core.paginator import Paginator
 from django.db.models import QuerySet
@@ -11,6 +11,7 @@ from baserow.contrib.database.export.exceptions import ExportJobCanceledExceptio
 from baserow.contrib.database.table.models import FieldObject
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_type_registry
+from baserow.core.utils import grouper
 
 
 class FileWriter(abc.ABC):
@@ -59,11 +60,11 @@ class FileWriter(abc.ABC):
         return csv.DictWriter(self._file, headers, **kwargs)
 
 
-class PaginatedExportJobFileWriter(FileWriter):
+class ExportJobFileWriter(FileWriter, abc.ABC):
     """
-    Uses Django's built-in paginator to write querysets to files in a memory efficient
-    manner. Also updates the provided job as it progresses through any queryset writes
-    every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
+    Base class for the file writers used by export jobs. Updates the provided job as
+    it progresses through any queryset writes every
+    EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
     """
 
     EXPORT_JOB_UPDATE_FREQUENCY_SECONDS = 1
@@ -79,6 +80,49 @@ class PaginatedExportJobFileWriter(FileWriter):
     def write(self, value: str, encoding="utf-8"):
         self._file.write(value.encode(encoding))
 
+    def _check_and_update_job(self, current_row, total_rows, is_last_row=None):
+        """
+        Checks if enough time has passed and if so checks the state of the job and
+        updates its progress percentage.
+        Will raise a ExportJobCanceledException exception if when a check occurs
+        the job has been cancelled.
+
+        :param current_row: An int indicating the current row this export job has
+            exported upto
+        :param total_rows: An int of the total number of rows this job is exporting.
+        :param is_last_row: Indicates whether the current row is the last one. If not
+            provided, it's derived from the current and total rows.
+        """
+
+        current_time = time.perf_counter()
+        # We check only every so often as we don't need per row granular updates as the
+        # client is only polling every X seconds also.
+        enough_time_has_passed = (
+            current_time - self.last_check > self.EXPORT_JOB_UPDATE_FREQUENCY_SECONDS
+        )
+        if is_last_row is None:
+            is_last_row = current_row == total_rows
+        if enough_time_has_passed or is_last_row:
+            self.last_check = time.perf_counter()
+            self.job.refresh_from_db()
+            if self.job.is_cancelled_or_expired():
+                raise ExportJobCanceledException()
+            else:
+                # The total can be 0 if rows were created after it was counted.
+                progress = (
+                    100 if is_last_row else current_row / max(total_rows, 1) * 100
+                )
+                self.job.progress_percentage = min(progress, 100)
+                self.job.save()
+
+
+class PaginatedExportJobFileWriter(ExportJobFileWriter):
+    """
+    Uses Django's built-in paginator to write querysets to files in a memory efficient
+    manner. Also updates the provided job as it progresses through any queryset writes
+    every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS.
+    """
+
     def write_rows(self, queryset, write_row):
         """
         Writes the queryset to the file using the provided write_row callback.
@@ -103,33 +147,73 @@ class PaginatedExportJobFileWriter(FileWriter):
                 write_row(row, is_last_row)
                 self._check_and_update_job(i, paginator.count)
 
-    def _check_and_update_job(self, current_row, total_rows):
+
+class StreamingExportJobFileWriter(ExportJobFileWriter):
+    """
+    Streams the rows of querysets to the file using a server-side cursor. Contrary to
+    the `PaginatedExportJobFileWriter`, which executes an increasingly slower OFFSET
+    query for every page, the rows are fetched from one single query in chunks of
+    CHUNK_SIZE rows, so the export time grows linearly with the number of rows while
+    the memory usage stays flat.
+    """
+
+    CHUNK_SIZE = 2000
+
+    def write_rows(self, queryset, write_row):
         """
-        Checks if enough time has passed and if so checks the state of the job and
-        updates its progress percentage.
-        Will raise a ExportJobCanceledException exception if when a check occurs
-        the job has been cancelled.
+        Writes the queryset to the file using the provided write_row callback.
+        Every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS will check if the job has been
+        cancelled and if so stop writing to the file and will raise a
+        ExportJobCanceledException. Finally will also update job.progress_percentage
+        every EXPORT_JOB_UPDATE_FREQUENCY_SECONDS as it progresses through writing
+        the queryset.
 
-        :param current_row: An int indicating the current row this export job has
-            exported upto
-        :param total_rows: An int of the total number of rows this job is exporting.
+        :param queryset: The queryset to write to the file.
+        :param write_row: A callable function which takes each row from the queryset in
+            turn and writes to the file.
         """
 
-        current_time = time.perf_counter()
-        # We check only every so often as we don't need per row granular updates as the
-        # client is only polling every X seconds also.
-        enough_time_has_passed = (
-            current_time - self.last_check > self.EXPORT_JOB_UPDATE_FREQUENCY_SECONDS
-        )
-        is_last_row = current_row == total_rows
-        if enough_time_has_passed or is_last_row:
-            self.last_check = time.perf_counter()
-            self.job.refresh_from_db()
-            if self.job.is_cancelled_or_expired():
-                raise ExportJobCanceledException()
-            else:
-                self.job.progress_percentage = current_row / total_rows * 100
-                self.job.save()
+        self.last_check = time.perf_counter()
+        # The count is only used to report the progress. Whether a row is the last
+        # one is determined by looking ahead, so that the file stays valid if rows
+        # are created or deleted while exporting.
+        total_rows = queryset.count()
+        i = 0
+        previous_row = None
+        for chunk in self._iterate_in_chunks(queryset):
+            for row in chunk:
+                if previous_row is not None:
+                    i = i + 1
+                    write_row(previous_row, False)
+                    self._check_and_update_job(i, total_rows, is_last_row=False)
+                previous_row = row
+
+        if previous_row is not None:
+            i = i + 1
+            write_row(previous_row, True)
+            self._check_and_update_job(i, total_rows, is_last_row=True)
+
+    def _iterate_in_chunks(self, queryset) -> Iterable[List[Any]]:
+        """
+        Yields the rows of the queryset in lists of CHUNK_SIZE rows. The
+        `prefetch_related` lookups are applied to every chunk by Django, but the
+        multi field prefetches of the queryset are only executed when the whole
+        queryset is evaluated, so they're applied to every chunk here.
+
+        :param queryset: The queryset to iterate over.
+        :return: A generator yielding lists of rows.
+        """
+
+        multi_field_prefetches = []
+        if hasattr(queryset, "get_multi_field_prefetches"):
+            multi_field_prefetches = queryset.get_multi_field_prefetches()
+
+        rows = queryset.all().iterator(chunk_size=self.CHUNK_SIZE)
+        for chunk in grouper(self.CHUNK_SIZE, rows):
+            chunk = list(chunk)
+            for prefetch in multi_field_prefetches:
+                prefetch(queryset, chunk)
+            yield chunk
 
 
 class QuerysetSerializer(abc.ABC):
@@ -35,7 +35,7 @@ from .exceptions import (
     TableOnlyExportUnsupported,
     ViewUnsupportedForExporterType,
 )
-from .file_writer import PaginatedExportJobFileWriter
+from .file_writer import StreamingExportJobFileWriter
 from .registries import TableExporter, table_exporter_registry
 
 User = get_user_model()
@@ -295,7 +295,7 @@ def _open_file_and_run_export(job: ExportJob) -> ExportJob:
             serializer = queryset_serializer_class.for_view(job.view)
 
         serializer.write_to_file(
-            PaginatedExportJobFileWriter(file, job), **job.export_options
+            StreamingExportJobFileWriter(file, job), **job.export_options
         )
 
     return job
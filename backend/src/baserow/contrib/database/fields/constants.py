@@ -31,6 +31,10 @@ BASEROW_BOOLEAN_FIELD_FALSE_VALUES = [
     False
 ]
 
+# The value of a formula with this periodic update granularity can only change when
+# the UTC date changes, like formulas using `today()`.
+PERIODIC_UPDATE_GRANULARITY_DAY = "day"
+
 
 class DeleteFieldStrategyEnum(Enum):
     """
@@ -101,6 +101,7 @@ class PathBasedUpdateStatementCollector:
                     next_via_field_link.table,
                     next_via_field_link,
                     connection_is_broken=self.connection_is_broken,
+                    update_changes_only=self.update_changes_only,
                 )
             self.sub_paths[
                 next_link_db_column
@@ -118,7 +119,10 @@ class PathBasedUpdateStatementCollector:
         broken_name = f"broken_connection_to_table_{field.table_id}"
         if broken_name not in self.sub_paths:
             collector = PathBasedUpdateStatementCollector(
-                field.table, None, connection_is_broken=True
+                field.table,
+                None,
+                connection_is_broken=True,
+                update_changes_only=self.update_changes_only,
             )
             self.sub_paths[broken_name] = collector
         else:
@@ -213,11 +217,24 @@ class PathBasedUpdateStatementCollector:
                         }
                     ) | ~Q(**{field: expr})
 
-            updated_rows = (
-                qs.annotate(**annotations)
-                .filter(filters)
-                .update(**self.update_statements)
-            )
+            qs = qs.annotate(**annotations).filter(filters)
+            if (
+                self.update_changes_only
+                and starting_row_ids is None
+                and self.table.tsvectors_are_supported
+            ):
+                # Only the changed cells are updated, so they're logged to only
+                # update their search vectors instead of the entire columns.
+                searchable_field_ids = [
+                    field.id
+                    for field in model.get_fields_with_search_index()
+                    if field.db_column in self.update_statements
+                ]
+                updated_rows = SearchHandler.update_and_log_changed_cells(
+                    self.table, qs, self.update_statements, searchable_field_ids
+                )
+            else:
+                updated_rows = qs.update(**self.update_statements)
         return updated_rows
 
     def _include_rows_connected_to_deleted_m2m_relationships(
@@ -422,6 +439,9 @@ class FieldUpdateCollector:
                         SearchHandler.field_value_updated_or_created(
                             table,
                         )
+                    elif self.update_changes_only:
+                        # Only the changed cells have been updated and logged
+                        SearchHandler.logged_field_values_changed(table)
                     else:
                         # The cascade was for the entire field
                         SearchHandler.entire_field_values_changed_or_created(
@@ -3,7 +3,7 @@ import uuid
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from copy import deepcopy
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, datetime, time, timedelta, timezone
 from decimal import Decimal, InvalidOperation
 from itertools import cycle
 from random import randint, randrange, sample
@@ -51,6 +51,7 @@ from django.db.models.functions import Coalesce, RowNumber
 from dateutil import parser
 from dateutil.parser import ParserError
 from loguru import logger
+from psycopg2.sql import Composable
 from rest_framework import serializers
 
 from baserow.contrib.database.api.fields.errors import (
@@ -145,6 +146,7 @@ from baserow.core.utils import list_to_comma_separated_string
 
 from .constants import (
     BASEROW_BOOLEAN_FIELD_TRUE_VALUES,
+    PERIODIC_UPDATE_GRANULARITY_DAY,
     UPSERT_OPTION_DICT_KEY,
     DeleteFieldStrategyEnum,
 )
@@ -245,6 +247,7 @@ User = get_user_model()
 
 
 if TYPE_CHECKING:
+    from baserow.contrib.database.db.rows_copy import RowsCopyContext
     from baserow.contrib.database.table.models import FieldObject, GeneratedTableModel
 
 
@@ -277,6 +280,8 @@ class TextFieldMatchingRegexFieldType(FieldType, ABC):
           altering a column to being an email type.
     """
 
+    can_have_trigram_index = True
+
     @property
     @abstractmethod
     def regex(self):
@@ -307,6 +312,9 @@ class TextFieldMatchingRegexFieldType(FieldType, ABC):
             }
         )
 
+    def get_response_value_encoder(self, instance, serializer_field):
+        return str
+
     def get_model_field(self, instance, **kwargs):
         return models.TextField(
             default="",
@@ -397,6 +405,7 @@ class TextFieldType(CollationSortMixin, FieldType):
     allowed_fields = ["text_default"]
     serializer_field_names = ["text_default"]
     _can_group_by = True
+    can_have_trigram_index = True
 
     def get_serializer_field(self, instance, **kwargs):
         required = kwargs.get("required", False)
@@ -410,6 +419,9 @@ class TextFieldType(CollationSortMixin, FieldType):
             }
         )
 
+    def get_response_value_encoder(self, instance, serializer_field):
+        return str
+
     def get_model_field(self, instance, **kwargs):
         return models.TextField(
             default=instance.text_default or None, blank=True, null=True, **kwargs
@@ -442,6 +454,7 @@ class LongTextFieldType(CollationSortMixin, FieldType):
     model_class = LongTextField
     allowed_fields = ["long_text_enable_rich_text"]
     serializer_field_names = ["long_text_enable_rich_text"]
+    can_have_trigram_index = True
 
     def check_can_group_by(self, field: Field) -> bool:
         return not field.long_text_enable_rich_text
@@ -466,6 +479,9 @@ class LongTextFieldType(CollationSortMixin, FieldType):
             }
         )
 
+    def get_response_value_encoder(self, instance, serializer_field):
+        return str
+
     def serialize_metadata_for_row_history(
         self,
         field: Field,
@@ -936,6 +952,9 @@ class BooleanFieldType(FieldType):
     def get_serializer_field(self, instance, **kwargs):
         return BaserowBooleanField(**{"required": False, "default": False, **kwargs})
 
+    def get_response_value_encoder(self, instance, serializer_field):
+        return bool
+
     def get_model_field(self, instance, **kwargs):
         return models.BooleanField(default=False, **kwargs)
 
@@ -1434,6 +1453,15 @@ class CreatedOnLastModifiedBaseFieldType(ReadOnlyFieldType, DateFieldType):
 
         setattr(row, field_name, value)
 
+    def get_in_database_copy_expression(
+        self,
+        field: Field,
+        source_column: Composable,
+        context: "RowsCopyContext",
+    ) -> Composable:
+        # The column is always in sync with the source field of the row.
+        return source_column
+
     def random_value(self, instance, fake, cache):
         return getattr(instance, self.source_field_name)
 
@@ -1575,6 +1603,16 @@ class LastModifiedByFieldType(ReadOnlyFieldType):
         value = getattr(row, self.source_field_name)
         setattr(row, field_name, value)
 
+    def get_in_database_copy_expression(
+        self,
+        field: Field,
+        source_column: Composable,
+        context: "RowsCopyContext",
+    ) -> Composable:
+        return context.workspace_user_or_null(
+            source_column, context.user_references_workspace_id
+        )
+
     def get_internal_value_from_db(
         self, row: "GeneratedTableModel", field_name: str
     ) -> Any:
@@ -1782,6 +1820,16 @@ class CreatedByFieldType(ReadOnlyFieldType):
         value = getattr(row, self.source_field_name)
         setattr(row, field_name, value)
 
+    def get_in_database_copy_expression(
+        self,
+        field: Field,
+        source_column: Composable,
+        context: "RowsCopyContext",
+    ) -> Composable:
+        return context.workspace_user_or_null(
+            source_column, context.user_references_workspace_id
+        )
+
     def get_internal_value_from_db(
         self, row: "GeneratedTableModel", field_name: str
     ) -> Any:
@@ -2673,6 +2721,34 @@ class LinkRowFieldType(
             child=inner_serializer(), **{"required": False, **kwargs}
         )
 
+    def get_response_value_encoder(self, instance, serializer_field):
+        # The joined target fields of a `link_row_join` are serialized by the
+        # serializer.
+        if type(serializer_field.child) is not LinkRowValueSerializer:
+            return None
+
+        to_order_representation = serializer_field.child.fields[
+            "order"
+        ].to_representation
+
+        def encode(related_rows):
+            if isinstance(related_rows, models.manager.BaseManager):
+                related_rows = related_rows.all()
+            return [
+                {
+                    "id": related_row.id,
+                    "value": str(related_row),
+                    "order": (
+                        None
+                        if related_row.order is None
+                        else to_order_representation(related_row.order)
+                    ),
+                }
+                for related_row in related_rows
+            ]
+
+        return encode
+
     def get_serializer_help_text(self, instance):
         return (
             "This field accepts an `array` containing the ids or the names of the "
@@ -3777,6 +3853,14 @@ class SelectOptionBaseFieldType(FieldType):
     _can_group_by = True
     _db_column_fields = []
 
+    @staticmethod
+    def encode_select_option(option: SelectOption) -> Dict[str, Any]:
+        """
+        Returns the same value as the `SelectOptionSerializer` for the option.
+        """
+
+        return {"id": option.id, "value": option.value, "color": option.color}
+
     def before_create(
         self, table, primary, allowed_field_values, order, user, field_kwargs
     ):
@@ -3868,6 +3952,9 @@ class SingleSelectFieldType(CollationSortMixin, SelectOptionBaseFieldType):
             }
         )
 
+    def get_response_value_encoder(self, instance, serializer_field):
+        return self.encode_select_option
+
     def enhance_queryset(self, queryset, field, name, **kwargs):
         # It's important that this individual enhance_queryset method exists, even
         # though the enhance queryset in bulk exists, because the link_row field can
@@ -4159,6 +4246,16 @@ class SingleSelectFieldType(CollationSortMixin, SelectOptionBaseFieldType):
 
         setattr(row, field_name + "_id", select_option_mapping[value])
 
+    def get_in_database_copy_expression(
+        self,
+        field: Field,
+        source_column: Composable,
+        context: "RowsCopyContext",
+    ) -> Composable:
+        return context.map_ids(
+            source_column, context.id_mapping["database_field_select_options"]
+        )
+
     def to_baserow_formula_type(self, field):
         return BaserowFormulaSingleSelectType(nullable=True)
 
@@ -4230,6 +4327,16 @@ class MultipleSelectFieldType(
             }
         )
 
+    def get_response_value_encoder(self, instance, serializer_field):
+        encode_select_option = self.encode_select_option
+
+        def encode(options):
+            if isinstance(options, models.manager.BaseManager):
+                options = options.all()
+            return [encode_select_option(option) for option in options]
+
+        return encode
+
     def enhance_queryset(self, queryset, field, name, **kwargs):
         # It's important that this individual enhance_queryset method exists, even
         # though the enhance queryset in bulk exists, because the link_row field can
@@ -4496,6 +4603,16 @@ class MultipleSelectFieldType(
             if item in id_mapping["database_field_select_options"]
         ]
 
+    def get_in_database_copy_expression(
+        self,
+        field: Field,
+        source_column: Composable,
+        context: "RowsCopyContext",
+    ) -> Composable:
+        return context.map_ids(
+            source_column, context.id_mapping["database_field_select_options"]
+        )
+
     def contains_query(self, field_name, value, model_field, field):
         value = value.strip()
         # If an empty value has been provided we do not want to filter at all.
@@ -4917,6 +5034,26 @@ class FormulaFieldType(FormulaArrayFilterSupport, ReadOnlyFieldType):
             table__database__workspace__trashed=False,
         )
 
+    def get_fields_with_periodic_changes(
+        self, fields: QuerySet, since: Optional[datetime], until: datetime
+    ) -> QuerySet:
+        if since is None:
+            return fields
+
+        # The `today()` function is evaluated in UTC, so its value can only change
+        # when a UTC midnight has passed since the previous update.
+        next_midnight = datetime.combine(
+            since.astimezone(timezone.utc).date() + timedelta(days=1),
+            time.min,
+            tzinfo=timezone.utc,
+        )
+        if next_midnight <= until:
+            return fields
+
+        return fields.exclude(
+            periodic_update_granularity=PERIODIC_UPDATE_GRANULARITY_DAY
+        )
+
     def run_periodic_update(
         self,
         fields: List[Field],
@@ -6127,6 +6264,16 @@ class MultipleCollaboratorsFieldType(
 
         return through_objects
 
+    def get_in_database_copy_expression(
+        self,
+        field: Field,
+        source_column: Composable,
+        context: "RowsCopyContext",
+    ) -> Composable:
+        return context.workspace_user_or_null(
+            source_column, context.collaborators_workspace_id
+        )
+
     def random_value(self, instance, fake, cache):
         """
         Selects a random sublist out of the possible collaborators.
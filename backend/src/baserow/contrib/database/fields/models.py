@@ -201,6 +201,10 @@ class Field(
     def tsv_index_name(self):
         return f"tbl_tsv_{self.id}_idx"
 
+    @property
+    def trigram_index_name(self):
+        return f"tbl_trgm_{self.id}_idx"
+
     @property
     def model_attribute_name(self):
         """
@@ -597,6 +601,14 @@ class FormulaField(Field):
         default=False,
         help_text="Indicates if the field needs to be periodically updated.",
     )
+    periodic_update_granularity = models.CharField(
+        max_length=32,
+        null=True,
+        blank=True,
+        help_text="If set, the value of the periodically updated field can only "
+        "change when this unit of time changes, like `day`, so that it's not "
+        "updated more often than needed.",
+    )
     expand_formula_when_referenced = models.BooleanField(
         default=False,
         null=True,  # TODO zdm remove me in next release
@@ -1,7 +1,9 @@
+from datetime import datetime
 from functools import cached_property
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     List,
     NoReturn,
@@ -39,6 +41,7 @@ from django.db.models import (
 from django.db.models.fields.related import ForeignKey, ManyToManyField
 from django.db.models.functions import Cast, Coalesce
 
+from psycopg2 import sql
 from rest_framework import serializers
 
 from baserow.contrib.database.fields.constants import UPSERT_OPTION_DICT_KEY
@@ -73,6 +76,7 @@ from .models import Field, LinkRowField, SelectOption
 from .utils import DeferredForeignKeyUpdater
 
 if TYPE_CHECKING:
+    from baserow.contrib.database.db.rows_copy import RowsCopyContext
     from baserow.contrib.database.fields.dependencies.handler import FieldDependants
     from baserow.contrib.database.fields.dependencies.types import FieldDependencies
     from baserow.contrib.database.fields.dependencies.update_collector import (
@@ -154,6 +158,21 @@ class FieldType(
     the read-only UUID field type for example
     """
 
+    can_copy_rows_in_database = True
+    """
+    Indicates whether the values of this field type can be copied with an SQL
+    expression when the table is duplicated in the same instance, see
+    `get_in_database_copy_expression`. When False, the rows of the tables are
+    exported and imported again instead, which is a lot slower.
+    """
+
+    can_have_trigram_index = False
+    """
+    Indicates whether the `contains_query` of this field type compiles to a case
+    insensitive `LIKE` on the text of the column, which can be sped up by a `pg_trgm`
+    GIN index on `UPPER(column::text)` when a view filters on the field.
+    """
+
     field_data_is_derived_from_attrs = False
     """Set this to True if your field can completely reconstruct it's data just from
     it's field attributes. When set to False the fields data will be backed up when
@@ -492,6 +511,24 @@ class FieldType(
 
         return self.get_serializer_field(instance, **kwargs)
 
+    def get_response_value_encoder(
+        self, instance: Field, serializer_field: serializers.Field
+    ) -> Optional[Callable[[Any], Any]]:
+        """
+        Can return a function that directly converts a non null value of the field to
+        exactly the same JSON serializable value as the `to_representation` method of
+        the provided response serializer field. It's used to serialize rows for read
+        responses without going through the serializer machinery of every cell. If
+        None is returned, then the serializer field is used.
+
+        :param instance: The field instance for which to get the encoder.
+        :param serializer_field: The response serializer field of the field, as
+            returned by `get_response_serializer_field`.
+        :return: The function converting the value or None.
+        """
+
+        return None
+
     def get_serializer_help_text(self, instance):
         """
         If some additional information in the documentation related to the field's type
@@ -1144,6 +1181,29 @@ class FieldType(
 
         setattr(row, field_name, value)
 
+    def get_in_database_copy_expression(
+        self,
+        field: Field,
+        source_column: sql.Composable,
+        context: "RowsCopyContext",
+    ) -> sql.Composable:
+        """
+        Returns the SQL expression selecting the value of the duplicated field from
+        the source column when the rows of the table are copied inside the database.
+        It must result in the same value as `get_export_serialized_value` followed by
+        `set_import_serialized_value`. If the field uses a many to many relation,
+        the source column is the column of the through table containing the id of
+        the related object and the expression must select the id of the new related
+        object.
+
+        :param field: The duplicated field instance.
+        :param source_column: The column of the source table containing the value.
+        :param context: Provides the id mapping and helpers to build the expression.
+        :return: The expression selecting the value of the new column.
+        """
+
+        return source_column
+
     def get_export_value(
         self, value: Any, field_object: "FieldObject", rich_value: bool = False
     ) -> Any:
@@ -1272,6 +1332,22 @@ class FieldType(
 
         return None
 
+    def get_fields_with_periodic_changes(
+        self, fields: QuerySet, since: Optional[datetime], until: datetime
+    ) -> QuerySet:
+        """
+        Narrows down the fields needing a periodic update to the ones whose values
+        can have changed between the previous and the current periodic update. By
+        default, all the fields can have changed.
+
+        :param fields: The queryset of fields needing a periodic update.
+        :param since: The time of the previous successful periodic update, if any.
+        :param until: The time of the current periodic update.
+        :return: The queryset of fields that must be updated.
+        """
+
+        return fields
+
     def run_periodic_update(
         self,
         fields: List[Field],
@@ -1883,6 +1959,18 @@ class ReadOnlyFieldType(FieldType):
                 row, field_name, value, id_mapping, cache, files_zip, storage
             )
 
+    def get_in_database_copy_expression(
+        self,
+        field: Field,
+        source_column: sql.Composable,
+        context: "RowsCopyContext",
+    ) -> sql.Composable:
+        if self.keep_data_on_duplication:
+            return super().get_in_database_copy_expression(
+                field, source_column, context
+            )
+        return sql.SQL("NULL")
+
 
 class ManyToManyGroupByMixin:
     """
@@ -1,3 +1,4 @@
+import time
 import traceback
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
@@ -8,7 +9,7 @@ from django.db import transaction
 from django.db.models import Q, QuerySet
 
 from loguru import logger
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 
 from baserow.config.celery import app
 from baserow.contrib.database.fields.periodic_field_update_handler import (
@@ -21,6 +22,19 @@ from baserow.core.models import Workspace
 from baserow.core.telemetry.utils import add_baserow_trace_attrs, baserow_trace
 
 tracer = trace.get_tracer(__name__)
+meter = metrics.get_meter(__name__)
+periodic_field_update_duration_histogram = meter.create_histogram(
+    "baserow.periodic_field_update.duration",
+    unit="ms",
+    description="The time it took to periodically update the fields of a field type "
+    "in a workspace.",
+)
+periodic_field_update_skipped_fields_counter = meter.create_counter(
+    "baserow.periodic_field_update.skipped_fields",
+    unit="1",
+    description="The number of periodically updated fields that were skipped because "
+    "their values couldn't have changed since the previous update.",
+)
 
 
 def filter_distinct_workspace_ids_per_fields(
@@ -89,17 +103,37 @@ def _run_periodic_field_type_update_per_workspace(
     if qs is None:
         return
 
+    started = time.perf_counter()
+    # The fields that couldn't have changed since the last successful update are
+    # skipped. A failed update doesn't count, because it didn't store any value.
+    since = workspace.periodic_field_update_succeeded_at if update_now else None
     if update_now:
         workspace.refresh_now()
     add_baserow_trace_attrs(update_now=update_now, workspace_id=workspace.id)
 
     all_updated_fields = []
 
-    fields = qs.filter(
+    workspace_fields = qs.filter(
         table__database__workspace_id=workspace.id,
         table__trashed=False,
         table__database__trashed=False,
     )
+    # Only the fields whose values can have changed since the previous update are
+    # updated. The fields depending on them are still updated via their dependencies.
+    fields = field_type_instance.get_fields_with_periodic_changes(
+        workspace_fields, since, workspace.now
+    )
+    metric_attributes = {
+        "workspace_id": workspace.id,
+        "field_type": field_type_instance.type,
+    }
+    if fields is not workspace_fields:
+        skipped_fields_count = workspace_fields.count() - fields.count()
+        if skipped_fields_count:
+            periodic_field_update_skipped_fields_counter.add(
+                skipped_fields_count, metric_attributes
+            )
+
     # noinspection PyBroadException
     try:
         all_updated_fields = _run_periodic_field_update(
@@ -113,15 +147,31 @@ def _run_periodic_field_type_update_per_workspace(
             field_ids=field_ids,
             tb=tb,
         )
+    else:
+        if update_now:
+            workspace.periodic_field_update_succeeded_at = workspace.now
+            workspace.save(update_fields=["periodic_field_update_succeeded_at"])
 
     # After a successful periodic update of all fields, we would need to update the
     # search index for all of them in one function per table to avoid ending up in a
-    # deadlock because rows are updated simultaneously.
+    # deadlock because rows are updated simultaneously. Only the changed cells have
+    # been updated and logged, including the ones of dependant fields updated via
+    # link row fields, so only their search vectors are updated.
     fields_per_table = defaultdict(list)
     for field in all_updated_fields:
         fields_per_table[field.table_id].append(field)
     for _, fields in fields_per_table.items():
-        SearchHandler().entire_field_values_changed_or_created(fields[0].table, fields)
+        SearchHandler.logged_field_values_changed(fields[0].table)
+
+    # The periodically updated values can be filtered on, so the cached row counts of
+    # the views in those tables might not be valid anymore.
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    ViewHandler().clear_row_count_cache(fields_per_table.keys())
+
+    periodic_field_update_duration_histogram.record(
+        (time.perf_counter() - started) * 1000, metric_attributes
+    )
 
 
 @app.task(bind=True)
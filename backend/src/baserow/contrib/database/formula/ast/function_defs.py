@@ -55,6 +55,7 @@ from django.db.models.functions import (
 )
 from django.db.models.functions.datetime import TimezoneMixin
 
+from baserow.contrib.database.fields.constants import PERIODIC_UPDATE_GRANULARITY_DAY
 from baserow.contrib.database.fields.models import NUMBER_MAX_DECIMAL_PLACES
 from baserow.contrib.database.formula.ast.function import (
     BaserowFunctionDefinition,
@@ -1610,6 +1611,7 @@ class BaserowNow(ZeroArgumentBaserowFunction):
 class BaserowToday(ZeroArgumentBaserowFunction):
     type = "today"
     needs_periodic_update = True
+    periodic_update_granularity = PERIODIC_UPDATE_GRANULARITY_DAY
 
     def type_function(
         self, func_call: BaserowFunctionCall[UnTyped]
@@ -60,6 +60,24 @@ def _needs_periodic_update(expression: BaserowExpression):
     return any(getattr(f, "needs_periodic_update", False) for f in functions_used)
 
 
+def _get_periodic_update_granularity(expression: BaserowExpression) -> Optional[str]:
+    """
+    Returns the unit of time that must change for the value of the expression to
+    change, if all the periodically updated functions it uses share the same one.
+    If None, then the value can change at every periodic update.
+    """
+
+    functions_used: Set[BaserowFunctionDefinition] = expression.accept(
+        FunctionsUsedVisitor()
+    )
+    granularities = {
+        getattr(f, "periodic_update_granularity", None)
+        for f in functions_used
+        if getattr(f, "needs_periodic_update", False)
+    }
+    return granularities.pop() if len(granularities) == 1 else None
+
+
 def _expression_requires_refresh_after_insert(expression: BaserowExpression):
     """
     WARNING: This function is directly used by migration code. Please ensure
@@ -361,6 +379,9 @@ class FormulaHandler(metaclass=baserow_trace_methods(tracer)):
         formula_field.version = BASEROW_FORMULA_VERSION
 
         formula_field.needs_periodic_update = _needs_periodic_update(expression)
+        formula_field.periodic_update_granularity = _get_periodic_update_granularity(
+            expression
+        )
         formula_field.expand_formula_when_referenced = _has_lookup_expressions(
             expression
         )
@@ -131,6 +131,15 @@ FORMULA_MIGRATIONS = FormulaMigrations(
             recalculate_cell_values_for=NO_FORMULAS,
             force_recreate_formula_columns_for=all_aggregate_formulas,
         ),
+        FormulaMigration(
+            version=6,
+            # v6 calculates the periodic update granularity of the formulas that
+            # need to be periodically updated.
+            recalculate_formula_attributes_for=Q(needs_periodic_update=True),
+            recalculate_field_dependencies_for=NO_FORMULAS,
+            recalculate_cell_values_for=NO_FORMULAS,
+            force_recreate_formula_columns_for=NO_FORMULAS,
+        ),
     ]
 )
 # The current version is the last migration.
@@ -0,0 +1,31 @@
+# Generated by Django 5.0.9 on 2026-10-17 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0175_formviewfieldoptions_include_all_select_options_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="postgresqldatasync",
+            name="postgresql_incremental_column",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="If provided, only the rows where the value of this column is higher than in the previous sync are fetched. Rows deleted in the source table are not removed by such an incremental sync.",
+                max_length=255,
+            ),
+        ),
+        migrations.AddField(
+            model_name="postgresqldatasync",
+            name="postgresql_incremental_state",
+            field=models.JSONField(
+                default=None,
+                help_text="Private state of the previous sync needed to determine which rows must be fetched in the next incremental sync.",
+                null=True,
+            ),
+        ),
+    ]
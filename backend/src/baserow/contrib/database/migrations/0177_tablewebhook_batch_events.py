@@ -0,0 +1,20 @@
+# Generated by Django 5.0.9 on 2026-10-17 12:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0176_postgresqldatasync_incremental_sync"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tablewebhook",
+            name="batch_events",
+            field=models.BooleanField(
+                default=False,
+                help_text="Indicates whether the events waiting to be sent must be sent together in a single call with a batched payload.",
+            ),
+        ),
+    ]
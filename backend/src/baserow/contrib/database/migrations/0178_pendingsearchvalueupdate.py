@@ -0,0 +1,54 @@
+# Generated by Django 5.0.9 on 2026-10-17 14:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0177_tablewebhook_batch_events"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingSearchValueUpdate",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "row_id",
+                    models.PositiveIntegerField(
+                        help_text="The id of the row that the changed cell is in."
+                    ),
+                ),
+                (
+                    "field",
+                    models.ForeignKey(
+                        help_text="The field that the changed cell is in.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="database.field",
+                    ),
+                ),
+                (
+                    "table",
+                    models.ForeignKey(
+                        help_text="The table that the changed cell is in.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="database.table",
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("table", "row_id", "field")},
+            },
+        ),
+    ]
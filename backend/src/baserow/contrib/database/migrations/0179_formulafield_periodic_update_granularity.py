@@ -0,0 +1,24 @@
+# Generated by Django 5.0.9 on 2026-10-17 15:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("database", "0178_pendingsearchvalueupdate"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="formulafield",
+            name="periodic_update_granularity",
+            field=models.CharField(
+                blank=True,
+                help_text="If set, the value of the periodically updated field can "
+                "only change when this unit of time changes, like `day`, so that it's "
+                "not updated more often than needed.",
+                max_length=32,
+                null=True,
+            ),
+        ),
+    ]
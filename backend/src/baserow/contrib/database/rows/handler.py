@@ -17,6 +17,7 @@ from typing import (
     cast,
 )
 
+from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
 from django.db import connection, transaction
@@ -43,6 +44,7 @@ from baserow.contrib.database.table.operations import (
 from baserow.contrib.database.table.signals import table_updated
 from baserow.contrib.database.trash.models import TrashedRows
 from baserow.core.db import (
+    bulk_insert_with_copy,
     get_highest_order_of_queryset,
     get_unique_orders_before_item,
     recalculate_full_orders,
@@ -1084,6 +1086,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         send_webhook_events: bool = True,
         generate_error_report: bool = False,
         skip_search_update: bool = False,
+        skip_dependencies_update: bool = False,
     ) -> List[GeneratedTableModel]:
         """
         Creates new rows for a given table without checking permissions. It also calls
@@ -1104,6 +1107,10 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param skip_search_update: If you want to instead trigger the search handler
             cells update later on after many create_rows calls then set this to True
             but make sure you trigger it eventually.
+        :param skip_dependencies_update: If you want to update the dependant fields
+            of all the rows at once after many create_rows calls then set this to
+            True, but make sure to call `update_dependencies_of_rows_created` and
+            `ViewHandler().field_value_updated` eventually.
         :return: The created row instances.
 
         """
@@ -1153,9 +1160,16 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             # saved.
             instance._m2m_values = relations
 
-        inserted_rows = model.objects.bulk_create(
-            [row for (row, _) in rows_relationships]
-        )
+        inserted_rows = [row for (row, _) in rows_relationships]
+        use_copy = self._should_insert_with_copy(len(inserted_rows))
+        if not use_copy or not bulk_insert_with_copy(model, inserted_rows):
+            inserted_rows = model.objects.bulk_create(inserted_rows)
+        else:
+            from baserow.contrib.database.views.handler import ViewHandler
+
+            # Unlike the inserts made via the model, COPY doesn't invalidate the
+            # cached row counts.
+            ViewHandler().clear_row_count_cache(table.id)
         rows_created_counter.add(len(rows_relationships))
 
         many_to_many = defaultdict(list)
@@ -1176,17 +1190,21 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
         for field_name, values in many_to_many.items():
             through = getattr(model, field_name).through
-            through.objects.bulk_create(values)
+            if not use_copy or not bulk_insert_with_copy(
+                through, values, set_primary_keys=False
+            ):
+                through.objects.bulk_create(values)
 
-        _, dependant_fields = self.update_dependencies_of_rows_created(
-            model,
-            inserted_rows,
-        )
+        if not skip_dependencies_update:
+            _, dependant_fields = self.update_dependencies_of_rows_created(
+                model,
+                inserted_rows,
+            )
 
-        from baserow.contrib.database.views.handler import ViewHandler
+            from baserow.contrib.database.views.handler import ViewHandler
 
-        updated_fields = [o["field"] for o in model._field_objects.values()]
-        ViewHandler().field_value_updated(updated_fields + dependant_fields)
+            updated_fields = [o["field"] for o in model._field_objects.values()]
+            ViewHandler().field_value_updated(updated_fields + dependant_fields)
         if not skip_search_update:
             SearchHandler.field_value_updated_or_created(table)
 
@@ -1232,6 +1250,7 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         send_webhook_events: bool = True,
         generate_error_report: bool = False,
         skip_search_update: bool = False,
+        skip_dependencies_update: bool = False,
     ) -> List[GeneratedTableModel]:
         """
         Creates new rows for a given table if the user
@@ -1252,6 +1271,10 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
         :param skip_search_update: If you want to instead trigger the search handler
             cells update later on after many create_rows calls then set this to True
             but make sure you trigger it eventually.
+        :param skip_dependencies_update: If you want to update the dependant fields
+            of all the rows at once after many create_rows calls then set this to
+            True, but make sure to call `update_dependencies_of_rows_created` and
+            `ViewHandler().field_value_updated` eventually.
         :param values_already_prepared: Whether or not the values are already sanitized
             and validated for every field and can be used directly by the handler
             without any further check.
@@ -1277,8 +1300,18 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
             send_webhook_events,
             generate_error_report,
             skip_search_update,
+            skip_dependencies_update,
         )
 
+    def _should_insert_with_copy(self, row_count: int) -> bool:
+        """
+        Indicates whether the provided number of rows is large enough to be inserted
+        with the PostgreSQL `COPY` command instead of an `INSERT` statement.
+        """
+
+        min_rows = settings.BASEROW_ROW_COPY_INSERT_MIN_ROWS
+        return 0 < min_rows <= row_count
+
     def update_dependencies_of_rows_created(
         self,
         model: Type[GeneratedTableModel],
@@ -1478,9 +1511,11 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
                 generate_error_report=True,
                 send_realtime_update=False,
                 send_webhook_events=False,
-                # Don't trigger loads of search updates for every batch of rows we
-                # create but instead a single one for this entire table at the end.
+                # Don't trigger loads of search and dependencies updates for every
+                # batch of rows we create but instead a single one for this entire
+                # table at the end.
                 skip_search_update=True,
+                skip_dependencies_update=True,
             )
 
             for valid_index, field_errors in creation_report.items():
@@ -1493,6 +1528,16 @@ class RowHandler(metaclass=baserow_trace_methods(tracer)):
 
             all_created_rows += created_rows
 
+        if all_created_rows:
+            _, dependant_fields = self.update_dependencies_of_rows_created(
+                model, all_created_rows
+            )
+
+            from baserow.contrib.database.views.handler import ViewHandler
+
+            updated_fields = [o["field"] for o in model._field_objects.values()]
+            ViewHandler().field_value_updated(updated_fields + dependant_fields)
+
         SearchHandler.field_value_updated_or_created(table)
 
         return all_created_rows, report
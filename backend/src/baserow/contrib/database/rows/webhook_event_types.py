@@ -29,6 +29,12 @@ class RespectSendWebhookEvents:
 
 
 class RowsEventType(RespectSendWebhookEvents, WebhookEventType):
+    def listener_after_commit(self, **kwargs):
+        # The serialized rows only depend on whether the webhook uses the user field
+        # names, so they're shared by all the webhooks called for the same event
+        # instead of serializing the same rows for every webhook.
+        super().listener_after_commit(serialized_rows_cache={}, **kwargs)
+
     def get_row_serializer(self, webhook, model):
         return get_row_serializer_class(
             model,
@@ -37,9 +43,26 @@ class RowsEventType(RespectSendWebhookEvents, WebhookEventType):
             user_field_names=webhook.use_user_field_names,
         )
 
-    def get_payload(self, event_id, webhook, model, table, rows, **kwargs):
+    def get_payload(
+        self,
+        event_id,
+        webhook,
+        model,
+        table,
+        rows,
+        serialized_rows_cache=None,
+        **kwargs,
+    ):
         payload = super().get_payload(event_id, webhook, **kwargs)
-        payload["items"] = self.get_row_serializer(webhook, model)(rows, many=True).data
+        if serialized_rows_cache is None:
+            serialized_rows_cache = {}
+
+        cache_key = ("items", webhook.use_user_field_names)
+        if cache_key not in serialized_rows_cache:
+            serialized_rows_cache[cache_key] = self.get_row_serializer(webhook, model)(
+                rows, many=True
+            ).data
+        payload["items"] = serialized_rows_cache[cache_key]
         return payload
 
 
@@ -72,6 +95,7 @@ class RowsUpdatedEventType(RowsEventType):
         rows,
         before_return,
         updated_field_ids,
+        serialized_rows_cache=None,
         **kwargs,
     ):
         # Check if any related field has been set in the event_config of the
@@ -93,14 +117,26 @@ class RowsUpdatedEventType(RowsEventType):
                 if not updated_field_ids_in_trigger_field_ids:
                     raise SkipWebhookCall
 
-        payload = super().get_payload(event_id, webhook, model, table, rows, **kwargs)
+        if serialized_rows_cache is None:
+            serialized_rows_cache = {}
 
-        old_items = dict(before_return)[serialize_rows_values]
-
-        if webhook.use_user_field_names:
-            old_items = remap_serialized_rows_to_user_field_names(old_items, model)
+        payload = super().get_payload(
+            event_id,
+            webhook,
+            model,
+            table,
+            rows,
+            serialized_rows_cache=serialized_rows_cache,
+            **kwargs,
+        )
 
-        payload["old_items"] = old_items
+        cache_key = ("old_items", webhook.use_user_field_names)
+        if cache_key not in serialized_rows_cache:
+            old_items = dict(before_return)[serialize_rows_values]
+            if webhook.use_user_field_names:
+                old_items = remap_serialized_rows_to_user_field_names(old_items, model)
+            serialized_rows_cache[cache_key] = old_items
+        payload["old_items"] = serialized_rows_cache[cache_key]
 
         return payload
 
@@ -1,7 +1,9 @@
 import math
+import time
 import traceback
+from collections import defaultdict
 from enum import Enum
-from typing import TYPE_CHECKING, List, NamedTuple, Optional, Type
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Type
 
 from django.conf import settings
 from django.contrib.postgres.indexes import GinIndex
@@ -12,7 +14,7 @@ from django.db.models import Expression, Func, Q, QuerySet, TextField, Value
 from django.utils.encoding import force_str
 
 from loguru import logger
-from opentelemetry import trace
+from opentelemetry import metrics, trace
 from psycopg2 import sql
 from redis.exceptions import LockNotOwnedError
 
@@ -39,6 +41,19 @@ if TYPE_CHECKING:
     from baserow.contrib.database.table.models import GeneratedTableModel, Table
 
 tracer = trace.get_tracer(__name__)
+meter = metrics.get_meter(__name__)
+logged_tsvector_changes_counter = meter.create_counter(
+    "baserow.search.logged_tsvector_changes",
+    unit="1",
+    description="The number of logged cell changes whose search vector has been "
+    "updated, per table.",
+)
+logged_tsvector_changes_duration_histogram = meter.create_histogram(
+    "baserow.search.logged_tsvector_changes_duration",
+    unit="ms",
+    description="The time it took to update the search vectors of the logged cell "
+    "changes of a table.",
+)
 
 
 class SearchModes(str, Enum):
@@ -52,6 +67,12 @@ class SearchModes(str, Enum):
     # method is much faster as tables grow in size.
     MODE_FT_WITH_COUNT = "full-text-with-count"
 
+    # Use this mode to search rows using Postgres full-text search, like
+    # `MODE_FT_WITH_COUNT`, but return the `count` estimated by Postgres for
+    # large tables instead of counting all the matches. The first page of a broad
+    # search in a table with millions of rows is returned much faster.
+    MODE_FT_WITH_ESTIMATED_COUNT = "full-text-with-estimated-count"
+
 
 ALL_SEARCH_MODES = [getattr(mode, "value") for mode in SearchModes]
 
@@ -755,6 +776,185 @@ class SearchHandler(
             updated_fields=updated_fields,
         )
 
+    @classmethod
+    def update_and_log_changed_cells(
+        cls,
+        table: "Table",
+        queryset: QuerySet,
+        update_values: Dict[str, Optional[Expression]],
+        field_ids: List[int],
+    ) -> int:
+        """
+        Executes the update of the provided queryset and, in the same statement, logs
+        the updated cells of the provided fields as needing a search vector update.
+        This makes it possible to only update the tsvector of the cells that have
+        actually changed when the update is filtered on the changed values, instead
+        of updating the entire column. The logged changes are processed by
+        `update_logged_tsvector_changes`.
+
+        :param table: The table the queryset belongs to.
+        :param queryset: The queryset containing the rows to update.
+        :param update_values: The columns and expressions to update, like the kwargs
+            of `QuerySet.update`.
+        :param field_ids: The ids of the searchable fields updated by the statement.
+        :return: The number of updated rows.
+        """
+
+        from django.db.models.sql import UpdateQuery
+
+        from baserow.contrib.database.table.models import PendingSearchValueUpdate
+
+        if not field_ids:
+            return queryset.update(**update_values)
+
+        # The update query is compiled like `QuerySet.update` does, so that it can be
+        # wrapped in a statement returning the ids of the updated rows.
+        query = queryset.order_by().query.chain(UpdateQuery)
+        query.add_update_values(update_values)
+        query.annotations = {}
+        update_sql, update_params = query.get_compiler(queryset.db).as_sql()
+
+        quote_name = connection.ops.quote_name
+        log_table = quote_name(PendingSearchValueUpdate._meta.db_table)
+        returning_id = f"{quote_name(queryset.model._meta.db_table)}.{quote_name('id')}"
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"WITH updated_rows AS ({update_sql} RETURNING {returning_id}), "
+                "logged_changes AS ("
+                f"INSERT INTO {log_table} (table_id, row_id, field_id) "
+                "SELECT %s, updated_rows.id, updated_fields.id "
+                "FROM updated_rows CROSS JOIN unnest(%s::integer[]) "
+                "AS updated_fields(id) ON CONFLICT DO NOTHING"
+                ") SELECT count(*) FROM updated_rows",
+                [*update_params, table.id, list(field_ids)],
+            )
+            return cursor.fetchone()[0]
+
+    @classmethod
+    def logged_field_values_changed(cls, table: "Table"):
+        """
+        Called when cell changes have been logged using
+        `update_and_log_changed_cells`. Schedules the update of their search vectors
+        when the transaction commits.
+
+        :param table: The table the changes have been logged for.
+        """
+
+        if table.tsvectors_are_supported:
+            from baserow.contrib.database.search.tasks import (
+                async_update_logged_tsvector_changes,
+            )
+            from baserow.contrib.database.tasks import (
+                enqueue_task_on_commit_swallowing_any_exceptions,
+            )
+
+            enqueue_task_on_commit_swallowing_any_exceptions(
+                lambda: async_update_logged_tsvector_changes.delay(table.id)
+            )
+
+    @classmethod
+    def update_logged_tsvector_changes(cls, table: "Table") -> int:
+        """
+        Updates the tsvector columns of the cells logged as changed in the provided
+        table, in batches of `TSV_UPDATE_CHUNK_SIZE` changes. Only the tsvector
+        columns of the changed fields are recomputed per batch. A batch is claimed by
+        removing it from the log in a separate transaction before its tsvectors are
+        computed, so that a cell changing again in the meantime is logged again
+        instead of conflicting with the claimed change. The batches are locked with
+        `SKIP LOCKED`, so multiple workers can process the same table concurrently.
+
+        :param table: The table to update the logged changes of.
+        :return: The number of processed changes.
+        """
+
+        from baserow.contrib.database.table.models import PendingSearchValueUpdate
+
+        if not cls.full_text_enabled():
+            raise PostgresFullTextSearchDisabledException()
+
+        model = table.get_model()
+        fields_by_id = {
+            field.id: field for field in model.get_fields_with_search_index()
+        }
+
+        started = time.perf_counter()
+        total_processed = 0
+        while True:
+            with transaction.atomic():
+                changes = list(
+                    PendingSearchValueUpdate.objects.filter(table_id=table.id)
+                    .order_by("id")
+                    .select_for_update(skip_locked=True)
+                    .values_list("id", "field_id", "row_id")[
+                        : settings.TSV_UPDATE_CHUNK_SIZE
+                    ]
+                )
+                if not changes:
+                    break
+
+                PendingSearchValueUpdate.objects.filter(
+                    id__in=[change_id for change_id, _, _ in changes]
+                ).delete()
+
+            row_ids_per_field_id = defaultdict(list)
+            for _, field_id, row_id in changes:
+                row_ids_per_field_id[field_id].append(row_id)
+
+            try:
+                with transaction.atomic():
+                    cls._update_tsvectors_of_rows(
+                        model, fields_by_id, row_ids_per_field_id
+                    )
+            except Exception:
+                # Log the claimed changes again, so that they're not lost.
+                PendingSearchValueUpdate.objects.bulk_create(
+                    [
+                        PendingSearchValueUpdate(
+                            table_id=table.id, field_id=field_id, row_id=row_id
+                        )
+                        for _, field_id, row_id in changes
+                    ],
+                    ignore_conflicts=True,
+                )
+                raise
+            total_processed += len(changes)
+
+        duration = time.perf_counter() - started
+        logged_tsvector_changes_counter.add(total_processed, {"table_id": table.id})
+        logged_tsvector_changes_duration_histogram.record(
+            duration * 1000, {"table_id": table.id}
+        )
+        logger.info(
+            "Updated the tsvs of {changes_count} logged changes in table {table_id} "
+            "at {changes_per_second} changes per second.",
+            changes_count=total_processed,
+            table_id=table.id,
+            changes_per_second=round(total_processed / duration) if duration else 0,
+        )
+        return total_processed
+
+    @classmethod
+    def _update_tsvectors_of_rows(
+        cls,
+        model: Type["GeneratedTableModel"],
+        fields_by_id: Dict[int, "Field"],
+        row_ids_per_field_id: Dict[int, List[int]],
+    ):
+        for field_id, row_ids in row_ids_per_field_id.items():
+            # The field might not have a tsvector column (anymore), in which case the
+            # changes can just be discarded.
+            field = fields_by_id.get(field_id)
+            if field is None:
+                continue
+
+            qs = model.objects.filter(id__in=row_ids)
+            cv = cls._get_field_with_vector_from_field(field, qs)
+            try:
+                with transaction.atomic():
+                    qs.update(**{cv.field_tsv_db_column: cv.search_vector})
+            except Exception as e:
+                cls._search_error_handler(e)
+
     @classmethod
     def _trigger_async_tsvector_task_if_needed(
         cls,
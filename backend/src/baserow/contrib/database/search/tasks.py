@@ -40,3 +40,25 @@ def async_update_tsvector_columns(
         )
     except PostgresFullTextSearchDisabledException:
         logger.debug(f"Postgres full-text search is disabled.")
+
+
+@app.task(
+    queue="export",
+    time_limit=settings.CELERY_SEARCH_UPDATE_HARD_TIME_LIMIT,
+)
+def async_update_logged_tsvector_changes(table_id: int):
+    """
+    Responsible for asynchronously updating the `tsvector` columns of the cells
+    logged as changed in a table.
+
+    :param table_id: The ID of the table we'd like to update the tsvectors for.
+    """
+
+    from baserow.contrib.database.search.handler import SearchHandler
+    from baserow.contrib.database.table.handler import TableHandler
+
+    table = TableHandler().get_table(table_id)
+    try:
+        SearchHandler.update_logged_tsvector_changes(table)
+    except PostgresFullTextSearchDisabledException:
+        logger.debug(f"Postgres full-text search is disabled.")
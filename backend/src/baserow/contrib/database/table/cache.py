@@ -12,10 +12,18 @@ When we construct a model we:
 3. Check if the version in the cache matches the latest table version in the db.
 4. If they differ, re-query for all the fields and save them in the cache.
 5. If they are the same use the cached field attrs.
+
+On top of that every worker process keeps a bounded, in-memory LRU of the fully
+generated model classes. An entry stores the versions of the table and of every table
+that is connected to it via a related model, so it can be reused as long as none of
+those versions have changed. This skips both the Redis lookup and the construction of
+the model class for frequently used tables.
 """
+import threading
 import typing
 import uuid
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple, Type
 
 from django.conf import settings
 from django.core.cache import caches
@@ -28,6 +36,13 @@ if typing.TYPE_CHECKING:
 
 generated_models_cache = caches[settings.GENERATED_MODEL_CACHE_NAME]
 
+# Maps a model class cache key to a tuple containing the versions of all the tables
+# involved in the model and the generated model class itself.
+_local_model_classes: "OrderedDict[Hashable, Tuple[Dict[int, str], Type]]" = (
+    OrderedDict()
+)
+_local_model_classes_lock = threading.Lock()
+
 
 def table_model_cache_entry_key(table_id: int) -> str:
     return f"full_table_model_{table_id}_{BASEROW_VERSION}"
@@ -52,8 +67,66 @@ def set_cached_model_field_attrs(table: "Table", field_attrs: Dict[str, Any]):
     )
 
 
+def get_local_cached_model_class(
+    cache_key: Hashable,
+) -> Optional[Tuple[Dict[int, str], Type]]:
+    """
+    Returns the locally cached table versions and generated model class for the
+    provided key, or None if this worker doesn't have it in memory. The caller is
+    responsible for checking whether the versions are still up-to-date.
+    """
+
+    with _local_model_classes_lock:
+        entry = _local_model_classes.get(cache_key)
+        if entry is not None:
+            _local_model_classes.move_to_end(cache_key)
+        return entry
+
+
+def set_local_cached_model_class(
+    cache_key: Hashable, table_versions: Dict[int, str], model: Type
+):
+    """
+    Stores the generated model class in the process local LRU cache. The least
+    recently used entry is evicted if the cache grows beyond
+    `BASEROW_MODEL_CLASS_CACHE_SIZE` entries.
+
+    :param cache_key: The key uniquely identifying the model class.
+    :param table_versions: A mapping of the id to the version of every table that is
+        part of the generated model, including the related models.
+    :param model: The generated model class.
+    """
+
+    max_size = settings.BASEROW_MODEL_CLASS_CACHE_SIZE
+    if max_size <= 0:
+        return
+
+    with _local_model_classes_lock:
+        _local_model_classes[cache_key] = (table_versions, model)
+        _local_model_classes.move_to_end(cache_key)
+        while len(_local_model_classes) > max_size:
+            _local_model_classes.popitem(last=False)
+
+
+def invalidate_local_cached_model_classes(table_id: Optional[int] = None):
+    """
+    Removes every locally cached model class that involves the provided table, or all
+    of them if no table id is provided.
+    """
+
+    with _local_model_classes_lock:
+        if table_id is None:
+            _local_model_classes.clear()
+            return
+
+        for cache_key, (table_versions, _) in list(_local_model_classes.items()):
+            if table_id in table_versions:
+                del _local_model_classes[cache_key]
+
+
 def clear_generated_model_cache():
     print("Clearing Baserow's internal generated model cache...")
+    invalidate_local_cached_model_classes()
     if hasattr(generated_models_cache, "delete_pattern"):
         generated_models_cache.delete_pattern("full_table_model_*")
     elif settings.TESTS:
@@ -70,6 +143,8 @@ def invalidate_table_in_model_cache(table_id: int):
     if settings.BASEROW_DISABLE_MODEL_CACHE:
         return None
 
+    invalidate_local_cached_model_classes(table_id)
+
     new_version = str(uuid.uuid4())
     # Make sure to invalidate ourselves and any directly connected tables.
     from baserow.contrib.database.table.models import Table
@@ -1,7 +1,8 @@
+import copy
 import itertools
 import re
 import uuid
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from types import MethodType
 from typing import Generator, Iterable, List, Optional, Type, TypedDict
 
@@ -40,7 +41,9 @@ from baserow.contrib.database.fields.utils import get_field_id_from_field_key
 from baserow.contrib.database.search.handler import SearchHandler, SearchModes
 from baserow.contrib.database.table.cache import (
     get_cached_model_field_attrs,
+    get_local_cached_model_class,
     set_cached_model_field_attrs,
+    set_local_cached_model_class,
 )
 from baserow.contrib.database.table.constants import (
     CREATED_BY_COLUMN_NAME,
@@ -92,7 +95,49 @@ def get_row_needs_background_update_index(table):
     )
 
 
+def _clear_row_count_cache(model: Type["GeneratedTableModel"]):
+    """
+    Invalidates the cached row counts of the views of the table. Called by all the
+    writes made via the generated model, so that rows changed outside of the
+    `RowHandler` don't leave stale counts behind.
+    """
+
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    ViewHandler().clear_row_count_cache(model.baserow_table_id)
+
+
 class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
+    def update(self, **kwargs):
+        rows = super().update(**kwargs)
+        _clear_row_count_cache(self.model)
+        return rows
+
+    update.alters_data = True
+
+    def _update(self, values):
+        rows = super()._update(values)
+        _clear_row_count_cache(self.model)
+        return rows
+
+    _update.alters_data = True
+    _update.queryset_only = False
+
+    def delete(self):
+        result = super().delete()
+        _clear_row_count_cache(self.model)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+    def _raw_delete(self, using):
+        rows = super()._raw_delete(using)
+        _clear_row_count_cache(self.model)
+        return rows
+
+    _raw_delete.alters_data = True
+
     def _insert(self, objs, fields, *args, **kwargs):
         """
         We never want to include TSVector fields when inserting rows, we manage them
@@ -108,7 +153,9 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
                     insertable_fields.append(f)
         else:
             insertable_fields = None
-        return super()._insert(objs, insertable_fields, *args, **kwargs)
+        result = super()._insert(objs, insertable_fields, *args, **kwargs)
+        _clear_row_count_cache(self.model)
+        return result
 
     def pg_search(
         self,
@@ -206,8 +253,9 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
             filtered by the search term. Other fields not in the iterable will be
             ignored and not be filtered.
         :param search_mode: In `MODE_COMPAT` we will use the old search method, using
-            the LIKE operator on each column. In `MODE_FT_WITH_COUNT`  we will switch
-            to using Postgres full-text search.
+            the LIKE operator on each column. In `MODE_FT_WITH_COUNT` and
+            `MODE_FT_WITH_ESTIMATED_COUNT` we will switch to using Postgres
+            full-text search.
         :return: The queryset containing the search queries.
         :rtype: QuerySet
         """
@@ -217,7 +265,10 @@ class TableModelQuerySet(MultiFieldPrefetchQuerysetMixin, models.QuerySet):
 
         # If we are searching with Postgres full text search (whether with
         # or without a COUNT)...
-        if search_mode == SearchModes.MODE_FT_WITH_COUNT:
+        if search_mode in (
+            SearchModes.MODE_FT_WITH_COUNT,
+            SearchModes.MODE_FT_WITH_ESTIMATED_COUNT,
+        ):
             # If `USE_PG_FULLTEXT_SEARCH` is enabled, then use
             # the Postgres full-text search functionality instead.
             if self.model.baserow_table.tsvectors_are_supported:
@@ -566,6 +617,11 @@ class GeneratedTableModel(HierarchicalModelMixin, models.Model):
             base_qs, using, pk_val, values, update_fields, forced_update
         )
 
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        _clear_row_count_cache(type(self))
+        return result
+
     @classmethod
     def get_parent(cls):
         return cls.baserow_table
@@ -1018,6 +1074,29 @@ class Table(
         :rtype: Model
         """
 
+        # The fully generated model class can only be reused if it's the complete,
+        # unmanaged model that isn't generated as part of another model.
+        use_model_class_cache = (
+            use_cache
+            and not fields
+            and field_ids is None
+            and field_names is None
+            and add_dependencies is True
+            and attribute_names is False
+            and manytomany_models is None
+            and app_label is None
+            and managed is False
+            and force_add_tsvectors is False
+            and not settings.BASEROW_DISABLE_MODEL_CACHE
+            and settings.BASEROW_MODEL_CLASS_CACHE_SIZE > 0
+        )
+
+        if use_model_class_cache:
+            model_class_cache_key = self._get_model_class_cache_key()
+            model = self._get_local_cached_model_class(model_class_cache_key)
+            if model is not None:
+                return model
+
         if app_label is None:
             # Generate a unique app_label to make the generation of the model thread
             # safe. Related fields generate pending operations in the `apps`
@@ -1097,7 +1176,10 @@ class Table(
         )
 
         if use_cache:
-            self.refresh_from_db(fields=["version"])
+            # The version has already been refreshed while checking the process local
+            # model class cache.
+            if not use_model_class_cache:
+                self.refresh_from_db(fields=["version"])
             field_attrs = get_cached_model_field_attrs(self)
         else:
             field_attrs = None
@@ -1160,6 +1242,14 @@ class Table(
 
         attrs.update(**field_attrs)
 
+        if use_model_class_cache:
+            # The cached model class is shared by all the requests of this worker, so
+            # it gets its own copy of the table instead of the one of this request.
+            attrs["baserow_table"] = copy.copy(self)
+            # The row serializer classes generated for the model are kept on the
+            # model class itself, so that they're discarded together with it.
+            attrs["_row_serializer_classes"] = OrderedDict()
+
         # Create the model class.
         model = type(
             str(model_name),
@@ -1177,8 +1267,76 @@ class Table(
         if not manytomany_models:
             self._after_model_generation(attrs, model)
 
+        if use_model_class_cache:
+            set_local_cached_model_class(
+                model_class_cache_key, self._get_model_table_versions(model), model
+            )
+
+        return model
+
+    def _get_model_class_cache_key(self):
+        """
+        The flags are part of the key because they change the columns of the
+        generated model without changing the version of the table.
+        """
+
+        return (
+            self.id,
+            self.needs_background_update_column_added,
+            self.created_by_column_added,
+            self.last_modified_by_column_added,
+        )
+
+    def _get_local_cached_model_class(
+        self, cache_key
+    ) -> Optional[Type["GeneratedTableModel"]]:
+        """
+        Refreshes the version of this table and of all the tables related to the
+        locally cached model class in a single query. The cached model class is only
+        returned if none of them have changed since it was generated, and if this
+        table hasn't been updated either, so that attributes that don't change the
+        version, like the name, are up-to-date in the `baserow_table` of the model.
+        """
+
+        entry = get_local_cached_model_class(cache_key)
+        table_ids = {self.id}
+        if entry is not None:
+            table_ids.update(entry[0].keys())
+
+        current_versions = {}
+        updated_on = None
+        for table_id, version, table_updated_on in Table.objects_and_trash.filter(
+            id__in=table_ids
+        ).values_list("id", "version", "updated_on"):
+            current_versions[table_id] = version
+            if table_id == self.id:
+                updated_on = table_updated_on
+        if self.id not in current_versions:
+            # Raises the same `DoesNotExist` error as an uncached call would.
+            self.refresh_from_db(fields=["version"])
+        self.version = current_versions[self.id]
+        self.updated_on = updated_on
+
+        if entry is None:
+            return None
+
+        table_versions, model = entry
+        if (
+            table_versions != current_versions
+            or model.baserow_table.updated_on != updated_on
+        ):
+            return None
+
         return model
 
+    def _get_model_table_versions(self, model):
+        table_versions = {self.id: self.version}
+        for related_model in model.baserow_models.values():
+            related_table = getattr(related_model, "baserow_table", None)
+            if related_table is not None:
+                table_versions[related_table.id] = related_table.version
+        return table_versions
+
     def _add_search_tsvector_fields_to_model(self, field_attrs, indexes, force_add):
         field_objects = field_attrs["_field_objects"]
         trashed_field_objects = field_attrs["_trashed_field_objects"]
@@ -1429,3 +1587,30 @@ class RichTextFieldMention(models.Model):
         indexes = [
             models.Index(fields=["row_id", "field"]),
         ]
+
+
+class PendingSearchValueUpdate(models.Model):
+    """
+    A change log of the cells whose search vector must be recomputed. It's written
+    when only some cells of a field change, so that only the tsvector columns of the
+    changed cells are updated in the background instead of the entire column.
+    """
+
+    table = models.ForeignKey(
+        Table,
+        on_delete=models.CASCADE,
+        related_name="+",
+        help_text="The table that the changed cell is in.",
+    )
+    row_id = models.PositiveIntegerField(
+        help_text="The id of the row that the changed cell is in."
+    )
+    field = models.ForeignKey(
+        "database.Field",
+        on_delete=models.CASCADE,
+        related_name="+",
+        help_text="The field that the changed cell is in.",
+    )
+
+    class Meta:
+        unique_together = ("table", "row_id", "field")
@@ -1,22 +1,35 @@
 import dataclasses
+import json
 import re
+import time
 import traceback
 from collections import defaultdict, namedtuple
 from copy import deepcopy
 from dataclasses import dataclass
+from functools import partial
 from hashlib import shake_128
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type, Union
 
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser, AnonymousUser
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.cache import cache
-from django.core.exceptions import FieldDoesNotExist, ValidationError
-from django.db import connection
+from django.core.exceptions import (
+    EmptyResultSet,
+    FieldDoesNotExist,
+    FieldError,
+    FullResultSet,
+    ValidationError,
+)
+from django.db import DatabaseError, connection, connections
 from django.db import models as django_models
-from django.db.models import Count, Q
+from django.db import transaction
+from django.db.models import Case, Count, Q, Value, When
 from django.db.models.expressions import OrderBy
+from django.db.models.functions import Cast, Upper
 from django.db.models.query import QuerySet
+from django.db.models.sql import Query
 
 import jwt
 from loguru import logger
@@ -128,6 +141,7 @@ from .exceptions import (
 )
 from .models import (
     OWNERSHIP_TYPE_COLLABORATIVE,
+    GridViewFieldOptions,
     View,
     ViewDecoration,
     ViewFilter,
@@ -175,6 +189,17 @@ ending_number_regex = re.compile(r"(.+) (\d+)$")
 
 tracer = trace.get_tracer(__name__)
 
+# The number of seconds the last time a view has been loaded is kept, which is used
+# to decide which partial view indexes are evicted when a table exceeds its budget.
+PARTIAL_INDEX_USAGE_TIMEOUT = 60 * 60 * 24 * 30
+# The number of seconds before a view that could not get a partial index because of
+# the budget of its table is considered again.
+PARTIAL_INDEX_DENIED_TIMEOUT = 60 * 60
+# The number of seconds a partial view index must not have been used before it can
+# be replaced by the partial index of another view. Otherwise, views that are used
+# alternately would keep replacing each other's index.
+PARTIAL_INDEX_MIN_IDLE_TIME = 60 * 60
+
 
 PerViewTableIndexUpdate = namedtuple(
     "PerViewTableIndexUpdate", "all_indexes added removed"
@@ -262,6 +287,31 @@ class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
         index_hash = cls._get_index_hash(field_order_bys)
         return f"{index_name_prefix}{index_hash}"
 
+    @classmethod
+    def _get_partial_index_name_prefix(cls, table_id: int) -> str:
+        return f"p{table_id}:"
+
+    @classmethod
+    def get_partial_index_name(
+        cls,
+        table_id: int,
+        field_order_bys: List[OptionallyAnnotatedOrderBy],
+        condition: Q,
+    ) -> str:
+        """
+        Returns the name of the partial index for a view based on provided field
+        sortings and the condition matching the filters of the view.
+
+        :param table_id: The id of the table.
+        :param field_order_bys: List of order bys that form the sort on a view.
+        :param condition: The condition matching the filters of the view.
+        :return: The index name.
+        """
+
+        index_key = f"{cls._get_index_hash(field_order_bys)}-{condition}"
+        index_hash = shake_128(index_key.encode("utf-8")).hexdigest(10)
+        return f"{cls._get_partial_index_name_prefix(table_id)}{index_hash}"
+
     @classmethod
     def schedule_index_creation_if_needed(cls, view: View, model: GeneratedTableModel):
         """
@@ -279,7 +329,15 @@ class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
             return
 
         try:
-            db_index = cls.get_index(view, model)
+            partial_index_condition = None
+            if settings.BASEROW_VIEW_PARTIAL_INDEXES_PER_TABLE > 0:
+                cls._set_view_last_used(view.id)
+                if not cache.get(cls._get_partial_index_denied_cache_key(view.id)):
+                    partial_index_condition = cls.get_partial_index_condition(
+                        view, model
+                    )
+
+            db_index = cls.get_index(view, model, partial_index_condition)
             if db_index is not None and db_index.name != view.db_index_name:
                 cls.schedule_index_update(view)
         except Exception as exc:  # nosec
@@ -290,7 +348,10 @@ class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
 
     @classmethod
     def get_index(
-        cls, view: View, model: Optional[GeneratedTableModel] = None
+        cls,
+        view: View,
+        model: Optional[GeneratedTableModel] = None,
+        partial_index_condition: Optional[Q] = None,
     ) -> Optional[django_models.Index]:
         """
         Returns the model and the best possible index for the requested view.
@@ -298,6 +359,9 @@ class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
         :param view: The view to get the model and index for.
         :param model: The table model for which the view index should be
             generated.
+        :param partial_index_condition: The condition matching the filters of the
+            view, see `get_partial_index_condition`. If provided, the index only
+            contains the rows matching it, even if the view uses the default order.
         :return: The index for view or None for the default order or if an
             index cannot be created because of annotations or ordering based on
             other tables fields.
@@ -326,6 +390,17 @@ class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
 
         index_fields = [o for ob in field_order_bys for o in ob.order_bys]
 
+        if partial_index_condition is not None:
+            return django_models.Index(
+                *index_fields,
+                "order",
+                "id",
+                condition=Q(trashed=False) & partial_index_condition,
+                name=cls.get_partial_index_name(
+                    view.table_id, field_order_bys, partial_index_condition
+                ),
+            )
+
         if not index_fields:
             return None
 
@@ -338,6 +413,174 @@ class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
             name=index_name,
         )
 
+    @classmethod
+    def get_partial_index_condition(
+        cls, view: View, model: GeneratedTableModel
+    ) -> Optional[Q]:
+        """
+        Returns the condition matching the filters of the view if they can be used
+        as the `WHERE` clause of a partial index. PostgreSQL can then use the index
+        for the queries of the view because they contain the exact same expressions.
+        This is only the case if partial indexes are enabled and all the filters of
+        the view are static filters on columns of the table.
+
+        :param view: The view to get the condition for.
+        :param model: The table model of the view.
+        :return: The condition or None if the view can't use a partial index.
+        """
+
+        if settings.BASEROW_VIEW_PARTIAL_INDEXES_PER_TABLE <= 0 or (
+            view.filters_disabled
+            or not view_type_registry.get_by_model(view).can_filter
+        ):
+            return None
+
+        view_filters = list(view.viewfilter_set.all())
+        if not view_filters:
+            return None
+
+        for view_filter in view_filters:
+            field_object = model._field_objects.get(view_filter.field_id)
+            if (
+                field_object is None
+                or field_object["type"].is_many_to_many_field
+                or not view_filter_type_registry.get(
+                    view_filter.type
+                ).can_be_used_in_partial_index
+            ):
+                return None
+
+        filter_builder = ViewHandler().get_filter_builder(view, model)
+        condition, annotations = filter_builder.get_filters_and_annotations()
+        if annotations:
+            return None
+
+        # Make sure the condition can be compiled without joins, the same way
+        # Django compiles the condition of an index.
+        try:
+            query = Query(model=model, alias_cols=False)
+            where = query.build_where(condition)
+            where.as_sql(query.get_compiler(connection=connection), connection)
+        except (EmptyResultSet, FieldError, FullResultSet):
+            return None
+
+        return condition
+
+    @classmethod
+    def _get_view_last_used_cache_key(cls, view_id: int) -> str:
+        return f"view_index_last_used_{view_id}"
+
+    @classmethod
+    def _get_partial_index_denied_cache_key(cls, view_id: int) -> str:
+        return f"view_partial_index_denied_{view_id}"
+
+    @classmethod
+    def _set_view_last_used(cls, view_id: int):
+        cache.set(
+            cls._get_view_last_used_cache_key(view_id),
+            time.time(),
+            timeout=PARTIAL_INDEX_USAGE_TIMEOUT,
+        )
+
+    @classmethod
+    def _get_views_last_used(cls, view_ids: Iterable[int]) -> Dict[int, float]:
+        cache_keys = {cls._get_view_last_used_cache_key(i): i for i in view_ids}
+        last_used = cache.get_many(cache_keys.keys())
+        return {
+            view_id: last_used.get(cache_key, 0)
+            for cache_key, view_id in cache_keys.items()
+        }
+
+    @classmethod
+    def get_allowed_partial_index_condition(
+        cls, view: View, model: GeneratedTableModel
+    ) -> Optional[Q]:
+        """
+        Returns the partial index condition of the view, see
+        `get_partial_index_condition`, if the table has not reached its budget of
+        partial indexes yet, or if the least recently used view with a partial index
+        has not been used for `PARTIAL_INDEX_MIN_IDLE_TIME` seconds, in which case
+        its index is evicted by `evict_least_recently_used_partial_indexes`.
+        Otherwise the view is not considered again for a while.
+
+        :param view: The view to get the condition for.
+        :param model: The table model of the view.
+        :return: The condition or None if the view must not use a partial index.
+        """
+
+        condition = cls.get_partial_index_condition(view, model)
+        if condition is None:
+            return None
+
+        index_name = cls.get_index(view, model, condition).name
+        other_views = list(
+            View.objects.filter(
+                table_id=view.table_id,
+                db_index_name__startswith=cls._get_partial_index_name_prefix(
+                    view.table_id
+                ),
+            )
+            .exclude(pk=view.pk)
+            .values_list("id", "db_index_name")
+        )
+        other_index_names = {name for _, name in other_views}
+        if (
+            index_name in other_index_names
+            or len(other_index_names) < settings.BASEROW_VIEW_PARTIAL_INDEXES_PER_TABLE
+        ):
+            return condition
+
+        # The view itself has just been used, so comparing with its own last use
+        # would always evict the least recently used index.
+        last_used = cls._get_views_last_used(i for i, _ in other_views)
+        index_last_used = defaultdict(float)
+        for view_id, name in other_views:
+            index_last_used[name] = max(index_last_used[name], last_used[view_id])
+        if time.time() - min(index_last_used.values()) >= PARTIAL_INDEX_MIN_IDLE_TIME:
+            return condition
+
+        cache.set(
+            cls._get_partial_index_denied_cache_key(view.id),
+            True,
+            timeout=PARTIAL_INDEX_DENIED_TIMEOUT,
+        )
+        return None
+
+    @classmethod
+    def evict_least_recently_used_partial_indexes(cls, table_id: int):
+        """
+        Schedules the index update of the views using the least recently used
+        partial indexes of the table, if the table has more partial indexes than
+        its budget. Those views then use an index without condition.
+
+        :param table_id: The id of the table.
+        """
+
+        views = list(
+            View.objects.filter(
+                table_id=table_id,
+                db_index_name__startswith=cls._get_partial_index_name_prefix(table_id),
+            )
+        )
+        views_by_index_name = defaultdict(list)
+        for view in views:
+            views_by_index_name[view.db_index_name].append(view)
+
+        excess = (
+            len(views_by_index_name) - settings.BASEROW_VIEW_PARTIAL_INDEXES_PER_TABLE
+        )
+        if excess <= 0:
+            return
+
+        last_used = cls._get_views_last_used(view.id for view in views)
+        index_names_by_last_use = sorted(
+            views_by_index_name,
+            key=lambda name: max(last_used[v.id] for v in views_by_index_name[name]),
+        )
+        for index_name in index_names_by_last_use[:excess]:
+            for view in views_by_index_name[index_name]:
+                cls.schedule_index_update(view)
+
     @classmethod
     def before_view_permanently_deleted(cls, view: View):
         """
@@ -347,6 +590,7 @@ class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
         :param view: The view that was deleted.
         """
 
+        cls.schedule_trigram_index_update(view.table_id)
         return cls.drop_index_if_unused(view)
 
     @classmethod
@@ -364,6 +608,11 @@ class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
         for view in views_need_to_be_updated:
             cls.schedule_index_update(view)
 
+        if settings.AUTO_INDEX_TRIGRAM_ENABLED and cls.does_index_exist(
+            field.trigram_index_name
+        ):
+            cls.schedule_trigram_index_update(field.table_id)
+
     @classmethod
     def schedule_index_update(cls, view: View):
         """
@@ -510,7 +759,9 @@ class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
             if model is None:
                 model = view.table.get_model()
 
-            db_index = cls.get_index(view, model)
+            db_index = cls.get_index(
+                view, model, cls.get_allowed_partial_index_condition(view, model)
+            )
             new_index_name = db_index and db_index.name
             if view.db_index_name == new_index_name:
                 return  # Nothing to do, the index is already up to date.
@@ -523,6 +774,294 @@ class ViewIndexingHandler(metaclass=baserow_trace_methods(tracer)):
             view.db_index_name = new_index_name
             view.save(update_fields=["db_index_name"])
 
+            if new_index_name and new_index_name.startswith(
+                cls._get_partial_index_name_prefix(view.table_id)
+            ):
+                # A new index counts as used, so that it's not replaced before it
+                # has been idle for a while.
+                cls._set_view_last_used(view.id)
+                cls.evict_least_recently_used_partial_indexes(view.table_id)
+
+    @classmethod
+    def get_trigram_filter_types(cls) -> List[str]:
+        """
+        Returns the types of the view filters that can use a trigram index.
+        """
+
+        return [
+            view_filter_type.type
+            for view_filter_type in view_filter_type_registry.get_all()
+            if view_filter_type.can_use_trigram_index
+        ]
+
+    @classmethod
+    def get_fields_needing_trigram_index(cls, table: Table) -> List[Field]:
+        """
+        Returns the fields of the table that are filtered by at least one view with a
+        filter that can use a trigram index, if their field type supports it.
+
+        :param table: The table to get the fields for.
+        :return: The fields needing a trigram index.
+        """
+
+        filtered_field_ids = ViewFilter.objects.filter(
+            view__table_id=table.id, type__in=cls.get_trigram_filter_types()
+        ).values("field_id")
+        fields = Field.objects.filter(id__in=filtered_field_ids).select_related(
+            "content_type"
+        )
+        return [
+            field
+            for field in fields
+            if field_type_registry.get_by_model(
+                field.specific_class
+            ).can_have_trigram_index
+        ]
+
+    @classmethod
+    def get_existing_trigram_index_names(cls, table: Table) -> Set[str]:
+        """
+        Returns the names of the trigram indexes that exist for the table.
+
+        :param table: The table to get the trigram indexes for.
+        :return: The names of the trigram indexes.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT indexname FROM pg_indexes "
+                "WHERE tablename = %s AND indexname LIKE %s",
+                [table.get_database_table_name(), "tbl\\_trgm\\_%"],
+            )
+            return {row[0] for row in cursor.fetchall()}
+
+    @classmethod
+    def get_trigram_index(cls, field: Field) -> GinIndex:
+        """
+        Returns the trigram index for the field. The indexed expression must be the
+        same as the left hand side of the `icontains` lookup used by the
+        `contains_filter`, so that PostgreSQL can use it.
+
+        :param field: The field to get the index for.
+        :return: The trigram index.
+        """
+
+        return GinIndex(
+            OpClass(
+                Upper(Cast(field.db_column, output_field=django_models.TextField())),
+                name="gin_trgm_ops",
+            ),
+            name=field.trigram_index_name,
+        )
+
+    @classmethod
+    def trigram_extension_is_available(cls) -> bool:
+        """
+        Returns whether the `pg_trgm` extension is installed, trying to install it
+        if it's not. The extension is optional, so the trigram indexes are not
+        created if the database user is not allowed to install it.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            if cursor.fetchone() is not None:
+                return True
+
+        try:
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        except DatabaseError as exc:
+            logger.warning(
+                "The pg_trgm extension could not be installed, so no trigram "
+                "indexes will be created: {e}",
+                e=str(exc),
+            )
+            return False
+        return True
+
+    @classmethod
+    def schedule_trigram_index_creation_if_needed(
+        cls, view: View, model: GeneratedTableModel
+    ):
+        """
+        Schedules the update of the trigram indexes of the table if the view filters
+        a field with a filter that can use a trigram index, and the index doesn't
+        exist yet.
+
+        :param view: The view that has been loaded.
+        :param model: The model of the table of the view.
+        """
+
+        if not settings.AUTO_INDEX_TRIGRAM_ENABLED:
+            return
+
+        try:
+            trigram_filter_types = cls.get_trigram_filter_types()
+            index_names = set()
+            for view_filter in view.viewfilter_set.all():
+                field_object = model._field_objects.get(view_filter.field_id)
+                if (
+                    view_filter.type in trigram_filter_types
+                    and field_object is not None
+                    and field_object["type"].can_have_trigram_index
+                ):
+                    index_names.add(field_object["field"].trigram_index_name)
+
+            if index_names and not index_names.issubset(
+                cls.get_existing_trigram_index_names(view.table)
+            ):
+                cls.schedule_trigram_index_update(view.table_id)
+        except Exception as exc:  # nosec
+            logger.error(
+                "Failed to check if view needs trigram index because of {e}",
+                e=str(exc),
+            )
+            traceback.print_exc()
+
+    @classmethod
+    def after_view_filter_changed(cls, view_filter: ViewFilter):
+        """
+        Called when a view filter is created, updated or deleted. The index of the
+        view is updated if partial indexes are enabled because its condition could
+        change. The trigram indexes of the table are updated if the filter can use
+        one, or if the field has one which could not be used anymore.
+
+        :param view_filter: The view filter that has changed.
+        """
+
+        if settings.BASEROW_VIEW_PARTIAL_INDEXES_PER_TABLE > 0:
+            cls.schedule_index_update(view_filter.view)
+
+        if not settings.AUTO_INDEX_TRIGRAM_ENABLED:
+            return
+
+        if view_filter.type in cls.get_trigram_filter_types() or cls.does_index_exist(
+            view_filter.field.trigram_index_name
+        ):
+            cls.schedule_trigram_index_update(view_filter.view.table_id)
+
+    @classmethod
+    def after_field_type_changed(cls, field: Field):
+        """
+        Called when the type of a field has changed. The trigram index of the field
+        is dropped if the new type doesn't support it.
+
+        :param field: The field that has changed.
+        """
+
+        if not settings.AUTO_INDEX_TRIGRAM_ENABLED:
+            return
+
+        field_type = field_type_registry.get_by_model(field.specific_class)
+        if not field_type.can_have_trigram_index and cls.does_index_exist(
+            field.trigram_index_name
+        ):
+            cls.schedule_trigram_index_update(field.table_id)
+
+    @classmethod
+    def schedule_trigram_index_update(cls, table_id: int):
+        """
+        Schedules a celery task calling the update_trigram_indexes method to update
+        the trigram indexes of the table.
+
+        :param table_id: The id of the table for which the indexes need to be
+            updated.
+        """
+
+        from baserow.contrib.database.views.tasks import (
+            schedule_table_trigram_index_update,
+        )
+
+        schedule_table_trigram_index_update(table_id)
+
+    @classmethod
+    def update_trigram_indexes_by_table_id(cls, table_id: int, nowait=True):
+        """
+        Updates the trigram indexes of the table with the provided id. If nowait is
+        set to True, the operation will not wait for a lock on the table, raising a
+        DatabaseError if the lock cannot be acquired immediately.
+
+        :param table_id: The id of the table to update the indexes for.
+        :param nowait: If set to True, the operation will not wait for a lock on the
+            table.
+        :raises TableDoesNotExist: When the table with the provided id does not
+            exist.
+        :raises DatabaseError: When the lock on the table cannot be acquired
+            immediately.
+        """
+
+        from baserow.contrib.database.table.handler import TableHandler
+
+        table = TableHandler().get_table(table_id)
+
+        if nowait:
+            first_sql_to_run = (
+                sql.SQL("LOCK TABLE {0} IN SHARE MODE NOWAIT"),
+                [sql.Identifier(table.get_database_table_name())],
+            )
+        else:
+            first_sql_to_run = None
+
+        with transaction_atomic(
+            first_sql_to_run_in_transaction_with_args=first_sql_to_run
+        ):
+            ViewIndexingHandler.update_trigram_indexes(table)
+
+    @classmethod
+    def update_trigram_indexes(
+        cls, table: Table, model: Optional[GeneratedTableModel] = None
+    ):
+        """
+        Creates the missing trigram indexes for the fields of the table filtered by
+        a view with a contains filter, and drops the ones that are not used by any
+        view anymore.
+
+        :param table: The table to update the indexes for.
+        :param model: The model to use for the table. If not provided the model
+            will be generated.
+        """
+
+        with atomic_if_not_already():
+            existing_index_names = cls.get_existing_trigram_index_names(table)
+            fields_by_index_name = {
+                field.trigram_index_name: field
+                for field in cls.get_fields_needing_trigram_index(table)
+            }
+            index_names_to_drop = existing_index_names - fields_by_index_name.keys()
+            fields_to_index = [
+                field
+                for index_name, field in fields_by_index_name.items()
+                if index_name not in existing_index_names
+            ]
+            if fields_to_index and not cls.trigram_extension_is_available():
+                fields_to_index = []
+
+            if not index_names_to_drop and not fields_to_index:
+                return
+
+            if model is None:
+                model = table.get_model()
+
+            with safe_django_schema_editor() as schema_editor:
+                for index_name in index_names_to_drop:
+                    schema_editor.remove_index(
+                        model, django_models.Index("id", name=index_name)
+                    )
+                    logger.info(
+                        "Removed trigram index {index_name} of table {table_id}",
+                        index_name=index_name,
+                        table_id=table.id,
+                    )
+
+                for field in fields_to_index:
+                    db_index = cls.get_trigram_index(field)
+                    schema_editor.add_index(model, db_index)
+                    logger.info(
+                        "Created trigram index {index_name} of table {table_id}",
+                        index_name=db_index.name,
+                        table_id=table.id,
+                    )
+
 
 class ViewHandler(metaclass=baserow_trace_methods(tracer)):
     PUBLIC_VIEW_TOKEN_ALGORITHM = "HS256"  # nosec
@@ -1345,6 +1884,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
             if not filter_type.field_is_compatible(field):
                 filter.delete()
 
+        ViewIndexingHandler.after_field_type_changed(field)
+
         # Call view types hook
         for view_type in view_type_registry.get_all():
             view_type.after_field_type_change(field)
@@ -1368,6 +1909,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         if not isinstance(updated_fields, list):
             updated_fields = [updated_fields]
 
+        self.clear_row_count_cache([field.table_id for field in updated_fields])
+
         # Call each view types hook
         for view_type in view_type_registry.get_all():
             view_type.after_field_value_update(updated_fields)
@@ -2721,6 +3264,472 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 # No cache key, we create one
                 cache.set(cache_key, 2)
 
+    def _incremental_aggregations_enabled(self) -> bool:
+        return settings.BASEROW_VIEW_INCREMENTAL_AGGREGATIONS_ENABLED
+
+    def _get_incremental_state_alias(
+        self, field_name: str, state_key: Optional[str] = None
+    ) -> str:
+        """
+        Returns the alias of the incremental state of the aggregation of the field,
+        or of one of the additional aggregations of this state.
+        """
+
+        alias = f"{field_name}_state"
+        return f"{alias}_{state_key}" if state_key else alias
+
+    def _pop_incremental_aggregation_states(
+        self, result: Dict[str, Any], names: Iterable[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Removes the incremental states computed by `get_field_aggregations` from its
+        result and returns them by field name.
+        """
+
+        states = {}
+        for name in names:
+            alias = self._get_incremental_state_alias(name)
+            if alias in result:
+                states[name] = result.pop(alias)
+        return states
+
+    def _get_incrementally_maintainable_aggregations(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        field_ids: Optional[Iterable[int]] = None,
+    ) -> List[Tuple[View, List[Tuple[Field, str]]]]:
+        """
+        Returns the views of the table with the aggregations whose cached value can
+        be updated with the changes of the rows, instead of being computed again. The
+        type of the aggregation must support it and the values of the field must only
+        depend on the row itself. The filters of the view must only depend on the row
+        itself as well, so that the changed rows are the only ones that can enter or
+        leave the view.
+
+        :param table: The table whose rows are changed.
+        :param model: The model of the table.
+        :param field_ids: If provided, only the aggregations of these fields are
+            returned.
+        :return: A list of views with their (field, aggregation_type) couples.
+        """
+
+        from baserow.contrib.database.fields.field_types import FormulaFieldType
+
+        def depends_only_on_row(field_id):
+            field_object = model._field_objects.get(field_id)
+            return (
+                field_object is not None
+                and not isinstance(field_object["type"], FormulaFieldType)
+                and not isinstance(
+                    model._meta.get_field(field_object["name"]),
+                    django_models.ManyToManyField,
+                )
+            )
+
+        field_options = (
+            GridViewFieldOptions.objects.filter(grid_view__table_id=table.id)
+            .exclude(aggregation_raw_type="")
+            .select_related("grid_view")
+        )
+        if field_ids is not None:
+            field_options = field_options.filter(field_id__in=field_ids)
+
+        views = {}
+        aggregations_by_view_id = defaultdict(list)
+        for options in field_options:
+            if not depends_only_on_row(options.field_id):
+                continue
+
+            field_object = model._field_objects[options.field_id]
+            aggregation_type = view_aggregation_type_registry.get(
+                options.aggregation_raw_type
+            )
+            state_aggregations = aggregation_type.get_incremental_state_aggregations(
+                field_object["name"],
+                model._meta.get_field(field_object["name"]),
+                field_object["field"],
+            )
+            if state_aggregations is None:
+                continue
+
+            views[options.grid_view_id] = options.grid_view
+            aggregations_by_view_id[options.grid_view_id].append(
+                (field_object["field"], options.aggregation_raw_type)
+            )
+
+        if not views:
+            return []
+
+        filtered_field_ids = ViewFilter.objects.filter(
+            view_id__in=list(views.keys())
+        ).values_list("view_id", "field_id")
+        for view_id, field_id in filtered_field_ids:
+            view = views.get(view_id)
+            if (
+                view is not None
+                and not view.filters_disabled
+                and not depends_only_on_row(field_id)
+            ):
+                del views[view_id]
+
+        return [
+            (view, aggregations_by_view_id[view_id]) for view_id, view in views.items()
+        ]
+
+    def _get_incrementally_updatable_aggregations(
+        self,
+        view: View,
+        aggregations: List[Tuple[Field, str]],
+        versions_behind: int,
+    ) -> Tuple[List[Tuple[Field, str]], Dict[str, int]]:
+        """
+        Returns the aggregations having a cached value with an incremental state that
+        is exactly `versions_behind` versions older than the current version, along
+        with their current version by field name.
+        """
+
+        names = [field.db_column for field, _ in aggregations]
+        cached = cache.get_many(
+            [self._get_aggregation_value_cache_key(view, name) for name in names]
+            + [self._get_aggregation_version_cache_key(view, name) for name in names]
+        )
+
+        updatable = []
+        versions = {}
+        for field, aggregation_type_name in aggregations:
+            name = field.db_column
+            cached_value = cached.get(self._get_aggregation_value_cache_key(view, name))
+            version = cached.get(self._get_aggregation_version_cache_key(view, name), 1)
+            if (
+                cached_value is not None
+                and cached_value.get("state") is not None
+                and cached_value["version"] == version - versions_behind
+            ):
+                updatable.append((field, aggregation_type_name))
+                versions[name] = version
+        return updatable, versions
+
+    def _get_incremental_aggregation_states(
+        self,
+        view: View,
+        model: GeneratedTableModel,
+        aggregations: List[Tuple[Field, str]],
+        row_ids: List[int],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the incremental states of the aggregations over the provided rows
+        matching the filters of the view, by field name.
+        """
+
+        result = self.get_field_aggregations(
+            None,
+            view,
+            aggregations,
+            model,
+            skip_perm_check=True,
+            with_incremental_states=True,
+            row_ids=row_ids,
+        )
+        return self._pop_incremental_aggregation_states(
+            result, [field.db_column for field, _ in aggregations]
+        )
+
+    def prepare_incremental_aggregations_update(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        rows: List[GeneratedTableModel],
+        updated_field_ids: Optional[Iterable[int]] = None,
+    ) -> List[Tuple[View, List[Tuple[Field, str]], Dict[str, Dict[str, Any]]]]:
+        """
+        Must be called before the provided rows are updated or deleted. Computes the
+        incremental states over the old values of the rows for the cached
+        aggregations that can be maintained incrementally, so that
+        `update_aggregations_incrementally` can remove them from the cached values
+        once the rows have changed.
+
+        :param table: The table whose rows are going to change.
+        :param model: The model of the table.
+        :param rows: The rows that are going to be updated or deleted.
+        :param updated_field_ids: The ids of the fields that are going to be updated,
+            all the fields are considered if not provided.
+        :return: The views with their aggregations and the states over the old
+            values of the rows, to be passed to `update_aggregations_incrementally`.
+        """
+
+        if not self._incremental_aggregations_enabled() or not rows:
+            return []
+
+        row_ids = [row.id for row in rows]
+        prepared = []
+        for view, aggregations in self._get_incrementally_maintainable_aggregations(
+            table, model, updated_field_ids
+        ):
+            aggregations, _ = self._get_incrementally_updatable_aggregations(
+                view, aggregations, versions_behind=0
+            )
+            if aggregations:
+                removed_states = self._get_incremental_aggregation_states(
+                    view, model, aggregations, row_ids
+                )
+                prepared.append((view, aggregations, removed_states))
+        return prepared
+
+    def update_aggregations_incrementally(
+        self,
+        table: Table,
+        model: GeneratedTableModel,
+        rows: List[GeneratedTableModel],
+        prepared: Optional[
+            List[Tuple[View, List[Tuple[Field, str]], Dict[str, Dict[str, Any]]]]
+        ] = None,
+        deleted: bool = False,
+    ):
+        """
+        Must be called after the provided rows have been created, updated or deleted,
+        and after `field_value_updated` has incremented the versions of the cached
+        aggregations. Instead of letting the next request aggregate all the rows of
+        the view again, the cached values are updated with the states over the old
+        and the new values of the rows when the transaction is committed. A cached
+        value is only updated if this change is the only one that happened since it
+        has been computed, otherwise it's computed again as usual.
+
+        :param table: The table whose rows have changed.
+        :param model: The model of the table.
+        :param rows: The rows that have been created, updated or deleted.
+        :param prepared: The result of `prepare_incremental_aggregations_update`
+            called before the rows were updated or deleted. If not provided, the rows
+            are considered as created.
+        :param deleted: Whether the rows have been deleted.
+        """
+
+        if not self._incremental_aggregations_enabled() or not rows:
+            return
+
+        if prepared is None:
+            prepared = [
+                (view, aggregations, None)
+                for (
+                    view,
+                    aggregations,
+                ) in self._get_incrementally_maintainable_aggregations(table, model)
+            ]
+
+        row_ids = [row.id for row in rows]
+        for view, aggregations, removed_states in prepared:
+            aggregations, versions = self._get_incrementally_updatable_aggregations(
+                view, aggregations, versions_behind=1
+            )
+            if not aggregations:
+                continue
+
+            if removed_states is None:
+                removed_states = self._get_incremental_aggregation_states(
+                    view, model, aggregations, []
+                )
+            added_states = self._get_incremental_aggregation_states(
+                view, model, aggregations, [] if deleted else row_ids
+            )
+
+            transaction.on_commit(
+                partial(
+                    self._apply_incremental_aggregation_states,
+                    view,
+                    aggregations,
+                    versions,
+                    removed_states,
+                    added_states,
+                )
+            )
+
+    def _apply_incremental_aggregation_states(
+        self,
+        view: View,
+        aggregations: List[Tuple[Field, str]],
+        versions: Dict[str, int],
+        removed_states: Dict[str, Dict[str, Any]],
+        added_states: Dict[str, Dict[str, Any]],
+    ):
+        value_cache_keys = {
+            field.db_column: self._get_aggregation_value_cache_key(
+                view, field.db_column
+            )
+            for field, _ in aggregations
+        }
+        cached = cache.get_many(list(value_cache_keys.values()))
+
+        to_cache = {}
+        for field, aggregation_type_name in aggregations:
+            name = field.db_column
+            cached_value = cached.get(value_cache_keys[name])
+            # Another change could have updated or invalidated the value in the
+            # meantime, in which case it's computed again by the next request.
+            if (
+                cached_value is None
+                or cached_value.get("state") is None
+                or cached_value["version"] != versions[name] - 1
+            ):
+                continue
+
+            aggregation_type = view_aggregation_type_registry.get(aggregation_type_name)
+            state = aggregation_type.combine_incremental_states(
+                cached_value["state"], removed_states[name], added_states[name]
+            )
+            if state is not None:
+                to_cache[value_cache_keys[name]] = {
+                    "value": state["value"],
+                    "version": versions[name],
+                    "state": state,
+                }
+
+        if to_cache:
+            cache.set_many(to_cache)
+
+    def _get_row_count_version_cache_key(self, table_id: int) -> str:
+        """
+        Returns the row count version cache key for the specified table.
+        """
+
+        return f"row_count_version__{table_id}"
+
+    def _get_row_count_value_cache_key(self, view: View) -> str:
+        """
+        Returns the row count value cache key for the specified view.
+        """
+
+        return f"row_count_value__{view.pk}"
+
+    def clear_row_count_cache(self, table_ids: Union[Iterable[int], int]):
+        """
+        Increments the row count version in cache for the specified tables, which
+        invalidates the cached row counts of all their views. If called in a
+        transaction, the version is incremented again when it's committed, because
+        another request could have cached the count of the uncommitted rows.
+        """
+
+        if isinstance(table_ids, int):
+            table_ids = [table_ids]
+        table_ids = set(table_ids)
+
+        def clear():
+            for table_id in table_ids:
+                cache_key = self._get_row_count_version_cache_key(table_id)
+                try:
+                    cache.incr(cache_key, 1)
+                except ValueError:
+                    # No cache key, we create one
+                    cache.set(cache_key, 2)
+
+        clear()
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(clear)
+
+    def get_estimated_row_count(self, queryset: QuerySet) -> int:
+        """
+        Returns the number of rows the PostgreSQL query planner expects the
+        queryset to return. This doesn't execute the query, so it's fast even for
+        very large tables, but the result is only as accurate as the table
+        statistics.
+        """
+
+        plan = json.loads(queryset.order_by().explain(format="json"))
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def get_estimated_search_row_count(
+        self, queryset: QuerySet, search_mode: Optional[str]
+    ) -> Optional[int]:
+        """
+        Returns the count estimated by the query planner for a queryset containing a
+        search if the `full-text-with-estimated-count` search mode is used, so that
+        all the matches don't have to be counted when searching a broad term in a
+        large table. The exact count must be computed if None is returned, which is
+        the case for the other search modes and if less rows than
+        `BASEROW_ESTIMATED_ROW_COUNT_THRESHOLD` are expected.
+
+        :param queryset: The queryset containing the search.
+        :param search_mode: The search mode provided by the API consumer.
+        :return: The estimated number of matching rows or None.
+        """
+
+        if search_mode != SearchModes.MODE_FT_WITH_ESTIMATED_COUNT:
+            return None
+
+        estimated_count = self.get_estimated_row_count(queryset)
+        if estimated_count < settings.BASEROW_ESTIMATED_ROW_COUNT_THRESHOLD:
+            return None
+
+        return estimated_count
+
+    def get_view_row_count(
+        self,
+        view: View,
+        queryset: QuerySet,
+        use_cache: bool = True,
+        estimate: bool = False,
+    ) -> int:
+        """
+        Returns the number of rows in the provided view queryset. The exact count is
+        cached per view and invalidated in the same way as the aggregations, by
+        incrementing a version every time the rows of the table change.
+
+        :param view: The view the queryset has been generated for.
+        :param queryset: The queryset of the view, containing the view filters.
+        :param use_cache: Indicates whether a cached count can be used. This must be
+            False if the queryset contains a search or adhoc filters. Setting
+            `BASEROW_VIEW_ROW_COUNT_CACHE_TIMEOUT` to 0 disables the cache entirely.
+        :param estimate: If True and the view doesn't have any filters, the
+            estimate of the query planner is returned for large tables instead of
+            the exact count.
+        :return: The (estimated) number of rows in the view.
+        """
+
+        if (
+            estimate
+            and use_cache
+            and (view.filters_disabled or not view.viewfilter_set.exists())
+        ):
+            estimated_count = self.get_estimated_row_count(queryset)
+            if estimated_count >= settings.BASEROW_ESTIMATED_ROW_COUNT_THRESHOLD:
+                return estimated_count
+
+        if not use_cache or settings.BASEROW_VIEW_ROW_COUNT_CACHE_TIMEOUT <= 0:
+            return queryset.count()
+
+        value_cache_key = self._get_row_count_value_cache_key(view)
+        version_cache_key = self._get_row_count_version_cache_key(view.table_id)
+        cached = cache.get_many([value_cache_key, version_cache_key])
+        cached_value = cached.get(value_cache_key, {"version": 0})
+        cached_version = cached.get(version_cache_key, 1)
+
+        # The signature makes sure that the count is recomputed when the filters of
+        # the view or the fields of the table (and with that the table version)
+        # change, without having to hook into every place where that can happen.
+        count_queryset = queryset.order_by()
+        try:
+            query_sql = str(count_queryset.query)
+        except EmptyResultSet:
+            # A filter can't match any row, for example because of an invalid
+            # filter value.
+            return 0
+        signature = shake_128(
+            f"{queryset.model.baserow_table.version}_{query_sql}".encode()
+        ).hexdigest(16)
+
+        if (
+            cached_value["version"] == cached_version
+            and cached_value.get("signature") == signature
+        ):
+            return cached_value["value"]
+
+        count = count_queryset.count()
+        cache.set(
+            value_cache_key,
+            {"value": count, "version": cached_version, "signature": signature},
+            timeout=settings.BASEROW_VIEW_ROW_COUNT_CACHE_TIMEOUT,
+        )
+        return count
+
     def _get_aggregations_to_compute(
         self,
         view: View,
@@ -2895,6 +3904,10 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 search_mode=search_mode,
                 skip_perm_check=skip_perm_check,
                 restrict_to_field_ids=visible_field_ids,
+                with_incremental_states=self._incremental_aggregations_enabled(),
+            )
+            states = self._pop_incremental_aggregation_states(
+                db_result, need_computation.keys()
             )
 
             if not search and not adhoc_filters.has_any_filters:
@@ -2905,6 +3918,7 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                         to_cache[self._get_aggregation_value_cache_key(view, key)] = {
                             "value": value,
                             "version": need_computation[key]["version"],
+                            "state": states.get(key),
                         }
 
                 # Let's cache the newly computed values
@@ -2936,6 +3950,8 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         search_mode: Optional[SearchModes] = None,
         skip_perm_check: bool = False,
         restrict_to_field_ids: Optional[Set[int]] = None,
+        with_incremental_states: bool = False,
+        row_ids: Optional[Iterable[int]] = None,
     ) -> Dict[str, Any]:
         """
         Returns a dict of aggregation for given (field, aggregation_type) couple list.
@@ -2959,6 +3975,10 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param skip_perm_check: Skips the permission check if not necessary.
         :param restrict_to_field_ids: Restrict the aggregations only to certain
             fields, for example if the aggregation is requested for public views.
+        :param with_incremental_states: Whether the additional values needed to
+            maintain the aggregations incrementally must be computed as well. They
+            can be extracted with `_pop_incremental_aggregation_states`.
+        :param row_ids: If provided, only these rows are aggregated.
         :raises FieldAggregationNotSupported: When the view type doesn't support
             field aggregation.
         :raises FieldNotInTable: When one of the field doesn't belong to the specified
@@ -3007,7 +4027,11 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 search, restrict_to_field_ids, search_mode=search_mode
             )
 
+        if row_ids is not None:
+            queryset = queryset.filter(id__in=row_ids)
+
         aggregation_dict = {}
+        incremental_state_keys = {}
 
         for field_instance, aggregation_type_name in aggregations:
             field_name = field_instance.db_column
@@ -3028,6 +4052,21 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                 field_name, model_field, field
             )
 
+            if with_incremental_states:
+                state_aggregations = (
+                    aggregation_type.get_incremental_state_aggregations(
+                        field_name, model_field, field
+                    )
+                )
+                if state_aggregations is None:
+                    continue
+
+                incremental_state_keys[field_name] = list(state_aggregations.keys())
+                for state_key, aggregation in state_aggregations.items():
+                    aggregation_dict[
+                        self._get_incremental_state_alias(field_name, state_key)
+                    ] = aggregation
+
         # Check if the returned aggregations contain a `AnnotatedAggregation`,
         # and if so, apply the annotations and only keep the actual aggregation in
         # the dict. This is needed because some aggregations require annotated values
@@ -3041,7 +4080,20 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         if with_total:
             aggregation_dict["total"] = Count("id", distinct=True)
 
-        return queryset.aggregate(**aggregation_dict)
+        result = queryset.aggregate(**aggregation_dict)
+
+        for field_name, state_keys in incremental_state_keys.items():
+            result[self._get_incremental_state_alias(field_name)] = {
+                "value": result[field_name],
+                **{
+                    state_key: result.pop(
+                        self._get_incremental_state_alias(field_name, state_key)
+                    )
+                    for state_key in state_keys
+                },
+            }
+
+        return result
 
     def rotate_view_slug(
         self, user: AbstractUser, view: View, slug_field: str = "slug"
@@ -3445,15 +4497,25 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
 
         return queryset, field_ids, visible_field_options
 
+    def _get_group_by_metadata_value_cache_key(self, view: View) -> str:
+        """
+        Returns the group by metadata value cache key for the specified view.
+        """
+
+        return f"group_by_metadata_value__{view.pk}"
+
     def get_group_by_metadata_in_rows(
         self,
         fields: List[Field],
         rows: List["GeneratedTableModel"],
         base_queryset: QuerySet,
-    ) -> Dict[Field, QuerySet]:
+        view: Optional[View] = None,
+    ) -> Dict[Field, List[Dict[str, Any]]]:
         """
         This method calculates the count of each unique value within the provided rows,
-        grouped accordingly.
+        grouped accordingly. The counts of all the levels are calculated with a single
+        `GROUPING SETS` query that only counts the rows having a value of the first
+        level present in the provided rows.
 
         :param fields: A list of the fields of the group bys in the right order.
         :param rows: The rows of the paginated query set. The unique values will be
@@ -3461,8 +4523,13 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
         :param base_queryset: The base_queryset before the pagination was applied.
             This is needed because the rows that must be counted can be outside of
             the paginated range.
+        :param view: Optionally, the view the base queryset has been generated for.
+            If provided, the result is cached per view and invalidated in the same
+            way as the cached row count. It must not be provided if the queryset
+            contains a search or adhoc filters. The cache is disabled if
+            `BASEROW_VIEW_GROUP_BY_METADATA_CACHE_TIMEOUT` is 0.
         :return: A dictionary where the key is the grouped by field, and the value a
-            queryset containing the count per field.
+            list containing the count per unique value.
         :raises ValueError: if a field is provided that cannot be grouped by.
         """
 
@@ -3501,33 +4568,178 @@ class ViewHandler(metaclass=baserow_trace_methods(tracer)):
                     qs_per_level[level] |= Q(**all_filters)
                     unique_value_per_level[level].add(all_values)
 
-        by_level = {}
-        for level, q in qs_per_level.items():
-            field_names = []
+        if len(qs_per_level) == 0:
+            return {}
+
+        field_names = [field.db_column for field in fields]
+        # The names of the booleans of the levels after the first one.
+        level_names = [f"group_by_level_{level}" for level in range(1, len(fields))]
+
+        # Wrap the queryset to avoid conflicts with annotations, orders, joins,
+        # etc that can have an impact on the count.
+        queryset = base_queryset.model.objects.filter(
+            id__in=base_queryset.clear_multi_field_prefetch().values("id")
+        ).values()
+
+        if len(all_annotations) > 0:
+            queryset = queryset.annotate(**all_annotations)
+
+        # Every group of a deeper level is part of a group of the first level, so
+        # only the rows matching the first level must be counted. For the deeper
+        # levels, a boolean indicates whether the row is part of a group present in
+        # the rows, so that the other groups can be excluded after counting.
+        queryset = (
+            queryset.filter(qs_per_level[0])
+            .values(
+                *field_names,
+                **{
+                    level_names[level - 1]: Case(
+                        When(q, then=Value(True)),
+                        default=Value(False),
+                        output_field=django_models.BooleanField(),
+                    )
+                    for level, q in qs_per_level.items()
+                    if level > 0
+                },
+            )
+            .order_by()
+        )
 
-            for field in fields[: level + 1]:
-                field_name = field.db_column
-                field_names.append(field_name)
+        use_cache = (
+            view is not None
+            and settings.BASEROW_VIEW_GROUP_BY_METADATA_CACHE_TIMEOUT > 0
+        )
+        if use_cache:
+            try:
+                query_sql = str(queryset.query)
+            except EmptyResultSet:
+                # A filter can't match any row, so there is nothing to count.
+                return {field: [] for field in fields}
+
+            value_cache_key = self._get_group_by_metadata_value_cache_key(view)
+            version_cache_key = self._get_row_count_version_cache_key(view.table_id)
+            cached = cache.get_many([value_cache_key, version_cache_key])
+            cached_value = cached.get(value_cache_key, {"version": 0})
+            cached_version = cached.get(version_cache_key, 1)
+            # The query contains the view filters and the unique values of the
+            # rows, so the cached counts are only used for the same page of rows.
+            signature = shake_128(
+                f"{base_queryset.model.baserow_table.version}_{query_sql}".encode()
+            ).hexdigest(16)
 
-            # Wrap the queryset to avoid conflicts with annotations, orders, joins,
-            # etc that can have an impact on the count.
-            queryset = base_queryset.model.objects.filter(
-                id__in=base_queryset.clear_multi_field_prefetch().values("id")
-            ).values()
+            if (
+                cached_value["version"] == cached_version
+                and cached_value.get("signature") == signature
+            ):
+                return {
+                    fields[level]: counts
+                    for level, counts in enumerate(cached_value["value"])
+                }
 
-            if len(all_annotations) > 0:
-                queryset = queryset.annotate(**all_annotations)
+        counts_per_level = self._count_rows_per_group_by_level(
+            queryset, field_names, level_names
+        )
 
-            queryset = (
-                queryset.filter(q)
-                .values(*field_names)
-                .annotate(count=Count("id"))
-                .order_by()
+        if use_cache:
+            cache.set(
+                value_cache_key,
+                {
+                    "value": counts_per_level,
+                    "version": cached_version,
+                    "signature": signature,
+                },
+                timeout=settings.BASEROW_VIEW_GROUP_BY_METADATA_CACHE_TIMEOUT,
             )
 
-            by_level[fields[level]] = queryset
+        return {fields[level]: counts for level, counts in enumerate(counts_per_level)}
+
+    def _count_rows_per_group_by_level(
+        self, queryset: QuerySet, field_names: List[str], level_names: List[str]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Counts the rows of the provided values queryset per unique value of every
+        group by level with a single `GROUP BY GROUPING SETS` query. Django doesn't
+        support grouping sets, so the queryset is compiled and wrapped in a raw query.
+
+        :param queryset: The values queryset selecting the group by fields and, for
+            every level except the first one, a boolean indicating whether the row is
+            part of one of the groups that must be counted.
+        :param field_names: The names of the group by fields in the right order.
+        :param level_names: The names of the booleans of the levels after the first
+            one, in the same order as the fields.
+        :return: A list containing the count per unique value of every level.
+        """
+
+        counts_per_level = [[] for _ in field_names]
+        compiler = queryset.query.get_compiler(using=queryset.db)
+
+        try:
+            inner_sql, params = compiler.as_sql()
+        except EmptyResultSet:
+            return counts_per_level
+
+        query = queryset.query
+        names = [*query.extra_select, *query.values_select, *query.annotation_select]
+        converters = compiler.get_converters(
+            [expression for expression, _, _ in compiler.select]
+        )
+
+        # The first level is grouped by its field only, every next level by its
+        # fields and its boolean.
+        grouping_sets = []
+        for level in range(len(field_names)):
+            grouping_names = field_names[: level + 1]
+            if level > 0:
+                grouping_names.append(level_names[level - 1])
+            grouping_sets.append(
+                sql.SQL("({})").format(
+                    sql.SQL(", ").join(map(sql.Identifier, grouping_names))
+                )
+            )
+        grouping_sets_sql = sql.SQL(
+            "SELECT {columns}, COUNT(*) FROM ({inner}) AS grouped_rows ({names}) "
+            "GROUP BY GROUPING SETS ({grouping_sets})"
+        ).format(
+            columns=sql.SQL(", ").join(map(sql.Identifier, field_names + level_names)),
+            inner=sql.SQL(inner_sql),
+            names=sql.SQL(", ").join(map(sql.Identifier, names)),
+            grouping_sets=sql.SQL(", ").join(grouping_sets),
+        )
+
+        db_connection = connections[queryset.db]
+        with db_connection.cursor() as cursor:
+            cursor.execute(grouping_sets_sql, params)
+            results = cursor.fetchall()
+
+        field_positions = [names.index(field_name) for field_name in field_names]
+        for result in results:
+            # Only the boolean of the level of the grouping set is not NULL, and
+            # none of them is for the first level.
+            level_flags = result[len(field_names) : -1]
+            level = next(
+                (
+                    index + 1
+                    for index, flag in enumerate(level_flags)
+                    if flag is not None
+                ),
+                0,
+            )
+            if level > 0 and not level_flags[level - 1]:
+                continue
+
+            counts = {}
+            for index, field_name in enumerate(field_names[: level + 1]):
+                value = result[index]
+                field_converters, expression = converters.get(
+                    field_positions[index], ([], None)
+                )
+                for converter in field_converters:
+                    value = converter(value, expression, db_connection)
+                counts[field_name] = value
+            counts["count"] = result[-1]
+            counts_per_level[level].append(counts)
 
-        return by_level
+        return counts_per_level
 
     def _get_prepared_values_for_data(
         self, view_type: ViewType, view: View, changed_allowed_keys: Iterable[str]
@@ -893,6 +893,21 @@ class ViewFilterType(Instance):
     checked and returns True if compatible or False if not.
     """
 
+    can_use_trigram_index = False
+    """
+    Indicates whether the filter uses the `contains_query` of the field type, so that
+    a trigram index is created for the compatible fields it's applied on. See
+    `ViewIndexingHandler.update_trigram_indexes`.
+    """
+
+    can_be_used_in_partial_index = False
+    """
+    Indicates whether the filter always compiles to the same immutable SQL expression
+    on the column of the field for the same value, so that it can be part of the
+    `WHERE` clause of a partial view index. Filters relative to the current date or
+    user must not set this. See `ViewIndexingHandler.get_partial_index_condition`.
+    """
+
     def default_filter_on_exception(self):
         """The default Q to use when the filter value is of an incompatible type."""
 
@@ -1027,6 +1042,48 @@ class ViewAggregationType(Instance):
             "Each aggregation type must have his own get_aggregation method."
         )
 
+    def get_incremental_state_aggregations(
+        self,
+        field_name: str,
+        model_field: django_models.Field,
+        field: "Field",
+    ) -> Optional[Dict[str, django_models.Aggregate]]:
+        """
+        If the value of this aggregation can be maintained incrementally when rows
+        are created, updated or deleted, this method must return the additional
+        aggregations needed to do so. Together with the `value`, they form the state
+        passed to `combine_incremental_states`.
+
+        :param field_name: The name of the field that needs to be aggregated.
+        :param model_field: The field extracted from the model.
+        :param field: The instance of the underlying baserow field.
+        :return: The additional aggregations by state key, or None if the value
+            can't be maintained incrementally.
+        """
+
+        return None
+
+    def combine_incremental_states(
+        self,
+        state: Dict[str, Any],
+        removed_state: Dict[str, Any],
+        added_state: Dict[str, Any],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Returns the new state of the aggregation after the rows described by
+        `removed_state` have been removed and the rows described by `added_state`
+        have been added. An updated row is removed with its old values and added
+        with its new ones.
+
+        :param state: The current state of the aggregation over all the rows.
+        :param removed_state: The state of the aggregation over the removed rows.
+        :param added_state: The state of the aggregation over the added rows.
+        :return: The new state containing at least the `value`, or None if it can't
+            be computed without aggregating all the rows again.
+        """
+
+        return None
+
     def field_is_compatible(self, field: "Field") -> bool:
         """
         Given a particular instance of a field returns whether the field is supported
@@ -1,6 +1,8 @@
+from django.db.models.signals import m2m_changed
 from django.dispatch import Signal, receiver
 
 from baserow.contrib.database.fields import signals as field_signals
+from baserow.contrib.database.rows import signals as row_signals
 
 view_loaded = Signal()
 view_created = Signal()
@@ -73,6 +75,13 @@ def update_view_index_if_view_group_by_changes(sender, view_group_by, **kwargs):
     ViewIndexingHandler.schedule_index_update(view_group_by.view)
 
 
+@receiver([view_filter_created, view_filter_updated, view_filter_deleted])
+def update_trigram_indexes_if_view_filter_changes(sender, view_filter, **kwargs):
+    from baserow.contrib.database.views.handler import ViewIndexingHandler
+
+    ViewIndexingHandler.after_view_filter_changed(view_filter)
+
+
 @receiver(view_loaded)
 def view_loaded_create_indexes_and_columns(sender, view, table_model, **kwargs):
     from baserow.contrib.database.table.tasks import (
@@ -81,7 +90,77 @@ def view_loaded_create_indexes_and_columns(sender, view, table_model, **kwargs):
     from baserow.contrib.database.views.handler import ViewIndexingHandler
 
     ViewIndexingHandler.schedule_index_creation_if_needed(view, table_model)
+    ViewIndexingHandler.schedule_trigram_index_creation_if_needed(view, table_model)
 
     table = view.table
     if not table.last_modified_by_column_added or not table.created_by_column_added:
         setup_created_by_and_last_modified_by_column.delay(table_id=view.table.id)
+
+
+@receiver(row_signals.before_rows_update)
+def prepare_aggregations_update_before_rows_update(
+    sender, rows, table, model, updated_field_ids, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    return ViewHandler().prepare_incremental_aggregations_update(
+        table, model, rows, updated_field_ids
+    )
+
+
+@receiver(row_signals.before_rows_delete)
+def prepare_aggregations_update_before_rows_delete(
+    sender, rows, table, model, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    return ViewHandler().prepare_incremental_aggregations_update(table, model, rows)
+
+
+@receiver(row_signals.rows_created)
+def update_aggregations_after_rows_created(sender, rows, table, model, **kwargs):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    ViewHandler().update_aggregations_incrementally(table, model, rows)
+
+
+@receiver(row_signals.rows_updated)
+def update_aggregations_after_rows_updated(
+    sender, rows, table, model, before_return, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    prepared = dict(before_return).get(prepare_aggregations_update_before_rows_update)
+    if prepared:
+        ViewHandler().update_aggregations_incrementally(table, model, rows, prepared)
+
+
+@receiver(row_signals.rows_deleted)
+def update_aggregations_after_rows_deleted(
+    sender, rows, table, model, before_return, **kwargs
+):
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    prepared = dict(before_return).get(prepare_aggregations_update_before_rows_delete)
+    if prepared:
+        ViewHandler().update_aggregations_incrementally(
+            table, model, rows, prepared, deleted=True
+        )
+
+
+@receiver(m2m_changed)
+def clear_row_count_cache_after_relations_changed(
+    sender, instance, action, model, **kwargs
+):
+    from baserow.contrib.database.table.models import GeneratedTableModel
+    from baserow.contrib.database.views.handler import ViewHandler
+
+    if action not in ("post_add", "post_remove", "post_clear") or not isinstance(
+        instance, GeneratedTableModel
+    ):
+        return
+
+    table_ids = [instance.baserow_table_id]
+    if issubclass(model, GeneratedTableModel):
+        table_ids.append(model.baserow_table_id)
+    ViewHandler().clear_row_count_cache(table_ids)
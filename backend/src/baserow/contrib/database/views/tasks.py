@@ -8,6 +8,7 @@ from celery_singleton import DuplicateTaskError, Singleton
 from loguru import logger
 
 from baserow.config.celery import app
+from baserow.contrib.database.table.exceptions import TableDoesNotExist
 from baserow.contrib.database.views.exceptions import ViewDoesNotExist
 from baserow.contrib.database.views.handler import ViewIndexingHandler
 
@@ -105,3 +106,91 @@ def schedule_view_index_update(view_id: int):
         return
 
     transaction.on_commit(lambda: _schedule_view_index_update(view_id))
+
+
+AUTO_TRIGRAM_INDEX_CACHE_KEY = "auto_trigram_index_table_cache_key"
+
+
+def get_auto_trigram_index_cache_key(table_id):
+    return f"{AUTO_TRIGRAM_INDEX_CACHE_KEY}:{table_id}"
+
+
+@app.task(
+    base=Singleton,
+    queue="export",
+    lock_expiry=settings.AUTO_INDEX_LOCK_EXPIRY,
+    raise_on_duplicate=True,
+)
+def update_table_trigram_indexes(table_id: int):
+    """
+    Create/drop the trigram indexes of the provided table if needed.
+
+    :param table_id: The id of the table for which the indexes should be updated.
+    """
+
+    recheck_delay = 0
+    try:
+        ViewIndexingHandler.update_trigram_indexes_by_table_id(table_id)
+
+    except TableDoesNotExist:
+        return  # can be ignored, the table doesn't exist anymore
+    except DatabaseError:
+        if "could not obtain lock on" in traceback.format_exc():
+            recheck_delay = 10
+            logger.debug(
+                "Retrying table trigram index update in {0} seconds", recheck_delay
+            )
+            _set_pending_table_trigram_index_update(table_id)
+
+    _check_for_pending_table_trigram_index_updates.s(table_id).apply_async(
+        countdown=recheck_delay
+    )
+
+
+def _set_pending_table_trigram_index_update(table_id: int):
+    cache.set(
+        get_auto_trigram_index_cache_key(table_id),
+        True,
+        timeout=settings.AUTO_INDEX_LOCK_EXPIRY * 2,
+    )
+
+
+@app.task(queue="export")
+def _check_for_pending_table_trigram_index_updates(table_id):
+    """
+    Checks if there are any pending table trigram index updates and schedules them.
+    """
+
+    if cache.delete(get_auto_trigram_index_cache_key(table_id)):
+        _schedule_table_trigram_index_update(table_id)
+
+
+def _schedule_table_trigram_index_update(table_id: int):
+    # another task has already scheduled the table trigram index update
+    if cache.get(get_auto_trigram_index_cache_key(table_id)):
+        return
+
+    try:
+        update_table_trigram_indexes.delay(table_id)
+    except DuplicateTaskError:
+        _set_pending_table_trigram_index_update(table_id)
+    except Exception as exc:  # nosec
+        logger.error(
+            "Failed to schedule trigram index update because of {e}", e=str(exc)
+        )
+        traceback.print_exc()
+
+
+def schedule_table_trigram_index_update(table_id: int):
+    """
+    Schedules a trigram index update for the provided table id. If the update is
+    already scheduled then just add the table_id in the cache so that
+    `update_table_trigram_indexes` will re-schedule itself at the end.
+
+    :param table_id: The id of the table for which the indexes should be updated.
+    """
+
+    if not settings.AUTO_INDEX_TRIGRAM_ENABLED:
+        return
+
+    transaction.on_commit(lambda: _schedule_table_trigram_index_update(table_id))
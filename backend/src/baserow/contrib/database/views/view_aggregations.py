@@ -1,4 +1,5 @@
-from typing import Dict
+from decimal import Decimal
+from typing import Any, Dict, Optional, Tuple
 
 from django.db.models import (
     Avg,
@@ -71,6 +72,80 @@ def get_has_relations_annotation(field_name: str, model_field: Field) -> Dict:
     return {f"has_relations_{field_name}": Exists(subquery)}
 
 
+def _is_nan(value: Any) -> bool:
+    # `NaN` is the only value that isn't equal to itself.
+    return value is not None and value != value
+
+
+def _combine_incremental_sums(
+    state: Dict[str, Any],
+    removed_state: Dict[str, Any],
+    added_state: Dict[str, Any],
+    sum_key: str,
+    count_key: str,
+) -> Optional[Tuple[Any, int]]:
+    """
+    Returns the sum and the number of summed values after removing and adding the
+    sums of the provided states, or None if they can't be combined. Like the `SUM`
+    aggregate, the sum is None if there isn't any value left.
+    """
+
+    total, removed_total, added_total = (
+        state[sum_key],
+        removed_state[sum_key],
+        added_state[sum_key],
+    )
+    count = state[count_key] - removed_state[count_key] + added_state[count_key]
+    if (
+        count < 0
+        or any(_is_nan(value) for value in (total, removed_total, added_total))
+        or (total is None and removed_total is not None)
+    ):
+        return None
+
+    if removed_total is not None:
+        total = total - removed_total
+    if added_total is not None:
+        total = added_total if total is None else total + added_total
+    return (total if count > 0 else None), count
+
+
+def _divide_like_postgres(dividend: Any, divisor: int) -> Decimal:
+    """
+    Divides like the numeric division of PostgreSQL, which is used by the `AVG`
+    aggregate, so that the result has the same scale and rounding as the value
+    computed by the database. PostgreSQL keeps at least 16 significant digits, and at
+    least the scale of the operands, based on the weights and first digits of the
+    operands in base 10000.
+    """
+
+    dividend = Decimal(dividend)
+
+    def weight_and_first_digit(value: Decimal) -> Tuple[int, int]:
+        if value == 0:
+            return 0, 0
+        weight = value.copy_abs().adjusted() // 4
+        return weight, int(value.copy_abs().scaleb(-4 * weight))
+
+    dividend_weight, dividend_first_digit = weight_and_first_digit(dividend)
+    divisor_weight, divisor_first_digit = weight_and_first_digit(Decimal(divisor))
+    quotient_weight = dividend_weight - divisor_weight
+    if dividend_first_digit <= divisor_first_digit:
+        quotient_weight -= 1
+
+    dividend_scale = max(0, -dividend.as_tuple().exponent)
+    scale = min(max(16 - quotient_weight * 4, dividend_scale, 0), 1000)
+
+    # The division is done with integers, so that the result is rounded half away
+    # from zero exactly once like PostgreSQL does.
+    sign, digits, exponent = dividend.as_tuple()
+    numerator = int("".join(map(str, digits)) or "0") * 10 ** (exponent + scale)
+    quotient, remainder = divmod(numerator, divisor)
+    if remainder * 2 >= divisor:
+        quotient += 1
+    return Decimal(-quotient if sign else quotient).scaleb(-scale)
+
+
 class EmptyCountViewAggregationType(ViewAggregationType):
     """
     The empty count aggregation counts how many values are considered empty for
@@ -129,6 +204,13 @@ class EmptyCountViewAggregationType(ViewAggregationType):
                 filter=field_type.empty_query(field_name, model_field, field),
             )
 
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        return {}
+
+    def combine_incremental_states(self, state, removed_state, added_state):
+        value = state["value"] - removed_state["value"] + added_state["value"]
+        return {"value": value} if value >= 0 else None
+
 
 class NotEmptyCountViewAggregationType(EmptyCountViewAggregationType):
     """
@@ -221,6 +303,25 @@ class MinViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Min(field_name)
 
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        return {}
+
+    def combine_incremental_states(self, state, removed_state, added_state):
+        value, removed, added = (
+            state["value"],
+            removed_state["value"],
+            added_state["value"],
+        )
+        if any(_is_nan(v) for v in (value, removed, added)):
+            return None
+        # If one of the removed values was the minimum, the next smallest value is
+        # unknown.
+        if removed is not None and (value is None or removed <= value):
+            return None
+        if added is not None and (value is None or added < value):
+            value = added
+        return {"value": value}
+
 
 class MaxViewAggregationType(ViewAggregationType):
     """
@@ -247,6 +348,25 @@ class MaxViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Max(field_name)
 
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        return {}
+
+    def combine_incremental_states(self, state, removed_state, added_state):
+        value, removed, added = (
+            state["value"],
+            removed_state["value"],
+            added_state["value"],
+        )
+        if any(_is_nan(v) for v in (value, removed, added)):
+            return None
+        # If one of the removed values was the maximum, the next largest value is
+        # unknown.
+        if removed is not None and (value is None or removed >= value):
+            return None
+        if added is not None and (value is None or added > value):
+            value = added
+        return {"value": value}
+
 
 class SumViewAggregationType(ViewAggregationType):
     """
@@ -267,6 +387,19 @@ class SumViewAggregationType(ViewAggregationType):
     def get_aggregation(self, field_name, model_field, field):
         return Sum(field_name)
 
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        # The number of summed values tells whether the sum must become empty.
+        return {"count": Count(field_name)}
+
+    def combine_incremental_states(self, state, removed_state, added_state):
+        combined = _combine_incremental_sums(
+            state, removed_state, added_state, "value", "count"
+        )
+        if combined is None:
+            return None
+        value, count = combined
+        return {"value": value, "count": count}
+
 
 class AverageViewAggregationType(ViewAggregationType):
     """
@@ -291,6 +424,25 @@ class AverageViewAggregationType(ViewAggregationType):
             filter=~field_type.empty_query(field_name, model_field, field),
         )
 
+    def get_incremental_state_aggregations(self, field_name, model_field, field):
+        field_type = field_type_registry.get_by_model(field)
+        not_empty = ~field_type.empty_query(field_name, model_field, field)
+
+        return {
+            "sum": Sum(field_name, filter=not_empty),
+            "count": Count("id", filter=not_empty),
+        }
+
+    def combine_incremental_states(self, state, removed_state, added_state):
+        combined = _combine_incremental_sums(
+            state, removed_state, added_state, "sum", "count"
+        )
+        if combined is None:
+            return None
+        total, count = combined
+        value = _divide_like_postgres(total, count) if count > 0 else None
+        return {"value": value, "sum": total, "count": count}
+
 
 class StdDevViewAggregationType(ViewAggregationType):
     """
@@ -95,6 +95,7 @@ class EqualViewFilterType(ViewFilterType):
     """
 
     type = "equal"
+    can_be_used_in_partial_index = True
     compatible_field_types = [
         BooleanFieldType.type,
         TextFieldType.type,
@@ -231,6 +232,7 @@ class ContainsViewFilterType(ViewFilterType):
     """
 
     type = "contains"
+    can_use_trigram_index = True
     compatible_field_types = [
         TextFieldType.type,
         LongTextFieldType.type,
@@ -304,6 +306,8 @@ class DoesntContainWordViewFilterType(
 
 class ContainsNotViewFilterType(NotViewFilterTypeMixin, ContainsViewFilterType):
     type = "contains_not"
+    # The negated `LIKE` must check all the rows, so an index doesn't help.
+    can_use_trigram_index = False
 
 
 class LengthIsLowerThanViewFilterType(ViewFilterType):
@@ -1077,6 +1081,7 @@ class SingleSelectEqualViewFilterType(ViewFilterType):
     """
 
     type = "single_select_equal"
+    can_be_used_in_partial_index = True
     compatible_field_types = [
         SingleSelectFieldType.type,
         FormulaFieldType.compatible_with_formula_types(
@@ -1209,6 +1214,7 @@ class BooleanViewFilterType(ViewFilterType):
     """
 
     type = "boolean"
+    can_be_used_in_partial_index = True
     compatible_field_types = [
         BooleanFieldType.type,
         FormulaFieldType.compatible_with_formula_types(
@@ -1599,6 +1605,7 @@ class EmptyViewFilterType(ViewFilterType):
     """
 
     type = "empty"
+    can_be_used_in_partial_index = True
     compatible_field_types = [
         TextFieldType.type,
         LongTextFieldType.type,
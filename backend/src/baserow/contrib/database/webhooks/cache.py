@@ -0,0 +1,121 @@
+"""
+This file is responsible for caching the webhooks subscribed to the events of a table,
+so that the tables without webhooks, which are most of them, don't have to query the
+database every time a row, field or view is changed.
+
+The active webhooks of a table are stored in the Django cache with their headers and
+events prefetched, together with the version of the cache of the table, under the key:
+    `webhook_subscriptions_{table_id}`
+
+The version is stored under the key:
+    `webhook_subscriptions_version_{table_id}`
+
+It's replaced by a new one every time one of the webhooks of the table is created,
+updated or deleted. If that happens in a transaction, it's replaced again when the
+transaction is committed. An entry is only used if it has the current version, so
+webhooks fetched before an invalidation are never used after it, even if they're
+stored afterwards. Nothing is cached while in a transaction because the webhooks
+could be based on data that is not visible to the other workers yet or that is rolled
+back.
+"""
+
+import uuid
+from typing import List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+from .models import TableWebhook
+
+
+def _get_subscriptions_cache_key(table_id: int) -> str:
+    return f"webhook_subscriptions_{table_id}"
+
+
+def _get_subscriptions_version_cache_key(table_id: int) -> str:
+    return f"webhook_subscriptions_version_{table_id}"
+
+
+def _set_new_subscriptions_version(table_id: int):
+    cache.set(
+        _get_subscriptions_version_cache_key(table_id), uuid.uuid4().hex, timeout=None
+    )
+
+
+def is_webhook_subscriptions_cache_enabled() -> bool:
+    return settings.BASEROW_WEBHOOKS_SUBSCRIPTIONS_CACHE_TIMEOUT > 0
+
+
+def get_cached_table_webhooks(
+    table_id: int,
+) -> Tuple[Optional[List[TableWebhook]], Optional[str]]:
+    """
+    Returns the cached active webhooks of the table, or None if they're not in the
+    cache or have been invalidated, and the current version of the cache of the
+    table. The version must be passed to `set_cached_table_webhooks` when caching
+    the webhooks fetched afterwards.
+    """
+
+    if not is_webhook_subscriptions_cache_enabled():
+        return None, None
+
+    cache_key = _get_subscriptions_cache_key(table_id)
+    version_cache_key = _get_subscriptions_version_cache_key(table_id)
+    cached = cache.get_many([cache_key, version_cache_key])
+    version = cached.get(version_cache_key)
+    if version is None:
+        cache.add(version_cache_key, uuid.uuid4().hex, timeout=None)
+        return None, cache.get(version_cache_key)
+
+    cached_value = cached.get(cache_key)
+    if cached_value is None or cached_value["version"] != version:
+        return None, version
+
+    return cached_value["webhooks"], version
+
+
+def set_cached_table_webhooks(
+    table_id: int, webhooks: List[TableWebhook], version: Optional[str]
+):
+    """
+    Stores the active webhooks of the table in the cache, unless a transaction is
+    open or the cache of the table has been invalidated since the provided version
+    was returned by `get_cached_table_webhooks`.
+
+    :param table_id: The id of the table the webhooks belong to.
+    :param webhooks: All the active webhooks of the table with their headers and
+        events prefetched.
+    :param version: The version of the cache of the table returned by
+        `get_cached_table_webhooks` before the webhooks were fetched.
+    """
+
+    if (
+        not is_webhook_subscriptions_cache_enabled()
+        or connection.in_atomic_block
+        or version is None
+        or cache.get(_get_subscriptions_version_cache_key(table_id)) != version
+    ):
+        return
+
+    cache.set(
+        _get_subscriptions_cache_key(table_id),
+        {"version": version, "webhooks": webhooks},
+        timeout=settings.BASEROW_WEBHOOKS_SUBSCRIPTIONS_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_table_webhooks_cache(table_id: int):
+    """
+    Invalidates the cached webhooks of the table. If called in a transaction, the
+    cache is invalidated again when it's committed.
+
+    :param table_id: The id of the table whose webhooks have changed.
+    """
+
+    if not is_webhook_subscriptions_cache_enabled():
+        return
+
+    _set_new_subscriptions_version(table_id)
+    if connection.in_atomic_block:
+        transaction.on_commit(lambda: _set_new_subscriptions_version(table_id))
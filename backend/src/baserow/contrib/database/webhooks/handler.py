@@ -1,5 +1,6 @@
 import json
 import uuid
+from datetime import datetime, timezone
 from typing import List, Optional
 
 from django.conf import settings
@@ -14,6 +15,11 @@ from baserow.contrib.database.table.models import Table
 from baserow.core.handler import CoreHandler
 from baserow.core.utils import extract_allowed, set_allowed_attrs
 
+from .cache import (
+    get_cached_table_webhooks,
+    invalidate_table_webhooks_cache,
+    set_cached_table_webhooks,
+)
 from .exceptions import (
     TableWebhookDoesNotExist,
     TableWebhookEventConfigFieldNotInTable,
@@ -34,8 +40,8 @@ from .operations import (
     UpdateWebhookOperationType,
 )
 from .registries import webhook_event_type_registry
+from .sessions import get_webhook_session
 from .typing import EventConfigItem
-from .validators import get_webhook_request_function
 
 
 class WebhookHandler:
@@ -62,6 +68,40 @@ class WebhookHandler:
             .select_related("table__database")
         )
 
+    def get_webhooks_to_call(
+        self, table_id: int, event_type: str
+    ) -> List[TableWebhook]:
+        """
+        Returns the same webhooks as `find_webhooks_to_call`, but selects them from
+        the cached active webhooks of the table. The active webhooks are fetched and
+        cached if they're not in the cache yet, so that the next events of the table
+        don't have to query the database, even if it doesn't have any webhooks.
+
+        :param table_id: The id of the table where the event happened.
+        :param event_type: The type of the event.
+        :return: The webhooks that must be called, ordered by id.
+        """
+
+        webhooks, version = get_cached_table_webhooks(table_id)
+        if webhooks is None:
+            webhooks = list(
+                TableWebhook.objects.filter(table_id=table_id, active=True)
+                .prefetch_related("headers", "events", "events__fields")
+                .select_related("table__database")
+            )
+            set_cached_table_webhooks(table_id, webhooks, version)
+
+        event_type_object = webhook_event_type_registry.get(event_type)
+        include_all_events = (
+            event_type_object.should_trigger_when_all_event_types_selected
+        )
+        return [
+            webhook
+            for webhook in webhooks
+            if (include_all_events and webhook.include_all_events)
+            or any(event.event_type == event_type for event in webhook.events.all())
+        ]
+
     def get_table_webhook(
         self,
         user: DjangoUser,
@@ -219,6 +259,7 @@ class WebhookHandler:
             "request_method",
             "name",
             "include_all_events",
+            "batch_events",
         ]
         values = extract_allowed(kwargs, allowed_fields)
         webhook = TableWebhook.objects.create(table_id=table.id, **values)
@@ -295,6 +336,7 @@ class WebhookHandler:
             "name",
             "include_all_events",
             "active",
+            "batch_events",
         ]
         webhook = set_allowed_attrs(kwargs, allowed_fields, webhook)
         webhook.save()
@@ -366,6 +408,7 @@ class WebhookHandler:
         # Invalidate the prefetch objects cache because the related object might have
         # changed.
         webhook._prefetched_objects_cache = {}
+        invalidate_table_webhooks_cache(webhook.table_id)
 
         return webhook
 
@@ -403,9 +446,9 @@ class WebhookHandler:
         :return: The request and response as the tuple (request, response)
         """
 
-        request = get_webhook_request_function()
+        session = get_webhook_session(url)
 
-        response = request(
+        response = session.request(
             method,
             url,
             headers=headers,
@@ -431,6 +474,27 @@ class WebhookHandler:
             "X-Baserow-Delivery": str(event_id),
         }
 
+    def get_batch_headers(self, event_ids: List[str]):
+        """
+        Returns the default headers that must be added to a request containing the
+        payloads of multiple events.
+        """
+
+        return {
+            "Content-type": "application/json",
+            "X-Baserow-Event": "batch",
+            "X-Baserow-Delivery": str(event_ids[0]),
+            "X-Baserow-Batch-Size": str(len(event_ids)),
+        }
+
+    def get_batch_payload(self, payloads: List[dict]) -> dict:
+        """
+        Returns the payload of a request containing the payloads of multiple events,
+        in the order in which the events occurred.
+        """
+
+        return {"events": payloads}
+
     def trigger_test_call(
         self,
         user: DjangoUser,
@@ -470,6 +534,7 @@ class WebhookHandler:
             "request_method",
             "name",
             "include_all_events",
+            "batch_events",
         ]
         values = extract_allowed(kwargs, allowed_fields)
         webhook = TableWebhook(table=table, **values)  # Must not be saved.
@@ -480,7 +545,11 @@ class WebhookHandler:
         event = webhook_event_type_registry.get(event_type)
 
         payload = event.get_test_call_payload(table, model, event_id, webhook)
-        headers.update(self.get_headers(event_type, event_id))
+        if webhook.batch_events:
+            payload = self.get_batch_payload([payload])
+            headers.update(self.get_batch_headers([event_id]))
+        else:
+            headers.update(self.get_headers(event_type, event_id))
 
         return self.make_request(webhook.request_method, webhook.url, headers, payload)
 
@@ -513,6 +582,68 @@ class WebhookHandler:
             response_body,
         )
 
+    def save_webhook_calls(
+        self,
+        webhook: TableWebhook,
+        events: List[dict],
+        url: str,
+        request: Optional[PreparedRequest],
+        response: Optional[Response],
+        error: str,
+    ):
+        """
+        Stores a call log entry for every event that has been sent with the request.
+        The entries of the events that have already been sent before, for example in
+        a previous attempt, are updated. All the entries are written in bulk.
+
+        :param webhook: The webhook that has been called.
+        :param events: The events sent with the request, as dicts containing the
+            `event_id` and `event_type`.
+        :param url: The URL that has been called.
+        :param request: The request that has been made, if any.
+        :param response: The response that has been received, if any.
+        :param error: The error that occurred while making the request, if any.
+        """
+
+        values = {
+            "called_time": datetime.now(tz=timezone.utc),
+            "called_url": url,
+            "request": self.format_request(request) if request is not None else None,
+            "response": self.format_response(response)
+            if response is not None
+            else None,
+            "response_status": response.status_code if response is not None else None,
+            "error": error,
+        }
+
+        existing_calls = {
+            (str(call.event_id), call.event_type): call
+            for call in TableWebhookCall.objects.filter(
+                webhook=webhook, event_id__in=[event["event_id"] for event in events]
+            )
+        }
+        calls_to_create = []
+        calls_to_update = []
+        for event in events:
+            call = existing_calls.get((str(event["event_id"]), event["event_type"]))
+            if call is None:
+                calls_to_create.append(
+                    TableWebhookCall(
+                        webhook=webhook,
+                        event_id=event["event_id"],
+                        event_type=event["event_type"],
+                        **values,
+                    )
+                )
+            else:
+                set_allowed_attrs(values, values.keys(), call)
+                calls_to_update.append(call)
+
+        if calls_to_create:
+            TableWebhookCall.objects.bulk_create(calls_to_create)
+        if calls_to_update:
+            TableWebhookCall.objects.bulk_update(calls_to_update, list(values.keys()))
+
     def clean_webhook_calls(self, webhook: TableWebhook):
         """
         Cleans up oldest webhook calls and makes sure that the total amount of calls
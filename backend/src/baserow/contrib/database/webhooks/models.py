@@ -53,6 +53,11 @@ class TableWebhook(CreatedAndUpdatedOnMixin, models.Model):
     failed_triggers = models.IntegerField(
         default=0, help_text="The amount of failed webhook calls."
     )
+    batch_events = models.BooleanField(
+        default=False,
+        help_text="Indicates whether the events waiting to be sent must be sent "
+        "together in a single call with a batched payload.",
+    )
 
     @property
     def header_dict(self):
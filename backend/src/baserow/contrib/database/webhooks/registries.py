@@ -123,7 +123,7 @@ class WebhookEventType(Instance):
 
         table = self.get_table_object(**kwargs)
         webhook_handler = WebhookHandler()
-        webhooks = webhook_handler.find_webhooks_to_call(table.id, self.type)
+        webhooks = webhook_handler.get_webhooks_to_call(table.id, self.type)
         event_id = uuid.uuid4()
         for webhook in webhooks:
             try:
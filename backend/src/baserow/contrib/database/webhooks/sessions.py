@@ -0,0 +1,83 @@
+import threading
+from collections import OrderedDict
+from http.cookiejar import DefaultCookiePolicy
+from typing import Tuple
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from advocate import RequestsAPIWrapper
+from requests import Session
+
+from .validators import get_advocate_address_validator
+
+# The maximum number of target hosts for which a session is kept per process. The
+# least recently used session is dropped when a new host is called.
+MAX_POOLED_WEBHOOK_SESSIONS = 100
+
+_webhook_sessions: "OrderedDict[Tuple[bool, str, str], Session]" = OrderedDict()
+_webhook_sessions_lock = threading.Lock()
+
+
+def _create_webhook_session(allow_private_address: bool) -> Session:
+    if allow_private_address:
+        session = Session()
+    else:
+        session = RequestsAPIWrapper(get_advocate_address_validator()).Session()
+
+    # The session is shared by the webhooks of all the workspaces calling the same
+    # host, so the cookies set by a response must never be sent with the next
+    # calls.
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+def get_webhook_session(url: str) -> Session:
+    """
+    Returns the session that must be used to call the provided URL. One session is
+    kept per target host in every process, so that the connections to the host are
+    kept alive and reused by the next webhook calls instead of doing a new TCP and
+    TLS handshake every time. In production mode, the session of the advocate library
+    is used so that the internal network can't be reached. This can be disabled by
+    changing the Django setting BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS.
+
+    :param url: The URL that must be called.
+    :return: The session that must be used to make the request.
+    """
+
+    parsed_url = urlparse(url)
+    allow_private_address = settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True
+    key = (allow_private_address, parsed_url.scheme, parsed_url.netloc)
+
+    with _webhook_sessions_lock:
+        session = _webhook_sessions.get(key)
+        if session is None:
+            session = _create_webhook_session(allow_private_address)
+            _webhook_sessions[key] = session
+        _webhook_sessions.move_to_end(key)
+
+        while len(_webhook_sessions) > MAX_POOLED_WEBHOOK_SESSIONS:
+            # The dropped session is not closed because it could still be used by
+            # another thread. Its connections are closed when it's garbage collected.
+            _webhook_sessions.popitem(last=False)
+
+    return session
+
+
+def clear_webhook_sessions():
+    """
+    Drops all the pooled sessions, so that new ones are created with the current
+    settings.
+    """
+
+    with _webhook_sessions_lock:
+        _webhook_sessions.clear()
+
+
+@receiver(setting_changed)
+def clear_webhook_sessions_if_settings_change(sender, setting, **kwargs):
+    # The address validator is bound to the session when it's created.
+    if setting.startswith("BASEROW_WEBHOOKS_"):
+        clear_webhook_sessions()
@@ -0,0 +1,11 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_table_webhooks_cache
+from .models import TableWebhook
+
+
+@receiver(post_save, sender=TableWebhook)
+@receiver(post_delete, sender=TableWebhook)
+def invalidate_webhooks_cache_when_webhook_changed(sender, instance, **kwargs):
+    invalidate_table_webhooks_cache(instance.table_id)
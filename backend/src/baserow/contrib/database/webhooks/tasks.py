@@ -1,4 +1,4 @@
-from datetime import datetime, timezone
+from typing import List, Optional, Tuple
 
 from django.conf import settings
 from django.core import cache
@@ -37,6 +37,71 @@ def clear_webhook_queue(webhook_id):
     queue.clear()
 
 
+def pop_batchable_events_from_queue(
+    webhook_id: int, method: str, url: str, max_events: int
+) -> Tuple[List[dict], List[dict]]:
+    """
+    Pops the calls waiting in the queue of the webhook that can be sent in the same
+    request as the current call, because they use the same method and URL. It stops
+    at the first call that can't be batched, which is put back in front of the queue,
+    so that the events are always sent in the order in which they occurred.
+
+    :param webhook_id: The id of the webhook related to the calls.
+    :param method: The request method of the current call.
+    :param url: The URL of the current call.
+    :param max_events: The maximum number of events to pop.
+    :return: The `event_id`, `event_type` and `payload` of the popped events, and the
+        popped tasks, so that they can be put back with `requeue_webhook_tasks` if
+        the events can't be sent.
+    """
+
+    queue = get_queue(webhook_id)
+    events = []
+    tasks = []
+    while len(events) < max_events:
+        task = queue.get_and_pop_next()
+        if not task:
+            break
+
+        kwargs = task.get("kwargs") or {}
+        if (
+            task.get("args")
+            or kwargs.get("method") != method
+            or kwargs.get("url") != url
+        ):
+            queue.requeue_task(task)
+            break
+
+        tasks.append(task)
+        events.append(
+            {
+                "event_id": kwargs["event_id"],
+                "event_type": kwargs["event_type"],
+                "payload": kwargs["payload"],
+            }
+        )
+        events.extend(kwargs.get("batched_events") or [])
+
+    return events, tasks
+
+
+def requeue_webhook_tasks(webhook_id: int, tasks: List[dict]):
+    """
+    Puts the tasks popped by `pop_batchable_events_from_queue` back in front of the
+    queue of the webhook, in their original order.
+
+    :param webhook_id: The id of the webhook related to the calls.
+    :param tasks: The popped tasks, in the order in which they were popped.
+    """
+
+    if not tasks:
+        return
+
+    queue = get_queue(webhook_id)
+    for task in reversed(tasks):
+        queue.requeue_task(task)
+
+
 def schedule_next_task_in_queue(webhook_id):
     next_task = get_queue(webhook_id).get_and_pop_next()
     if next_task:
@@ -58,6 +123,7 @@ def call_webhook(
     headers: dict,
     payload: dict,
     retries: int = 0,
+    batched_events: Optional[List[dict]] = None,
     **kwargs: dict,
 ):
     """
@@ -81,17 +147,22 @@ def call_webhook(
     :param retries: Because the task can be added to a queue, we can't on the
         self.request.retries value. We're therefore passing in the kwargs so that we
         can still measure this.
+    :param batched_events: The `event_id`, `event_type` and `payload` of the other
+        events that must be sent in the same request. If the webhook batches its
+        events, the calls waiting in the queue are added to them, and they're kept
+        when the call is retried.
     """
 
     from advocate import UnacceptableAddressException
     from requests import RequestException
 
     from .handler import WebhookHandler
-    from .models import TableWebhook, TableWebhookCall
+    from .models import TableWebhook
 
     if self.request.retries > retries:
         retries = self.request.retries
 
+    popped_tasks = []
     try:
         with transaction.atomic():
             handler = WebhookHandler()
@@ -127,13 +198,42 @@ def call_webhook(
                 else:
                     raise e
 
+            events = [
+                {"event_id": event_id, "event_type": event_type, "payload": payload}
+            ]
+            events.extend(batched_events or [])
+            if webhook.batch_events:
+                popped_events, popped_tasks = pop_batchable_events_from_queue(
+                    webhook_id,
+                    method,
+                    url,
+                    settings.BASEROW_WEBHOOKS_MAX_EVENTS_PER_BATCH - len(events),
+                )
+                events.extend(popped_events)
+
+            if webhook.batch_events or len(events) > 1:
+                request_headers = {
+                    **headers,
+                    **handler.get_batch_headers(
+                        [event["event_id"] for event in events]
+                    ),
+                }
+                request_payload = handler.get_batch_payload(
+                    [event["payload"] for event in events]
+                )
+            else:
+                request_headers = headers
+                request_payload = payload
+
             request = None
             response = None
             success = False
             error = ""
 
             try:
-                request, response = handler.make_request(method, url, headers, payload)
+                request, response = handler.make_request(
+                    method, url, request_headers, request_payload
+                )
                 success = response.ok
             except RequestException as exception:
                 request = exception.request
@@ -142,25 +242,7 @@ def call_webhook(
             except UnacceptableAddressException as exception:
                 error = f"UnacceptableAddressException: {exception}"
 
-            TableWebhookCall.objects.update_or_create(
-                event_id=event_id,
-                event_type=event_type,
-                webhook=webhook,
-                defaults={
-                    "called_time": datetime.now(tz=timezone.utc),
-                    "called_url": url,
-                    "request": handler.format_request(request)
-                    if request is not None
-                    else None,
-                    "response": handler.format_response(response)
-                    if response is not None
-                    else None,
-                    "response_status": response.status_code
-                    if response is not None
-                    else None,
-                    "error": error,
-                },
-            )
+            handler.save_webhook_calls(webhook, events, url, request, response, error)
             handler.clean_webhook_calls(webhook)
 
             if success and webhook.failed_triggers != 0:
@@ -191,8 +273,11 @@ def call_webhook(
             # in the queue, so that only one call is triggered concurrently.
             transaction.on_commit(lambda: schedule_next_task_in_queue(webhook_id))
     except Exception as e:
-        # If something else fails, then we don't want to block the webhook call
+        # The events popped from the queue have been rolled back together with
+        # their webhook calls, so they're put back in front of the queue to not lose
+        # them. If something else fails, then we don't want to block the webhook call
         # queue, so we'll delay the next task.
+        requeue_webhook_tasks(webhook_id, popped_tasks)
         schedule_next_task_in_queue(webhook_id)
         raise e
 
@@ -206,4 +291,5 @@ def call_webhook(
         # that the task is placed at the end of the queue.
         kwargs = self.request.kwargs or {}
         kwargs["retries"] = retries + 1
+        kwargs["batched_events"] = events[1:]
         self.retry(countdown=2**retries, kwargs=kwargs)
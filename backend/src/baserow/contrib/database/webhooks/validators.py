@@ -1,13 +1,12 @@
 from http.client import _is_illegal_header_value, _is_legal_header_name
 from socket import gaierror, timeout
-from typing import Callable
 from urllib.parse import urlparse
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
 
-from advocate import AddrValidator, RequestsAPIWrapper
+from advocate import AddrValidator
 from advocate.connection import (
     UnacceptableAddressException,
     validating_create_connection,
@@ -16,28 +15,6 @@ from advocate.connection import (
 INVALID_URL_CODE = "invalid_url"
 
 
-def get_webhook_request_function() -> Callable:
-    """
-    Return the appropriate request function based on production environment
-    or settings.
-    In production mode, the advocate library is used so that the internal
-    network can't be reached. This can be disabled by changing the Django
-    setting BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS.
-    """
-
-    if settings.BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS is True:
-        from requests import request
-
-        return request
-    else:
-        from advocate import request
-
-        addr_validator = get_advocate_address_validator()
-        baserow_advocate = RequestsAPIWrapper(addr_validator)
-
-        return baserow_advocate.request
-
-
 def get_advocate_address_validator() -> AddrValidator:
     """
     Return Advocate's AddrValidator with the user configurable white and black lists.
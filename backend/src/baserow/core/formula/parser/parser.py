@@ -1,3 +1,8 @@
+from functools import lru_cache
+from typing import Callable
+
+from django.conf import settings
+
 from antlr4 import CommonTokenStream, InputStream
 from antlr4.BufferedTokenStream import BufferedTokenStream
 from antlr4.error.ErrorListener import ErrorListener
@@ -34,8 +39,46 @@ def get_parse_tree_for_formula(formula: str):
     """
     WARNING: This function is directly used by migration code. Please ensure
     backwards compatibility .
+
+    The parse trees are cached per process because the same formulas are parsed over
+    and over again, so the returned tree is shared and must never be modified.
+    """
+
+    return _get_cached_parse_tree_func()(formula)
+
+
+def get_parse_tree_cache_info():
+    """
+    Returns the statistics of the parse tree cache, containing the `hits`, `misses`,
+    `maxsize` and `currsize`.
+    """
+
+    return _get_cached_parse_tree_func().cache_info()
+
+
+def clear_parse_tree_cache():
+    """
+    Removes all the parse trees from the cache and resets its statistics.
     """
 
+    _get_cached_parse_tree_func().cache_clear()
+
+
+_cached_parse_tree_func = None
+
+
+def _get_cached_parse_tree_func() -> Callable[[str], BaserowFormula.RootContext]:
+    # The cache is created lazily so that the settings are not accessed on import.
+    global _cached_parse_tree_func
+
+    if _cached_parse_tree_func is None:
+        _cached_parse_tree_func = lru_cache(
+            maxsize=settings.BASEROW_FORMULA_PARSE_TREE_CACHE_SIZE
+        )(_parse_formula)
+    return _cached_parse_tree_func
+
+
+def _parse_formula(formula: str) -> BaserowFormula.RootContext:
     lexer = BaserowFormulaLexer(InputStream(formula))
     stream = CommonTokenStream(lexer)
     parser = BaserowFormula(stream)
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, List
 
 from baserow.core.formula.types import FormulaContext
 from baserow.core.utils import to_path
@@ -32,7 +32,18 @@ class RuntimeFormulaContext(FormulaContext):
         :return: the value for this path.
         """
 
-        provider_name, *rest = to_path(key)
+        return self.get_by_path(to_path(key))
+
+    def get_by_path(self, path: List[str]) -> Any:
+        """
+        Same as the item lookup but for an already split path, which allows compiled
+        formulas to split their paths only once.
+
+        :param path: the path parts of the data.
+        :return: the value for this path.
+        """
+
+        provider_name, *rest = path
         data_provider_type = self.data_provider_registry.get(provider_name)
         return data_provider_type.get_data_chunk(
             self,
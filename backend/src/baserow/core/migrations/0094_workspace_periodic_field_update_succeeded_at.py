@@ -0,0 +1,17 @@
+# Generated by Django 5.0.9 on 2026-10-17 18:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0093_alter_appauthprovider_options_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="workspace",
+            name="periodic_field_update_succeeded_at",
+            field=models.DateTimeField(null=True),
+        ),
+    ]
@@ -93,6 +93,16 @@ class RedisQueue:
         result = self.redis_connection.eval(lua_script, 1, self.queue_key)
         return json.loads(result) if result else None
 
+    def requeue_task(self, task_object: Any):
+        """
+        Puts a task that has just been popped back in front of the queue. The max
+        length is not checked because the task was already in the queue.
+
+        :param task_object: The object that must be put back in the queue.
+        """
+
+        self.redis_connection.lpush(self.queue_key, json.dumps(task_object))
+
     def clear(self):
         """
         Clears all objects from the queue.
@@ -757,6 +757,18 @@ def run_clear_current_workspace_id_after_test():
     clear_current_workspace_id()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache_after_test():
+    """
+    Clear the default cache after each test, so that the values cached by a test,
+    like the roles, the webhooks of a table or the AI prompt outputs, can't be used
+    by the next one.
+    """
+
+    yield
+    cache.cache.clear()
+
+
 def fake_import_formula(formula, id_mapping):
     return formula
 
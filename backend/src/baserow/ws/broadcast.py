@@ -0,0 +1,284 @@
+import asyncio
+import atexit
+import os
+import queue
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+
+from loguru import logger
+from opentelemetry import metrics
+
+meter = metrics.get_meter(__name__)
+broadcast_fan_out_latency_histogram = meter.create_histogram(
+    "baserow.ws.broadcast_fan_out_latency",
+    unit="ms",
+    description="The time between queueing a realtime event and sending it to the "
+    "channel layer.",
+)
+broadcast_messages_counter = meter.create_counter(
+    "baserow.ws.broadcast_messages",
+    unit="1",
+    description="The number of realtime events sent directly to the channel layer.",
+)
+broadcast_fallbacks_counter = meter.create_counter(
+    "baserow.ws.broadcast_fallbacks",
+    unit="1",
+    description="The number of realtime events that were dispatched via Celery "
+    "because they couldn't be sent directly.",
+)
+
+BATCH_MESSAGE_TYPE = "broadcast_batch"
+
+
+class ChannelGroupBroadcaster:
+    """
+    Sends messages to channel groups directly from the current process. The messages
+    are queued and sent by a background thread that runs its own event loop, so that
+    the connection pools of the channel layer are kept open instead of being created
+    and closed for every message like the Celery tasks do.
+
+    The messages that are queued within `batch_interval` seconds of each other,
+    which is the case for all the events of a transaction because they're
+    broadcast in its `on_commit` callbacks, are grouped per channel group and sent as
+    one message. The consumer then handles them in order.
+    """
+
+    def __init__(
+        self,
+        batch_interval: Optional[float] = None,
+        max_batch_size: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+    ):
+        self._batch_interval = batch_interval
+        self._max_batch_size = max_batch_size
+        self._max_queue_size = max_queue_size
+        self._lock = threading.Lock()
+        self._queue = None
+        self._thread = None
+        self._pid = None
+
+    @property
+    def batch_interval(self) -> float:
+        if self._batch_interval is not None:
+            return self._batch_interval
+        return settings.BASEROW_WS_BROADCAST_BATCH_INTERVAL_MS / 1000
+
+    @property
+    def max_batch_size(self) -> int:
+        if self._max_batch_size is not None:
+            return self._max_batch_size
+        return settings.BASEROW_WS_BROADCAST_MAX_BATCH_SIZE
+
+    @property
+    def max_queue_size(self) -> int:
+        if self._max_queue_size is not None:
+            return self._max_queue_size
+        return settings.BASEROW_WS_BROADCAST_MAX_QUEUE_SIZE
+
+    def send(self, channel_group_name: str, message: dict) -> bool:
+        """
+        Queues the message to be sent to the channel group.
+
+        :param channel_group_name: The name of the channel group that should receive
+            the message.
+        :param message: The message that must be sent. The `type` must match an event
+            handler of the consumer.
+        :return: `False` if the message could not be queued, because direct
+            broadcasting is disabled or the queue is full. The caller must then
+            dispatch the message in another way.
+        """
+
+        if not settings.BASEROW_WS_DIRECT_BROADCAST_ENABLED:
+            return False
+
+        try:
+            self._get_queue().put_nowait(
+                (time.perf_counter(), channel_group_name, message)
+            )
+        except queue.Full:
+            broadcast_fallbacks_counter.add(1)
+            return False
+
+        return True
+
+    def flush(self, timeout: Optional[float] = None):
+        """
+        Blocks until all the queued messages have been sent.
+
+        :param timeout: The maximum number of seconds to wait.
+        """
+
+        if self._queue is None or self._pid != os.getpid():
+            return
+
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            time.sleep(0.001)
+
+    def close(self, timeout: Optional[float] = None):
+        """
+        Sends the queued messages, then stops the background thread and closes the
+        connection pools of its channel layer.
+
+        :param timeout: The maximum number of seconds to wait for each step.
+        """
+
+        if self._thread is None or self._pid != os.getpid():
+            return
+
+        self.flush(timeout=timeout)
+        with self._lock:
+            message_queue, thread = self._queue, self._thread
+            self._queue, self._thread = None, None
+
+        try:
+            message_queue.put(None, timeout=timeout)
+        except queue.Full:
+            return
+        thread.join(timeout=timeout)
+
+    def _get_queue(self) -> queue.Queue:
+        """
+        Returns the queue of the background thread, starting the thread if needed.
+        The thread is started lazily and again after forking, because threads don't
+        survive a fork of the process.
+        """
+
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None:
+            return self._queue
+
+        with self._lock:
+            if self._pid != pid or self._thread is None:
+                self._queue = queue.Queue(maxsize=self.max_queue_size)
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(self._queue,),
+                    name="baserow-ws-broadcaster",
+                    daemon=True,
+                )
+                self._thread.start()
+                self._pid = pid
+
+        return self._queue
+
+    def _run(self, message_queue: queue.Queue):
+        from channels.layers import DEFAULT_CHANNEL_LAYER, channel_layers
+
+        # The connection pools of a channel layer are bound to the event loop they're
+        # created in, so this thread uses its own channel layer instead of sharing the
+        # one of `get_channel_layer` with the rest of the process.
+        channel_layer = channel_layers.make_backend(DEFAULT_CHANNEL_LAYER)
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        stop = False
+        try:
+            while not stop:
+                batch = self._get_batch(message_queue)
+                # `None` is queued by `close` to stop the thread.
+                if batch[-1] is None:
+                    stop = True
+                    batch.pop()
+                    message_queue.task_done()
+                if not batch:
+                    continue
+                try:
+                    failed_messages = loop.run_until_complete(
+                        self._send_batch(channel_layer, batch)
+                    )
+                    if failed_messages:
+                        self._send_via_celery(failed_messages)
+                except Exception:
+                    logger.exception("Failed to broadcast realtime events.")
+                finally:
+                    for _ in batch:
+                        message_queue.task_done()
+        finally:
+            close_pools = getattr(channel_layer, "close_pools", None)
+            if close_pools is not None:
+                try:
+                    loop.run_until_complete(close_pools())
+                except Exception:
+                    logger.exception("Failed to close the channel layer pools.")
+            loop.close()
+
+    def _get_batch(
+        self, message_queue: queue.Queue
+    ) -> List[Optional[Tuple[float, str, dict]]]:
+        """
+        Waits for the first message and then collects the messages that are queued
+        within the batch interval. Stops collecting after a `None` item, which is
+        then the last item of the batch.
+        """
+
+        batch = [message_queue.get()]
+        deadline = time.perf_counter() + self.batch_interval
+        while batch[-1] is not None and len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining > 0:
+                    batch.append(message_queue.get(timeout=remaining))
+                else:
+                    batch.append(message_queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    @staticmethod
+    def _group_batch(batch: List[Tuple[float, str, dict]]) -> Dict[str, List[dict]]:
+        messages_per_group = defaultdict(list)
+        for _, channel_group_name, message in batch:
+            messages_per_group[channel_group_name].append(message)
+        return messages_per_group
+
+    async def _send_batch(
+        self, channel_layer, batch: List[Tuple[float, str, dict]]
+    ) -> Dict[str, List[dict]]:
+        """
+        Sends the messages of the batch grouped per channel group.
+
+        :return: The messages per channel group that could not be sent.
+        """
+
+        failed_messages = {}
+        for channel_group_name, messages in self._group_batch(batch).items():
+            if len(messages) == 1:
+                message = messages[0]
+            else:
+                message = {"type": BATCH_MESSAGE_TYPE, "messages": messages}
+            try:
+                await channel_layer.group_send(channel_group_name, message)
+            except Exception:
+                logger.exception(
+                    f"Failed to broadcast to {channel_group_name}, falling back to "
+                    f"Celery."
+                )
+                failed_messages[channel_group_name] = messages
+
+        now = time.perf_counter()
+        for queued_at, _, _ in batch:
+            broadcast_fan_out_latency_histogram.record((now - queued_at) * 1000)
+        sent_count = len(batch) - sum(len(m) for m in failed_messages.values())
+        broadcast_messages_counter.add(sent_count)
+        return failed_messages
+
+    def _send_via_celery(self, messages_per_group: Dict[str, List[dict]]):
+        from baserow.ws.tasks import broadcast_messages_to_channel_group
+
+        for channel_group_name, messages in messages_per_group.items():
+            broadcast_fallbacks_counter.add(len(messages))
+            broadcast_messages_to_channel_group.delay(channel_group_name, messages)
+
+
+channel_group_broadcaster = ChannelGroupBroadcaster()
+
+# Try to send the remaining messages and close the connection pools when the process
+# shuts down gracefully.
+atexit.register(channel_group_broadcaster.close, timeout=2)
@@ -423,6 +423,18 @@ class CoreConsumer(AsyncJsonWebsocketConsumer):
         if not ignore_web_socket_id or ignore_web_socket_id != web_socket_id:
             await self.send_json(payload)
 
+    async def broadcast_batch(self, event):
+        """
+        Handles multiple messages that have been sent to a group at once, in the
+        order they were sent.
+
+        :param event: The event containing the list of messages. Each message is
+            dispatched to the event handler matching its type.
+        """
+
+        for message in event["messages"]:
+            await self.dispatch(message)
+
     async def users_removed_from_permission_group(self, event):
         """
         Event handler that reacts to a situation when one or many users were
@@ -1,4 +1,6 @@
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from celery import Task
 
 from baserow.config.celery import app
 
@@ -53,7 +55,74 @@ async def send_message_to_channel_group(
         await channel_layer.close_pools()
 
 
-@app.task(bind=True)
+def broadcast_message_to_channel_group(channel_group_name: str, message: dict):
+    """
+    Sends a message to a channel group via the `ChannelGroupBroadcaster` of the
+    current process if possible, or right away with a new channel layer connection
+    otherwise.
+
+    :param channel_group_name: The channel group name identifying the channel group
+        that should receive the message.
+    :param message: JSON to send.
+    """
+
+    from asgiref.sync import async_to_sync
+    from channels.layers import get_channel_layer
+
+    from baserow.ws.broadcast import channel_group_broadcaster
+
+    if channel_group_broadcaster.send(channel_group_name, message):
+        return
+
+    channel_layer = get_channel_layer()
+    async_to_sync(send_message_to_channel_group)(
+        channel_layer, channel_group_name, message
+    )
+
+
+class ChannelGroupMessageTask(Task):
+    """
+    The base of the tasks that only send one message to a channel group. Calling
+    `delay` queues the message to the `ChannelGroupBroadcaster` of the current process
+    instead of dispatching the Celery task, which is only used as fallback if the
+    message can't be queued.
+
+    The tasks must provide a `get_channel_group_message` static method accepting the
+    arguments of the task and returning the channel group name and the message.
+    """
+
+    get_channel_group_message = None
+
+    def delay(self, *args, **kwargs):
+        from baserow.ws.broadcast import channel_group_broadcaster
+
+        channel_group_name, message = self.get_channel_group_message(*args, **kwargs)
+        if channel_group_broadcaster.send(channel_group_name, message):
+            return None
+
+        return super().delay(*args, **kwargs)
+
+
+def get_broadcast_to_users_message(
+    user_ids: List[int],
+    payload: Dict[Any, Any],
+    ignore_web_socket_id: Optional[int] = None,
+    send_to_all_users: bool = False,
+) -> Tuple[str, dict]:
+    return "users", {
+        "type": "broadcast_to_users",
+        "user_ids": user_ids,
+        "payload": payload,
+        "ignore_web_socket_id": ignore_web_socket_id,
+        "send_to_all_users": send_to_all_users,
+    }
+
+
+@app.task(
+    bind=True,
+    base=ChannelGroupMessageTask,
+    get_channel_group_message=staticmethod(get_broadcast_to_users_message),
+)
 def broadcast_to_users(
     self,
     user_ids: List[int],
@@ -75,20 +144,10 @@ def broadcast_to_users(
         be respected.
     """
 
-    from asgiref.sync import async_to_sync
-    from channels.layers import get_channel_layer
-
-    channel_layer = get_channel_layer()
-    async_to_sync(send_message_to_channel_group)(
-        channel_layer,
-        "users",
-        {
-            "type": "broadcast_to_users",
-            "user_ids": user_ids,
-            "payload": payload,
-            "ignore_web_socket_id": ignore_web_socket_id,
-            "send_to_all_users": send_to_all_users,
-        },
+    broadcast_message_to_channel_group(
+        *get_broadcast_to_users_message(
+            user_ids, payload, ignore_web_socket_id, send_to_all_users
+        )
     )
 
 
@@ -156,7 +215,23 @@ def broadcast_to_permitted_users(
     broadcast_to_users(user_ids, payload, ignore_web_socket_id=ignore_web_socket_id)
 
 
-@app.task(bind=True)
+def get_broadcast_to_users_individual_payloads_message(
+    payload_map: Dict[str, any], ignore_web_socket_id: Optional[int] = None
+) -> Tuple[str, dict]:
+    return "users", {
+        "type": "broadcast_to_users_individual_payloads",
+        "payload_map": payload_map,
+        "ignore_web_socket_id": ignore_web_socket_id,
+    }
+
+
+@app.task(
+    bind=True,
+    base=ChannelGroupMessageTask,
+    get_channel_group_message=staticmethod(
+        get_broadcast_to_users_individual_payloads_message
+    ),
+)
 def broadcast_to_users_individual_payloads(
     self, payload_map: Dict[str, any], ignore_web_socket_id: Optional[int] = None
 ):
@@ -171,22 +246,32 @@ def broadcast_to_users_individual_payloads(
         made the change request.
     """
 
-    from asgiref.sync import async_to_sync
-    from channels.layers import get_channel_layer
-
-    channel_layer = get_channel_layer()
-    async_to_sync(send_message_to_channel_group)(
-        channel_layer,
-        "users",
-        {
-            "type": "broadcast_to_users_individual_payloads",
-            "payload_map": payload_map,
-            "ignore_web_socket_id": ignore_web_socket_id,
-        },
+    broadcast_message_to_channel_group(
+        *get_broadcast_to_users_individual_payloads_message(
+            payload_map, ignore_web_socket_id
+        )
     )
 
 
-@app.task(bind=True)
+def get_broadcast_to_channel_group_message(
+    workspace: str,
+    payload: dict,
+    ignore_web_socket_id: Optional[str] = None,
+    exclude_user_ids: Optional[List[int]] = None,
+) -> Tuple[str, dict]:
+    return workspace, {
+        "type": "broadcast_to_group",
+        "payload": payload,
+        "ignore_web_socket_id": ignore_web_socket_id,
+        "exclude_user_ids": exclude_user_ids,
+    }
+
+
+@app.task(
+    bind=True,
+    base=ChannelGroupMessageTask,
+    get_channel_group_message=staticmethod(get_broadcast_to_channel_group_message),
+)
 def broadcast_to_channel_group(
     self,
     workspace,
@@ -212,19 +297,37 @@ def broadcast_to_channel_group(
     :type exclude_user_ids: Optional[list]
     """
 
+    broadcast_message_to_channel_group(
+        *get_broadcast_to_channel_group_message(
+            workspace, payload, ignore_web_socket_id, exclude_user_ids
+        )
+    )
+
+
+@app.task(bind=True)
+def broadcast_messages_to_channel_group(
+    self, channel_group_name: str, messages: List[dict]
+):
+    """
+    Sends the provided messages to the channel group in one message. This is used if
+    the messages could not be sent directly by the `ChannelGroupBroadcaster`.
+
+    :param channel_group_name: The name of the channel group that should receive the
+        messages.
+    :param messages: The messages that must be sent in order. The `type` of every
+        message must match an event handler of the consumer.
+    """
+
     from asgiref.sync import async_to_sync
     from channels.layers import get_channel_layer
 
+    from baserow.ws.broadcast import BATCH_MESSAGE_TYPE
+
     channel_layer = get_channel_layer()
     async_to_sync(send_message_to_channel_group)(
         channel_layer,
-        workspace,
-        {
-            "type": "broadcast_to_group",
-            "payload": payload,
-            "ignore_web_socket_id": ignore_web_socket_id,
-            "exclude_user_ids": exclude_user_ids,
-        },
+        channel_group_name,
+        {"type": BATCH_MESSAGE_TYPE, "messages": messages},
     )
 
 
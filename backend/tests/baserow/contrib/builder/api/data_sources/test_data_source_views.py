@@ -1,7 +1,8 @@
 import json
 from unittest.mock import ANY, MagicMock, patch
 
-from django.db import transaction
+from django.db import connection, transaction
+from django.test import override_settings
 from django.urls import reverse
 
 import pytest
@@ -13,6 +14,7 @@ from rest_framework.status import (
     HTTP_404_NOT_FOUND,
 )
 
+from baserow.contrib.builder.data_sources.handler import DataSourceHandler
 from baserow.contrib.builder.data_sources.models import DataSource
 from baserow.contrib.database.rows.handler import RowHandler
 from baserow.core.services.models import Service
@@ -1545,6 +1547,102 @@ def test_dispatch_data_sources(api_client, data_fixture):
     }
 
 
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_BUILDER_DATA_SOURCE_DISPATCH_MAX_WORKERS=1)
+def test_dispatch_data_sources_sequentially_in_a_transaction(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    builder = data_fixture.create_builder_application(user=user)
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_fixture.create_builder_data_source(user=user, page=page)
+
+    in_atomic_block = []
+
+    def dispatch_data_sources(self, data_sources, dispatch_context):
+        in_atomic_block.append(connection.in_atomic_block)
+        return {}
+
+    url = reverse("api:builder:data_source:dispatch-all", kwargs={"page_id": page.id})
+
+    with patch.object(
+        DataSourceHandler,
+        "dispatch_data_sources",
+        autospec=True,
+        side_effect=dispatch_data_sources,
+    ):
+        response = api_client.post(
+            url,
+            {},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+
+    assert response.status_code == HTTP_200_OK
+    assert in_atomic_block == [True]
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_BUILDER_DATA_SOURCE_DISPATCH_MAX_WORKERS=4)
+def test_dispatch_data_sources_concurrently(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["BMW"], ["Audi"], ["2Cv"]],
+    )
+    view = data_fixture.create_grid_view(user, table=table)
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        view=view,
+        table=table,
+        row_id=str(rows[1].id),
+    )
+    data_source2 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        view=view,
+        table=table,
+        row_id=str(rows[2].id),
+    )
+
+    url = reverse("api:builder:data_source:dispatch-all", kwargs={"page_id": page.id})
+
+    with patch.object(
+        DataSourceHandler,
+        "_dispatch_data_sources_concurrently",
+        autospec=True,
+        side_effect=DataSourceHandler._dispatch_data_sources_concurrently,
+    ) as dispatch_data_sources_concurrently:
+        response = api_client.post(
+            url,
+            {},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+
+    assert response.status_code == HTTP_200_OK
+    assert dispatch_data_sources_concurrently.call_count == 1
+    assert response.json() == {
+        str(data_source.id): {
+            fields[0].db_column: "Audi",
+            "id": rows[1].id,
+            "order": AnyStr(),
+        },
+        str(data_source2.id): {
+            fields[0].db_column: "2Cv",
+            "id": rows[2].id,
+            "order": AnyStr(),
+        },
+    }
+
+
 @pytest.mark.django_db
 def test_dispatch_data_sources_with_formula_using_datasource_calling_an_other(
     data_fixture, api_client
@@ -16,6 +16,7 @@ from baserow.contrib.builder.data_sources.exceptions import (
     DataSourceDoesNotExist,
     DataSourceImproperlyConfigured,
 )
+from baserow.contrib.builder.data_sources.handler import DataSourceHandler
 from baserow.contrib.builder.elements.models import Element
 from baserow.contrib.builder.pages.models import Page
 from baserow.core.exceptions import PermissionException
@@ -980,6 +981,63 @@ def test_public_dispatch_data_sources_get_row_no_elements(
     assert response.json() == {str(data_source.id): {}}
 
 
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_BUILDER_DATA_SOURCE_DISPATCH_MAX_WORKERS=4)
+def test_public_dispatch_data_sources_concurrently(
+    api_client, data_fixture, user_source_user_fixture
+):
+    user = user_source_user_fixture["user"]
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["Apple"], ["Banana"], ["Cherry"]],
+    )
+
+    page = user_source_user_fixture["page"]
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=user_source_user_fixture["integration"],
+        table=table,
+        row_id=str(rows[1].id),
+    )
+    data_source2 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=user_source_user_fixture["integration"],
+        table=table,
+        row_id=str(rows[2].id),
+    )
+
+    builder = page.builder
+    builder.workspace = None
+    builder.save()
+    data_fixture.create_builder_custom_domain(published_to=builder)
+
+    url = reverse(
+        "api:builder:domains:public_dispatch_all",
+        kwargs={"page_id": page.id},
+    )
+    user_token = user_source_user_fixture["user_source_user_token"]
+
+    with patch.object(
+        DataSourceHandler,
+        "_dispatch_data_sources_concurrently",
+        autospec=True,
+        side_effect=DataSourceHandler._dispatch_data_sources_concurrently,
+    ) as dispatch_data_sources_concurrently:
+        response = api_client.post(
+            url,
+            {},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {user_token}",
+        )
+
+    assert response.status_code == HTTP_200_OK
+    assert dispatch_data_sources_concurrently.call_count == 1
+    assert response.json() == {str(data_source.id): {}, str(data_source2.id): {}}
+
+
 @pytest.mark.django_db
 def test_public_dispatch_data_sources_list_rows_no_elements(
     api_client, data_fixture, user_source_user_fixture
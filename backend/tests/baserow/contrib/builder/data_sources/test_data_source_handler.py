@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 from django.http import HttpRequest
 from django.shortcuts import reverse
+from django.test import override_settings
 
 import pytest
 
@@ -352,6 +353,76 @@ def test_dispatch_data_sources(data_fixture):
     assert isinstance(result[data_source3.id], Exception)
 
 
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_BUILDER_DATA_SOURCE_DISPATCH_MAX_WORKERS=4)
+def test_dispatch_data_sources_concurrently(data_fixture):
+    user = data_fixture.create_user()
+    table, fields, rows = data_fixture.build_table(
+        user=user,
+        columns=[("Name", "text")],
+        rows=[["BMW"], ["Audi"], ["Volkswagen"]],
+    )
+    view = data_fixture.create_grid_view(user, table=table)
+    builder = data_fixture.create_builder_application(user=user)
+    integration = data_fixture.create_local_baserow_integration(
+        user=user, application=builder
+    )
+    page = data_fixture.create_builder_page(user=user, builder=builder)
+    data_source = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        view=view,
+        table=table,
+        row_id=str(rows[1].id),
+    )
+    data_source2 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        view=view,
+        table=table,
+        row_id=str(rows[2].id),
+    )
+    data_source3 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        view=view,
+        table=table,
+        row_id=f"get('data_source.{data_source.id}.id')",
+    )
+    data_source4 = data_fixture.create_builder_local_baserow_get_row_data_source(
+        user=user,
+        page=page,
+        integration=integration,
+        view=view,
+        table=table,
+        row_id="b",
+    )
+
+    dispatch_context = BuilderDispatchContext(
+        HttpRequest(), page, only_expose_public_formula_fields=False
+    )
+    handler = DataSourceHandler()
+    with patch.object(
+        handler.service_handler,
+        "dispatch_service",
+        wraps=handler.service_handler.dispatch_service,
+    ) as dispatch_service:
+        result = handler.dispatch_data_sources(
+            [data_source, data_source2, data_source3, data_source4],
+            dispatch_context,
+        )
+
+    # The dependent data source reused the result of the first one.
+    assert dispatch_service.call_count == 4
+    assert result[data_source.id][fields[0].db_column] == "Audi"
+    assert result[data_source2.id][fields[0].db_column] == "Volkswagen"
+    assert result[data_source3.id][fields[0].db_column] == "Audi"
+    assert isinstance(result[data_source4.id], Exception)
+
+
 @pytest.mark.django_db
 def test_update_data_source_invalid_values(data_fixture):
     data_source = data_fixture.create_builder_local_baserow_get_row_data_source()
@@ -6,8 +6,10 @@ from rest_framework import serializers
 from baserow.contrib.database.api.rows.serializers import (
     RowSerializer,
     get_example_row_serializer_class,
+    get_row_encoder,
     get_row_serializer_class,
     remap_serialized_row_to_user_field_names,
+    serialize_rows_with_encoder,
 )
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import SelectOption
@@ -499,3 +501,76 @@ def test_remap_serialized_row_to_user_field_names(data_fixture):
         ],
         "Test 1": "Test value",
     }
+
+
+@pytest.mark.django_db
+def test_get_row_serializer_class_is_cached_per_model(data_fixture, settings):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table, name="Text")
+    model = table.get_model()
+
+    serializer_class = get_row_serializer_class(
+        model, RowSerializer, is_response=True, field_ids=[text_field.id]
+    )
+    assert serializer_class is get_row_serializer_class(
+        model, RowSerializer, is_response=True, field_ids=[text_field.id]
+    )
+    assert serializer_class is not get_row_serializer_class(
+        model, RowSerializer, is_response=False, field_ids=[text_field.id]
+    )
+    assert serializer_class is not get_row_serializer_class(
+        model,
+        RowSerializer,
+        is_response=True,
+        field_ids=[text_field.id],
+        user_field_names=True,
+    )
+    assert serializer_class is not get_row_serializer_class(
+        model,
+        RowSerializer,
+        is_response=True,
+        field_ids=[text_field.id],
+        field_kwargs={f"field_{text_field.id}": {"required": False}},
+    )
+
+    # The fields of the table have changed, so the model and the serializer must be
+    # generated again.
+    number_field = data_fixture.create_number_field(table=table, name="Number")
+    new_model = table.get_model()
+    new_serializer_class = get_row_serializer_class(
+        new_model, RowSerializer, is_response=True
+    )
+    assert new_serializer_class is not get_row_serializer_class(
+        model, RowSerializer, is_response=True
+    )
+    assert f"field_{number_field.id}" in new_serializer_class().fields
+
+    # The serializers of a model generated for a single call aren't cached, so that
+    # they don't keep the model in memory.
+    filtered_model = table.get_model(field_ids=[text_field.id])
+    assert get_row_serializer_class(
+        filtered_model, RowSerializer, is_response=True
+    ) is not get_row_serializer_class(filtered_model, RowSerializer, is_response=True)
+    assert "_row_serializer_classes" not in filtered_model.__dict__
+
+    settings.BASEROW_ROW_SERIALIZER_CLASS_CACHE_SIZE = 0
+    assert new_serializer_class is not get_row_serializer_class(
+        new_model, RowSerializer, is_response=True
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("user_field_names", [False, True])
+def test_serialize_rows_with_encoder_matches_serializer(data_fixture, user_field_names):
+    table, user, row, _, context = setup_interesting_test_table(data_fixture)
+    model = table.get_model()
+    model.objects.create()
+    rows = list(model.objects.all().enhance_by_fields())
+    serializer_class = get_row_serializer_class(
+        model, RowSerializer, is_response=True, user_field_names=user_field_names
+    )
+
+    assert get_row_encoder(serializer_class) is get_row_encoder(serializer_class)
+    assert serialize_rows_with_encoder(serializer_class, rows) == (
+        serializer_class(rows, many=True).data
+    )
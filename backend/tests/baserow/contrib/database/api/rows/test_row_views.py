@@ -2,7 +2,7 @@ import json
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from unittest.mock import patch
-from urllib.parse import quote
+from urllib.parse import quote, urlencode
 
 from django.db import connection
 from django.shortcuts import reverse
@@ -4326,3 +4326,91 @@ def test_list_rows_can_combine_view_id_with_include_exclude(
         {"id": AnyInt(), "order": AnyStr(), "Name": "Paul"},
         {"id": AnyInt(), "order": AnyStr(), "Name": "Jack"},
     ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("order_by", [None, "{name}", "-{name},{number}"])
+def test_list_rows_cursor_pagination(data_fixture, api_client, order_by):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    name_field = data_fixture.create_text_field(name="Name", table=table, primary=True)
+    number_field = data_fixture.create_number_field(name="Number", table=table)
+    model = table.get_model()
+    for name, number in [
+        ("b", 1),
+        ("a", None),
+        (None, 2),
+        ("b", None),
+        ("c", 3),
+        (None, None),
+        ("a", 1),
+    ]:
+        model.objects.create(
+            **{f"field_{name_field.id}": name, f"field_{number_field.id}": number}
+        )
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    params = {"size": 2}
+    if order_by:
+        params["order_by"] = order_by.format(name=name_field.id, number=number_field.id)
+    response = api_client.get(
+        url, {**params, "size": 100}, HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    expected_ids = [row["id"] for row in response.json()["results"]]
+
+    cursor_ids = []
+    next_url = f"{url}?{urlencode({**params, 'cursor': ''})}"
+    while next_url:
+        response = api_client.get(next_url, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+        assert response.status_code == HTTP_200_OK
+        response_json = response.json()
+        assert "count" not in response_json
+        assert len(response_json["results"]) <= 2
+        cursor_ids += [row["id"] for row in response_json["results"]]
+        next_url = response_json["next"]
+
+    assert cursor_ids == expected_ids
+
+
+@pytest.mark.django_db
+def test_list_rows_cursor_pagination_invalid_cursor(data_fixture, api_client):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(name="Name", table=table, primary=True)
+    other_field = data_fixture.create_text_field(name="Other", table=table)
+    model = table.get_model()
+    for _ in range(3):
+        model.objects.create()
+
+    url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    response = api_client.get(
+        url, {"cursor": "invalid"}, HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+    response = api_client.get(
+        url, {"cursor": "", "size": 1}, HTTP_AUTHORIZATION=f"JWT {jwt_token}"
+    )
+    next_url = response.json()["next"]
+
+    # A cursor can't be used with a different ordering.
+    response = api_client.get(
+        f"{next_url}&order_by=-field_{field.id}",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
+
+    # Nor with the same kind of ordering expression on another field.
+    response = api_client.get(
+        url,
+        {"cursor": "", "size": 1, "order_by": f"field_{field.id}"},
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    next_url = response.json()["next"].replace(
+        f"field_{field.id}", f"field_{other_field.id}"
+    )
+    response = api_client.get(next_url, HTTP_AUTHORIZATION=f"JWT {jwt_token}")
+    assert response.status_code == HTTP_400_BAD_REQUEST
+    assert response.json()["error"] == "ERROR_INVALID_CURSOR"
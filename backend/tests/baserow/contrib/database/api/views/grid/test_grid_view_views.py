@@ -1,9 +1,11 @@
 import json
 from decimal import Decimal
 from typing import Any, Dict, List
+from unittest.mock import patch
 
 from django.core.cache import cache
 from django.shortcuts import reverse
+from django.test.utils import override_settings
 
 import pytest
 from pytest_unordered import unordered
@@ -11,6 +13,7 @@ from rest_framework import serializers
 from rest_framework.fields import Field
 from rest_framework.status import (
     HTTP_200_OK,
+    HTTP_204_NO_CONTENT,
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
     HTTP_404_NOT_FOUND,
@@ -1846,6 +1849,85 @@ def test_view_aggregations_cache_invalidation_with_dependant_fields(
     )
 
 
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_VIEW_INCREMENTAL_AGGREGATIONS_ENABLED=True)
+def test_view_aggregations_are_updated_incrementally_through_the_api(
+    api_client, data_fixture
+):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    number_field = data_fixture.create_number_field(table=table, name="Number")
+    grid = data_fixture.create_grid_view(table=table)
+    data_fixture.create_grid_view_field_option(
+        grid_view=grid,
+        field=number_field,
+        aggregation_type="sum",
+        aggregation_raw_type="sum",
+    )
+
+    rows_url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+    url = reverse(
+        "api:database:views:grid:field-aggregations",
+        kwargs={"view_id": grid.id},
+    )
+    value_cache_key = f"aggregation_value__{grid.id}_{number_field.db_column}"
+    version_cache_key = f"aggregation_version__{grid.id}_{number_field.db_column}"
+
+    def create_row(value):
+        response = api_client.post(
+            rows_url,
+            {f"field_{number_field.id}": value},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+        assert response.status_code == HTTP_200_OK
+        return response.json()
+
+    def get_aggregation():
+        response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {token}")
+        assert response.status_code == HTTP_200_OK
+        return response.json()[number_field.db_column]
+
+    def assert_cached_value_is_up_to_date(value):
+        cached_value = cache.get(value_cache_key)
+        assert cached_value["version"] == cache.get(version_cache_key)
+        assert cached_value["value"] == value
+
+    row_1 = create_row(1)
+    create_row(10)
+    assert get_aggregation() == 11
+
+    # The cached value is updated with the changed rows, so it's already up to
+    # date before the aggregations are requested again.
+    row_3 = create_row(100)
+    assert_cached_value_is_up_to_date(111)
+    assert get_aggregation() == 111
+
+    response = api_client.patch(
+        reverse(
+            "api:database:rows:item",
+            kwargs={"table_id": table.id, "row_id": row_1["id"]},
+        ),
+        {f"field_{number_field.id}": 1000},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    assert_cached_value_is_up_to_date(1110)
+    assert get_aggregation() == 1110
+
+    response = api_client.delete(
+        reverse(
+            "api:database:rows:item",
+            kwargs={"table_id": table.id, "row_id": row_3["id"]},
+        ),
+        HTTP_AUTHORIZATION=f"JWT {token}",
+    )
+    assert response.status_code == HTTP_204_NO_CONTENT
+    assert_cached_value_is_up_to_date(1010)
+    assert get_aggregation() == 1010
+
+
 @pytest.mark.django_db
 def test_can_get_aggregation_if_result_is_nan(api_client, data_fixture):
     user, token = data_fixture.create_user_and_token()
@@ -4930,3 +5012,228 @@ def test_list_grid_rows_adhoc_filtering_advanced_filters(api_client, data_fixtur
         response_json = response.json()
         assert response.status_code == HTTP_400_BAD_REQUEST
         assert response_json["error"] == "ERROR_FILTERS_PARAM_VALIDATION_ERROR"
+
+
+@pytest.mark.django_db
+@override_settings(
+    BASEROW_VIEW_ROW_COUNT_CACHE_TIMEOUT=60, BASEROW_ROW_COPY_INSERT_MIN_ROWS=2
+)
+def test_list_rows_count_is_cached_until_rows_change(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    grid = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    model.objects.create(**{f"field_{text_field.id}": "a"})
+    model.objects.create(**{f"field_{text_field.id}": "b"})
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+
+    def get_count():
+        response = api_client.get(
+            url, data={"count": ""}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        return response.json()["count"]
+
+    assert get_count() == 2
+    assert cache.get(f"row_count_value__{grid.id}")["value"] == 2
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.json()["count"] == 2
+
+    RowHandler().create_row(user, table, {f"field_{text_field.id}": "c"}, model)
+    assert get_count() == 3
+
+    # The rows written directly via the model invalidate the cached count as well.
+    model.objects.create(**{f"field_{text_field.id}": "d"})
+    assert get_count() == 4
+    model.objects.bulk_create([model(**{f"field_{text_field.id}": "e"})])
+    assert get_count() == 5
+    model.objects.filter(**{f"field_{text_field.id}": "e"}).delete()
+    assert get_count() == 4
+    model.objects.filter(**{f"field_{text_field.id}": "d"}).update(trashed=True)
+    assert get_count() == 3
+    model.objects.get(**{f"field_{text_field.id}": "c"}).delete()
+    assert get_count() == 2
+
+    # The rows imported with COPY.
+    RowHandler().force_create_rows(
+        user,
+        table,
+        [{f"field_{text_field.id}": "f"}, {f"field_{text_field.id}": "g"}],
+        model=model,
+    )
+    assert get_count() == 4
+
+    # Changing the filters of the view changes the count without changing the rows.
+    data_fixture.create_view_filter(
+        view=grid, field=text_field, type="equal", value="a"
+    )
+    response = api_client.get(
+        url, data={"count": ""}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.json() == {"count": 1}
+
+    # Adhoc filters and searches are never cached.
+    response = api_client.get(
+        url, data={"count": "", "search": "b"}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.json() == {"count": 0}
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_ESTIMATED_ROW_COUNT_THRESHOLD=0)
+def test_list_rows_estimated_count(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    grid = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    model.objects.create(**{f"field_{text_field.id}": "a"})
+    model.objects.create(**{f"field_{text_field.id}": "b"})
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    with patch.object(ViewHandler, "get_estimated_row_count", return_value=1000):
+        response = api_client.get(
+            url,
+            data={"count": "", "estimate_count": ""},
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+        assert response.json() == {"count": 1000}
+
+        # Filtered views always return the exact count.
+        data_fixture.create_view_filter(
+            view=grid, field=text_field, type="equal", value="a"
+        )
+        response = api_client.get(
+            url,
+            data={"count": "", "estimate_count": ""},
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+        assert response.json() == {"count": 1}
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_ESTIMATED_ROW_COUNT_THRESHOLD=100)
+def test_list_rows_search_with_estimated_count(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    grid = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    model.objects.create(**{f"field_{text_field.id}": "apple"})
+    model.objects.create(**{f"field_{text_field.id}": "banana"})
+    SearchHandler.update_tsvector_columns(
+        table, update_tsvectors_for_changed_rows_only=False
+    )
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    search = {"search": "apple", "search_mode": "full-text-with-estimated-count"}
+    with patch.object(ViewHandler, "get_estimated_row_count", return_value=1000):
+        response = api_client.get(
+            url, data={"count": "", **search}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        assert response.json() == {"count": 1000}
+
+        # The rows are paginated with the exact count, so that the pages match the
+        # rows that are actually returned.
+        response = api_client.get(
+            url, data={"limit": 10, **search}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        response_json = response.json()
+        assert response_json["count"] == 1
+        assert response_json["next"] is None
+        assert len(response_json["results"]) == 1
+
+        response = api_client.get(
+            url,
+            data={"page": 1, "size": 1, **search},
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+        response_json = response.json()
+        assert response_json["count"] == 1
+        assert response_json["next"] is None
+        assert len(response_json["results"]) == 1
+
+        # The other search modes always return the exact count.
+        response = api_client.get(
+            url,
+            data={
+                "count": "",
+                "search": "apple",
+                "search_mode": "full-text-with-count",
+            },
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+        assert response.json() == {"count": 1}
+
+    # Small tables are counted exactly.
+    with patch.object(ViewHandler, "get_estimated_row_count", return_value=10):
+        response = api_client.get(
+            url, data={"count": "", **search}, HTTP_AUTHORIZATION=f"JWT {token}"
+        )
+        assert response.json() == {"count": 1}
+
+
+@pytest.mark.django_db
+def test_get_estimated_row_count(data_fixture):
+    table = data_fixture.create_database_table()
+    data_fixture.create_text_field(table=table, primary=True)
+    model = table.get_model()
+
+    estimated_count = ViewHandler().get_estimated_row_count(model.objects.all())
+    assert isinstance(estimated_count, int)
+    assert estimated_count >= 0
+
+
+@pytest.mark.django_db
+def test_list_rows_cursor_pagination(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    grid = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_sort(view=grid, field=text_field, order="DESC")
+    model = table.get_model()
+    for value in ["b", "a", None, "c", "b"]:
+        model.objects.create(**{f"field_{text_field.id}": value})
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {token}")
+    expected_ids = [row["id"] for row in response.json()["results"]]
+
+    cursor_ids = []
+    next_url = f"{url}?cursor=&size=2"
+    while next_url:
+        response = api_client.get(next_url, HTTP_AUTHORIZATION=f"JWT {token}")
+        assert response.status_code == HTTP_200_OK
+        cursor_ids += [row["id"] for row in response.json()["results"]]
+        next_url = response.json()["next"]
+
+    assert cursor_ids == expected_ids
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_VIEW_ROW_COUNT_CACHE_TIMEOUT=60 * 10)
+def test_list_rows_cached_count_with_filter_matching_nothing(api_client, data_fixture):
+    user, token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, primary=True)
+    date_field = data_fixture.create_date_field(table=table)
+    grid = data_fixture.create_grid_view(table=table)
+    model = table.get_model()
+    model.objects.create(**{f"field_{text_field.id}": "a"})
+    # An invalid date can't match any row.
+    data_fixture.create_view_filter(
+        view=grid, field=date_field, type="date_equal", value="UTC?2020-13-45"
+    )
+
+    url = reverse("api:database:views:grid:list", kwargs={"view_id": grid.id})
+    response = api_client.get(
+        url, data={"count": ""}, HTTP_AUTHORIZATION=f"JWT {token}"
+    )
+    assert response.status_code == HTTP_200_OK
+    assert response.json() == {"count": 0}
+
+    response = api_client.get(url, HTTP_AUTHORIZATION=f"JWT {token}")
+    assert response.status_code == HTTP_200_OK
+    assert response.json()["count"] == 0
+    assert response.json()["results"] == []
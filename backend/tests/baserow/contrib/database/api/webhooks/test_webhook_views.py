@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.shortcuts import reverse
 from django.test.utils import override_settings
 
@@ -393,6 +395,59 @@ def test_get_webhook(api_client, data_fixture):
     assert response_json["calls"] == []
 
 
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_WEBHOOKS_SUBSCRIPTIONS_CACHE_TIMEOUT=60 * 60)
+def test_webhooks_are_called_with_the_subscriptions_cache_enabled(
+    api_client, data_fixture
+):
+    user, jwt_token = data_fixture.create_user_and_token()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table, name="Name")
+    rows_url = reverse("api:database:rows:list", kwargs={"table_id": table.id})
+
+    def create_row_and_get_called_webhook_ids():
+        with patch(
+            "baserow.contrib.database.webhooks.registries.call_webhook.delay"
+        ) as call_webhook:
+            response = api_client.post(
+                rows_url,
+                {f"field_{text_field.id}": "Test"},
+                format="json",
+                HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+            )
+            assert response.status_code == HTTP_200_OK
+        return [call.kwargs["webhook_id"] for call in call_webhook.call_args_list]
+
+    # Caches that the table doesn't have any webhooks.
+    assert create_row_and_get_called_webhook_ids() == []
+
+    response = api_client.post(
+        reverse("api:database:webhooks:list", kwargs={"table_id": table.id}),
+        {
+            "url": "https://mydomain.com/endpoint",
+            "name": "My Webhook",
+            "include_all_events": True,
+        },
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK
+    webhook_id = response.json()["id"]
+
+    assert create_row_and_get_called_webhook_ids() == [webhook_id]
+    assert create_row_and_get_called_webhook_ids() == [webhook_id]
+
+    response = api_client.patch(
+        reverse("api:database:webhooks:item", kwargs={"webhook_id": webhook_id}),
+        {"active": False},
+        format="json",
+        HTTP_AUTHORIZATION=f"JWT {jwt_token}",
+    )
+    assert response.status_code == HTTP_200_OK
+
+    assert create_row_and_get_called_webhook_ids() == []
+
+
 @pytest.mark.django_db
 def test_update_webhook(api_client, data_fixture):
     user, jwt_token = data_fixture.create_user_and_token()
@@ -16,6 +16,7 @@ from baserow.contrib.database.data_sync.models import PostgreSQLDataSync
 from baserow.contrib.database.data_sync.postgresql_data_sync_type import (
     TextPostgreSQLSyncProperty,
 )
+from baserow.contrib.database.data_sync.registries import data_sync_type_registry
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import NumberField
 from baserow.core.db import specific_iterator
@@ -637,6 +638,114 @@ def test_postgresql_data_sync_initial_table_limit(
     assert data_sync.last_error == "The table can't contain more than 1 records."
 
 
+@pytest.mark.django_db(transaction=True)
+def test_postgresql_data_sync_incremental_sync(
+    data_fixture, create_postgresql_test_table
+):
+    default_database = settings.DATABASES["default"]
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    handler = DataSyncHandler()
+
+    data_sync = handler.create_data_sync_table(
+        user=user,
+        database=database,
+        table_name="Test",
+        type_name="postgresql",
+        synced_properties=["id", "text_col", "int_col"],
+        postgresql_host=default_database["HOST"],
+        postgresql_username=default_database["USER"],
+        postgresql_password=default_database["PASSWORD"],
+        postgresql_port=default_database["PORT"],
+        postgresql_database=default_database["NAME"],
+        postgresql_table=create_postgresql_test_table,
+        postgresql_sslmode=default_database["OPTIONS"].get("sslmode", "prefer"),
+        postgresql_incremental_column="int_col",
+    )
+
+    # The first sync fetches all the rows, so it's limited like any full sync.
+    with override_settings(INITIAL_TABLE_DATA_LIMIT=1):
+        handler.sync_data_sync_table(user=user, data_sync=data_sync)
+
+    data_sync.refresh_from_db()
+    assert data_sync.last_sync is None
+    assert data_sync.last_error == "The table can't contain more than 1 records."
+    assert data_sync.postgresql_incremental_state is None
+
+    handler.sync_data_sync_table(user=user, data_sync=data_sync)
+
+    data_sync.refresh_from_db()
+    assert data_sync.last_error is None
+    assert data_sync.postgresql_incremental_state["high_water_mark"] == "10"
+
+    fields = specific_iterator(data_sync.table.field_set.all().order_by("id"))
+    text_field = fields[1]
+    model = data_sync.table.get_model()
+    assert model.objects.count() == 2
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {create_postgresql_test_table} SET text_col = 'Not synced' "
+            f"WHERE id = 1"
+        )
+        cursor.execute(f"DELETE FROM {create_postgresql_test_table} WHERE id = 2")
+        cursor.execute(
+            f"INSERT INTO {create_postgresql_test_table} (text_col, int_col) "
+            f"VALUES ('New', 11)"
+        )
+    transaction.commit()
+
+    # The incremental sync only fetches the new row, so the source table can
+    # contain more rows than the limit.
+    with override_settings(INITIAL_TABLE_DATA_LIMIT=1):
+        handler.sync_data_sync_table(user=user, data_sync=data_sync)
+
+    data_sync.refresh_from_db()
+    assert data_sync.last_error is None
+    assert data_sync.postgresql_incremental_state["high_water_mark"] == "11"
+    rows = list(model.objects.all())
+    # Only the new row is fetched, the unchanged and deleted ones are untouched.
+    assert len(rows) == 3
+    assert getattr(rows[0], f"field_{text_field.id}").startswith("Lorem ipsum")
+    assert getattr(rows[2], f"field_{text_field.id}") == "New"
+
+    # Changing the synced properties results in a full sync.
+    handler.update_data_sync_table(
+        user=user, data_sync=data_sync, synced_properties=["id", "text_col"]
+    )
+    handler.sync_data_sync_table(user=user, data_sync=data_sync)
+
+    rows = list(model.objects.all())
+    assert len(rows) == 2
+    assert getattr(rows[0], f"field_{text_field.id}") == "Not synced"
+
+
+@pytest.mark.django_db(transaction=True)
+@patch(
+    "baserow.contrib.database.data_sync.postgresql_data_sync_type."
+    "PostgreSQLDataSyncType.fetch_batch_size",
+    1,
+)
+def test_postgresql_data_sync_get_rows_in_batches(
+    data_fixture, create_postgresql_test_table
+):
+    default_database = settings.DATABASES["default"]
+    data_sync = PostgreSQLDataSync(
+        postgresql_host=default_database["HOST"],
+        postgresql_username=default_database["USER"],
+        postgresql_password=default_database["PASSWORD"],
+        postgresql_port=default_database["PORT"],
+        postgresql_database=default_database["NAME"],
+        postgresql_table=create_postgresql_test_table,
+        postgresql_sslmode=default_database["OPTIONS"].get("sslmode", "prefer"),
+    )
+    data_sync_type = data_sync_type_registry.get("postgresql")
+
+    batches = list(data_sync_type.get_rows_in_batches(data_sync, 1))
+    assert [[row["id"] for row in batch] for batch in batches] == [[1], [2]]
+    assert [row["id"] for row in data_sync_type.get_all_rows(data_sync)] == [1, 2]
+
+
 @pytest.mark.django_db(transaction=True)
 def test_get_data_sync(data_fixture, api_client, create_postgresql_test_table):
     default_database = settings.DATABASES["default"]
@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from unittest.mock import patch
 
 from django.test import override_settings
@@ -376,6 +376,97 @@ def test_all_formula_that_needs_updates_are_periodically_updated(data_fixture):
         assert FormulaFieldType().get_fields_needing_periodic_update().count() == 2
 
 
+@pytest.mark.django_db
+def test_today_formulas_are_only_periodically_updated_when_the_date_changes(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    with freeze_time("2023-02-27 10:15"):
+        now_field = data_fixture.create_formula_field(
+            table=table, formula="now()", date_include_time=True
+        )
+        today_field = data_fixture.create_formula_field(table=table, formula="today()")
+        row = RowHandler().create_row(user=user, table=table)
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    assert now_field.periodic_update_granularity is None
+    assert today_field.periodic_update_granularity == "day"
+
+    fields = FormulaFieldType().get_fields_needing_periodic_update()
+    since = datetime(2023, 2, 27, 10, 15, tzinfo=timezone.utc)
+    assert set(
+        FormulaFieldType().get_fields_with_periodic_changes(
+            fields, since, datetime(2023, 2, 27, 23, 59, tzinfo=timezone.utc)
+        )
+    ) == {now_field}
+    assert set(
+        FormulaFieldType().get_fields_with_periodic_changes(
+            fields, since, datetime(2023, 2, 28, 0, 1, tzinfo=timezone.utc)
+        )
+    ) == {now_field, today_field}
+    assert set(
+        FormulaFieldType().get_fields_with_periodic_changes(
+            fields, None, datetime(2023, 2, 27, 23, 59, tzinfo=timezone.utc)
+        )
+    ) == {now_field, today_field}
+
+    with patch.object(
+        FormulaFieldType, "run_periodic_update", return_value=[]
+    ) as run_periodic_update, freeze_time("2023-02-27 23:59"):
+        run_periodic_fields_updates(workspace_id=workspace.id)
+        assert list(run_periodic_update.call_args.args[0]) == [now_field]
+
+    with freeze_time("2023-02-28 00:01"):
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    row.refresh_from_db()
+    assert getattr(row, f"field_{today_field.id}") == date(2023, 2, 28)
+    assert getattr(row, f"field_{now_field.id}") == datetime(
+        2023, 2, 28, 0, 1, tzinfo=timezone.utc
+    )
+
+
+@pytest.mark.django_db
+def test_today_formulas_are_updated_after_a_failed_periodic_update(data_fixture):
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    with freeze_time("2023-02-27 10:15"):
+        today_field = data_fixture.create_formula_field(table=table, formula="today()")
+        row = RowHandler().create_row(user=user, table=table)
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    workspace.refresh_from_db()
+    assert workspace.periodic_field_update_succeeded_at == datetime(
+        2023, 2, 27, 10, 15, tzinfo=timezone.utc
+    )
+
+    with patch.object(
+        FormulaFieldType, "run_periodic_update", side_effect=Exception
+    ), freeze_time("2023-02-28 00:01"):
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    workspace.refresh_from_db()
+    assert workspace.now == datetime(2023, 2, 28, 0, 1, tzinfo=timezone.utc)
+    assert workspace.periodic_field_update_succeeded_at == datetime(
+        2023, 2, 27, 10, 15, tzinfo=timezone.utc
+    )
+
+    with freeze_time("2023-02-28 00:02"):
+        run_periodic_fields_updates(workspace_id=workspace.id)
+
+    row.refresh_from_db()
+    assert getattr(row, f"field_{today_field.id}") == date(2023, 2, 28)
+    workspace.refresh_from_db()
+    assert workspace.periodic_field_update_succeeded_at == datetime(
+        2023, 2, 28, 0, 2, tzinfo=timezone.utc
+    )
+
+
 @pytest.mark.django_db
 def test_run_periodic_field_type_doesnt_update_trashed_table(data_fixture):
     user = data_fixture.create_user()
@@ -20,6 +20,7 @@ from baserow.contrib.database.export.exceptions import (
     TableOnlyExportUnsupported,
     ViewUnsupportedForExporterType,
 )
+from baserow.contrib.database.export.file_writer import StreamingExportJobFileWriter
 from baserow.contrib.database.export.handler import ExportHandler
 from baserow.contrib.database.export.models import (
     EXPORT_JOB_CANCELLED_STATUS,
@@ -734,6 +735,66 @@ def test_adding_more_rows_doesnt_increase_number_of_queries_run(
         run_export_job_with_mock_storage(table, grid_view, storage_mock, user)
 
 
+@pytest.mark.django_db
+@patch("baserow.core.storage.get_default_storage")
+def test_export_streams_rows_in_chunks(get_storage_mock, data_fixture):
+    storage_mock = MagicMock()
+    get_storage_mock.return_value = storage_mock
+    add_row, add_linked_row, user, table, grid_view = setup_testing_table(data_fixture)
+
+    linked_row_1 = add_linked_row("linked_row_1")
+    linked_row_2 = add_linked_row("linked_row_2")
+    for i in range(5):
+        add_row(
+            f"row_{i}",
+            "2020-02-01 01:23",
+            "A",
+            i,
+            [],
+            [linked_row_1.id, linked_row_2.id] if i % 2 else [linked_row_1.id],
+        )
+
+    with patch.object(StreamingExportJobFileWriter, "CHUNK_SIZE", 2):
+        job, contents = run_export_job_with_mock_storage(
+            table, grid_view, storage_mock, user
+        )
+
+    job.refresh_from_db()
+    assert job.state == EXPORT_JOB_FINISHED_STATUS
+    assert job.progress_percentage == 100
+    lines = contents.strip("\r\n").split("\r\n")
+    assert len(lines) == 6
+    assert [line.split(",")[1] for line in lines[1:]] == [f"row_{i}" for i in range(5)]
+    assert '"linked_row_1,linked_row_2"' in lines[2]
+    assert '"linked_row_1,linked_row_2"' not in lines[1]
+
+
+@pytest.mark.django_db
+def test_streaming_export_when_rows_are_created_after_counting(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    model = table.get_model()
+    for _ in range(3):
+        model.objects.create()
+    job = ExportHandler().create_pending_export_job(
+        user, table, None, {"exporter_type": "csv"}
+    )
+    writer = StreamingExportJobFileWriter(BytesIO(), job)
+    written_rows = []
+
+    with patch.object(
+        StreamingExportJobFileWriter, "EXPORT_JOB_UPDATE_FREQUENCY_SECONDS", -1
+    ), patch("django.db.models.QuerySet.count", return_value=0):
+        writer.write_rows(
+            model.objects.all(),
+            lambda row, is_last_row: written_rows.append((row.id, is_last_row)),
+        )
+
+    job.refresh_from_db()
+    assert job.progress_percentage == 100
+    assert [is_last_row for _, is_last_row in written_rows] == [False, False, True]
+
+
 @pytest.mark.django_db
 def test_creating_job_with_view_that_is_not_in_the_table(
     data_fixture,
@@ -4,7 +4,7 @@ from unittest.mock import patch
 
 from django.core.exceptions import ValidationError
 from django.db import connection, models
-from django.test.utils import CaptureQueriesContext
+from django.test.utils import CaptureQueriesContext, override_settings
 
 import pytest
 from freezegun import freeze_time
@@ -16,8 +16,10 @@ from baserow.contrib.database.api.utils import (
     extract_user_field_names_from_params,
     get_include_exclude_fields,
 )
+from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.rows.exceptions import RowDoesNotExist
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.core.db import bulk_insert_with_copy
 from baserow.core.exceptions import UserNotInWorkspace
 from baserow.core.trash.handler import TrashHandler
 
@@ -868,6 +870,59 @@ def test_create_rows_last_modified_by(data_fixture):
     assert rows[1].last_modified_by == user
 
 
+@pytest.mark.django_db
+@override_settings(BASEROW_ROW_COPY_INSERT_MIN_ROWS=2)
+def test_create_rows_with_copy(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(name="Car", user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name")
+    number_field = data_fixture.create_number_field(
+        table=table, name="Price", number_decimal_places=2
+    )
+    link_field = data_fixture.create_link_row_field(table=table, name="Link")
+    linked_row = link_field.link_row_table.get_model().objects.create()
+    formula_field = FieldHandler().create_field(
+        user, table, "formula", name="Formula", formula="concat(field('Name'), '!')"
+    )
+    handler = RowHandler()
+
+    with patch(
+        "baserow.contrib.database.rows.handler.bulk_insert_with_copy",
+        wraps=bulk_insert_with_copy,
+    ) as mock_copy:
+        rows = handler.create_rows(
+            user,
+            table,
+            rows_values=[
+                {
+                    f"field_{name_field.id}": "Tab\tand\\new\nline",
+                    f"field_{number_field.id}": "1.50",
+                    f"field_{link_field.id}": [linked_row.id],
+                },
+                {f"field_{name_field.id}": None},
+            ],
+        )
+
+    assert mock_copy.call_count == 2
+    assert all(row.id is not None for row in rows)
+
+    model = table.get_model()
+    row_1, row_2 = model.objects.all().order_by("order")
+    assert [row_1.id, row_2.id] == [row.id for row in rows]
+    assert getattr(row_1, f"field_{name_field.id}") == "Tab\tand\\new\nline"
+    assert getattr(row_1, f"field_{number_field.id}") == Decimal("1.50")
+    assert [r.id for r in getattr(row_1, f"field_{link_field.id}").all()] == [
+        linked_row.id
+    ]
+    assert getattr(row_1, f"field_{formula_field.id}") == "Tab\tand\\new\nline!"
+    assert getattr(row_2, f"field_{name_field.id}") is None
+    assert getattr(row_2, f"field_{formula_field.id}") == "!"
+    assert row_1.last_modified_by == user
+
+    # A new row must get the next id of the sequence.
+    assert model.objects.create().id == row_2.id + 1
+
+
 @pytest.mark.django_db
 def test_update_rows_created_on_and_last_modified(data_fixture):
     user = data_fixture.create_user()
@@ -1055,6 +1110,45 @@ def test_import_rows(
     assert sorted(report.keys()) == sorted([1, 2])
 
 
+@pytest.mark.django_db
+@patch("baserow.contrib.database.rows.handler.BATCH_SIZE", 2)
+def test_import_rows_in_multiple_batches_updates_dependencies_of_imported_rows(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    name_field = data_fixture.create_text_field(table=table, name="Name", order=1)
+    formula_field = data_fixture.create_formula_field(
+        table=table, name="Formula", formula="concat(field('Name'), '!')", order=2
+    )
+    handler = RowHandler()
+
+    handler.import_rows(user=user, table=table, data=[["Tesla"]])
+
+    # A stale value that would be replaced if the dependencies of the existing rows
+    # were updated as well.
+    model = table.get_model()
+    model.objects.update(**{f"field_{formula_field.id}": "Stale"})
+
+    handler.import_rows(
+        user=user, table=table, data=[["Giulietta"], ["Panda"], ["2Cv"]]
+    )
+
+    model = table.get_model()
+    assert [
+        (
+            getattr(row, f"field_{name_field.id}"),
+            getattr(row, f"field_{formula_field.id}"),
+        )
+        for row in model.objects.all()
+    ] == [
+        ("Tesla", "Stale"),
+        ("Giulietta", "Giulietta!"),
+        ("Panda", "Panda!"),
+        ("2Cv", "2Cv!"),
+    ]
+
+
 @pytest.mark.django_db
 def test_import_rows_with_read_only_field(
     data_fixture,
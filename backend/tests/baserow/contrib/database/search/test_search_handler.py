@@ -1,12 +1,14 @@
 from unittest.mock import Mock, patch
 
 from django.db import connection
+from django.db.models import Value
 from django.test.utils import override_settings
 
 import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.search.handler import SearchHandler, SearchModes
+from baserow.contrib.database.table.models import PendingSearchValueUpdate
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -402,3 +404,116 @@ def test_split_update_into_chunks_until_all_background_done(data_fixture):
     assert rows[2].needs_background_update is False
     assert getattr(rows[3], field.tsv_db_column) == "'4':2 'test':1"
     assert rows[3].needs_background_update is False
+
+
+@override_settings(TSV_UPDATE_CHUNK_SIZE=1)
+@pytest.mark.django_db
+def test_update_logged_tsvector_changes(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(user, table=table, primary=True)
+
+    model = table.get_model()
+    row_1 = model.objects.create(**{f"field_{field.id}": "Test 1"})
+    row_2 = model.objects.create(**{f"field_{field.id}": "Test 2"})
+    row_3 = model.objects.create(**{f"field_{field.id}": "Test 3"})
+    SearchHandler().update_tsvector_columns(table, False)
+
+    updated_rows = SearchHandler.update_and_log_changed_cells(
+        table,
+        model.objects.exclude(id=row_2.id),
+        {f"field_{field.id}": Value("Changed")},
+        [field.id],
+    )
+    assert updated_rows == 2
+    assert set(
+        PendingSearchValueUpdate.objects.filter(table=table).values_list(
+            "row_id", "field_id"
+        )
+    ) == {(row_1.id, field.id), (row_3.id, field.id)}
+
+    # The search vectors are only updated when the logged changes are processed.
+    row_1.refresh_from_db()
+    assert getattr(row_1, field.tsv_db_column) == "'1':2 'test':1"
+
+    assert SearchHandler.update_logged_tsvector_changes(table) == 2
+
+    row_1.refresh_from_db()
+    row_2.refresh_from_db()
+    row_3.refresh_from_db()
+    assert getattr(row_1, field.tsv_db_column) == "'changed':1"
+    assert getattr(row_2, field.tsv_db_column) == "'2':2 'test':1"
+    assert getattr(row_3, field.tsv_db_column) == "'changed':1"
+    assert not PendingSearchValueUpdate.objects.filter(table=table).exists()
+
+
+@pytest.mark.django_db
+def test_update_logged_tsvector_changes_keeps_changes_logged_while_processing(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(user, table=table, primary=True)
+
+    model = table.get_model()
+    row = model.objects.create(**{f"field_{field.id}": "Test"})
+    SearchHandler().update_tsvector_columns(table, False)
+
+    SearchHandler.update_and_log_changed_cells(
+        table, model.objects.all(), {f"field_{field.id}": Value("Changed")}, [field.id]
+    )
+
+    update_tsvectors_of_rows = SearchHandler._update_tsvectors_of_rows
+
+    def change_cell_while_processing(*args):
+        update_tsvectors_of_rows(*args)
+        # The claimed change has already been removed from the log, so changing the
+        # cell again must log it again instead of conflicting with the claimed one.
+        SearchHandler.update_and_log_changed_cells(
+            table,
+            model.objects.all(),
+            {f"field_{field.id}": Value("Changed again")},
+            [field.id],
+        )
+
+    with patch.object(
+        SearchHandler,
+        "_update_tsvectors_of_rows",
+        side_effect=change_cell_while_processing,
+    ):
+        assert SearchHandler.update_logged_tsvector_changes(table) == 1
+
+    assert list(
+        PendingSearchValueUpdate.objects.filter(table=table).values_list(
+            "row_id", "field_id"
+        )
+    ) == [(row.id, field.id)]
+
+    assert SearchHandler.update_logged_tsvector_changes(table) == 1
+    row.refresh_from_db()
+    assert getattr(row, field.tsv_db_column) == "'again':2 'changed':1"
+    assert not PendingSearchValueUpdate.objects.filter(table=table).exists()
+
+
+@pytest.mark.django_db
+def test_update_logged_tsvector_changes_logs_changes_again_on_failure(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    field = data_fixture.create_text_field(user, table=table, primary=True)
+
+    model = table.get_model()
+    row = model.objects.create(**{f"field_{field.id}": "Test"})
+    SearchHandler.update_and_log_changed_cells(
+        table, model.objects.all(), {f"field_{field.id}": Value("Changed")}, [field.id]
+    )
+
+    with patch.object(
+        SearchHandler, "_update_tsvectors_of_rows", side_effect=Exception
+    ), pytest.raises(Exception):
+        SearchHandler.update_logged_tsvector_changes(table)
+
+    assert list(
+        PendingSearchValueUpdate.objects.filter(table=table).values_list(
+            "row_id", "field_id"
+        )
+    ) == [(row.id, field.id)]
@@ -3,7 +3,11 @@ from django.test.utils import override_settings
 import pytest
 
 from baserow.contrib.database.fields.handler import FieldHandler
-from baserow.contrib.database.table.cache import get_cached_model_field_attrs
+from baserow.contrib.database.table.cache import (
+    get_cached_model_field_attrs,
+    get_local_cached_model_class,
+)
+from baserow.contrib.database.table.models import Table
 from baserow.core.trash.handler import TrashHandler
 
 
@@ -204,3 +208,88 @@ def test_deleting_field_invalidates_tables_model_cache(data_fixture):
 
     table.refresh_from_db()
     assert get_cached_model_field_attrs(table) is None
+
+
+@pytest.mark.django_db
+def test_get_model_reuses_locally_cached_model_class(
+    data_fixture, django_assert_num_queries
+):
+    field = data_fixture.create_text_field()
+    table = field.table
+
+    model = table.get_model()
+
+    with django_assert_num_queries(1):
+        assert table.get_model() is model
+
+    data_fixture.create_text_field(table=table)
+
+    new_model = table.get_model()
+    assert new_model is not model
+    assert len(new_model._field_objects) == 2
+
+
+@pytest.mark.django_db
+def test_locally_cached_model_class_is_invalidated_when_related_table_changes(
+    data_fixture,
+):
+    user = data_fixture.create_user()
+    table_a, table_b, link_field = data_fixture.create_two_linked_tables(user=user)
+
+    model_a = table_a.get_model()
+    assert table_a.get_model() is model_a
+
+    data_fixture.create_text_field(table=table_b)
+
+    new_model_a = table_a.get_model()
+    assert new_model_a is not model_a
+    related_model_b = new_model_a._meta.get_field(link_field.db_column).related_model
+    assert len(related_model_b._field_objects) == len(
+        table_b.get_model()._field_objects
+    )
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_MODEL_CLASS_CACHE_SIZE=1)
+def test_local_model_class_cache_is_bounded(data_fixture):
+    table_a = data_fixture.create_database_table()
+    table_b = data_fixture.create_database_table()
+
+    table_a.get_model()
+    assert get_local_cached_model_class(table_a._get_model_class_cache_key())
+
+    table_b.get_model()
+    assert get_local_cached_model_class(table_b._get_model_class_cache_key())
+    assert get_local_cached_model_class(table_a._get_model_class_cache_key()) is None
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_MODEL_CLASS_CACHE_SIZE=0)
+def test_can_disable_local_model_class_cache(data_fixture):
+    table = data_fixture.create_database_table()
+
+    assert table.get_model() is not table.get_model()
+    assert get_local_cached_model_class(table._get_model_class_cache_key()) is None
+
+
+@pytest.mark.django_db
+def test_locally_cached_model_class_has_its_own_table_instance(data_fixture):
+    table = data_fixture.create_database_table(name="Before")
+
+    model = table.get_model()
+    assert model.baserow_table is not table
+    assert model.baserow_table.id == table.id
+
+    other_table = Table.objects.get(id=table.id)
+    assert other_table.get_model() is model
+    assert model.baserow_table is not other_table
+
+    # Updating the table replaces the cached model class, so that the attributes
+    # not changing the version are up-to-date.
+    other_table.name = "After"
+    other_table.save()
+
+    new_model = Table.objects.get(id=table.id).get_model()
+    assert new_model is not model
+    assert new_model.baserow_table.name == "After"
+    assert model.baserow_table.name == "Before"
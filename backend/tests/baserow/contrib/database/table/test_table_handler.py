@@ -657,6 +657,44 @@ def test_duplicate_interesting_table(data_fixture):
             )
 
 
+def _get_human_readable_rows(table):
+    model = table.get_model()
+    rows = []
+    for row in model.objects.all().enhance_by_fields().order_by("id"):
+        values = {}
+        for field_object in model._field_objects.values():
+            value = getattr(row, field_object["name"])
+            values[field_object["field"].name] = field_object[
+                "type"
+            ].get_human_readable_value(value, field_object)
+        rows.append(values)
+    return rows
+
+
+@pytest.mark.django_db
+def test_duplicate_interesting_table_rows_in_database(data_fixture):
+    user = data_fixture.create_user()
+    database = data_fixture.create_database_application(user=user)
+    table, _, _, _, _ = setup_interesting_test_table(data_fixture, user, database)
+    table_handler = TableHandler()
+
+    with patch(
+        "baserow.contrib.database.application_types.copy_rows_in_database"
+    ) as mock_copy_rows:
+        with override_settings(BASEROW_DUPLICATE_ROWS_IN_DATABASE=False):
+            serialized_duplicate = table_handler.duplicate_table(user, table)
+        mock_copy_rows.assert_not_called()
+
+    copied_duplicate = table_handler.duplicate_table(user, table)
+
+    copied_rows = _get_human_readable_rows(copied_duplicate)
+    assert len(copied_rows) == table.get_model().objects.count()
+    assert copied_rows == _get_human_readable_rows(serialized_duplicate)
+
+    # The sequence must be reset, so that new rows don't conflict with the copies.
+    RowHandler().create_row(user, copied_duplicate)
+
+
 @pytest.mark.django_db
 @pytest.mark.undo_redo
 def test_duplicate_table_with_limit_view_link_row_field(data_fixture):
@@ -1,13 +1,19 @@
 import random
 from decimal import Decimal
 
+from django.db.models import Avg
+from django.test import override_settings
+
 import pytest
 
 from baserow.contrib.database.fields.exceptions import FieldNotInTable
 from baserow.contrib.database.fields.handler import FieldHandler
+from baserow.contrib.database.rows.handler import RowHandler
 from baserow.contrib.database.views.exceptions import FieldAggregationNotSupported
 from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.registries import view_aggregation_type_registry
+from baserow.contrib.database.views.view_aggregations import _divide_like_postgres
+from baserow.contrib.database.views.view_types import GridViewType
 from baserow.core.trash.handler import TrashHandler
 from baserow.test_utils.helpers import setup_interesting_test_table
 
@@ -467,3 +473,120 @@ def test_aggregation_is_updated_when_view_is_trashed(data_fixture):
         user, grid_view_one
     )
     assert field.db_column not in aggregations_restored_view
+
+
+@pytest.mark.django_db
+@override_settings(BASEROW_VIEW_INCREMENTAL_AGGREGATIONS_ENABLED=True)
+def test_view_aggregations_are_updated_incrementally_when_rows_change(
+    data_fixture, django_capture_on_commit_callbacks
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    sum_field = data_fixture.create_number_field(table=table)
+    average_field = data_fixture.create_number_field(table=table)
+    min_field = data_fixture.create_number_field(table=table)
+    filter_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+    data_fixture.create_view_filter(
+        view=grid_view, field=filter_field, type="not_empty", value=""
+    )
+
+    view_handler = ViewHandler()
+    view_handler.update_field_options(
+        view=grid_view,
+        field_options={
+            sum_field.id: {"aggregation_type": "sum", "aggregation_raw_type": "sum"},
+            average_field.id: {
+                "aggregation_type": "average",
+                "aggregation_raw_type": "average",
+            },
+            min_field.id: {"aggregation_type": "min", "aggregation_raw_type": "min"},
+        },
+    )
+
+    model = table.get_model()
+
+    def values(value, in_view=True):
+        return {
+            sum_field.db_column: value,
+            average_field.db_column: value,
+            min_field.db_column: value,
+            filter_field.db_column: 1 if in_view else None,
+        }
+
+    row_1 = model.objects.create(**values(10))
+    row_2 = model.objects.create(**values(20))
+    model.objects.create(**values(100, in_view=False))
+
+    def get_aggregations():
+        result = view_handler.get_view_field_aggregations(user, grid_view)
+        return (
+            result[sum_field.db_column],
+            result[average_field.db_column],
+            result[min_field.db_column],
+        )
+
+    def get_aggregations_to_compute():
+        _, need_computation = view_handler._get_aggregations_to_compute(
+            grid_view, GridViewType().get_aggregations(grid_view)
+        )
+        return set(need_computation.keys())
+
+    def assert_average_is_identical_to_recomputed_one(average):
+        # The incremental average must have the same scale and rounding as the one
+        # computed by PostgreSQL, so the responses are identical.
+        recomputed = model.objects.filter(
+            **{f"{filter_field.db_column}__isnull": False}
+        ).aggregate(average=Avg(average_field.db_column))["average"]
+        assert str(average) == str(recomputed)
+
+    assert get_aggregations() == (30, 15, 10)
+
+    row_handler = RowHandler()
+    with django_capture_on_commit_callbacks(execute=True):
+        row_3 = row_handler.create_row(user, table, values(5), model=model)
+    assert get_aggregations_to_compute() == set()
+    total, average, minimum = get_aggregations()
+    assert (total, minimum) == (35, 5)
+    assert float(average) == pytest.approx(35 / 3)
+    assert_average_is_identical_to_recomputed_one(average)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.update_row_by_id(user, table, row_2.id, values(50), model=model)
+    assert get_aggregations_to_compute() == set()
+    total, average, minimum = get_aggregations()
+    assert (total, minimum) == (65, 5)
+    assert float(average) == pytest.approx(65 / 3)
+    assert_average_is_identical_to_recomputed_one(average)
+
+    # The row leaves the view because of the filter.
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.update_row_by_id(
+            user, table, row_1.id, values(10, in_view=False), model=model
+        )
+    assert get_aggregations_to_compute() == set()
+    assert get_aggregations() == (55, Decimal("27.5"), 5)
+    assert_average_is_identical_to_recomputed_one(get_aggregations()[1])
+
+    # The minimum is removed, so it must be computed again from all the rows.
+    with django_capture_on_commit_callbacks(execute=True):
+        row_handler.delete_row_by_id(user, table, row_3.id, model=model)
+    assert get_aggregations_to_compute() == {min_field.db_column}
+    assert get_aggregations() == (50, 50, 50)
+
+
+@pytest.mark.parametrize(
+    "dividend,divisor,expected",
+    [
+        # The results of `SELECT dividend::numeric / divisor` in PostgreSQL.
+        (3, 2, "1.5000000000000000"),
+        (1, 1, "1.00000000000000000000"),
+        (35, 3, "11.6666666666666667"),
+        (Decimal("-7"), 3, "-2.3333333333333333"),
+        (Decimal("65.00"), 3, "21.6666666666666667"),
+        (Decimal("0.0001"), 3, "0.000033333333333333333333"),
+        (Decimal("123456789012.345"), 7, "17636684144.62071429"),
+    ],
+)
+def test_average_is_divided_like_postgres(dividend, divisor, expected):
+    assert str(_divide_like_postgres(dividend, divisor)) == expected
@@ -1,7 +1,9 @@
+import time
 from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
 from unittest.mock import patch
 
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.test import override_settings
 
@@ -43,6 +45,7 @@ from baserow.contrib.database.views.exceptions import (
 )
 from baserow.contrib.database.views.filters import AdHocFilters
 from baserow.contrib.database.views.handler import (
+    PARTIAL_INDEX_MIN_IDLE_TIME,
     PublicViewRows,
     ViewHandler,
     ViewIndexingHandler,
@@ -3020,6 +3023,123 @@ def test_perm_deleting_view_remove_index_if_unused(
     assert ViewIndexingHandler.does_index_exist(index.name) is False
 
 
+@override_settings(AUTO_INDEX_TRIGRAM_ENABLED=True)
+@pytest.mark.django_db(transaction=True)
+def test_contains_view_filter_creates_and_drops_trigram_index(
+    data_fixture, enable_singleton_testing
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(user=user, table=table)
+    number_field = data_fixture.create_number_field(user=user, table=table)
+    handler = ViewHandler()
+    grid_view = handler.create_view(
+        user=user,
+        table=table,
+        type_name="grid",
+        name="Test grid",
+        ownership_type=OWNERSHIP_TYPE_COLLABORATIVE,
+    )
+
+    handler.create_filter(user, grid_view, text_field, "contains_not", "test")
+    assert ViewIndexingHandler.get_existing_trigram_index_names(table) == set()
+
+    view_filter = handler.create_filter(user, grid_view, text_field, "contains", "test")
+    handler.create_filter(user, grid_view, number_field, "contains", "1")
+    assert ViewIndexingHandler.get_existing_trigram_index_names(table) == {
+        text_field.trigram_index_name
+    }
+
+    handler.delete_filter(user, view_filter)
+    assert ViewIndexingHandler.get_existing_trigram_index_names(table) == set()
+
+
+@override_settings(
+    AUTO_INDEX_VIEW_ENABLED=True, BASEROW_VIEW_PARTIAL_INDEXES_PER_TABLE=1
+)
+@pytest.mark.django_db(transaction=True)
+def test_view_filters_create_partial_indexes_within_the_table_budget(
+    data_fixture, enable_singleton_testing
+):
+    cache.clear()
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(user=user, table=table)
+    boolean_field = data_fixture.create_boolean_field(user=user, table=table)
+    handler = ViewHandler()
+    grid_view_1 = handler.create_view(
+        user=user,
+        table=table,
+        type_name="grid",
+        name="Test grid 1",
+        ownership_type=OWNERSHIP_TYPE_COLLABORATIVE,
+    )
+    grid_view_2 = handler.create_view(
+        user=user,
+        table=table,
+        type_name="grid",
+        name="Test grid 2",
+        ownership_type=OWNERSHIP_TYPE_COLLABORATIVE,
+    )
+
+    handler.create_filter(user, grid_view_1, text_field, "equal", "open")
+    grid_view_1.refresh_from_db()
+    index_name_1 = grid_view_1.db_index_name
+    assert index_name_1.startswith(f"p{table.id}:")
+    assert ViewIndexingHandler.does_index_exist(index_name_1) is True
+
+    # The budget of the table is used, and the index of the first view has just
+    # been created.
+    handler.create_filter(user, grid_view_2, boolean_field, "boolean", "1")
+    grid_view_2.refresh_from_db()
+    assert grid_view_2.db_index_name is None
+
+    # Loading the second view after the budget check has expired evicts the least
+    # recently used partial index once it hasn't been used for a while.
+    cache.delete(f"view_partial_index_denied_{grid_view_2.id}")
+    cache.set(
+        f"view_index_last_used_{grid_view_1.id}",
+        time.time() - PARTIAL_INDEX_MIN_IDLE_TIME,
+    )
+    ViewIndexingHandler.schedule_index_creation_if_needed(
+        grid_view_2, table.get_model()
+    )
+    grid_view_1.refresh_from_db()
+    grid_view_2.refresh_from_db()
+    assert grid_view_2.db_index_name.startswith(f"p{table.id}:")
+    assert ViewIndexingHandler.does_index_exist(grid_view_2.db_index_name) is True
+    assert grid_view_1.db_index_name is None
+    assert ViewIndexingHandler.does_index_exist(index_name_1) is False
+
+    # Loading the first view again doesn't evict the index of the second view,
+    # because it has just been used.
+    index_name_2 = grid_view_2.db_index_name
+    ViewIndexingHandler.schedule_index_creation_if_needed(
+        grid_view_1, table.get_model()
+    )
+    grid_view_1.refresh_from_db()
+    grid_view_2.refresh_from_db()
+    assert grid_view_1.db_index_name is None
+    assert grid_view_2.db_index_name == index_name_2
+    assert ViewIndexingHandler.does_index_exist(index_name_2) is True
+
+    # Once the index of the second view hasn't been used for a while, it can be
+    # replaced.
+    cache.delete(f"view_partial_index_denied_{grid_view_1.id}")
+    cache.set(
+        f"view_index_last_used_{grid_view_2.id}",
+        time.time() - PARTIAL_INDEX_MIN_IDLE_TIME,
+    )
+    ViewIndexingHandler.schedule_index_creation_if_needed(
+        grid_view_1, table.get_model()
+    )
+    grid_view_1.refresh_from_db()
+    grid_view_2.refresh_from_db()
+    assert grid_view_1.db_index_name == index_name_1
+    assert grid_view_2.db_index_name is None
+    assert ViewIndexingHandler.does_index_exist(index_name_2) is False
+
+
 @override_settings(AUTO_INDEX_VIEW_ENABLED=True)
 @pytest.mark.django_db(transaction=True)
 def test_duplicating_table_do_not_duplicate_indexes(
@@ -4297,3 +4417,174 @@ def test_get_queryset_apply_sorts(data_fixture):
 
     row_ids = [row.id for row in rows]
     assert row_ids == [row_3.id, row_2.id, row_1.id]
+
+
+@pytest.mark.django_db
+def test_get_group_by_metadata_in_rows_only_counts_groups_in_rows(data_fixture):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    text_field = data_fixture.create_text_field(table=table)
+    number_field = data_fixture.create_number_field(table=table)
+    grid_view = data_fixture.create_grid_view(table=table)
+
+    model = table.get_model()
+    rows = [
+        model.objects.create(
+            **{f"field_{text_field.id}": text, f"field_{number_field.id}": number}
+        )
+        for text, number in [("a", 1), ("a", 1), ("a", 2), ("b", 1), ("c", 3)]
+    ]
+
+    queryset = model.objects.all().enhance_by_fields()
+    counts = ViewHandler().get_group_by_metadata_in_rows(
+        [text_field, number_field], [rows[0], rows[3]], queryset
+    )
+
+    assert counts == {
+        text_field: unordered(
+            [
+                {f"field_{text_field.id}": "a", "count": 3},
+                {f"field_{text_field.id}": "b", "count": 1},
+            ]
+        ),
+        number_field: unordered(
+            [
+                {
+                    f"field_{text_field.id}": "a",
+                    f"field_{number_field.id}": Decimal("1"),
+                    "count": 2,
+                },
+                {
+                    f"field_{text_field.id}": "b",
+                    f"field_{number_field.id}": Decimal("1"),
+                    "count": 1,
+                },
+            ]
+        ),
+    }
+
+    with override_settings(BASEROW_VIEW_GROUP_BY_METADATA_CACHE_TIMEOUT=60):
+        view_handler = ViewHandler()
+        view_handler.get_group_by_metadata_in_rows(
+            [text_field], rows, queryset, view=grid_view
+        )
+
+        # Creating a row invalidates the cached counts.
+        RowHandler().create_row(
+            user, table, {f"field_{text_field.id}": "a"}, model=model
+        )
+        counts = view_handler.get_group_by_metadata_in_rows(
+            [text_field], rows, queryset, view=grid_view
+        )
+        assert {
+            c[f"field_{text_field.id}"]: c["count"] for c in counts[text_field]
+        } == {
+            "a": 4,
+            "b": 1,
+            "c": 1,
+        }
+
+        # And so does updating a row.
+        RowHandler().update_row_by_id(
+            user, table, rows[4].id, {f"field_{text_field.id}": "b"}, model=model
+        )
+        counts = view_handler.get_group_by_metadata_in_rows(
+            [text_field], rows, queryset, view=grid_view
+        )
+        assert {
+            c[f"field_{text_field.id}"]: c["count"] for c in counts[text_field]
+        } == {
+            "a": 4,
+            "b": 2,
+        }
+
+
+@pytest.mark.django_db
+def test_get_group_by_metadata_in_rows_with_multiple_levels_and_annotations(
+    data_fixture,
+):
+    table = data_fixture.create_database_table()
+    text_field = data_fixture.create_text_field(table=table)
+    datetime_field = data_fixture.create_date_field(table=table, date_include_time=True)
+    number_field = data_fixture.create_number_field(table=table)
+
+    model = table.get_model()
+    rows = [
+        model.objects.create(
+            **{
+                f"field_{text_field.id}": text,
+                f"field_{datetime_field.id}": value,
+                f"field_{number_field.id}": number,
+            }
+        )
+        for text, value, number in [
+            ("a", datetime(2020, 2, 1, 1, 23, 10, tzinfo=timezone.utc), 1),
+            ("a", datetime(2020, 2, 1, 1, 23, 50, tzinfo=timezone.utc), 1),
+            ("a", datetime(2020, 2, 1, 1, 23, 30, tzinfo=timezone.utc), 2),
+            ("a", datetime(2020, 2, 1, 2, 0, tzinfo=timezone.utc), 1),
+            ("b", datetime(2020, 2, 1, 1, 23, 5, tzinfo=timezone.utc), 1),
+            ("b", None, 1),
+            ("c", datetime(2020, 2, 1, 1, 23, tzinfo=timezone.utc), 1),
+        ]
+    ]
+
+    # The datetime field is annotated because its values are truncated to the
+    # minute, so its column and converters are at a different position than the
+    # ones of the other fields.
+    queryset = model.objects.all().enhance_by_fields()
+    counts = ViewHandler().get_group_by_metadata_in_rows(
+        [text_field, datetime_field, number_field],
+        [rows[0], rows[4], rows[5]],
+        queryset,
+    )
+
+    minute = datetime(2020, 2, 1, 1, 23, tzinfo=timezone.utc)
+    assert counts == {
+        text_field: unordered(
+            [
+                {f"field_{text_field.id}": "a", "count": 4},
+                {f"field_{text_field.id}": "b", "count": 2},
+            ]
+        ),
+        datetime_field: unordered(
+            [
+                {
+                    f"field_{text_field.id}": "a",
+                    f"field_{datetime_field.id}": minute,
+                    "count": 3,
+                },
+                {
+                    f"field_{text_field.id}": "b",
+                    f"field_{datetime_field.id}": minute,
+                    "count": 1,
+                },
+                {
+                    f"field_{text_field.id}": "b",
+                    f"field_{datetime_field.id}": None,
+                    "count": 1,
+                },
+            ]
+        ),
+        number_field: unordered(
+            [
+                {
+                    f"field_{text_field.id}": "a",
+                    f"field_{datetime_field.id}": minute,
+                    f"field_{number_field.id}": Decimal("1"),
+                    "count": 2,
+                },
+                {
+                    f"field_{text_field.id}": "b",
+                    f"field_{datetime_field.id}": minute,
+                    f"field_{number_field.id}": Decimal("1"),
+                    "count": 1,
+                },
+                {
+                    f"field_{text_field.id}": "b",
+                    f"field_{datetime_field.id}": None,
+                    f"field_{number_field.id}": Decimal("1"),
+                    "count": 1,
+                },
+            ]
+        ),
+    }
@@ -0,0 +1,41 @@
+from django.test import override_settings
+
+from baserow.contrib.database.webhooks.cache import (
+    get_cached_table_webhooks,
+    invalidate_table_webhooks_cache,
+    set_cached_table_webhooks,
+)
+
+
+@override_settings(BASEROW_WEBHOOKS_SUBSCRIPTIONS_CACHE_TIMEOUT=60 * 60)
+def test_cached_table_webhooks_are_versioned():
+    table_id = 999999
+
+    webhooks, version = get_cached_table_webhooks(table_id)
+    assert webhooks is None
+    set_cached_table_webhooks(table_id, [], version)
+    assert get_cached_table_webhooks(table_id) == ([], version)
+
+    invalidate_table_webhooks_cache(table_id)
+    webhooks, new_version = get_cached_table_webhooks(table_id)
+    assert webhooks is None
+    assert new_version != version
+
+
+@override_settings(BASEROW_WEBHOOKS_SUBSCRIPTIONS_CACHE_TIMEOUT=60 * 60)
+def test_cached_table_webhooks_fetched_before_invalidation_are_not_stored():
+    table_id = 999998
+
+    webhooks, version = get_cached_table_webhooks(table_id)
+    # The webhooks change while the previous ones are being fetched.
+    invalidate_table_webhooks_cache(table_id)
+    set_cached_table_webhooks(table_id, ["outdated"], version)
+
+    webhooks, _ = get_cached_table_webhooks(table_id)
+    assert webhooks is None
+
+
+@override_settings(BASEROW_WEBHOOKS_SUBSCRIPTIONS_CACHE_TIMEOUT=0)
+def test_cached_table_webhooks_disabled():
+    set_cached_table_webhooks(999997, [], "version")
+    assert get_cached_table_webhooks(999997) == (None, None)
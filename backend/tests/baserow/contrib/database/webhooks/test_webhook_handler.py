@@ -83,6 +83,56 @@ def test_find_webhooks_to_call(data_fixture):
     assert webhook_5.id in webhook_ids
 
 
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_WEBHOOKS_SUBSCRIPTIONS_CACHE_TIMEOUT=3600)
+def test_get_webhooks_to_call_uses_cached_table_webhooks(
+    data_fixture, django_assert_num_queries
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    handler = WebhookHandler()
+
+    with django_assert_num_queries(1):
+        assert handler.get_webhooks_to_call(table.id, "rows.created") == []
+
+    # Tables without webhooks don't query the database after the first event.
+    with django_assert_num_queries(0):
+        assert handler.get_webhooks_to_call(table.id, "rows.created") == []
+
+    webhook_1 = handler.create_table_webhook(
+        user=user, table=table, url="http://localhost/", name="Webhook 1"
+    )
+    webhook_2 = handler.create_table_webhook(
+        user=user,
+        table=table,
+        url="http://localhost/",
+        name="Webhook 2",
+        include_all_events=False,
+        events=["rows.updated"],
+        headers={"Baserow-header-1": "Value 1"},
+    )
+
+    handler.get_webhooks_to_call(table.id, "rows.created")
+    with django_assert_num_queries(0):
+        webhooks = handler.get_webhooks_to_call(table.id, "rows.updated")
+        assert [webhook.id for webhook in webhooks] == [webhook_1.id, webhook_2.id]
+        assert webhooks[1].header_dict == {"Baserow-header-1": "Value 1"}
+        assert webhooks[1].table.database.workspace_id == table.database.workspace_id
+        webhooks = handler.get_webhooks_to_call(table.id, "rows.created")
+        assert [webhook.id for webhook in webhooks] == [webhook_1.id]
+
+    handler.update_table_webhook(user=user, webhook=webhook_1, active=False)
+    webhooks = handler.get_webhooks_to_call(table.id, "rows.updated")
+    assert [webhook.id for webhook in webhooks] == [webhook_2.id]
+
+    handler.delete_table_webhook(user=user, webhook=webhook_2)
+    assert handler.get_webhooks_to_call(table.id, "rows.updated") == []
+
+    with override_settings(BASEROW_WEBHOOKS_SUBSCRIPTIONS_CACHE_TIMEOUT=0):
+        with django_assert_num_queries(1):
+            assert handler.get_webhooks_to_call(table.id, "rows.created") == []
+
+
 @pytest.mark.django_db()
 def test_get_webhook(data_fixture):
     user = data_fixture.create_user()
@@ -3,6 +3,7 @@ from unittest.mock import patch
 import pytest
 
 from baserow.contrib.database.rows.handler import RowHandler
+from baserow.contrib.database.rows.webhook_event_types import RowsCreatedEventType
 
 
 @pytest.mark.django_db(transaction=True)
@@ -39,3 +40,31 @@ def test_signal_listener(mock_call_webhook, data_fixture):
         "event_type": "rows.created",
         "items": [{"id": 1, "order": "1.00000000000000000000"}],
     }
+
+
+@pytest.mark.django_db(transaction=True)
+@patch("baserow.contrib.database.webhooks.registries.call_webhook")
+def test_signal_listener_serializes_rows_once_per_event(
+    mock_call_webhook, data_fixture
+):
+    user = data_fixture.create_user()
+    table = data_fixture.create_database_table(user=user)
+    for _ in range(3):
+        data_fixture.create_table_webhook(
+            user=user, table=table, url="http://localhost/", use_user_field_names=True
+        )
+
+    with patch(
+        "baserow.contrib.database.rows.webhook_event_types.RowsCreatedEventType."
+        "get_row_serializer",
+        side_effect=RowsCreatedEventType.get_row_serializer,
+        autospec=True,
+    ) as get_row_serializer:
+        RowHandler().create_row(user=user, table=table, values={})
+
+    assert mock_call_webhook.delay.call_count == 3
+    get_row_serializer.assert_called_once()
+    payloads = [
+        kwargs["payload"] for _, kwargs in mock_call_webhook.delay.call_args_list
+    ]
+    assert payloads[0]["items"] == payloads[1]["items"] == payloads[2]["items"]
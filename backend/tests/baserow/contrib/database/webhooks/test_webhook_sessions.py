@@ -0,0 +1,31 @@
+from django.test.utils import override_settings
+
+import responses
+
+from baserow.contrib.database.webhooks.sessions import (
+    clear_webhook_sessions,
+    get_webhook_session,
+)
+
+
+@responses.activate
+@override_settings(BASEROW_WEBHOOKS_ALLOW_PRIVATE_ADDRESS=True)
+def test_webhook_session_is_pooled_per_host_without_cookies():
+    clear_webhook_sessions()
+    responses.add(
+        responses.POST,
+        "http://localhost/first",
+        status=200,
+        headers={"Set-Cookie": "session=secret; Path=/"},
+    )
+    responses.add(responses.POST, "http://localhost/second", status=200)
+
+    session = get_webhook_session("http://localhost/first")
+    session.post("http://localhost/first")
+
+    assert get_webhook_session("http://localhost/second") is session
+    assert get_webhook_session("http://127.0.0.1/second") is not session
+
+    session.post("http://localhost/second")
+    assert len(session.cookies) == 0
+    assert "Cookie" not in responses.calls[1].request.headers
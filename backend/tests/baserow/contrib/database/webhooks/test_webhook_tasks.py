@@ -1,3 +1,4 @@
+import json
 from collections import defaultdict
 from unittest.mock import MagicMock, patch
 
@@ -361,3 +362,131 @@ def test_can_call_webhook_to_localhost_when_private_addresses_allowed(
     assert not call.error
     assert call.response_status == 201
     assert webhook.active
+
+
+class PoppingMemoryQueue(MemoryQueue):
+    queues = defaultdict(list)
+
+    def get_and_pop_next(self):
+        try:
+            return self.queues[self.queue_key].pop(0)
+        except IndexError:
+            return None
+
+    def requeue_task(self, task_object):
+        self.queues[self.queue_key].insert(0, task_object)
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+@patch("baserow.contrib.database.webhooks.tasks.RedisQueue", PoppingMemoryQueue)
+@patch("baserow.contrib.database.webhooks.tasks.cache", MagicMock())
+@patch("baserow.contrib.database.webhooks.tasks.schedule_next_task_in_queue")
+def test_call_webhook_sends_waiting_events_in_a_single_batch(
+    mock_schedule, data_fixture
+):
+    from baserow.contrib.database.webhooks.tasks import get_queue
+
+    webhook = data_fixture.create_table_webhook(batch_events=True)
+    responses.add(responses.POST, "http://localhost/", json={}, status=200)
+
+    def event_kwargs(event_id, url="http://localhost/"):
+        return {
+            "webhook_id": webhook.id,
+            "event_id": event_id,
+            "event_type": "rows.updated",
+            "method": "POST",
+            "url": url,
+            "headers": {"Baserow-header-1": "Value 1"},
+            "payload": {"event_id": event_id},
+        }
+
+    queue = get_queue(webhook.id)
+    queue.enqueue_task(
+        {"args": [], "kwargs": event_kwargs("00000000-0000-0000-0000-000000000002")}
+    )
+    queue.enqueue_task(
+        {
+            "args": [],
+            "kwargs": event_kwargs(
+                "00000000-0000-0000-0000-000000000003", "http://localhost2/"
+            ),
+        }
+    )
+
+    call_webhook.run(**event_kwargs("00000000-0000-0000-0000-000000000001"))
+
+    assert len(responses.calls) == 1
+    request = responses.calls[0].request
+    assert request.headers["X-Baserow-Event"] == "batch"
+    assert request.headers["X-Baserow-Batch-Size"] == "2"
+    assert json.loads(request.body) == {
+        "events": [
+            {"event_id": "00000000-0000-0000-0000-000000000001"},
+            {"event_id": "00000000-0000-0000-0000-000000000002"},
+        ]
+    }
+
+    assert sorted(
+        str(event_id)
+        for event_id in TableWebhookCall.objects.filter(
+            webhook=webhook, response_status=200
+        ).values_list("event_id", flat=True)
+    ) == [
+        "00000000-0000-0000-0000-000000000001",
+        "00000000-0000-0000-0000-000000000002",
+    ]
+
+    # The event sent to another URL can't be batched and is still waiting in the
+    # queue.
+    assert [task["kwargs"]["event_id"] for task in queue.queues[queue.queue_key]] == [
+        "00000000-0000-0000-0000-000000000003"
+    ]
+    mock_schedule.assert_called_with(webhook.id)
+
+
+@pytest.mark.django_db(transaction=True)
+@responses.activate
+@patch("baserow.contrib.database.webhooks.tasks.RedisQueue", PoppingMemoryQueue)
+@patch("baserow.contrib.database.webhooks.tasks.cache", MagicMock())
+@patch("baserow.contrib.database.webhooks.tasks.schedule_next_task_in_queue")
+def test_call_webhook_requeues_popped_events_if_it_fails(mock_schedule, data_fixture):
+    from baserow.contrib.database.webhooks.tasks import get_queue
+
+    webhook = data_fixture.create_table_webhook(batch_events=True)
+    responses.add(responses.POST, "http://localhost/", json={}, status=200)
+
+    def event_kwargs(event_id):
+        return {
+            "webhook_id": webhook.id,
+            "event_id": event_id,
+            "event_type": "rows.updated",
+            "method": "POST",
+            "url": "http://localhost/",
+            "headers": {"Baserow-header-1": "Value 1"},
+            "payload": {"event_id": event_id},
+        }
+
+    queue = get_queue(webhook.id)
+    queue.clear()
+    for event_id in [
+        "00000000-0000-0000-0000-000000000002",
+        "00000000-0000-0000-0000-000000000003",
+    ]:
+        queue.enqueue_task({"args": [], "kwargs": event_kwargs(event_id)})
+
+    with patch(
+        "baserow.contrib.database.webhooks.handler.WebhookHandler.save_webhook_calls",
+        side_effect=Exception("Failed to save the calls."),
+    ):
+        with pytest.raises(Exception, match="Failed to save the calls."):
+            call_webhook.run(**event_kwargs("00000000-0000-0000-0000-000000000001"))
+
+    # The popped events are back in front of the queue in the original order, so
+    # that they're sent by the next call.
+    assert [task["kwargs"]["event_id"] for task in queue.queues[queue.queue_key]] == [
+        "00000000-0000-0000-0000-000000000002",
+        "00000000-0000-0000-0000-000000000003",
+    ]
+    assert TableWebhookCall.objects.filter(webhook=webhook).count() == 0
+    mock_schedule.assert_called_with(webhook.id)
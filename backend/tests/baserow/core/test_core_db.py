@@ -1,3 +1,5 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
 from unittest.mock import MagicMock
 
 from django.contrib.contenttypes.models import ContentType
@@ -8,6 +10,7 @@ from django.db.models.functions import Concat
 from django.test.utils import override_settings
 
 import pytest
+from psycopg2.extras import Json
 
 from baserow.contrib.database.fields.handler import FieldHandler
 from baserow.contrib.database.fields.models import (
@@ -25,6 +28,7 @@ from baserow.core.db import (
     QuerySet,
     specific_iterator,
     specific_queryset,
+    to_copy_text_value,
 )
 from baserow.core.models import Settings, Workspace
 
@@ -646,3 +650,25 @@ def test_multiple_field_prefetch__many_to_many_missing_source(data_fixture):
     )
     row = rows[0]
     assert len(row.field.all()) == 1
+
+
+def test_to_copy_text_value():
+    assert to_copy_text_value(None) == "\\N"
+    assert to_copy_text_value(True) == "t"
+    assert to_copy_text_value(False) == "f"
+    assert to_copy_text_value(10) == "10"
+    assert to_copy_text_value(Decimal("1.50")) == "1.50"
+    assert to_copy_text_value("a\tb\nc\\d\re") == "a\\tb\\nc\\\\d\\re"
+    assert to_copy_text_value(date(2020, 1, 2)) == "2020-01-02"
+    assert (
+        to_copy_text_value(datetime(2020, 1, 2, 3, 4, tzinfo=timezone.utc))
+        == "2020-01-02T03:04:00+00:00"
+    )
+    assert (
+        to_copy_text_value(timedelta(days=-1, seconds=5))
+        == "-1 days 5 seconds 0 microseconds"
+    )
+    assert to_copy_text_value(Json({"a": "b\tc"})) == '{"a": "b\\\\tc"}'
+
+    with pytest.raises(TypeError):
+        to_copy_text_value([1, 2])
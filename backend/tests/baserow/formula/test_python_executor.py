@@ -1,12 +1,23 @@
+from unittest.mock import MagicMock
+
 import pytest
 
 from baserow.core.formula.parser.exceptions import (
     BaserowFormulaSyntaxError,
     InvalidNumberOfArguments,
 )
-from baserow.core.formula.parser.parser import get_parse_tree_for_formula
+from baserow.core.formula.parser.parser import (
+    clear_parse_tree_cache,
+    get_parse_tree_cache_info,
+    get_parse_tree_for_formula,
+)
+from baserow.core.formula.parser.python_compiler import (
+    clear_compiled_formula_cache,
+    compile_formula,
+)
 from baserow.core.formula.parser.python_executor import BaserowPythonExecutor
 from baserow.core.formula.registries import formula_runtime_function_registry
+from baserow.core.formula.runtime_formula_context import RuntimeFormulaContext
 from baserow.test_utils.helpers import load_test_cases
 
 TEST_DATA = load_test_cases("formula_runtime_cases")
@@ -48,3 +59,85 @@ def test_invalid_number_of_arguments():
     with pytest.raises(InvalidNumberOfArguments):
         tree = get_parse_tree_for_formula("get(1,2)")
         BaserowPythonExecutor(formula_runtime_function_registry, {}).visit(tree)
+
+
+def test_parse_trees_are_cached():
+    clear_parse_tree_cache()
+
+    tree = get_parse_tree_for_formula("concat('a', 'b')")
+    assert get_parse_tree_for_formula("concat('a', 'b')") is tree
+    assert get_parse_tree_for_formula("concat('a', 'c')") is not tree
+
+    cache_info = get_parse_tree_cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 2
+    assert cache_info.currsize == 2
+
+    # A cached tree can be executed multiple times with different contexts.
+    context = {}
+    executor = BaserowPythonExecutor(formula_runtime_function_registry, context)
+    assert executor.visit(tree) == "ab"
+    assert executor.visit(tree) == "ab"
+
+
+def test_invalid_formulas_are_not_cached():
+    clear_parse_tree_cache()
+
+    for _ in range(2):
+        with pytest.raises(BaserowFormulaSyntaxError):
+            get_parse_tree_for_formula("concat('a'")
+
+    cache_info = get_parse_tree_cache_info()
+    assert cache_info.hits == 0
+    assert cache_info.currsize == 0
+
+
+@pytest.mark.parametrize("test_data", VALID_FORMULA_TESTS)
+def test_valid_compiled_formulas(test_data):
+    formula = test_data["formula"]
+    result = test_data["result"]
+    context = test_data["context"]
+
+    compiled = compile_formula(formula, formula_runtime_function_registry)
+    assert compiled(context) == result
+
+
+@pytest.mark.parametrize("test_data", INVALID_FORMULA_TESTS)
+def test_invalid_compiled_formulas(test_data):
+    formula = test_data["formula"]
+    context = test_data["context"]
+
+    with pytest.raises(Exception):
+        compile_formula(formula, formula_runtime_function_registry)(context)
+
+
+def test_compiled_formula_function_does_not_exist():
+    with pytest.raises(BaserowFormulaSyntaxError):
+        compile_formula("notExistingFunction(1,2,3)", formula_runtime_function_registry)
+
+
+def test_compiled_formulas_are_cached():
+    clear_compiled_formula_cache()
+
+    compiled = compile_formula("get('a')", formula_runtime_function_registry)
+    assert compile_formula("get('a')", formula_runtime_function_registry) is compiled
+    assert compiled({"a": 1}) == 1
+    assert compiled({"a": 2}) == 2
+
+
+def test_compiled_formula_get_uses_split_path():
+    data_provider_type = MagicMock()
+    data_provider_type.get_data_chunk.return_value = "value"
+
+    class TestContext(RuntimeFormulaContext):
+        data_provider_registry = MagicMock()
+
+    TestContext.data_provider_registry.get.return_value = data_provider_type
+    context = TestContext()
+
+    compiled = compile_formula(
+        "concat(get('provider.a[0].b'), '!')", formula_runtime_function_registry
+    )
+    assert compiled(context) == "value!"
+    TestContext.data_provider_registry.get.assert_called_once_with("provider")
+    data_provider_type.get_data_chunk.assert_called_once_with(context, ["a", "0", "b"])
@@ -0,0 +1,173 @@
+import queue
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.test.utils import override_settings
+
+from baserow.contrib.database.ws.pages import TablePageType
+from baserow.ws.broadcast import BATCH_MESSAGE_TYPE, ChannelGroupBroadcaster
+from baserow.ws.tasks import broadcast_to_users, broadcast_to_users_individual_payloads
+
+
+def _message(name):
+    return {"type": "broadcast_to_group", "payload": {"name": name}}
+
+
+@override_settings(BASEROW_WS_DIRECT_BROADCAST_ENABLED=False)
+def test_channel_group_broadcaster_disabled():
+    broadcaster = ChannelGroupBroadcaster()
+    assert broadcaster.send("table-1", _message("a")) is False
+    assert broadcaster._thread is None
+
+
+@override_settings(BASEROW_WS_DIRECT_BROADCAST_ENABLED=True)
+@patch("channels.layers.channel_layers.make_backend")
+def test_channel_group_broadcaster_groups_messages(mock_make_backend):
+    channel_layer = MagicMock()
+    channel_layer.group_send = AsyncMock()
+    mock_make_backend.return_value = channel_layer
+
+    broadcaster = ChannelGroupBroadcaster(batch_interval=0.5)
+    assert broadcaster.send("table-1", _message("a"))
+    assert broadcaster.send("table-2", _message("b"))
+    assert broadcaster.send("table-1", _message("c"))
+    broadcaster.flush(timeout=5)
+
+    calls = {call.args[0]: call.args[1] for call in channel_layer.group_send.mock_calls}
+    assert calls == {
+        "table-1": {
+            "type": BATCH_MESSAGE_TYPE,
+            "messages": [_message("a"), _message("c")],
+        },
+        "table-2": _message("b"),
+    }
+
+
+@override_settings(BASEROW_WS_DIRECT_BROADCAST_ENABLED=True)
+@patch("baserow.ws.tasks.broadcast_messages_to_channel_group")
+@patch("channels.layers.channel_layers.make_backend")
+def test_channel_group_broadcaster_falls_back_to_celery(
+    mock_make_backend, mock_broadcast_messages_to_channel_group
+):
+    channel_layer = MagicMock()
+    channel_layer.group_send = AsyncMock(side_effect=ConnectionError)
+    mock_make_backend.return_value = channel_layer
+
+    broadcaster = ChannelGroupBroadcaster(batch_interval=0)
+    assert broadcaster.send("table-1", _message("a"))
+    broadcaster.flush(timeout=5)
+
+    mock_broadcast_messages_to_channel_group.delay.assert_called_once_with(
+        "table-1", [_message("a")]
+    )
+
+
+@override_settings(BASEROW_WS_DIRECT_BROADCAST_ENABLED=True)
+@patch("channels.layers.channel_layers.make_backend")
+def test_channel_group_broadcaster_close(mock_make_backend):
+    channel_layer = MagicMock()
+    channel_layer.group_send = AsyncMock()
+    channel_layer.close_pools = AsyncMock()
+    mock_make_backend.return_value = channel_layer
+
+    broadcaster = ChannelGroupBroadcaster(batch_interval=0)
+    assert broadcaster.send("table-1", _message("a"))
+    thread = broadcaster._thread
+    broadcaster.close(timeout=5)
+
+    assert not thread.is_alive()
+    channel_layer.group_send.assert_awaited_once_with("table-1", _message("a"))
+    channel_layer.close_pools.assert_awaited_once()
+
+    # A new thread is started when sending again after closing.
+    assert broadcaster.send("table-1", _message("b"))
+    assert broadcaster._thread is not thread
+    broadcaster.close(timeout=5)
+
+
+@override_settings(BASEROW_WS_DIRECT_BROADCAST_ENABLED=True)
+def test_channel_group_broadcaster_queue_full():
+    broadcaster = ChannelGroupBroadcaster()
+    with patch.object(broadcaster, "_get_queue") as mock_get_queue:
+        mock_get_queue.return_value.put_nowait.side_effect = queue.Full
+        assert broadcaster.send("table-1", _message("a")) is False
+
+
+@patch("baserow.ws.tasks.broadcast_to_channel_group.apply_async")
+@patch("baserow.ws.broadcast.channel_group_broadcaster")
+def test_page_type_broadcast_uses_broadcaster(
+    mock_broadcaster, mock_broadcast_to_channel_group_apply_async
+):
+    page_type = TablePageType()
+
+    mock_broadcaster.send.return_value = True
+    page_type.broadcast({"message": "test"}, "ws-1", table_id=1)
+    mock_broadcaster.send.assert_called_once_with(
+        "table-1",
+        {
+            "type": "broadcast_to_group",
+            "payload": {"message": "test"},
+            "ignore_web_socket_id": "ws-1",
+            "exclude_user_ids": None,
+        },
+    )
+    mock_broadcast_to_channel_group_apply_async.assert_not_called()
+
+    mock_broadcaster.send.return_value = False
+    page_type.broadcast({"message": "test"}, "ws-1", table_id=1)
+    mock_broadcast_to_channel_group_apply_async.assert_called_once_with(
+        ("table-1", {"message": "test"}, "ws-1", None), {}
+    )
+
+
+@patch("baserow.ws.tasks.broadcast_to_users.apply_async")
+@patch("baserow.ws.broadcast.channel_group_broadcaster")
+def test_broadcast_to_users_delay_uses_broadcaster(
+    mock_broadcaster, mock_broadcast_to_users_apply_async
+):
+    message = {
+        "type": "broadcast_to_users",
+        "user_ids": [1, 2],
+        "payload": {"message": "test"},
+        "ignore_web_socket_id": "ws-1",
+        "send_to_all_users": False,
+    }
+
+    mock_broadcaster.send.return_value = True
+    broadcast_to_users.delay([1, 2], {"message": "test"}, ignore_web_socket_id="ws-1")
+    mock_broadcaster.send.assert_called_once_with("users", message)
+    mock_broadcast_to_users_apply_async.assert_not_called()
+
+    mock_broadcaster.send.return_value = False
+    broadcast_to_users.delay([1, 2], {"message": "test"}, ignore_web_socket_id="ws-1")
+    mock_broadcast_to_users_apply_async.assert_called_once_with(
+        ([1, 2], {"message": "test"}), {"ignore_web_socket_id": "ws-1"}
+    )
+
+
+@patch("channels.layers.get_channel_layer")
+@patch("baserow.ws.broadcast.channel_group_broadcaster")
+def test_broadcast_tasks_use_broadcaster_of_the_worker(
+    mock_broadcaster, mock_get_channel_layer
+):
+    # The tasks computing the users in Celery send the resulting message via the
+    # broadcaster of the worker process.
+    mock_broadcaster.send.return_value = True
+    broadcast_to_users_individual_payloads({"1": {"message": "test"}})
+    mock_broadcaster.send.assert_called_once_with(
+        "users",
+        {
+            "type": "broadcast_to_users_individual_payloads",
+            "payload_map": {"1": {"message": "test"}},
+            "ignore_web_socket_id": None,
+        },
+    )
+    mock_get_channel_layer.assert_not_called()
+
+    # And send it right away if the broadcaster can't be used.
+    channel_layer = MagicMock()
+    channel_layer.group_send = AsyncMock()
+    channel_layer.close_pools = AsyncMock()
+    mock_get_channel_layer.return_value = channel_layer
+    mock_broadcaster.send.return_value = False
+    broadcast_to_users_individual_payloads({"1": {"message": "test"}})
+    channel_layer.group_send.assert_awaited_once()
@@ -5,6 +5,7 @@ from channels.testing import WebsocketCommunicator
 
 from baserow.config.asgi import application
 from baserow.ws.tasks import (
+    broadcast_messages_to_channel_group,
     broadcast_to_channel_group,
     broadcast_to_group,
     broadcast_to_groups,
@@ -507,3 +508,52 @@ async def test_broadcast_to_users_individual_payloads(data_fixture):
 
     await communicator_1.disconnect()
     await communicator_2.disconnect()
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.websockets
+async def test_broadcast_messages_to_channel_group(data_fixture):
+    user_1, token_1 = data_fixture.create_user_and_token()
+    table_1 = data_fixture.create_database_table(user=user_1)
+
+    communicator_1 = WebsocketCommunicator(
+        application,
+        f"ws/core/?jwt_token={token_1}",
+        headers=[(b"origin", b"http://localhost")],
+    )
+    await communicator_1.connect()
+    response_1 = await communicator_1.receive_json_from()
+    web_socket_id_1 = response_1["web_socket_id"]
+
+    await communicator_1.send_json_to({"page": "table", "table_id": table_1.id})
+    response = await communicator_1.receive_json_from(0.1)
+    assert response["type"] == "page_add"
+
+    await sync_to_async(broadcast_messages_to_channel_group)(
+        f"table-{table_1.id}",
+        [
+            {
+                "type": "broadcast_to_group",
+                "payload": {"message": "test1"},
+                "ignore_web_socket_id": None,
+            },
+            {
+                "type": "broadcast_to_group",
+                "payload": {"message": "ignored"},
+                "ignore_web_socket_id": web_socket_id_1,
+            },
+            {
+                "type": "broadcast_to_group",
+                "payload": {"message": "test2"},
+                "ignore_web_socket_id": None,
+            },
+        ],
+    )
+    response_1 = await communicator_1.receive_json_from(0.1)
+    assert response_1["message"] == "test1"
+    response_1 = await communicator_1.receive_json_from(0.1)
+    assert response_1["message"] == "test2"
+    await communicator_1.receive_nothing(0.1)
+
+    await communicator_1.disconnect()
@@ -35,6 +35,19 @@ def setup(settings):
         os.getenv("BASEROW_ENTERPRISE_AUDIT_LOG_RETENTION_DAYS", "") or 365
     )
 
+    # The number of seconds the computed roles of the workspace members are cached
+    # for across requests. They're invalidated when they change, so this only limits
+    # how long unused entries are kept. Set to 0 to disable the cache.
+    settings.BASEROW_ENTERPRISE_PERMISSION_CACHE_TIMEOUT = int(
+        os.getenv("BASEROW_ENTERPRISE_PERMISSION_CACHE_TIMEOUT", "") or 60 * 60
+    )
+
+    # The maximum number of computed roles kept in memory by every worker process on
+    # top of the shared cache. Set to 0 to only use the shared cache.
+    settings.BASEROW_ENTERPRISE_PERMISSION_LOCAL_CACHE_SIZE = int(
+        os.getenv("BASEROW_ENTERPRISE_PERMISSION_LOCAL_CACHE_SIZE", "") or 5000
+    )
+
     # Set this to True to enable users to login with auth providers different than
     # the one they were originally created with.
     settings.BASEROW_ALLOW_MULTIPLE_SSO_PROVIDERS_FOR_SAME_ACCOUNT = bool(
@@ -0,0 +1,187 @@
+"""
+This file is responsible for caching the roles per scope of the actors of a workspace
+across requests, so that checking the permissions of a user doesn't have to query all
+their role assignments, teams and workspace user again.
+
+The entries are stored in two tiers: a bounded, in-memory LRU per worker process and
+the Redis backed Django cache shared by all the workers. Both use keys containing the
+current version of the workspace:
+    `role_permissions_{workspace_id}_{version}_{subject_type}_{actor_id}_{trash}`
+
+The version is stored in the Django cache and replaced by a new random one every time
+something affecting the roles of the workspace changes, which makes all the existing
+entries of the workspace unreachable at once. Every lookup therefore costs one cache
+request for the version, followed by local lookups and one cache request for the
+entries that aren't in memory yet.
+"""
+
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+
+# A role per scope entry only contains ids: the `(content_type_id, scope_id)` param of
+# the scope and the ids of its roles. The scopes are queried again and the roles are
+# resolved via the in memory role cache of the `RoleAssignmentHandler`, so no model
+# instance is ever pickled.
+CachedRolesPerScope = List[Tuple[Tuple[int, int], List[int]]]
+
+_local_roles_per_scope: "OrderedDict[str, CachedRolesPerScope]" = OrderedDict()
+_local_roles_per_scope_lock = threading.Lock()
+
+# The workspaces invalidated in the transaction that is currently open in this thread.
+# Nothing is cached for them until the transaction is committed because the computed
+# roles could be based on data that is not visible to the other workers yet or that
+# is rolled back.
+_pending_invalidations = threading.local()
+
+
+def _get_version_cache_key(workspace_id: int) -> str:
+    return f"role_permissions_version_{workspace_id}"
+
+
+def _get_roles_cache_key(
+    workspace_id: int,
+    version: str,
+    subject_type: str,
+    actor_id: int,
+    include_trash: bool,
+) -> str:
+    return (
+        f"role_permissions_{workspace_id}_{version}_{subject_type}_{actor_id}_"
+        f"{int(include_trash)}"
+    )
+
+
+def _get_pending_invalidations() -> set:
+    if not connection.in_atomic_block:
+        _pending_invalidations.workspace_ids = set()
+    elif not hasattr(_pending_invalidations, "workspace_ids"):
+        _pending_invalidations.workspace_ids = set()
+    return _pending_invalidations.workspace_ids
+
+
+def is_roles_cache_enabled() -> bool:
+    return settings.BASEROW_ENTERPRISE_PERMISSION_CACHE_TIMEOUT > 0
+
+
+def get_workspace_roles_version(workspace_id: int) -> str:
+    """
+    Returns the current version of the cached roles of the workspace, creating one if
+    it doesn't exist yet.
+    """
+
+    version_cache_key = _get_version_cache_key(workspace_id)
+    version = cache.get(version_cache_key)
+    if version is None:
+        cache.add(version_cache_key, uuid.uuid4().hex, timeout=None)
+        version = cache.get(version_cache_key)
+    return version
+
+
+def get_cached_roles_per_scope(
+    workspace_id: int,
+    version: str,
+    subject_type: str,
+    actor_ids: Iterable[int],
+    include_trash: bool,
+) -> Dict[int, CachedRolesPerScope]:
+    """
+    Returns the cached roles per scope of the provided actors, first from the local
+    cache and then from the Django cache. The actors that are not in the cache are
+    not part of the result.
+    """
+
+    result = {}
+    keys_to_fetch = {}
+    with _local_roles_per_scope_lock:
+        for actor_id in actor_ids:
+            cache_key = _get_roles_cache_key(
+                workspace_id, version, subject_type, actor_id, include_trash
+            )
+            entry = _local_roles_per_scope.get(cache_key)
+            if entry is None:
+                keys_to_fetch[cache_key] = actor_id
+            else:
+                _local_roles_per_scope.move_to_end(cache_key)
+                result[actor_id] = entry
+
+    if keys_to_fetch:
+        fetched = cache.get_many(keys_to_fetch.keys())
+        _set_local_entries(fetched)
+        for cache_key, entry in fetched.items():
+            result[keys_to_fetch[cache_key]] = entry
+
+    return result
+
+
+def set_cached_roles_per_scope(
+    workspace_id: int,
+    version: str,
+    subject_type: str,
+    roles_per_scope_by_actor_id: Dict[int, CachedRolesPerScope],
+    include_trash: bool,
+):
+    """
+    Stores the roles per scope of the actors in both the local and the Django cache,
+    unless the roles of the workspace have been invalidated in the current
+    transaction.
+    """
+
+    if workspace_id in _get_pending_invalidations():
+        return
+
+    entries = {
+        _get_roles_cache_key(
+            workspace_id, version, subject_type, actor_id, include_trash
+        ): roles_per_scope
+        for actor_id, roles_per_scope in roles_per_scope_by_actor_id.items()
+    }
+    cache.set_many(
+        entries, timeout=settings.BASEROW_ENTERPRISE_PERMISSION_CACHE_TIMEOUT
+    )
+    _set_local_entries(entries)
+
+
+def _set_local_entries(entries: Dict[str, CachedRolesPerScope]):
+    max_size = settings.BASEROW_ENTERPRISE_PERMISSION_LOCAL_CACHE_SIZE
+    if max_size <= 0:
+        return
+
+    with _local_roles_per_scope_lock:
+        for cache_key, entry in entries.items():
+            _local_roles_per_scope[cache_key] = entry
+            _local_roles_per_scope.move_to_end(cache_key)
+        while len(_local_roles_per_scope) > max_size:
+            _local_roles_per_scope.popitem(last=False)
+
+
+def invalidate_workspace_roles_cache(workspace_id: Optional[int]):
+    """
+    Invalidates the cached roles of all the actors of the workspace. If called in a
+    transaction, the cache is invalidated again when it's committed and nothing is
+    cached for the workspace in the meantime.
+
+    :param workspace_id: The id of the workspace whose roles have changed.
+    """
+
+    if workspace_id is None or not is_roles_cache_enabled():
+        return
+
+    def invalidate():
+        cache.set(_get_version_cache_key(workspace_id), uuid.uuid4().hex, timeout=None)
+
+    invalidate()
+    if connection.in_atomic_block:
+        pending_invalidations = _get_pending_invalidations()
+        pending_invalidations.add(workspace_id)
+
+        def invalidate_on_commit():
+            pending_invalidations.discard(workspace_id)
+            invalidate()
+
+        transaction.on_commit(invalidate_on_commit)
@@ -35,6 +35,12 @@ from baserow_enterprise.signals import (
 )
 from baserow_enterprise.teams.models import Team, TeamSubject
 
+from .cache import (
+    get_cached_roles_per_scope,
+    get_workspace_roles_version,
+    is_roles_cache_enabled,
+    set_cached_roles_per_scope,
+)
 from .constants import (
     ALLOWED_SUBJECT_TYPE_BY_PRIORITY,
     NO_ACCESS_ROLE_UID,
@@ -305,6 +311,28 @@ class RoleAssignmentHandler:
             the object hierarchy, the earlier the tuple is in the list.
         """
 
+        roles_by_scope_param_per_actor_id = self._get_roles_per_scope_param_for_actors(
+            workspace, actor_subject_type, actors, include_trash=include_trash
+        )
+        return self._get_roles_per_scope_from_scope_params(
+            workspace, actors, roles_by_scope_param_per_actor_id
+        )
+
+    def _get_roles_per_scope_param_for_actors(
+        self,
+        workspace: Workspace,
+        actor_subject_type: SubjectType,
+        actors: List[Subject],
+        include_trash=False,
+    ) -> Dict[int, Dict[Tuple[int, int], List[Role]]]:
+        """
+        Computes the roles of the actors per scope, where the scopes are identified
+        by their (content type id, id) params instead of the scope objects.
+
+        :return: A dict with the actor ids as keys and the roles per scope param,
+            sorted by priority, as value.
+        """
+
         content_types = ContentType.objects.get_for_models(
             actor_subject_type.model_class, Team, Workspace
         )
@@ -392,9 +420,6 @@ class RoleAssignmentHandler:
         # Track the latest role priority for each scope of each subject
         priorities_by_scope_per_actor_id = defaultdict(dict)
 
-        # Keep a list of scope params to query later
-        scopes_to_query = defaultdict(set)
-
         roles_by_scope = defaultdict(lambda: {workspace_scope_param: []})
 
         for role_assignment in role_assignments:
@@ -403,8 +428,6 @@ class RoleAssignmentHandler:
             role_assignment_priority = role_assignment.role_priority
             subject_id = role_assignment.subject_id
 
-            scopes_to_query[role_assignment.scope_type_id].add(role_assignment.scope_id)
-
             # Is it a simple actor or a team?
             # If it's a team we need to iterate over all the actor that are
             # subject of the team
@@ -467,6 +490,29 @@ class RoleAssignmentHandler:
                         workspace_level_role
                     ]
 
+        return {actor.id: roles_by_scope[actor.id] for actor in actors}
+
+    def _get_roles_per_scope_from_scope_params(
+        self,
+        workspace: Workspace,
+        actors: List[Subject],
+        roles_by_scope_param_per_actor_id: Dict[int, Dict[Tuple[int, int], List[Role]]],
+    ) -> Dict[Subject, Tuple[ScopeObject, List[Role]]]:
+        """
+        Replaces the scope params of the roles per scope of the actors by the scope
+        objects, which are queried type by type.
+        """
+
+        workspace_scope_param = (
+            ContentType.objects.get_for_model(Workspace).id,
+            workspace.id,
+        )
+        scopes_to_query = defaultdict(set)
+        for roles_by_scope_param in roles_by_scope_param_per_actor_id.values():
+            for content_type_id, scope_id in roles_by_scope_param.keys():
+                if (content_type_id, scope_id) != workspace_scope_param:
+                    scopes_to_query[content_type_id].add(scope_id)
+
         # Populate scope cache by querying all scopes type by type
         scope_cache = {workspace_scope_param: workspace}
         for content_type_id, content_ids in scopes_to_query.items():
@@ -476,7 +522,7 @@ class RoleAssignmentHandler:
         # Finally replace scope_params by real scope
         roles_per_scope_per_user = defaultdict(list)
         for actor in actors:
-            for key, value in roles_by_scope[actor.id].items():
+            for key, value in roles_by_scope_param_per_actor_id[actor.id].items():
                 # scope_cache contains all the filtered scopes we need to check
                 # permissions for. Objects from snapshotted applications (table,
                 # applications, etc.) are filtered out as they're not accessible to the
@@ -487,6 +533,90 @@ class RoleAssignmentHandler:
 
         return roles_per_scope_per_user
 
+    def get_cached_roles_per_scope_for_actors(
+        self,
+        workspace: Workspace,
+        actor_subject_type: SubjectType,
+        actors: List[Subject],
+        include_trash=False,
+    ) -> Dict[Subject, Tuple[ScopeObject, List[Role]]]:
+        """
+        Same as `get_roles_per_scope_for_actors`, but the result is cached per actor
+        across requests until a role assignment, team, team subject or workspace user
+        of the workspace changes. Only the actors that are not in the cache yet are
+        computed.
+
+        :param workspace: The workspace in which we want the role assignments for.
+        :param actor_subject_type: The type of the actors.
+        :param actors: The actors we want the role per scope map.
+        :param include_trash: If true then also checks even if given workspace has been
+            trashed instead of raising a DoesNotExist exception.
+        :return: A dict with actor as keys and a list of (scope, list[role]) as value.
+        """
+
+        if not is_roles_cache_enabled():
+            return self.get_roles_per_scope_for_actors(
+                workspace, actor_subject_type, actors, include_trash=include_trash
+            )
+
+        version = get_workspace_roles_version(workspace.id)
+        cached_roles_per_scope_by_actor_id = get_cached_roles_per_scope(
+            workspace.id,
+            version,
+            actor_subject_type.type,
+            [actor.id for actor in actors],
+            include_trash,
+        )
+
+        # Only the scope params and the role ids are cached, the scopes are
+        # queried again for every call so that no model instance is ever cached.
+        roles_by_scope_param_per_actor_id = {}
+        actors_to_compute = []
+        for actor in actors:
+            if actor.id in cached_roles_per_scope_by_actor_id:
+                roles_by_scope_param_per_actor_id[actor.id] = {
+                    tuple(scope_param): [
+                        self.get_role_by_id(role_id) for role_id in role_ids
+                    ]
+                    for scope_param, role_ids in cached_roles_per_scope_by_actor_id[
+                        actor.id
+                    ]
+                }
+            else:
+                actors_to_compute.append(actor)
+
+        if actors_to_compute:
+            computed_roles_by_scope_param_per_actor_id = (
+                self._get_roles_per_scope_param_for_actors(
+                    workspace,
+                    actor_subject_type,
+                    actors_to_compute,
+                    include_trash=include_trash,
+                )
+            )
+            set_cached_roles_per_scope(
+                workspace.id,
+                version,
+                actor_subject_type.type,
+                {
+                    actor_id: [
+                        (scope_param, [role.id for role in roles])
+                        for scope_param, roles in roles_by_scope_param.items()
+                    ]
+                    for actor_id, roles_by_scope_param in (
+                        computed_roles_by_scope_param_per_actor_id.items()
+                    )
+                },
+                include_trash,
+            )
+            roles_by_scope_param_per_actor_id.update(
+                computed_roles_by_scope_param_per_actor_id
+            )
+
+        return self._get_roles_per_scope_from_scope_params(
+            workspace, actors, roles_by_scope_param_per_actor_id
+        )
+
     def get_computed_roles(
         self, roles_per_scopes, context: Any, cache: Optional[Dict] = None
     ) -> List[Role]:
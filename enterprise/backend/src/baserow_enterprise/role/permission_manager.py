@@ -87,7 +87,7 @@ class RolePermissionManagerType(PermissionManagerType):
         for actor_subject_type, actors in actors_by_subject_type.items():
             computed_role_cache = {}
             roles_per_scope_by_actor = (
-                RoleAssignmentHandler().get_roles_per_scope_for_actors(
+                RoleAssignmentHandler().get_cached_roles_per_scope_for_actors(
                     workspace, actor_subject_type, actors, include_trash=include_trash
                 )
             )
@@ -243,7 +243,10 @@ class RolePermissionManagerType(PermissionManagerType):
             return None
 
         # Get all role assignments for this actor into this workspace
-        roles_by_scope = RoleAssignmentHandler().get_roles_per_scope(workspace, actor)
+        actor_subject_type = subject_type_registry.get_by_model(actor)
+        roles_by_scope = RoleAssignmentHandler().get_cached_roles_per_scope_for_actors(
+            workspace, actor_subject_type, [actor]
+        )[actor]
 
         policy_per_operation = defaultdict(lambda: {"default": False, "exceptions": []})
 
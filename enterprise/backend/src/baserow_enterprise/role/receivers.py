@@ -1,7 +1,7 @@
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
-from django.db.models.signals import post_delete
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from baserow.core.models import Workspace, WorkspaceUser
@@ -9,6 +9,8 @@ from baserow.core.registries import subject_type_registry
 from baserow.core.signals import permissions_updated, workspace_user_updated
 from baserow.core.types import Subject
 from baserow.ws.tasks import broadcast_to_users
+from baserow_enterprise.role.cache import invalidate_workspace_roles_cache
+from baserow_enterprise.role.models import RoleAssignment
 from baserow_enterprise.signals import (
     role_assignment_created,
     role_assignment_deleted,
@@ -16,7 +18,7 @@ from baserow_enterprise.signals import (
     team_deleted,
     team_restored,
 )
-from baserow_enterprise.teams.models import Team
+from baserow_enterprise.teams.models import Team, TeamSubject
 
 User = get_user_model()
 
@@ -65,6 +67,44 @@ def notify_users_about_updated_permissions(
     )
 
 
+@receiver(permissions_updated)
+def invalidate_roles_cache_when_permissions_updated(
+    sender, subject: Subject, workspace: Workspace, **kwargs
+):
+    invalidate_workspace_roles_cache(workspace.id)
+
+
+@receiver(post_save, sender=Workspace)
+def invalidate_roles_cache_when_workspace_saved(sender, instance, **kwargs):
+    # The workspace users of a trashed workspace are only included on request.
+    invalidate_workspace_roles_cache(instance.id)
+
+
+@receiver(post_save, sender=WorkspaceUser)
+@receiver(post_delete, sender=WorkspaceUser)
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+def invalidate_roles_cache_when_workspace_child_changed(sender, instance, **kwargs):
+    invalidate_workspace_roles_cache(instance.workspace_id)
+
+
+@receiver(post_save, sender=TeamSubject)
+@receiver(post_delete, sender=TeamSubject)
+def invalidate_roles_cache_when_team_subject_changed(sender, instance, **kwargs):
+    try:
+        workspace_id = instance.team.workspace_id
+    except Team.DoesNotExist:
+        # The team has been deleted as well, which already invalidated the cache.
+        return
+    invalidate_workspace_roles_cache(workspace_id)
+
+
+@receiver(post_save, sender=RoleAssignment)
+@receiver(post_delete, sender=RoleAssignment)
+def invalidate_roles_cache_when_role_assignment_changed(sender, instance, **kwargs):
+    invalidate_workspace_roles_cache(instance.workspace_id)
+
+
 def cascade_subject_delete(sender, instance, **kwargs):
     """
     Delete role assignments linked to deleted subjects.
@@ -15,6 +15,7 @@ from baserow.core.models import Workspace
 from baserow.core.trash.handler import TrashHandler
 from baserow.core.utils import atomic_if_not_already
 from baserow_enterprise.models import Role, RoleAssignment, Team, TeamSubject
+from baserow_enterprise.role.cache import invalidate_workspace_roles_cache
 from baserow_enterprise.role.handler import RoleAssignmentHandler
 from baserow_enterprise.signals import (
     team_created,
@@ -424,7 +425,10 @@ class TeamHandler:
                 subj_kwargs["pk"] = pk_override
             bulk_teamsubjects.append(TeamSubject(**subj_kwargs))
 
-        return TeamSubject.objects.bulk_create(bulk_teamsubjects)
+        team_subjects = TeamSubject.objects.bulk_create(bulk_teamsubjects)
+        # The bulk creation doesn't send the `post_save` signals.
+        invalidate_workspace_roles_cache(team.workspace_id)
+        return team_subjects
 
     def create_subject(
         self,
@@ -1,4 +1,5 @@
 from django.apps import apps
+from django.core.cache import cache
 from django.shortcuts import reverse
 from django.test.utils import override_settings
 
@@ -12,6 +13,7 @@ from baserow.contrib.database.views.operations import (
     CreateAndUsePersonalViewOperationType,
 )
 from baserow.core.apps import sync_operations_after_migrate
+from baserow.core.subjects import UserSubjectType
 from baserow_enterprise.apps import sync_default_roles_after_migrate
 from baserow_enterprise.role.default_roles import default_roles
 from baserow_enterprise.role.handler import RoleAssignmentHandler
@@ -465,3 +467,53 @@ def test_builders_and_up_can_change_views_ownership_type(
         else initial_ownership_type
     )
     assert view.ownership_type == expected_ownership_type
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_ENTERPRISE_PERMISSION_CACHE_TIMEOUT=60 * 60)
+def test_role_changes_are_applied_to_the_cached_roles_through_the_api(
+    api_client, data_fixture
+):
+    admin, admin_token = data_fixture.create_user_and_token()
+    user, token = data_fixture.create_user_and_token()
+    workspace = data_fixture.create_workspace(
+        user=admin, custom_permissions=[(user, "VIEWER")]
+    )
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+    data_fixture.create_text_field(table=table, primary=True)
+
+    def create_row():
+        return api_client.post(
+            reverse("api:database:rows:list", kwargs={"table_id": table.id}),
+            {},
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {token}",
+        )
+
+    def assign_role(role):
+        response = api_client.post(
+            reverse("api:enterprise:role:list", kwargs={"workspace_id": workspace.id}),
+            {
+                "scope_id": workspace.id,
+                "scope_type": "workspace",
+                "subject_id": user.id,
+                "subject_type": UserSubjectType.type,
+                "role": role,
+            },
+            format="json",
+            HTTP_AUTHORIZATION=f"JWT {admin_token}",
+        )
+        assert response.status_code == HTTP_200_OK
+
+    # The roles of the user are computed and cached by the first request, and used
+    # from the cache by the second one.
+    assert create_row().status_code == HTTP_401_UNAUTHORIZED
+    assert cache.get(f"role_permissions_version_{workspace.id}") is not None
+    assert create_row().status_code == HTTP_401_UNAUTHORIZED
+
+    assign_role("EDITOR")
+    assert create_row().status_code == HTTP_200_OK
+
+    assign_role("VIEWER")
+    assert create_row().status_code == HTTP_401_UNAUTHORIZED
@@ -1,3 +1,4 @@
+from django.contrib.contenttypes.models import ContentType
 from django.db import IntegrityError, connection, reset_queries
 from django.test import override_settings
 from django.test.utils import CaptureQueriesContext
@@ -47,10 +48,15 @@ from baserow.core.operations import (
     UpdateSettingsOperationType,
     UpdateWorkspaceOperationType,
 )
-from baserow.core.registries import operation_type_registry
+from baserow.core.registries import operation_type_registry, subject_type_registry
 from baserow.core.snapshots.handler import SnapshotHandler
+from baserow.core.subjects import UserSubjectType
 from baserow.core.types import PermissionCheck
 from baserow.core.utils import Progress
+from baserow_enterprise.role.cache import (
+    get_cached_roles_per_scope,
+    get_workspace_roles_version,
+)
 from baserow_enterprise.role.default_roles import default_roles
 from baserow_enterprise.role.handler import RoleAssignmentHandler
 from baserow_enterprise.role.models import Role
@@ -1847,3 +1853,124 @@ def test_fetching_permissions_does_not_extra_queries_per_snapshot(
         CoreHandler().get_permissions(viewer, workspace=workspace)
 
     assert len(captured_1.captured_queries) == len(captured_2.captured_queries)
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_ENTERPRISE_PERMISSION_CACHE_TIMEOUT=60)
+def test_check_permissions_uses_cached_roles(data_fixture, enterprise_data_fixture):
+    enterprise_data_fixture.enable_enterprise()
+    admin = data_fixture.create_user()
+    editor = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[editor])
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+
+    role_editor = Role.objects.get(uid="EDITOR")
+    RoleAssignmentHandler().assign_role(editor, workspace, role=role_editor)
+
+    def check():
+        return CoreHandler().check_permissions(
+            editor,
+            UpdateDatabaseRowOperationType.type,
+            workspace=workspace,
+            context=table,
+        )
+
+    check()
+
+    with CaptureQueriesContext(connection) as captured:
+        assert check()
+
+    assert not any(
+        "baserow_enterprise_roleassignment" in query["sql"]
+        for query in captured.captured_queries
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_ENTERPRISE_PERMISSION_CACHE_TIMEOUT=60)
+def test_cached_roles_only_contain_ids(data_fixture, enterprise_data_fixture):
+    enterprise_data_fixture.enable_enterprise()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=user)
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+
+    role_editor = Role.objects.get(uid="EDITOR")
+    RoleAssignmentHandler().assign_role(user, workspace, role=role_editor, scope=table)
+
+    handler = RoleAssignmentHandler()
+    subject_type = subject_type_registry.get(UserSubjectType.type)
+    handler.get_cached_roles_per_scope_for_actors(workspace, subject_type, [user])
+
+    version = get_workspace_roles_version(workspace.id)
+    cached = get_cached_roles_per_scope(
+        workspace.id, version, UserSubjectType.type, [user.id], False
+    )
+    table_scope_param = (ContentType.objects.get_for_model(Table).id, table.id)
+    assert dict(cached[user.id])[table_scope_param] == [role_editor.id]
+    for scope_param, role_ids in cached[user.id]:
+        assert all(isinstance(value, int) for value in scope_param)
+        assert all(isinstance(role_id, int) for role_id in role_ids)
+
+    # The scopes are queried again instead of being returned from the cache.
+    Table.objects.filter(id=table.id).update(name="Renamed")
+    roles_per_scope = handler.get_cached_roles_per_scope_for_actors(
+        workspace, subject_type, [user]
+    )[user]
+    scopes = [scope for scope, _ in roles_per_scope]
+    assert scopes[0] == workspace
+    table_scope = next(scope for scope in scopes if isinstance(scope, Table))
+    assert table_scope.name == "Renamed"
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(BASEROW_ENTERPRISE_PERMISSION_CACHE_TIMEOUT=60)
+def test_cached_roles_are_invalidated_when_roles_change(
+    data_fixture, enterprise_data_fixture
+):
+    enterprise_data_fixture.enable_enterprise()
+    admin = data_fixture.create_user()
+    user = data_fixture.create_user()
+    workspace = data_fixture.create_workspace(user=admin, members=[user])
+    database = data_fixture.create_database_application(workspace=workspace)
+    table = data_fixture.create_database_table(database=database)
+
+    role_viewer = Role.objects.get(uid="VIEWER")
+    role_editor = Role.objects.get(uid="EDITOR")
+    RoleAssignmentHandler().assign_role(user, workspace, role=role_viewer)
+
+    def can_update_rows():
+        try:
+            return CoreHandler().check_permissions(
+                user,
+                UpdateDatabaseRowOperationType.type,
+                workspace=workspace,
+                context=table,
+            )
+        except PermissionException:
+            return False
+
+    assert can_update_rows() is False
+
+    # A role assignment on a lower scope.
+    RoleAssignmentHandler().assign_role(user, workspace, role=role_editor, scope=table)
+    assert can_update_rows() is True
+
+    # A team role.
+    RoleAssignmentHandler().remove_role(user, workspace, scope=table)
+    assert can_update_rows() is False
+    team = enterprise_data_fixture.create_team(workspace=workspace, members=[user])
+    RoleAssignmentHandler().assign_role(team, workspace, role=role_editor, scope=table)
+    assert can_update_rows() is True
+
+    # The team membership.
+    team.subjects.all().delete()
+    assert can_update_rows() is False
+
+    # The workspace user.
+    workspace_user = workspace.get_workspace_user(user)
+    CoreHandler().force_update_workspace_user(
+        None, workspace_user, permissions="EDITOR"
+    )
+    assert can_update_rows() is True
@@ -0,0 +1,243 @@
+import contextvars
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from baserow_premium.generative_ai.managers import AIFileManager
+from opentelemetry import metrics
+
+from baserow.contrib.database.table.models import GeneratedTableModel
+from baserow.core.generative_ai.registries import (
+    GenerativeAIModelType,
+    GenerativeAIWithFilesModelType,
+)
+from baserow.core.models import Workspace
+
+from .models import AIField
+
+meter = metrics.get_meter(__name__)
+ai_field_prompts_counter = meter.create_counter(
+    "baserow.ai_field.prompts",
+    unit="1",
+    description="The number of AI field values generated, including the ones found "
+    "in the prompt result cache.",
+)
+ai_field_generation_duration_histogram = meter.create_histogram(
+    "baserow.ai_field.generation_duration",
+    unit="ms",
+    description="The time it took to generate the AI field values of a batch of rows.",
+)
+
+
+class ProviderRateLimiter:
+    """
+    Spreads the requests sent to a generative AI provider by the threads of this
+    process, so that no more than the configured number of requests per second are
+    started.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._next_request_at = 0.0
+
+    def wait(self, max_requests_per_second: float):
+        """
+        Blocks until the next request can be sent.
+
+        :param max_requests_per_second: The maximum number of requests per second,
+            0 or less disables the limit.
+        """
+
+        if max_requests_per_second <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            request_at = max(now, self._next_request_at)
+            self._next_request_at = request_at + 1 / max_requests_per_second
+
+        if request_at > now:
+            time.sleep(request_at - now)
+
+
+_provider_rate_limiters: Dict[str, ProviderRateLimiter] = {}
+_provider_rate_limiters_lock = threading.Lock()
+
+
+def get_provider_rate_limiter(generative_ai_type: str) -> ProviderRateLimiter:
+    with _provider_rate_limiters_lock:
+        return _provider_rate_limiters.setdefault(
+            generative_ai_type, ProviderRateLimiter()
+        )
+
+
+def get_prompt_result_cache_key(
+    generative_ai_type: str, model: str, temperature: Optional[float], prompt: str
+) -> str:
+    prompt_hash = hashlib.sha256(
+        json.dumps([generative_ai_type, model, temperature, prompt]).encode("utf-8")
+    ).hexdigest()
+    return f"ai_field_prompt_result_{prompt_hash}"
+
+
+class AIFieldValuesGenerator:
+    """
+    Generates the values of an AI field for multiple rows by sending the prompts to
+    the generative AI model concurrently. The results of prompts without files and
+    without a temperature above 0 are cached by the generative AI type, model,
+    temperature and prompt, so that identical prompts are only sent once.
+    """
+
+    def __init__(
+        self,
+        ai_field: AIField,
+        generative_ai_model_type: GenerativeAIModelType,
+        workspace: Workspace,
+    ):
+        self.ai_field = ai_field
+        self.generative_ai_model_type = generative_ai_model_type
+        self.workspace = workspace
+        self.use_files = ai_field.ai_file_field_id is not None and isinstance(
+            generative_ai_model_type, GenerativeAIWithFilesModelType
+        )
+        if self.use_files:
+            # Fetched once here because the threads must not query the database.
+            ai_field.ai_file_field
+
+    def generate(
+        self, rows: List[GeneratedTableModel], prompts: List[str]
+    ) -> Iterator[str]:
+        """
+        Sends the prompts of the rows to the generative AI model using at most
+        `BASEROW_AI_FIELD_GENERATION_CONCURRENCY` threads, and yields the outputs in
+        the same order as the rows. If a prompt fails, the exception is raised when
+        its output is yielded. The prompts that haven't been sent yet are cancelled
+        if the iterator is closed before the end.
+
+        :param rows: The rows to generate the values for.
+        :param prompts: The resolved prompt of every row.
+        :return: An iterator over the outputs of the generative AI model.
+        """
+
+        if not rows:
+            return
+
+        started = time.perf_counter()
+        max_workers = max(
+            1, min(settings.BASEROW_AI_FIELD_GENERATION_CONCURRENCY, len(rows))
+        )
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures: List[Future] = []
+            futures_by_cache_key: Dict[str, Future] = {}
+            for row, prompt in zip(rows, prompts):
+                cache_key = self._get_cache_key(prompt)
+                future = futures_by_cache_key.get(cache_key)
+                if future is None:
+                    future = executor.submit(
+                        contextvars.copy_context().run,
+                        self._generate,
+                        row,
+                        prompt,
+                        cache_key,
+                    )
+                    if cache_key is not None:
+                        futures_by_cache_key[cache_key] = future
+                futures.append(future)
+
+            for future in futures:
+                yield future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            ai_field_generation_duration_histogram.record(
+                (time.perf_counter() - started) * 1000,
+                {
+                    "generative_ai_type": self.generative_ai_model_type.type,
+                    "rows": len(rows),
+                },
+            )
+
+    def _get_cache_key(self, prompt: str) -> Optional[str]:
+        # With a temperature above 0 the output is sampled, so the user expects a
+        # new output for every row and every time the values are generated again.
+        temperature = self.ai_field.ai_temperature
+        if (
+            self.use_files
+            or (temperature is not None and temperature > 0)
+            or settings.BASEROW_AI_FIELD_PROMPT_CACHE_TIMEOUT <= 0
+        ):
+            return None
+
+        return get_prompt_result_cache_key(
+            self.generative_ai_model_type.type,
+            self.ai_field.ai_generative_ai_model,
+            self.ai_field.ai_temperature,
+            prompt,
+        )
+
+    def _generate(
+        self, row: GeneratedTableModel, prompt: str, cache_key: Optional[str]
+    ) -> str:
+        try:
+            if cache_key is not None:
+                output = cache.get(cache_key)
+                if output is not None:
+                    self._count_prompt(cached=True)
+                    return output
+
+            get_provider_rate_limiter(self.generative_ai_model_type.type).wait(
+                settings.BASEROW_AI_FIELD_MAX_REQUESTS_PER_SECOND
+            )
+            if self.use_files:
+                output = self._prompt_with_files(row, prompt)
+            else:
+                output = self.generative_ai_model_type.prompt(
+                    self.ai_field.ai_generative_ai_model,
+                    prompt,
+                    workspace=self.workspace,
+                    temperature=self.ai_field.ai_temperature,
+                )
+
+            if cache_key is not None:
+                cache.set(
+                    cache_key,
+                    output,
+                    timeout=settings.BASEROW_AI_FIELD_PROMPT_CACHE_TIMEOUT,
+                )
+            self._count_prompt(cached=False)
+            return output
+        finally:
+            connections.close_all()
+
+    def _prompt_with_files(self, row: GeneratedTableModel, prompt: str) -> str:
+        file_ids = AIFileManager.upload_files_from_file_field(
+            self.ai_field, row, self.generative_ai_model_type, workspace=self.workspace
+        )
+        try:
+            return self.generative_ai_model_type.prompt_with_files(
+                self.ai_field.ai_generative_ai_model,
+                prompt,
+                file_ids=file_ids,
+                workspace=self.workspace,
+                temperature=self.ai_field.ai_temperature,
+            )
+        finally:
+            self.generative_ai_model_type.delete_files(
+                file_ids, workspace=self.workspace
+            )
+
+    def _count_prompt(self, cached: bool):
+        ai_field_prompts_counter.add(
+            1,
+            {
+                "generative_ai_type": self.generative_ai_model_type.type,
+                "cached": cached,
+            },
+        )
@@ -261,6 +261,12 @@ class AIFieldType(CollationSortMixin, SelectOptionBaseFieldType):
             row, field_name, value, id_mapping, cache, files_zip, storage
         )
 
+    def get_in_database_copy_expression(self, field, source_column, context):
+        baserow_field_type = self.get_baserow_field_type(field)
+        return baserow_field_type.get_in_database_copy_expression(
+            field, source_column, context
+        )
+
     def get_export_value(self, value, field_object, rich_value=False):
         baserow_field_type = self.get_baserow_field_type(field_object["field"])
         return baserow_field_type.get_export_value(value, field_object, rich_value)
@@ -1,4 +1,4 @@
-from baserow_premium.generative_ai.managers import AIFileManager
+from contextlib import closing
 
 from baserow.config.celery import app
 from baserow.contrib.database.fields.handler import FieldHandler
@@ -12,13 +12,11 @@ from baserow.contrib.database.rows.signals import rows_ai_values_generation_erro
 from baserow.core.formula import resolve_formula
 from baserow.core.formula.registries import formula_runtime_function_registry
 from baserow.core.generative_ai.exceptions import ModelDoesNotBelongToType
-from baserow.core.generative_ai.registries import (
-    GenerativeAIWithFilesModelType,
-    generative_ai_model_type_registry,
-)
+from baserow.core.generative_ai.registries import generative_ai_model_type_registry
 from baserow.core.handler import CoreHandler
 from baserow.core.user.handler import User
 
+from .ai_generation import AIFieldValuesGenerator
 from .models import AIField
 from .registries import ai_field_output_registry
 
@@ -74,7 +72,8 @@ def generate_ai_values_for_rows(self, user_id: int, field_id: int, row_ids: list
 
     ai_output_type = ai_field_output_registry.get(ai_field.ai_output_type)
 
-    for i, row in enumerate(rows):
+    prompts = []
+    for row in rows:
         context = HumanReadableRowContext(row, exclude_field_ids=[ai_field.id])
         message = str(
             resolve_formula(
@@ -85,57 +84,35 @@ def generate_ai_values_for_rows(self, user_id: int, field_id: int, row_ids: list
         # The AI output type should be able to format the prompt because it can add
         # additional instructions to it. The choice output type for example adds
         # additional prompt trying to force the out, for example.
-        message = ai_output_type.format_prompt(message, ai_field)
+        prompts.append(ai_output_type.format_prompt(message, ai_field))
 
-        try:
-            if ai_field.ai_file_field_id is not None and isinstance(
-                generative_ai_model_type, GenerativeAIWithFilesModelType
-            ):
-                file_ids = AIFileManager.upload_files_from_file_field(
-                    ai_field, row, generative_ai_model_type, workspace=workspace
-                )
-                try:
-                    value = generative_ai_model_type.prompt_with_files(
-                        ai_field.ai_generative_ai_model,
-                        message,
-                        file_ids=file_ids,
-                        workspace=workspace,
-                        temperature=ai_field.ai_temperature,
-                    )
-                except Exception as exc:
-                    raise exc
-                finally:
-                    generative_ai_model_type.delete_files(file_ids, workspace=workspace)
-            else:
-                value = generative_ai_model_type.prompt(
-                    ai_field.ai_generative_ai_model,
-                    message,
-                    workspace=workspace,
-                    temperature=ai_field.ai_temperature,
+    generator = AIFieldValuesGenerator(ai_field, generative_ai_model_type, workspace)
+    with closing(generator.generate(rows, prompts)) as outputs:
+        for i, row in enumerate(rows):
+            try:
+                # Because the AI output type can change the prompt to try to force
+                # the output a certain way, then it should give the opportunity to
+                # parse the output when it's given. With the choice output type, it
+                # will try to match it to a `SelectOption`, for example.
+                value = ai_output_type.parse_output(next(outputs), ai_field)
+            except Exception as exc:
+                # If the prompt fails once, we should not continue with the other
+                # rows.
+                rows_ai_values_generation_error.send(
+                    self,
+                    user=user,
+                    rows=rows[i:],
+                    field=ai_field,
+                    table=table,
+                    error_message=str(exc),
                 )
+                raise exc
 
-            # Because the AI output type can change the prompt to try to force the
-            # output a certain way, then it should give the opportunity to parse the
-            # output when it's given. With the choice output type, it will try to match
-            # it to a `SelectOption`, for example.
-            value = ai_output_type.parse_output(value, ai_field)
-        except Exception as exc:
-            # If the prompt fails once, we should not continue with the other rows.
-            rows_ai_values_generation_error.send(
-                self,
-                user=user,
-                rows=rows[i:],
-                field=ai_field,
-                table=table,
-                error_message=str(exc),
+            RowHandler().update_row_by_id(
+                user,
+                table,
+                row.id,
+                {ai_field.db_column: value},
+                model=model,
+                values_already_prepared=True,
             )
-            raise exc
-
-        RowHandler().update_row_by_id(
-            user,
-            table,
-            row.id,
-            {ai_field.db_column: value},
-            model=model,
-            values_already_prepared=True,
-        )
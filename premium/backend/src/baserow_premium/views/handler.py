@@ -1,9 +1,26 @@
 from collections import defaultdict
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from zoneinfo import ZoneInfo
 
-from django.db.models import Count, Q, QuerySet
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import (
+    Case,
+    Count,
+    DateTimeField,
+    Expression,
+    F,
+    IntegerField,
+    OrderBy,
+    Q,
+    QuerySet,
+    Value,
+    When,
+    Window,
+)
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import RowNumber, TruncDate
 
 from baserow_premium.views.exceptions import CalendarViewHasNoDateField
 from baserow_premium.views.models import OWNERSHIP_TYPE_PERSONAL, TimelineView
@@ -23,6 +40,33 @@ from baserow.contrib.database.views.handler import ViewHandler
 from baserow.contrib.database.views.models import View
 from baserow.contrib.database.views.registries import view_type_registry
 
+# Fetches the rows of every bucket with one `id__in` sliced subquery per bucket, and
+# counts them with one filtered `Count` aggregate per bucket.
+GROUPED_ROWS_STRATEGY_SUBQUERIES = "subqueries"
+# Numbers the rows of every bucket with a `ROW_NUMBER() OVER (PARTITION BY bucket)`
+# window function to fetch the rows of all the buckets, and counts them with a
+# single `GROUP BY bucket` query.
+GROUPED_ROWS_STRATEGY_WINDOW_FUNCTION = "window_function"
+
+BUCKET_ANNOTATION = "grouped_rows_bucket"
+BUCKET_ROW_NUMBER_ANNOTATION = "grouped_rows_bucket_row_number"
+
+
+@dataclass
+class RowsBucket:
+    """
+    A group of rows of which a page of rows and the total count must be fetched.
+    """
+
+    # The key of the bucket in the result.
+    key: str
+    # The value of the bucket expression for the rows in the bucket.
+    value: Any
+    # The filters matching the rows in the bucket.
+    filters: Q
+    limit: int
+    offset: int
+
 
 def get_rows_grouped_by_single_select_field(
     view: View,
@@ -33,6 +77,7 @@ def get_rows_grouped_by_single_select_field(
     adhoc_filters: Optional[AdHocFilters] = None,
     model: Optional[GeneratedTableModel] = None,
     base_queryset: Optional[QuerySet] = None,
+    strategy: str = GROUPED_ROWS_STRATEGY_WINDOW_FUNCTION,
 ) -> Dict[str, Dict[str, Union[int, list]]]:
     """
     This method fetches the rows grouped by a single select field in a query
@@ -67,6 +112,8 @@ def get_rows_grouped_by_single_select_field(
     :param base_queryset: Optionally an alternative base queryset can be provided
         that will be used to fetch the rows. This should be provided if additional
         filters and/or sorts must be added.
+    :param strategy: The strategy used to query the rows of the options, either
+        `GROUPED_ROWS_STRATEGY_WINDOW_FUNCTION` or `GROUPED_ROWS_STRATEGY_SUBQUERIES`.
     :return: The fetched rows including the total count.
     """
 
@@ -89,10 +136,10 @@ def get_rows_grouped_by_single_select_field(
     else:
         base_option_queryset = ViewHandler().apply_filters(view, base_queryset)
 
-    all_filters = Q()
-    count_aggregates = {}
+    buckets = []
     all_options = list(single_select_field.select_options.all())
     all_option_ids = [option.id for option in all_options]
+    option_id_field_name = f"field_{single_select_field.id}_id"
 
     def get_id_and_string(option):
         return (
@@ -116,41 +163,35 @@ def get_rows_grouped_by_single_select_field(
             # Somehow the `Count` aggregate doesn't support an empty `__in` lookup.
             # That's why we always add the `-1` value that never exists to make sure
             # there is always a value in there.
-            filters = ~Q(
-                **{f"field_{single_select_field.id}_id__in": all_option_ids + [-1]}
-            )
+            filters = ~Q(**{f"{option_id_field_name}__in": all_option_ids + [-1]})
         else:
-            filters = Q(**{f"field_{single_select_field.id}_id": option_id})
-
-        # We don't want to execute a single query for each select option,
-        # so we create a subquery that finds the ids of the rows related to the
-        # option group. After the single query has been executed we can group the rows.
-        sub_queryset = base_option_queryset.filter(filters).values_list(
-            "id", flat=True
-        )[offset : offset + limit]
-        all_filters |= Q(id__in=sub_queryset)
-
-        # Same goes for fetching the total count. We will construct a single query,
-        # that calculates to total amount of rows per option.
-        count_aggregates[option_string] = Count(
-            "pk",
-            filter=filters,
-        )
-
-    queryset = list(base_queryset.filter(all_filters))
-    counts = base_option_queryset.aggregate(**count_aggregates)
-
-    rows = defaultdict(lambda: {"count": 0, "results": []})
-
-    for row in queryset:
-        option_id = getattr(row, f"field_{single_select_field.id}_id")
-        option_string = str(option_id) if option_id in all_option_ids else "null"
-        rows[option_string]["results"].append(row)
-
-    for key, value in counts.items():
-        rows[key]["count"] = value
+            filters = Q(**{option_id_field_name: option_id})
+
+        buckets.append(RowsBucket(option_string, option_id, filters, limit, offset))
+
+    # The rows having an option that doesn't exist anymore belong to the `null`
+    # bucket, just like the rows without an option.
+    bucket_expression = Case(
+        When(
+            **{f"{option_id_field_name}__in": all_option_ids},
+            then=F(option_id_field_name),
+        ),
+        default=Value(None),
+        output_field=IntegerField(),
+    )
 
-    return rows
+    def get_row_bucket_key(row):
+        option_id = getattr(row, option_id_field_name)
+        return str(option_id) if option_id in all_option_ids else "null"
+
+    return get_rows_grouped_by_bucket(
+        base_queryset,
+        base_option_queryset,
+        buckets,
+        bucket_expression,
+        get_row_bucket_key,
+        strategy=strategy,
+    )
 
 
 def get_rows_grouped_by_date_field(
@@ -167,6 +208,7 @@ def get_rows_grouped_by_date_field(
     base_queryset: Optional[QuerySet] = None,
     adhoc_filters: Optional[AdHocFilters] = None,
     combine_filters: bool = False,
+    strategy: str = GROUPED_ROWS_STRATEGY_WINDOW_FUNCTION,
 ) -> Dict[str, Dict[str, Union[int, list]]]:
     """
     This method fetches the rows grouped into per day buckets given the row's values
@@ -195,6 +237,8 @@ def get_rows_grouped_by_date_field(
         be applied. If set to `False` adhoc filters will be applied instead of view
         filters, if present. This flag should be set by a caller depending on a view's
         publicity status.
+    :param strategy: The strategy used to query the rows of the date buckets, either
+        `GROUPED_ROWS_STRATEGY_WINDOW_FUNCTION` or `GROUPED_ROWS_STRATEGY_SUBQUERIES`.
     :return: The fetched rows including the total count.
     """
 
@@ -229,8 +273,8 @@ def get_rows_grouped_by_date_field(
         else:
             base_option_queryset = ViewHandler().apply_filters(view, base_queryset)
 
-    all_filters = Q()
-    count_aggregates = {}
+    buckets = []
+    date_field_name = f"field_{date_field.id}"
 
     # Target timezone is the timezone that will be used
     # for aggregation of the results into date buckets
@@ -254,36 +298,96 @@ def get_rows_grouped_by_date_field(
     for start, end in generate_per_day_intervals(from_timestamp, to_timestamp):
         date_filters = Q(
             **{
-                f"field_{date_field.id}__gte": start,
-                f"field_{date_field.id}__lt": end,
+                f"{date_field_name}__gte": start,
+                f"{date_field_name}__lt": end,
             }
         )
-
-        sub_queryset = base_option_queryset.filter(date_filters).values_list(
-            "id", flat=True
-        )[offset : offset + limit]
-        all_filters |= Q(id__in=sub_queryset)
-
         start_date = start.date() if isinstance(start, datetime) else start
-        count_aggregates[str(start_date)] = Count(
-            "pk",
-            filter=date_filters,
+        buckets.append(
+            RowsBucket(str(start_date), start_date, date_filters, limit, offset)
         )
 
-    queryset = list(base_queryset.filter(all_filters))
-    counts = base_option_queryset.aggregate(**count_aggregates)
+    if isinstance(model._meta.get_field(date_field_name), DateTimeField):
+        bucket_expression = TruncDate(date_field_name, tzinfo=target_timezone_info)
+    else:
+        bucket_expression = F(date_field_name)
+
+    def get_row_bucket_key(row):
+        date_field_value = getattr(row, date_field_name)
+        if isinstance(date_field_value, datetime):
+            return str(date_field_value.astimezone(tz=target_timezone_info).date())
+        return str(date_field_value)
+
+    return get_rows_grouped_by_bucket(
+        base_queryset,
+        base_option_queryset,
+        buckets,
+        bucket_expression,
+        get_row_bucket_key,
+        buckets_range_filters=Q(
+            **{
+                f"{date_field_name}__gte": from_timestamp,
+                f"{date_field_name}__lt": to_timestamp,
+            }
+        ),
+        strategy=strategy,
+    )
+
+
+def get_rows_grouped_by_bucket(
+    base_queryset: QuerySet,
+    base_option_queryset: QuerySet,
+    buckets: List[RowsBucket],
+    bucket_expression: Expression,
+    get_row_bucket_key: Callable[[GeneratedTableModel], str],
+    buckets_range_filters: Optional[Q] = None,
+    strategy: str = GROUPED_ROWS_STRATEGY_WINDOW_FUNCTION,
+) -> Dict[str, Dict[str, Union[int, list]]]:
+    """
+    Fetches a page of rows and the total count of every bucket with two queries,
+    regardless of the number of buckets.
+
+    :param base_queryset: The queryset used to fetch the rows of the pages.
+    :param base_option_queryset: The filtered queryset containing the rows that can
+        be in the buckets, in the order in which they must be paginated.
+    :param buckets: The buckets for which the rows must be fetched.
+    :param bucket_expression: The expression computing the value of the bucket a row
+        belongs to, NULL if it doesn't belong to any bucket but the null one.
+    :param get_row_bucket_key: Returns the key of the bucket a fetched row belongs
+        to.
+    :param buckets_range_filters: Optionally, the filters matching all the rows of
+        the buckets. They're applied before the rows are numbered, so that an index
+        can be used to find them.
+    :param strategy: The strategy used to query the rows, either
+        `GROUPED_ROWS_STRATEGY_WINDOW_FUNCTION` or `GROUPED_ROWS_STRATEGY_SUBQUERIES`.
+    :return: The fetched rows and the total count per bucket key.
+    """
 
     rows = defaultdict(lambda: {"count": 0, "results": []})
 
+    if not buckets:
+        return rows
+
+    order_by = None
+    if strategy == GROUPED_ROWS_STRATEGY_WINDOW_FUNCTION:
+        order_by = get_window_order_by(base_option_queryset)
+
+    if order_by is None:
+        queryset, counts = _get_rows_grouped_by_bucket_with_subqueries(
+            base_queryset, base_option_queryset, buckets
+        )
+    else:
+        queryset, counts = _get_rows_grouped_by_bucket_with_window_function(
+            base_queryset,
+            base_option_queryset,
+            buckets,
+            bucket_expression,
+            order_by,
+            buckets_range_filters,
+        )
+
     for row in queryset:
-        date_field_value = getattr(row, f"field_{date_field.id}")
-        if isinstance(date_field_value, date):
-            date_value = str(date_field_value)
-        if isinstance(date_field_value, datetime):
-            date_value = str(
-                date_field_value.astimezone(tz=target_timezone_info).date()
-            )
-        rows[date_value]["results"].append(row)
+        rows[get_row_bucket_key(row)]["results"].append(row)
 
     for key, value in counts.items():
         rows[key]["count"] = value
@@ -291,6 +395,145 @@ def get_rows_grouped_by_date_field(
     return rows
 
 
+def _get_rows_grouped_by_bucket_with_subqueries(
+    base_queryset: QuerySet, base_option_queryset: QuerySet, buckets: List[RowsBucket]
+) -> Tuple[List[GeneratedTableModel], Dict[str, int]]:
+    all_filters = Q()
+    count_aggregates = {}
+
+    for bucket in buckets:
+        # We don't want to execute a single query for each bucket, so we create a
+        # subquery that finds the ids of the rows related to the bucket. After the
+        # single query has been executed we can group the rows.
+        sub_queryset = base_option_queryset.filter(bucket.filters).values_list(
+            "id", flat=True
+        )[bucket.offset : bucket.offset + bucket.limit]
+        all_filters |= Q(id__in=sub_queryset)
+
+        # Same goes for fetching the total count. We will construct a single query,
+        # that calculates to total amount of rows per bucket.
+        count_aggregates[bucket.key] = Count("pk", filter=bucket.filters)
+
+    queryset = list(base_queryset.filter(all_filters))
+    counts = base_option_queryset.aggregate(**count_aggregates)
+
+    return queryset, counts
+
+
+def _get_buckets_filters(buckets: List[RowsBucket]) -> Q:
+    values = [bucket.value for bucket in buckets if bucket.value is not None]
+    filters = Q(**{f"{BUCKET_ANNOTATION}__in": values})
+    if len(values) < len(buckets):
+        filters |= Q(**{f"{BUCKET_ANNOTATION}__isnull": True})
+    return filters
+
+
+def _get_rows_grouped_by_bucket_with_window_function(
+    base_queryset: QuerySet,
+    base_option_queryset: QuerySet,
+    buckets: List[RowsBucket],
+    bucket_expression: Expression,
+    order_by: List[OrderBy],
+    buckets_range_filters: Optional[Q] = None,
+) -> Tuple[List[GeneratedTableModel], Dict[str, int]]:
+    bucketed_queryset = base_option_queryset
+    if buckets_range_filters is not None:
+        bucketed_queryset = bucketed_queryset.filter(buckets_range_filters)
+    bucketed_queryset = bucketed_queryset.annotate(
+        **{BUCKET_ANNOTATION: bucket_expression}
+    ).filter(_get_buckets_filters(buckets))
+
+    # The rows of every bucket are numbered in the order of the queryset, so that
+    # the page of all the buckets can be selected with a single condition per
+    # distinct limit and offset instead of a sliced subquery per bucket.
+    buckets_by_page = defaultdict(list)
+    for bucket in buckets:
+        buckets_by_page[(bucket.limit, bucket.offset)].append(bucket)
+
+    pages_filters = Q()
+    for (limit, offset), page_buckets in buckets_by_page.items():
+        page_filters = Q(
+            **{
+                f"{BUCKET_ROW_NUMBER_ANNOTATION}__gt": offset,
+                f"{BUCKET_ROW_NUMBER_ANNOTATION}__lte": offset + limit,
+            }
+        )
+        if len(buckets_by_page) > 1:
+            page_filters &= _get_buckets_filters(page_buckets)
+        pages_filters |= page_filters
+
+    page_ids = (
+        bucketed_queryset.annotate(
+            **{
+                BUCKET_ROW_NUMBER_ANNOTATION: Window(
+                    RowNumber(),
+                    partition_by=F(BUCKET_ANNOTATION),
+                    order_by=order_by or None,
+                )
+            }
+        )
+        .filter(pages_filters)
+        .values("id")
+    )
+    queryset = list(base_queryset.filter(id__in=page_ids))
+
+    keys_by_value = {bucket.value: bucket.key for bucket in buckets}
+    counts = {bucket.key: 0 for bucket in buckets}
+    bucket_counts = (
+        bucketed_queryset.order_by()
+        .values(BUCKET_ANNOTATION)
+        .annotate(count=Count("pk"))
+        .values_list(BUCKET_ANNOTATION, "count")
+    )
+    for value, count in bucket_counts:
+        if value in keys_by_value:
+            counts[keys_by_value[value]] = count
+
+    return queryset, counts
+
+
+def get_window_order_by(queryset: QuerySet) -> Optional[List[OrderBy]]:
+    """
+    Returns the ordering of the queryset as expressions that can be used to order
+    the rows in a window function, or None if the ordering can't be expressed like
+    that, for example because it's random or follows the ordering of a related
+    model.
+
+    :param queryset: The queryset of which the ordering must be returned.
+    :return: The order by expressions.
+    """
+
+    query = queryset.query
+    if query.order_by:
+        ordering = query.order_by
+    elif query.default_ordering:
+        ordering = queryset.model._meta.ordering
+    else:
+        ordering = []
+
+    order_by = []
+    for item in ordering:
+        if isinstance(item, OrderBy):
+            order_by.append(item)
+        elif hasattr(item, "resolve_expression"):
+            order_by.append(item.asc())
+        elif item == "?" or LOOKUP_SEP in item:
+            return None
+        else:
+            descending = item.startswith("-")
+            name = item.lstrip("-")
+            try:
+                if queryset.model._meta.get_field(name).is_relation:
+                    return None
+            except FieldDoesNotExist:
+                # The name refers to an annotation.
+                pass
+            expression = F(name)
+            order_by.append(expression.desc() if descending else expression.asc())
+
+    return order_by
+
+
 def get_timeline_view_filtered_queryset(
     view: TimelineView,
     adhoc_filters: Optional[AdHocFilters] = None,
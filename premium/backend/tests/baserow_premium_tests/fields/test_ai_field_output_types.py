@@ -45,7 +45,10 @@ def test_strict_enum_output_parser():
 
 @pytest.mark.django_db
 @pytest.mark.field_ai
-def test_choice_output_type(premium_data_fixture, api_client):
+def test_choice_output_type(premium_data_fixture, api_client, settings):
+    # Both rows have the same prompt, but a different output is expected.
+    settings.BASEROW_AI_FIELD_PROMPT_CACHE_TIMEOUT = 0
+
     class TestAIChoiceOutputTypeGenerativeAIModelType(GenerativeAIModelType):
         type = "test_ai_choice_ouput_type"
         i = 0
@@ -1,7 +1,10 @@
 from io import BytesIO
 from unittest.mock import patch
 
+from django.core.cache import cache
+
 import pytest
+from baserow_premium.fields.ai_generation import ProviderRateLimiter
 from baserow_premium.fields.tasks import generate_ai_values_for_rows
 
 from baserow.contrib.database.rows.handler import RowHandler
@@ -240,3 +243,206 @@ def test_generate_ai_field_value_view_generative_ai_with_files(
     assert "Generated with files" in getattr(updated_row, field.db_column)
     assert "Test prompt" in getattr(updated_row, field.db_column)
     assert patched_rows_updated.call_args[1]["updated_field_ids"] == set([field.id])
+
+
+@pytest.mark.django_db
+@pytest.mark.field_ai
+@patch("baserow.contrib.database.rows.signals.rows_updated.send")
+def test_generate_ai_field_values_sends_identical_prompts_once(
+    patched_rows_updated, premium_data_fixture, settings
+):
+    settings.BASEROW_AI_FIELD_GENERATION_CONCURRENCY = 2
+    settings.BASEROW_AI_FIELD_PROMPT_CACHE_TIMEOUT = 60
+    cache.clear()
+
+    premium_data_fixture.register_fake_generate_ai_type()
+    user = premium_data_fixture.create_user()
+    table = premium_data_fixture.create_database_table(user=user)
+    firstname = premium_data_fixture.create_text_field(table=table, name="firstname")
+    field = premium_data_fixture.create_ai_field(
+        table=table,
+        name="ai",
+        ai_prompt=f"concat('Hello ', get('fields.field_{firstname.id}'))",
+    )
+    rows = RowHandler().create_rows(
+        user,
+        table,
+        rows_values=[
+            {firstname.db_column: "Bram"},
+            {firstname.db_column: "Peter"},
+            {firstname.db_column: "Bram"},
+        ],
+    )
+    row_ids = [row.id for row in rows]
+
+    with patch(
+        "baserow.test_utils.fixtures.generative_ai.TestGenerativeAIModelType.prompt",
+        side_effect=lambda model, prompt, **kwargs: f"Generated: {prompt}",
+    ) as patched_prompt:
+        generate_ai_values_for_rows(user.id, field.id, row_ids)
+        assert patched_prompt.call_count == 2
+
+        generate_ai_values_for_rows(user.id, field.id, row_ids)
+        assert patched_prompt.call_count == 2
+
+    assert patched_rows_updated.call_count == 6
+    values = [
+        getattr(call[1]["rows"][0], field.db_column)
+        for call in patched_rows_updated.call_args_list
+    ]
+    assert (
+        values
+        == [
+            "Generated: Hello Bram",
+            "Generated: Hello Peter",
+            "Generated: Hello Bram",
+        ]
+        * 2
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.field_ai
+@patch("baserow.contrib.database.rows.signals.rows_updated.send")
+def test_generate_ai_field_values_with_temperature_are_not_cached(
+    patched_rows_updated, premium_data_fixture, settings
+):
+    settings.BASEROW_AI_FIELD_PROMPT_CACHE_TIMEOUT = 60
+    cache.clear()
+
+    premium_data_fixture.register_fake_generate_ai_type()
+    user = premium_data_fixture.create_user()
+    table = premium_data_fixture.create_database_table(user=user)
+    field = premium_data_fixture.create_ai_field(
+        table=table, name="ai", ai_prompt="'Hello'", ai_temperature=0.7
+    )
+    rows = RowHandler().create_rows(user, table, rows_values=[{}, {}])
+    row_ids = [row.id for row in rows]
+
+    with patch(
+        "baserow.test_utils.fixtures.generative_ai.TestGenerativeAIModelType.prompt",
+        side_effect=lambda model, prompt, **kwargs: f"Generated: {prompt}",
+    ) as patched_prompt:
+        generate_ai_values_for_rows(user.id, field.id, row_ids)
+        assert patched_prompt.call_count == 2
+
+        generate_ai_values_for_rows(user.id, field.id, row_ids)
+        assert patched_prompt.call_count == 4
+
+
+@pytest.mark.django_db
+@pytest.mark.field_ai
+@patch("baserow.contrib.database.rows.signals.rows_updated.send")
+def test_generate_ai_field_values_are_rate_limited(
+    patched_rows_updated, premium_data_fixture, settings
+):
+    settings.BASEROW_AI_FIELD_MAX_REQUESTS_PER_SECOND = 5
+    settings.BASEROW_AI_FIELD_PROMPT_CACHE_TIMEOUT = 60
+    cache.clear()
+
+    premium_data_fixture.register_fake_generate_ai_type()
+    user = premium_data_fixture.create_user()
+    table = premium_data_fixture.create_database_table(user=user)
+    firstname = premium_data_fixture.create_text_field(table=table, name="firstname")
+    field = premium_data_fixture.create_ai_field(
+        table=table,
+        name="ai",
+        ai_prompt=f"concat('Hello ', get('fields.field_{firstname.id}'))",
+    )
+    rows = RowHandler().create_rows(
+        user,
+        table,
+        rows_values=[{firstname.db_column: "Bram"}, {firstname.db_column: "Peter"}],
+    )
+    row_ids = [row.id for row in rows]
+
+    with patch(
+        "baserow_premium.fields.ai_generation.ProviderRateLimiter.wait"
+    ) as patched_wait:
+        generate_ai_values_for_rows(user.id, field.id, row_ids)
+        assert [call.args for call in patched_wait.call_args_list] == [(5,), (5,)]
+
+        # The cached outputs are not rate limited because they're not sent.
+        generate_ai_values_for_rows(user.id, field.id, row_ids)
+        assert patched_wait.call_count == 2
+
+
+def test_provider_rate_limiter_spreads_requests():
+    limiter = ProviderRateLimiter()
+
+    with patch("baserow_premium.fields.ai_generation.time") as patched_time:
+        patched_time.monotonic.return_value = 100.0
+        limiter.wait(0)
+        for _ in range(3):
+            limiter.wait(4)
+
+    assert [call.args[0] for call in patched_time.sleep.call_args_list] == [
+        pytest.approx(0.25),
+        pytest.approx(0.5),
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.field_ai
+@patch("baserow.contrib.database.rows.signals.rows_ai_values_generation_error.send")
+@patch("baserow.contrib.database.rows.signals.rows_updated.send")
+def test_generate_ai_field_values_stops_at_the_first_failed_prompt(
+    patched_rows_updated,
+    patched_rows_ai_values_generation_error,
+    premium_data_fixture,
+    settings,
+):
+    settings.BASEROW_AI_FIELD_GENERATION_CONCURRENCY = 2
+    settings.BASEROW_AI_FIELD_PROMPT_CACHE_TIMEOUT = 60
+    cache.clear()
+
+    premium_data_fixture.register_fake_generate_ai_type()
+    user = premium_data_fixture.create_user()
+    table = premium_data_fixture.create_database_table(user=user)
+    firstname = premium_data_fixture.create_text_field(table=table, name="firstname")
+    field = premium_data_fixture.create_ai_field(
+        table=table,
+        name="ai",
+        ai_prompt=f"concat('Hello ', get('fields.field_{firstname.id}'))",
+    )
+    rows = RowHandler().create_rows(
+        user,
+        table,
+        rows_values=[
+            {firstname.db_column: "Bram"},
+            {firstname.db_column: "Peter"},
+            {firstname.db_column: "Jan"},
+        ],
+    )
+    row_ids = [row.id for row in rows]
+
+    def prompt(model, prompt, **kwargs):
+        if prompt == "Hello Peter":
+            raise GenerativeAIPromptError("Test error")
+        return f"Generated: {prompt}"
+
+    with patch(
+        "baserow.test_utils.fixtures.generative_ai.TestGenerativeAIModelType.prompt",
+        side_effect=prompt,
+    ) as patched_prompt:
+        with pytest.raises(GenerativeAIPromptError):
+            generate_ai_values_for_rows(user.id, field.id, row_ids)
+
+        # The rows before the failed one are updated, and the error is reported for
+        # the failed row and all the rows after it.
+        assert patched_rows_updated.call_count == 1
+        assert [row.id for row in patched_rows_updated.call_args[1]["rows"]] == row_ids[
+            :1
+        ]
+        assert patched_rows_ai_values_generation_error.call_count == 1
+        error_kwargs = patched_rows_ai_values_generation_error.call_args[1]
+        assert [row.id for row in error_kwargs["rows"]] == row_ids[1:]
+        assert error_kwargs["error_message"] == "Test error"
+
+        # The failed prompt is not cached, so it's sent again.
+        calls_before_retry = patched_prompt.call_count
+        with pytest.raises(GenerativeAIPromptError):
+            generate_ai_values_for_rows(user.id, field.id, row_ids)
+        assert [
+            call.args[1] for call in patched_prompt.call_args_list[calls_before_retry:]
+        ].count("Hello Peter") == 1
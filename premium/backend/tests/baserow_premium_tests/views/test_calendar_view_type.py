@@ -12,6 +12,8 @@ import pytest
 from baserow_premium.ical_utils import build_calendar
 from baserow_premium.views.exceptions import CalendarViewHasNoDateField
 from baserow_premium.views.handler import (
+    GROUPED_ROWS_STRATEGY_SUBQUERIES,
+    GROUPED_ROWS_STRATEGY_WINDOW_FUNCTION,
     generate_per_day_intervals,
     get_rows_grouped_by_date_field,
     to_midnight,
@@ -631,8 +633,12 @@ GET_ROWS_GROUPED_BY_DATE_FIELD_CASES = [
 @pytest.mark.django_db
 @pytest.mark.view_calendar
 @pytest.mark.parametrize("name,test_case", GET_ROWS_GROUPED_BY_DATE_FIELD_CASES)
+@pytest.mark.parametrize(
+    "strategy",
+    [GROUPED_ROWS_STRATEGY_WINDOW_FUNCTION, GROUPED_ROWS_STRATEGY_SUBQUERIES],
+)
 def test_calendar_timezone_test_cases(
-    premium_data_fixture, name, test_case, django_assert_num_queries
+    premium_data_fixture, name, test_case, strategy, django_assert_num_queries
 ):
     table, fields, rows = premium_data_fixture.build_table(
         columns=[test_case["field"]], rows=[[v] for v in test_case["rows"]]
@@ -649,12 +655,16 @@ def test_calendar_timezone_test_cases(
         to_timestamp=test_case["to_timestamp"],
         user_timezone=test_case["user_timezone"],
         model=type(rows[0]),
+        strategy=strategy,
     )
-    for date_bucket_key, result in test_case["expected_result"].items():
-        test_case["expected_result"][date_bucket_key]["results"] = [
-            rows[i] for i in test_case["expected_result"][date_bucket_key]["results"]
-        ]
-    assert dict(grouped_rows) == test_case["expected_result"]
+    expected_result = {
+        date_bucket_key: {
+            "count": result["count"],
+            "results": [rows[i] for i in result["results"]],
+        }
+        for date_bucket_key, result in test_case["expected_result"].items()
+    }
+    assert dict(grouped_rows) == expected_result
 
 
 @pytest.mark.view_calendar
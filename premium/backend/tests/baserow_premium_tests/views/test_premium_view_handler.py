@@ -1,6 +1,11 @@
 import pytest
-from baserow_premium.views.handler import get_rows_grouped_by_single_select_field
+from baserow_premium.views.handler import (
+    GROUPED_ROWS_STRATEGY_SUBQUERIES,
+    GROUPED_ROWS_STRATEGY_WINDOW_FUNCTION,
+    get_rows_grouped_by_single_select_field,
+)
 from baserow_premium.views.models import OWNERSHIP_TYPE_PERSONAL
+from pyinstrument import Profiler
 
 from baserow.contrib.database.views.exceptions import ViewDoesNotExist, ViewNotInTable
 from baserow.contrib.database.views.handler import ViewHandler
@@ -243,6 +248,134 @@ def test_get_rows_grouped_by_single_select_field_with_empty_table(
     assert len(rows["null"]["results"]) == 0
 
 
+def _get_grouped_row_ids(rows):
+    return {
+        key: {"count": value["count"], "ids": [row.id for row in value["results"]]}
+        for key, value in rows.items()
+    }
+
+
+@pytest.mark.django_db
+def test_get_rows_grouped_by_single_select_field_strategies_are_equal(
+    premium_data_fixture,
+):
+    table = premium_data_fixture.create_database_table()
+    text_field = premium_data_fixture.create_text_field(table=table, primary=True)
+    number_field = premium_data_fixture.create_number_field(table=table)
+    single_select_field = premium_data_fixture.create_single_select_field(table=table)
+    view = premium_data_fixture.create_kanban_view(
+        table=table, single_select_field=single_select_field
+    )
+    options = [
+        premium_data_fixture.create_select_option(
+            field=single_select_field, value=value
+        )
+        for value in ["A", "B", "C", "Deleted"]
+    ]
+
+    model = table.get_model()
+    for i in range(50):
+        option = [None, *options][i % 5]
+        model.objects.create(
+            **{
+                f"field_{text_field.id}": f"Row {i % 7}",
+                f"field_{number_field.id}": i,
+                f"field_{single_select_field.id}_id": option.id if option else None,
+            }
+        )
+    options[-1].delete()
+    premium_data_fixture.create_view_filter(
+        view=view, field=number_field, type="higher_than", value="3"
+    )
+    premium_data_fixture.create_view_sort(view=view, field=text_field, order="DESC")
+    base_queryset = ViewHandler().apply_sorting(
+        view, model.objects.all().enhance_by_fields()
+    )
+
+    for option_settings in [
+        None,
+        {"null": {"limit": 2, "offset": 1}},
+        {
+            str(options[0].id): {"limit": 3, "offset": 2},
+            str(options[1].id): {"limit": 1, "offset": 0},
+            str(options[2].id): {"limit": 20, "offset": 0},
+        },
+    ]:
+        for base in [None, base_queryset]:
+            rows_per_strategy = [
+                _get_grouped_row_ids(
+                    get_rows_grouped_by_single_select_field(
+                        view,
+                        single_select_field,
+                        option_settings=option_settings,
+                        default_limit=3,
+                        default_offset=1,
+                        model=model,
+                        base_queryset=base,
+                        strategy=strategy,
+                    )
+                )
+                for strategy in [
+                    GROUPED_ROWS_STRATEGY_WINDOW_FUNCTION,
+                    GROUPED_ROWS_STRATEGY_SUBQUERIES,
+                ]
+            ]
+            assert rows_per_strategy[0] == rows_per_strategy[1]
+
+
+@pytest.mark.django_db
+@pytest.mark.disabled_in_ci
+# You must add --run-disabled-in-ci -s to pytest to run this test, you can do this in
+# intellij by editing the run config for this test and adding --run-disabled-in-ci -s
+# to additional args.
+def test_get_rows_grouped_by_single_select_field_strategies_performance(
+    premium_data_fixture,
+):
+    table = premium_data_fixture.create_database_table()
+    text_field = premium_data_fixture.create_text_field(table=table, primary=True)
+    single_select_field = premium_data_fixture.create_single_select_field(table=table)
+    view = premium_data_fixture.create_kanban_view(
+        table=table, single_select_field=single_select_field
+    )
+    options = [
+        premium_data_fixture.create_select_option(
+            field=single_select_field, value=f"Option {i}"
+        )
+        for i in range(50)
+    ]
+
+    model = table.get_model()
+    model.objects.bulk_create(
+        [
+            model(
+                **{
+                    f"field_{text_field.id}": f"Row {i}",
+                    f"field_{single_select_field.id}_id": options[i % 50].id,
+                }
+            )
+            for i in range(100000)
+        ]
+    )
+
+    rows_per_strategy = []
+    for strategy in [
+        GROUPED_ROWS_STRATEGY_SUBQUERIES,
+        GROUPED_ROWS_STRATEGY_WINDOW_FUNCTION,
+    ]:
+        profiler = Profiler()
+        profiler.start()
+        rows = get_rows_grouped_by_single_select_field(
+            view, single_select_field, model=model, strategy=strategy
+        )
+        profiler.stop()
+
+        print(strategy)
+        print(profiler.output_text(unicode=True, color=True))
+        rows_per_strategy.append(_get_grouped_row_ids(rows))
+
+    assert rows_per_strategy[0] == rows_per_strategy[1]
+
+
 @pytest.mark.django_db
 @pytest.mark.view_ownership
 def test_list_views_personal_ownership_type(
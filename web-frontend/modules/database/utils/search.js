@@ -7,6 +7,9 @@ export const SearchModes = {
   // each field type, and provide a `count` in the response. This
   // method is much faster as tables grow in size.
   MODE_FT_WITH_COUNT: 'full-text-with-count',
+  // Use this mode to search rows using Postgres full-text search, but receive a
+  // `count` estimated by Postgres for large tables instead of an exact one.
+  MODE_FT_WITH_ESTIMATED_COUNT: 'full-text-with-estimated-count',
 }
 
 export function getDefaultSearchModeFromEnv($config) {
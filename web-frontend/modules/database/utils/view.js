@@ -349,7 +349,10 @@ export function valueMatchesActiveSearchTerm(
   value,
   activeSearchTerm
 ) {
-  if (searchMode === SearchModes.MODE_FT_WITH_COUNT) {
+  if (
+    searchMode === SearchModes.MODE_FT_WITH_COUNT ||
+    searchMode === SearchModes.MODE_FT_WITH_ESTIMATED_COUNT
+  ) {
     return _fullTextSearch(registry, field, value, activeSearchTerm)
   } else {
     return _compatSearchMode(registry, field, value, activeSearchTerm)